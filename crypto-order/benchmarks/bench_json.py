@@ -0,0 +1,214 @@
+"""
+Decode cost of exchange responses per JSON decoder, with and without the adapters' response schemas.
+
+    cd crypto-order
+    PYTHONPATH=src python -m benchmarks.bench_json --decodes 20000
+"""
+
+import json
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import click
+
+from trading.infrastructure.exchange import binance_adapter, okx_adapter
+from trading.infrastructure.exchange.json_decoder import (
+    ResponseSchema,
+    available_decoders,
+    get_decoder,
+)
+
+
+def binance_ticker() -> Dict[str, Any]:
+    return {
+        "symbol": "BTCUSDT",
+        "bidPrice": "50000.00000000",
+        "bidQty": "1.25000000",
+        "askPrice": "50010.00000000",
+        "askQty": "0.75000000",
+    }
+
+
+def binance_order(fills: int) -> Dict[str, Any]:
+    # FULL response type of POST /api/v3/order
+    return {
+        "symbol": "BTCUSDT",
+        "orderId": 28,
+        "orderListId": -1,
+        "clientOrderId": "6gCrw2kRUAF9CvJDGP16IP",
+        "transactTime": 1507725176595,
+        "price": "0.00000000",
+        "origQty": f"{fills}.00000000",
+        "executedQty": f"{fills}.00000000",
+        "origQuoteOrderQty": "0.00000000",
+        "cummulativeQuoteQty": f"{50010 * fills}.00000000",
+        "status": "FILLED",
+        "timeInForce": "GTC",
+        "type": "MARKET",
+        "side": "BUY",
+        "workingTime": 1507725176595,
+        "selfTradePreventionMode": "NONE",
+        "fills": [
+            {
+                "price": f"{50010 + i}.00000000",
+                "qty": "1.00000000",
+                "commission": "0.00100000",
+                "commissionAsset": "BTC",
+                "tradeId": 56 + i,
+            }
+            for i in range(fills)
+        ],
+    }
+
+
+def okx_order_details() -> Dict[str, Any]:
+    # GET /api/v5/trade/order
+    fields = {
+        "instType": "SPOT",
+        "instId": "BTC-USDT",
+        "ccy": "",
+        "ordId": "680800019749904384",
+        "clOrdId": "",
+        "tag": "",
+        "px": "",
+        "pxUsd": "",
+        "pxVol": "",
+        "pxType": "",
+        "sz": "1",
+        "pnl": "0",
+        "ordType": "market",
+        "side": "buy",
+        "posSide": "net",
+        "tdMode": "cash",
+        "accFillSz": "1",
+        "fillPx": "50010",
+        "tradeId": "744876980",
+        "fillSz": "1",
+        "fillTime": "1597026383085",
+        "avgPx": "50010",
+        "state": "filled",
+        "stpId": "",
+        "stpMode": "cancel_maker",
+        "lever": "",
+        "attachAlgoClOrdId": "",
+        "tpTriggerPx": "",
+        "tpTriggerPxType": "",
+        "tpOrdPx": "",
+        "slTriggerPx": "",
+        "slTriggerPxType": "",
+        "slOrdPx": "",
+        "attachAlgoOrds": [],
+        "feeCcy": "BTC",
+        "fee": "-0.001",
+        "rebateCcy": "USDT",
+        "source": "",
+        "rebate": "0",
+        "category": "normal",
+        "reduceOnly": "false",
+        "isTpLimit": "false",
+        "cancelSource": "",
+        "cancelSourceReason": "",
+        "quickMgnType": "",
+        "algoClOrdId": "",
+        "algoId": "",
+        "uTime": "1597026383085",
+        "cTime": "1597026383085",
+    }
+    return {"code": "0", "msg": "", "data": [fields]}
+
+
+def okx_ticker() -> Dict[str, Any]:
+    fields = {
+        "instType": "SPOT",
+        "instId": "BTC-USDT",
+        "last": "50005",
+        "lastSz": "0.1",
+        "askPx": "50010",
+        "askSz": "0.75",
+        "bidPx": "50000",
+        "bidSz": "1.25",
+        "open24h": "49000",
+        "high24h": "51000",
+        "low24h": "48500",
+        "volCcy24h": "2222",
+        "vol24h": "2222",
+        "sodUtc0": "49500",
+        "sodUtc8": "49700",
+        "ts": "1597026383085",
+    }
+    return {"code": "0", "msg": "", "data": [fields]}
+
+
+def payloads(fills: int) -> Dict[str, Tuple[bytes, Optional[ResponseSchema]]]:
+    """Responses with the schema the adapter decodes them with"""
+    return {
+        "binance ticker": (json.dumps(binance_ticker()).encode(), None),
+        "binance order": (
+            json.dumps(binance_order(fills)).encode(),
+            binance_adapter.ORDER_RESPONSE,
+        ),
+        "okx ticker": (json.dumps(okx_ticker()).encode(), okx_adapter.TICKER_RESPONSE),
+        "okx order details": (
+            json.dumps(okx_order_details()).encode(),
+            okx_adapter.ORDER_DETAILS_RESPONSE,
+        ),
+    }
+
+
+def measure(operation: Callable[[], Any], decodes: int, runs: int) -> float:
+    """Best seconds per decode over runs"""
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        for _ in range(decodes):
+            operation()
+        best = min(best, (time.perf_counter() - started) / decodes)
+    return best
+
+
+@click.command()
+@click.option("--decodes", type=click.IntRange(min=1), default=20000)
+@click.option("--runs", type=click.IntRange(min=1), default=5)
+@click.option(
+    "--fills", type=click.IntRange(min=1), default=5, help="Fills of the order"
+)
+@click.option("--json", "as_json", is_flag=True, help="Print results as JSONL")
+def main(decodes: int, runs: int, fills: int, as_json: bool):
+    """Compare the installed JSON decoders on ticker, order and order detail responses"""
+    header = (
+        f"{'payload':<18} {'decoder':<16} {'bytes':>6} {'us/decode':>10} {'vs json':>8}"
+    )
+    if not as_json:
+        click.echo(f"Decoders: {', '.join(available_decoders())}")
+        click.echo(header)
+        click.echo("-" * len(header))
+    for payload, (data, schema) in payloads(fills).items():
+        baseline = None
+        for name in reversed(available_decoders()):
+            decoder = get_decoder(name)
+            variants: Dict[str, Optional[ResponseSchema]] = {name: None}
+            if name == "msgspec" and schema is not None:
+                variants[f"{name}+schema"] = schema
+            for variant, variant_schema in variants.items():
+                seconds = measure(
+                    lambda: decoder.decode(data, variant_schema), decodes, runs
+                )
+                baseline = baseline or seconds
+                row = {
+                    "payload": payload,
+                    "decoder": variant,
+                    "bytes": len(data),
+                    "us_per_decode": seconds * 1e6,
+                    "speedup": baseline / seconds if seconds else 0.0,
+                }
+                if as_json:
+                    click.echo(json.dumps(row))
+                else:
+                    click.echo(
+                        f"{payload:<18} {variant:<16} {len(data):>6} "
+                        f"{row['us_per_decode']:>10.2f} {row['speedup']:>7.2f}x"
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+End-to-end latency benchmark against the local mock exchanges.
+
+    cd crypto-order
+    PYTHONPATH=src python -m benchmarks.bench_latency --requests 500 --concurrency 20 --latency 0.005 --jitter 0.002
+
+Reports p50/p99 latency and throughput per code path. Every request goes through the real adapters,
+so HTTP, JSON parsing and signing are included.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import click
+
+from trading.application.dto.order_dto import OrderDTO
+from trading.application.service.trading_app_service import (
+    RoutingMode,
+    TradingAppService,
+)
+from trading.domain.model.order import Symbol
+from trading.domain.service.trading_service import TradingService
+from trading.infrastructure.exchange.exchange_factory import ExchangeFactory
+from trading.infrastructure.exchange.rate_limiter import (
+    ExchangeLimits,
+    RequestScheduler,
+)
+from trading.infrastructure.repository.exchange_repository_impl import (
+    ExchangeRepositoryImpl,
+)
+from trading.infrastructure.repository.market_repository_impl import (
+    MarketRepositoryImpl,
+)
+
+from benchmarks.mock_exchange import FaultProfile, MockBinanceServer, MockOKXServer
+
+SYMBOL = Symbol(base="BTC", quote="USDT")
+UNLIMITED = ExchangeLimits(buckets={}, endpoints={})
+
+
+def percentile(samples: List[float], percent: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * percent / 100), len(ordered) - 1)]
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        count = len(self.latencies) + self.errors
+        return {
+            "name": self.name,
+            "requests": count,
+            "errors": self.errors,
+            "p50_ms": percentile(self.latencies, 50) * 1000,
+            "p99_ms": percentile(self.latencies, 99) * 1000,
+            "max_ms": max(self.latencies, default=0.0) * 1000,
+            "throughput": count / self.elapsed if self.elapsed else 0.0,
+        }
+
+
+async def measure(
+    name: str,
+    operation: Callable[[int], Awaitable[bool]],
+    requests: int,
+    concurrency: int,
+) -> BenchmarkResult:
+    """Run operation `requests` times, at most `concurrency` at once. operation returns False on a failed request."""
+    result = BenchmarkResult(name=name)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(index: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                ok = await operation(index)
+            except Exception:
+                ok = False
+            if ok:
+                result.latencies.append(time.perf_counter() - started)
+            else:
+                result.errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[run(index) for index in range(requests)])
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def build_app_service(
+    exchanges, logger, routing_mode: RoutingMode, **repository_options
+):
+    return TradingAppService(
+        trading_service=TradingService(logger=logger),
+        market_repository=MarketRepositoryImpl(
+            exchanges=exchanges, logger=logger, **repository_options
+        ),
+        exchange_repository=ExchangeRepositoryImpl(exchanges=exchanges, logger=logger),
+        logger=logger,
+        routing_mode=routing_mode,
+    )
+
+
+async def run_benchmarks(
+    requests: int,
+    concurrency: int,
+    profile: FaultProfile,
+    deadline: Optional[float],
+    rate_limits: bool,
+    seed: Optional[int],
+) -> List[BenchmarkResult]:
+    logger = logging.getLogger("benchmark")
+    # NOTE: Buys route to OKX (cheaper ask) and sells to Binance (higher bid), so both order paths are measured.
+    binance = MockBinanceServer(profile=profile, seed=seed)
+    okx = MockOKXServer(
+        profile=profile, seed=seed, bid=Decimal("49995"), ask=Decimal("50005")
+    )
+    async with binance, okx:
+        configs = {
+            "binance": binance.config(),
+            "okx": okx.config(fill_poll_initial_interval=0.005),
+        }
+        # NOTE: Without rate limits the benchmark measures the client, not the exchange quotas.
+        scheduler = RequestScheduler(
+            logger=logger,
+            limits=None if rate_limits else {"binance": UNLIMITED, "okx": UNLIMITED},
+        )
+        exchanges = ExchangeFactory.create_all(configs, logger, scheduler)
+        async with ExchangeFactory.open_all(exchanges):
+            market_repository = MarketRepositoryImpl(exchanges=exchanges, logger=logger)
+
+            async def get_all_markets(_: int) -> bool:
+                return len(await market_repository.get_all_markets(SYMBOL)) == len(
+                    exchanges
+                )
+
+            def place_order(app_service: TradingAppService, quantity: str):
+                async def operation(index: int) -> bool:
+                    result = await app_service.place_market_order(
+                        OrderDTO(
+                            symbol=str(SYMBOL),
+                            side="buy" if index % 2 == 0 else "sell",
+                            quantity=Decimal(quantity),
+                        )
+                    )
+                    return result.status == "filled"
+
+                return operation
+
+            benchmarks = {
+                "get_all_markets": get_all_markets,
+                "place_market_order[top_of_book]": place_order(
+                    build_app_service(exchanges, logger, RoutingMode.TOP_OF_BOOK), "1"
+                ),
+                "place_market_order[depth]": place_order(
+                    build_app_service(exchanges, logger, RoutingMode.DEPTH), "1"
+                ),
+                "place_market_order[split]": place_order(
+                    build_app_service(exchanges, logger, RoutingMode.SPLIT), "3"
+                ),
+            }
+            if deadline is not None:
+                deadline_repository = MarketRepositoryImpl(
+                    exchanges=exchanges, logger=logger, deadline=deadline
+                )
+
+                async def get_markets_by_deadline(_: int) -> bool:
+                    return bool(await deadline_repository.get_all_markets(SYMBOL))
+
+                benchmarks[f"get_all_markets[deadline={deadline}]"] = (
+                    get_markets_by_deadline
+                )
+                benchmarks[f"place_market_order[deadline={deadline}]"] = place_order(
+                    build_app_service(
+                        exchanges, logger, RoutingMode.TOP_OF_BOOK, deadline=deadline
+                    ),
+                    "1",
+                )
+
+            return [
+                await measure(name, operation, requests, concurrency)
+                for name, operation in benchmarks.items()
+            ]
+
+
+def format_table(results: List[BenchmarkResult]) -> str:
+    header = f"{'code path':<40} {'requests':>8} {'errors':>6} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'ops/s':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        row = result.as_dict()
+        lines.append(
+            f"{row['name']:<40} {row['requests']:>8} {row['errors']:>6} "
+            f"{row['p50_ms']:>8.2f} {row['p99_ms']:>8.2f} {row['max_ms']:>8.2f} {row['throughput']:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+@click.command()
+@click.option("--requests", type=click.IntRange(min=1), default=200)
+@click.option("--concurrency", type=click.IntRange(min=1), default=10)
+@click.option("--latency", type=float, default=0.0, help="Server latency in seconds")
+@click.option("--jitter", type=float, default=0.0, help="Latency jitter in seconds")
+@click.option("--error-rate", type=float, default=0.0, help="Share of 5xx responses")
+@click.option(
+    "--stall-rate", type=float, default=0.0, help="Share of requests held for --stall"
+)
+@click.option("--stall", type=float, default=1.0, help="Stall duration in seconds")
+@click.option(
+    "--deadline",
+    type=float,
+    default=None,
+    help="Also measure quote gathering with this deadline in seconds",
+)
+@click.option(
+    "--rate-limits/--no-rate-limits",
+    default=False,
+    help="Apply the real exchange rate limits",
+)
+@click.option("--seed", type=int, default=None, help="Seed of the fault injection")
+@click.option("--json", "as_json", is_flag=True, help="Print results as JSONL")
+def main(
+    requests: int,
+    concurrency: int,
+    latency: float,
+    jitter: float,
+    error_rate: float,
+    stall_rate: float,
+    stall: float,
+    deadline: Optional[float],
+    rate_limits: bool,
+    seed: Optional[int],
+    as_json: bool,
+):
+    """Benchmark the order and quote paths against local mock exchanges"""
+    logging.basicConfig(level=logging.CRITICAL)
+    profile = FaultProfile(
+        latency=latency,
+        jitter=jitter,
+        error_rate=error_rate,
+        stall_rate=stall_rate,
+        stall=stall,
+    )
+    results = asyncio.run(
+        run_benchmarks(requests, concurrency, profile, deadline, rate_limits, seed)
+    )
+    if as_json:
+        for result in results:
+            click.echo(json.dumps(result.as_dict()))
+    else:
+        click.echo(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Streamed quote hot path: Market with Decimal Prices against the fixed-point slotted Quote.
+
+    cd crypto-order
+    PYTHONPATH=src python -m benchmarks.bench_quotes --quotes 100000
+"""
+
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+import click
+
+from trading.domain.model.order import Market, Price, Symbol
+from trading.domain.model.quote import Quote
+
+BTCUSDT = Symbol(base="BTC", quote="USDT")
+SCALE = 8
+
+
+def make_messages(quotes: int, seed: int) -> List[Dict[str, Any]]:
+    """Binance bookTicker messages, with prices quoted to 8 decimals like the exchange does"""
+    rng = random.Random(seed)
+    messages = []
+    for i in range(quotes):
+        bid = rng.randint(4990000, 5010000)
+        ask = bid + rng.randint(1, 50)
+        messages.append(
+            {"u": i, "s": "BTCUSDT", "b": f"{bid / 100:.8f}", "a": f"{ask / 100:.8f}"}
+        )
+    return messages
+
+
+def parse_market(message: Dict[str, Any]) -> Market:
+    # NOTE: The path streams took before Quote.
+    now = datetime.now()
+    return Market(
+        exchange_id="binance",
+        symbol=BTCUSDT,
+        best_bid=Price(amount=Decimal(message["b"]), timestamp=now),
+        best_ask=Price(amount=Decimal(message["a"]), timestamp=now),
+    )
+
+
+def parse_quote(message: Dict[str, Any]) -> Quote:
+    return Quote.parse("binance", BTCUSDT, message["b"], message["a"], SCALE)
+
+
+def measure(operation: Callable[[], None], runs: int) -> float:
+    """Best of runs, in seconds"""
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def allocated(build: Callable[[], List[Any]]) -> int:
+    """Bytes held by the objects build returns"""
+    tracemalloc.start()
+    try:
+        objects = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del objects
+    return size
+
+
+@click.command()
+@click.option("--quotes", type=click.IntRange(min=1), default=100000)
+@click.option("--runs", type=click.IntRange(min=1), default=5)
+@click.option("--seed", type=int, default=1)
+@click.option("--json", "as_json", is_flag=True, help="Print results as JSONL")
+def main(quotes: int, runs: int, seed: int, as_json: bool):
+    """Compare parsing, validating and reading streamed quotes as Market and as Quote"""
+    messages = make_messages(quotes, seed)
+    markets = [parse_market(m) for m in messages]
+    fixed = [parse_quote(m) for m in messages]
+
+    cases = {
+        "parse Market": lambda: [parse_market(m) for m in messages],
+        "parse Quote": lambda: [parse_quote(m) for m in messages],
+        "is_price_valid Market": lambda: [m.is_price_valid() for m in markets],
+        "is_price_valid Quote": lambda: [q.is_price_valid() for q in fixed],
+        "Quote.to_market": lambda: [q.to_market() for q in fixed],
+    }
+    header = f"{'case':<24} {'ns/quote':>10} {'quotes/s':>12} {'bytes/quote':>12}"
+    if not as_json:
+        click.echo(f"{quotes} quotes, best of {runs} runs")
+        click.echo(header)
+        click.echo("-" * len(header))
+    for name, operation in cases.items():
+        seconds = measure(operation, runs)
+        # NOTE: Memory is only meaningful for the cases building the stored objects.
+        size = allocated(operation) // quotes if name.startswith("parse") else None
+        row = {
+            "name": name,
+            "quotes": quotes,
+            "ns_per_quote": seconds / quotes * 1e9,
+            "quotes_per_s": quotes / seconds if seconds else 0.0,
+            "bytes_per_quote": size,
+        }
+        if as_json:
+            click.echo(json.dumps(row))
+        else:
+            click.echo(
+                f"{name:<24} {row['ns_per_quote']:>10.1f} {row['quotes_per_s']:>12.0f} "
+                f"{'-' if size is None else size:>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
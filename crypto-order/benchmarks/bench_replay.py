@@ -0,0 +1,156 @@
+"""
+Replays a quote tape through TradingService.find_best_market.
+
+    cd crypto-order
+    # Record quotes while trading, or generate a synthetic tape.
+    PYTHONPATH=src python src/trading/interface/cli.py trade --side buy --quantity 1 --record-quotes quotes.tape
+    PYTHONPATH=src python -m benchmarks.bench_replay --generate 100000 --tape /tmp/quotes.tape
+    PYTHONPATH=src python -m benchmarks.bench_replay --tape /tmp/quotes.tape
+    # Replay with the original timing, 10x accelerated.
+    PYTHONPATH=src python -m benchmarks.bench_replay --tape /tmp/quotes.tape --speed 10
+
+Reports the decision throughput and a digest of the decisions. A changed digest on the same tape
+means that routing decided differently, which makes the digest a regression check.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import time
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import click
+
+from trading.domain.model.order import Market, OrderSide, Price, Symbol
+from trading.domain.service.trading_service import TradingService
+from trading.infrastructure.exchange.quote_tape import QuoteTapeWriter, load_tape
+from trading.infrastructure.exchange.replay_adapter import QuoteReplay
+
+from benchmarks.bench_latency import percentile
+
+SYMBOLS = (Symbol("BTC", "USDT"), Symbol("ETH", "USDT"), Symbol("DOGE", "USDT"))
+START_PRICES = {"BTC": Decimal("50000"), "ETH": Decimal("3000"), "DOGE": Decimal("0.1")}
+
+
+def generate_tape(
+    path: Path, quotes: int, exchanges: List[str], seed: Optional[int] = None
+) -> None:
+    """Random walk quotes of SYMBOLS on exchanges, 1ms apart"""
+    rng = random.Random(seed)
+    mids = {
+        (exchange, symbol): START_PRICES[symbol.base]
+        for exchange in exchanges
+        for symbol in SYMBOLS
+    }
+    started = time.time()
+    with QuoteTapeWriter(path, logger=logging.getLogger(__name__)) as tape:
+        for index in range(quotes):
+            key = (rng.choice(exchanges), rng.choice(SYMBOLS))
+            tick = START_PRICES[key[1].base] / 10000
+            mids[key] += tick * rng.randint(-3, 3)
+            spread = tick * rng.randint(1, 4)
+            timestamp = started + index / 1000
+            quoted_at = datetime.fromtimestamp(timestamp)
+            tape.record(
+                Market(
+                    exchange_id=key[0],
+                    symbol=key[1],
+                    best_bid=Price(amount=mids[key] - spread, timestamp=quoted_at),
+                    best_ask=Price(amount=mids[key] + spread, timestamp=quoted_at),
+                ),
+                timestamp=timestamp,
+            )
+
+
+async def replay_decisions(
+    replay: QuoteReplay, side: OrderSide, trading_service: TradingService
+) -> Dict[str, float]:
+    """Decide the best market of the symbol after every quote"""
+    digest = hashlib.sha256()
+    decisions = 0
+    latencies = []
+    started = time.perf_counter()
+    async for entry in replay.play():
+        markets = replay.markets(entry.market.symbol)
+        decided = time.perf_counter()
+        try:
+            best = trading_service.find_best_market(markets, side)
+        except ValueError:
+            continue
+        latencies.append(time.perf_counter() - decided)
+        decisions += 1
+        digest.update(f"{entry.timestamp}:{best.exchange_id}\n".encode())
+    elapsed = time.perf_counter() - started
+    return {
+        "quotes": len(replay.entries),
+        "decisions": decisions,
+        "elapsed_s": elapsed,
+        "quotes_per_s": len(replay.entries) / elapsed if elapsed else 0.0,
+        "decision_p50_us": percentile(latencies, 50) * 1e6 if latencies else 0.0,
+        "decision_p99_us": percentile(latencies, 99) * 1e6 if latencies else 0.0,
+        "digest": digest.hexdigest()[:16],
+    }
+
+
+@click.command()
+@click.option("--tape", "tape_path", type=click.Path(dir_okay=False), required=True)
+@click.option(
+    "--generate",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Write a synthetic tape of this many quotes first",
+)
+@click.option(
+    "--speed",
+    type=float,
+    default=0.0,
+    help="Replay speed relative to the recording. 0 replays as fast as possible.",
+)
+@click.option("--side", type=click.Choice(["buy", "sell"]), default="buy")
+@click.option("--seed", type=int, default=None, help="Seed of the synthetic tape")
+@click.option("--json", "as_json", is_flag=True, help="Print results as JSON")
+def main(
+    tape_path: str,
+    generate: Optional[int],
+    speed: float,
+    side: str,
+    seed: Optional[int],
+    as_json: bool,
+):
+    """Replay a quote tape through the routing decision"""
+    logger = logging.getLogger(__name__)
+    if generate:
+        Path(tape_path).unlink(missing_ok=True)
+        generate_tape(Path(tape_path), generate, ["binance", "okx"], seed=seed)
+
+    started = time.perf_counter()
+    entries = load_tape(Path(tape_path))
+    load_s = time.perf_counter() - started
+
+    # NOTE: find_best_market logs every decision at info level. Keep it quiet for the measurement.
+    trading_logger = logging.getLogger("bench_replay.trading")
+    trading_logger.setLevel(logging.WARNING)
+    result = asyncio.run(
+        replay_decisions(
+            QuoteReplay(entries, logger=logger, speed=speed or None),
+            OrderSide(side),
+            TradingService(logger=trading_logger),
+        )
+    )
+    result["load_s"] = load_s
+
+    if as_json:
+        click.echo(json.dumps(result))
+        return
+    for key, value in result.items():
+        formatted = f"{value:.3f}" if isinstance(value, float) else value
+        click.echo(f"{key:<18} {formatted}")
+
+
+if __name__ == "__main__":
+    main()
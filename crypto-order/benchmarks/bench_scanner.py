@@ -0,0 +1,107 @@
+"""
+Best-market scan of many symbols: MarketScanner against find_best_market per symbol.
+
+    cd crypto-order
+    PYTHONPATH=src python -m benchmarks.bench_scanner --symbols 500 --exchanges 5
+"""
+
+import json
+import logging
+import random
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Callable, Dict, List
+
+import click
+
+from trading.domain.model.order import Market, OrderSide, Price, Symbol
+from trading.domain.service.market_scanner import MarketScanner
+from trading.domain.service.trading_service import TradingService
+
+from benchmarks.bench_latency import percentile
+
+
+def make_markets(symbols: int, exchanges: int, seed: int) -> Dict[Symbol, List[Market]]:
+    rng = random.Random(seed)
+    now = datetime.now()
+    markets = {}
+    for i in range(symbols):
+        symbol = Symbol(base=f"C{i}", quote="USDT")
+        markets[symbol] = []
+        for j in range(exchanges):
+            bid = Decimal(rng.randint(90000, 100000)) / 100
+            ask = bid + Decimal(rng.randint(1, 50)) / 100
+            markets[symbol].append(
+                Market(
+                    exchange_id=f"exchange{j}",
+                    symbol=symbol,
+                    best_bid=Price(amount=bid, timestamp=now),
+                    best_ask=Price(amount=ask, timestamp=now),
+                )
+            )
+    return markets
+
+
+def measure(operation: Callable[[], None], runs: int) -> List[float]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+@click.command()
+@click.option("--symbols", type=click.IntRange(min=1), default=500)
+@click.option("--exchanges", type=click.IntRange(min=1), default=5)
+@click.option("--runs", type=click.IntRange(min=1), default=50)
+@click.option("--seed", type=int, default=1)
+@click.option("--json", "as_json", is_flag=True, help="Print results as JSONL")
+def main(symbols: int, exchanges: int, runs: int, seed: int, as_json: bool):
+    """Compare a vectorized scan with a find_best_market loop over every symbol"""
+    markets = make_markets(symbols, exchanges, seed)
+    # NOTE: find_best_market logs every decision at info level. Keep it quiet for the measurement.
+    trading_logger = logging.getLogger("bench_scanner.trading")
+    trading_logger.setLevel(logging.WARNING)
+    trading_service = TradingService(logger=trading_logger)
+    scanner = MarketScanner([f"exchange{j}" for j in range(exchanges)])
+    all_markets = [m for symbol_markets in markets.values() for m in symbol_markets]
+    scanner.update_all(all_markets)
+
+    def find_best_markets() -> None:
+        for symbol_markets in markets.values():
+            trading_service.find_best_market(symbol_markets, OrderSide.BUY)
+            trading_service.find_best_market(symbol_markets, OrderSide.SELL)
+
+    cases = {
+        "find_best_market loop": find_best_markets,
+        "MarketScanner.scan": scanner.scan,
+        "MarketScanner.update_all": lambda: scanner.update_all(all_markets),
+    }
+    header = f"{'case':<28} {'p50 ms':>8} {'p99 ms':>8} {'symbols/s':>12}"
+    if not as_json:
+        click.echo(f"{symbols} symbols x {exchanges} exchanges")
+        click.echo(header)
+        click.echo("-" * len(header))
+    for name, operation in cases.items():
+        samples = measure(operation, runs)
+        p50 = percentile(samples, 50)
+        row = {
+            "name": name,
+            "symbols": symbols,
+            "exchanges": exchanges,
+            "p50_ms": p50 * 1000,
+            "p99_ms": percentile(samples, 99) * 1000,
+            "symbols_per_s": symbols / p50 if p50 else 0.0,
+        }
+        if as_json:
+            click.echo(json.dumps(row))
+        else:
+            click.echo(
+                f"{name:<28} {row['p50_ms']:>8.3f} {row['p99_ms']:>8.3f} {row['symbols_per_s']:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
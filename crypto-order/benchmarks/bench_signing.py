@@ -0,0 +1,129 @@
+"""
+Signed request build time per exchange: signing from scratch per request against the prepared signers.
+
+    cd crypto-order
+    PYTHONPATH=src python -m benchmarks.bench_signing --requests 20000
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict
+
+import click
+
+from trading.infrastructure.exchange.signing import (
+    BinanceRequestSigner,
+    OKXRequestSigner,
+)
+
+API_KEY = "vmPUZE6mv9SD5VNHk4HlWFsOr6aKE2zvsw0MuIgwCIPy6utIco14y7Ju91duEh8A"
+API_SECRET = "NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j"
+PASSPHRASE = "passphrase"
+
+
+def binance_params() -> Dict[str, Any]:
+    return {"symbol": "BTCUSDT", "side": "BUY", "type": "MARKET", "quantity": "0.5"}
+
+
+def okx_body() -> Dict[str, Any]:
+    return {
+        "instId": "BTC-USDT",
+        "tdMode": "cash",
+        "side": "buy",
+        "ordType": "market",
+        "sz": "0.5",
+        "tgtCcy": "base_ccy",
+    }
+
+
+def binance_from_scratch() -> None:
+    # NOTE: How BinanceAdapter signed orders before the prepared signer.
+    params = binance_params()
+    params["timestamp"] = int(time.time() * 1000)
+    query_string = "&".join([f"{k}={v}" for k, v in params.items()])
+    params["signature"] = hmac.new(
+        API_SECRET.encode("utf-8"), query_string.encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+    {"X-MBX-APIKEY": API_KEY}
+
+
+def okx_from_scratch() -> None:
+    # NOTE: How OKXAdapter signed orders before the prepared signer, serializing the body twice.
+    body = okx_body()
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    pre_hash = timestamp + "POST" + "/api/v5/trade/order" + json.dumps(body)
+    signature = base64.b64encode(
+        hmac.new(
+            API_SECRET.encode("utf-8"), pre_hash.encode("utf-8"), hashlib.sha256
+        ).digest()
+    ).decode("utf-8")
+    headers = {
+        "OK-ACCESS-KEY": API_KEY,
+        "OK-ACCESS-TIMESTAMP": timestamp,
+        "OK-ACCESS-PASSPHRASE": PASSPHRASE,
+        "OK-ACCESS-SIGN": signature,
+        "Content-Type": "application/json",
+    }
+    headers["x-simulated-trading"] = "1"
+    json.dumps(body)
+
+
+def measure(operation: Callable[[], None], requests: int, runs: int) -> float:
+    """Best seconds per request over runs"""
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        for _ in range(requests):
+            operation()
+        best = min(best, (time.perf_counter() - started) / requests)
+    return best
+
+
+@click.command()
+@click.option("--requests", type=click.IntRange(min=1), default=20000)
+@click.option("--runs", type=click.IntRange(min=1), default=5)
+@click.option("--json", "as_json", is_flag=True, help="Print results as JSONL")
+def main(requests: int, runs: int, as_json: bool):
+    """Compare building signed order requests from scratch with the prepared signers"""
+    binance = BinanceRequestSigner(API_KEY, API_SECRET)
+    okx = OKXRequestSigner(API_KEY, API_SECRET, PASSPHRASE)
+
+    def binance_prepared() -> None:
+        binance.sign(binance_params())
+
+    def okx_prepared() -> None:
+        okx.headers("POST", "/api/v5/trade/order", body=json.dumps(okx_body()))
+
+    cases = {
+        "binance": (binance_from_scratch, binance_prepared),
+        "okx": (okx_from_scratch, okx_prepared),
+    }
+    header = f"{'exchange':<10} {'scratch us':>11} {'prepared us':>12} {'speedup':>8}"
+    if not as_json:
+        click.echo(f"{requests} signed order requests, best of {runs} runs")
+        click.echo(header)
+        click.echo("-" * len(header))
+    for exchange, (scratch, prepared) in cases.items():
+        scratch_seconds = measure(scratch, requests, runs)
+        prepared_seconds = measure(prepared, requests, runs)
+        row = {
+            "exchange": exchange,
+            "scratch_us": scratch_seconds * 1e6,
+            "prepared_us": prepared_seconds * 1e6,
+            "speedup": scratch_seconds / prepared_seconds if prepared_seconds else 0.0,
+        }
+        if as_json:
+            click.echo(json.dumps(row))
+        else:
+            click.echo(
+                f"{exchange:<10} {row['scratch_us']:>11.2f} {row['prepared_us']:>12.2f} "
+                f"{row['speedup']:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
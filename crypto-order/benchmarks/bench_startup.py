@@ -0,0 +1,78 @@
+"""
+CLI cold-start benchmark. Each sample runs a fresh interpreter.
+
+    cd crypto-order
+    PYTHONPATH=src python -m benchmarks.bench_startup --runs 20
+
+Use `cli.py --profile-startup <command>` to see which imports a regression comes from.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import click
+
+from benchmarks.bench_latency import percentile
+
+CLI = str(Path(__file__).parent.parent / "src" / "trading" / "interface" / "cli.py")
+
+COMMANDS: Dict[str, List[str]] = {
+    "python (baseline)": [sys.executable, "-c", "pass"],
+    "import trading.interface.cli": [
+        sys.executable,
+        "-c",
+        "import trading.interface.cli",
+    ],
+    "cli.py --help": [sys.executable, CLI, "--help"],
+    "cli.py trade --help": [sys.executable, CLI, "trade", "--help"],
+}
+
+
+def measure(command: List[str], runs: int) -> List[float]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=os.environ.copy(),
+            check=True,
+        )
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+@click.command()
+@click.option("--runs", type=click.IntRange(min=1), default=10)
+@click.option("--json", "as_json", is_flag=True, help="Print results as JSONL")
+def main(runs: int, as_json: bool):
+    """Measure CLI cold-start time"""
+    header = f"{'command':<32} {'min ms':>8} {'p50 ms':>8} {'max ms':>8}"
+    if not as_json:
+        click.echo(header)
+        click.echo("-" * len(header))
+    for name, command in COMMANDS.items():
+        samples = measure(command, runs)
+        row = {
+            "name": name,
+            "runs": runs,
+            "min_ms": min(samples) * 1000,
+            "p50_ms": percentile(samples, 50) * 1000,
+            "max_ms": max(samples) * 1000,
+        }
+        if as_json:
+            click.echo(json.dumps(row))
+        else:
+            click.echo(
+                f"{name:<32} {row['min_ms']:>8.1f} {row['p50_ms']:>8.1f} {row['max_ms']:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+First-order latency after startup, with and without warming up the exchange connections.
+
+    cd crypto-order
+    PYTHONPATH=src python -m benchmarks.bench_warmup --runs 20 --connect-latency 0.05
+
+The mock exchanges add --connect-latency to the first request of every connection,
+standing in for the DNS, TCP and TLS setup that a cold start pays to the real venues.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from decimal import Decimal
+from typing import Dict, List
+
+import click
+
+from trading.application.dto.order_dto import OrderDTO
+from trading.application.service.trading_app_service import RoutingMode
+from trading.infrastructure.exchange.exchange_factory import (
+    DEFAULT_WARM_CONNECTIONS,
+    ExchangeFactory,
+)
+from trading.infrastructure.exchange.rate_limiter import RequestScheduler
+
+from benchmarks.bench_latency import SYMBOL, UNLIMITED, build_app_service, percentile
+from benchmarks.mock_exchange import FaultProfile, MockBinanceServer, MockOKXServer
+
+
+async def start_and_order(
+    configs: Dict[str, Dict[str, str]], connections: int, logger: logging.Logger
+) -> Dict[str, float]:
+    """Seconds to warm up, then to place the first and the second order on new adapters"""
+    scheduler = RequestScheduler(
+        logger=logger, limits={"binance": UNLIMITED, "okx": UNLIMITED}
+    )
+    exchanges = ExchangeFactory.create_all(configs, logger, scheduler)
+    async with ExchangeFactory.open_all(exchanges):
+        started = time.perf_counter()
+        await ExchangeFactory.warm_up_all(exchanges, connections, logger=logger)
+        warm_up = time.perf_counter() - started
+        app_service = build_app_service(exchanges, logger, RoutingMode.TOP_OF_BOOK)
+        seconds = {"warm_up": warm_up}
+        for name in ("first_order", "second_order"):
+            started = time.perf_counter()
+            result = await app_service.place_market_order(
+                OrderDTO(symbol=str(SYMBOL), side="buy", quantity=Decimal("1"))
+            )
+            if result.status != "filled":
+                raise click.ClickException(f"Order was not filled: {result}")
+            seconds[name] = time.perf_counter() - started
+        return seconds
+
+
+async def run_benchmarks(
+    runs: int, connections: int, profile: FaultProfile
+) -> List[Dict[str, float]]:
+    logger = logging.getLogger("benchmark")
+    async with MockBinanceServer(profile=profile) as binance, MockOKXServer(
+        profile=profile
+    ) as okx:
+        configs = {
+            "binance": binance.config(),
+            "okx": okx.config(fill_poll_initial_interval=0.005),
+        }
+        rows = []
+        for mode, warm_connections in (("cold", 0), ("warm", connections)):
+            samples = [
+                await start_and_order(configs, warm_connections, logger)
+                for _ in range(runs)
+            ]
+            row = {"mode": mode, "connections": warm_connections}
+            for name in ("warm_up", "first_order", "second_order"):
+                row[f"{name}_ms"] = (
+                    percentile([sample[name] for sample in samples], 50) * 1000
+                )
+            rows.append(row)
+        return rows
+
+
+@click.command()
+@click.option("--runs", type=click.IntRange(min=1), default=20)
+@click.option(
+    "--connections",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WARM_CONNECTIONS,
+    help="Connections warmed up per exchange",
+)
+@click.option(
+    "--connect-latency",
+    type=float,
+    default=0.05,
+    help="Setup time of every new connection in seconds",
+)
+@click.option("--latency", type=float, default=0.005, help="Server latency in seconds")
+@click.option("--json", "as_json", is_flag=True, help="Print results as JSONL")
+def main(
+    runs: int, connections: int, connect_latency: float, latency: float, as_json: bool
+):
+    """Compare the first order after startup on cold and on warmed-up connections"""
+    logging.basicConfig(level=logging.CRITICAL)
+    profile = FaultProfile(latency=latency, connect_latency=connect_latency)
+    rows = asyncio.run(run_benchmarks(runs, connections, profile))
+    header = f"{'mode':<6} {'connections':>11} {'warm-up ms':>11} {'1st order ms':>13} {'2nd order ms':>13}"
+    if not as_json:
+        click.echo(f"Median of {runs} startups")
+        click.echo(header)
+        click.echo("-" * len(header))
+    for row in rows:
+        if as_json:
+            click.echo(json.dumps(row))
+        else:
+            click.echo(
+                f"{row['mode']:<6} {row['connections']:>11} {row['warm_up_ms']:>11.2f} "
+                f"{row['first_order_ms']:>13.2f} {row['second_order_ms']:>13.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,442 @@
+"""
+Local stand-ins of the Binance and OKX REST APIs.
+They speak the endpoints used by the adapters, verify request signatures,
+and inject latency, jitter, stalls and errors so that the whole HTTP/JSON/signing path can be measured.
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import itertools
+import json
+import random
+import time
+import urllib.parse
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, Optional, Set, Tuple
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Levels of the book limit orders are matched against.
+MATCH_DEPTH = 100
+# Milliseconds a Binance request timestamp may lag the server clock by default.
+RECV_WINDOW = 5000
+
+
+@dataclass
+class FaultProfile:
+    """How a mock exchange misbehaves. Latencies are in seconds."""
+
+    latency: float = 0.0
+    # Latency is drawn uniformly from latency ± jitter.
+    jitter: float = 0.0
+    # Share of requests answered with error_status.
+    error_rate: float = 0.0
+    error_status: int = 500
+    # JSON body of the injected errors. None answers with an error object.
+    error_body: Any = None
+    # Share of requests held for stall seconds, e.g. to exercise deadlines and hedging.
+    stall_rate: float = 0.0
+    stall: float = 5.0
+    # Added to the first request of every connection, standing in for the DNS, TCP and TLS setup of a real venue.
+    connect_latency: float = 0.0
+
+
+class MockExchangeServer:
+    """Base of the mock exchanges. Subclasses add their routes in _routes."""
+
+    def __init__(
+        self,
+        api_secret: str = "secret",
+        profile: Optional[FaultProfile] = None,
+        bid: Decimal = Decimal("50000"),
+        ask: Decimal = Decimal("50010"),
+        level_size: Decimal = Decimal("1"),
+        seed: Optional[int] = None,
+        symbols: Tuple[Tuple[str, str], ...] = (("BTC", "USDT"), ("ETH", "USDT")),
+        lot_size: Decimal = Decimal("0.00001"),
+        clock_offset: float = 0.0,
+    ):
+        self.api_secret = api_secret
+        # (base, quote) pairs listed by the exchange.
+        self.symbols = symbols
+        # Step and minimum of order quantities of every symbol.
+        self.lot_size = lot_size
+        # Seconds the exchange clock is ahead of the local one.
+        self.clock_offset = clock_offset
+        self.profile = profile or FaultProfile()
+        self.bid = bid
+        self.ask = ask
+        self.level_size = level_size
+        self.requests: Dict[str, int] = {}
+        # Client addresses of the connections accepted so far.
+        self.connections: Set[Any] = set()
+        self.__random = random.Random(seed)
+        self.__server: Optional[TestServer] = None
+
+    @property
+    def url(self) -> str:
+        return str(self.__server.make_url("")).rstrip("/")
+
+    def config(self, **overrides) -> Dict[str, str]:
+        """Adapter config pointing at this server"""
+        config = {
+            "api_key": "key",
+            "api_secret": self.api_secret,
+            "api_passphrase": "passphrase",
+            "base_url": self.url,
+        }
+        config.update(overrides)
+        return config
+
+    async def start(self) -> None:
+        app = web.Application(middlewares=[self._faults])
+        self._routes(app)
+        self.__server = TestServer(app)
+        await self.__server.start_server()
+
+    async def close(self) -> None:
+        if self.__server is not None:
+            await self.__server.close()
+
+    async def __aenter__(self) -> "MockExchangeServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _routes(self, app: web.Application) -> None:
+        raise NotImplementedError
+
+    @web.middleware
+    async def _faults(self, request: web.Request, handler):
+        key = f"{request.method} {request.path}"
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+        profile = self.profile
+        delay = max(
+            profile.latency + self.__random.uniform(-profile.jitter, profile.jitter), 0
+        )
+        if self.__random.random() < profile.stall_rate:
+            delay += profile.stall
+        peer = request.transport.get_extra_info("peername")
+        if peer not in self.connections:
+            self.connections.add(peer)
+            delay += profile.connect_latency
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.__random.random() < profile.error_rate:
+            body = profile.error_body
+            if body is None:
+                body = {"code": "50001", "msg": "Injected error"}
+            return web.json_response(body, status=profile.error_status)
+        return await handler(request)
+
+    def _now(self) -> float:
+        return time.time() + self.clock_offset
+
+    def _levels(self, depth: int):
+        tick = Decimal("1")
+        bids = [(self.bid - tick * i, self.level_size) for i in range(depth)]
+        asks = [(self.ask + tick * i, self.level_size) for i in range(depth)]
+        return bids, asks
+
+    def _match(
+        self, side: str, quantity: Decimal, limit_price: Optional[Decimal]
+    ) -> Tuple[Decimal, Optional[Decimal]]:
+        """
+        Filled quantity and average price of an order taking the book levels up to limit_price.
+        Market orders fill the whole quantity at the top of the book.
+        """
+        if limit_price is None:
+            return quantity, self.ask if side == "buy" else self.bid
+        bids, asks = self._levels(MATCH_DEPTH)
+        filled = Decimal("0")
+        notional = Decimal("0")
+        for price, size in asks if side == "buy" else bids:
+            if (price > limit_price) if side == "buy" else (price < limit_price):
+                break
+            take = min(size, quantity - filled)
+            filled += take
+            notional += take * price
+            if filled >= quantity:
+                break
+        return filled, (notional / filled if filled else None)
+
+
+class MockBinanceServer(MockExchangeServer):
+    """Binance spot REST API: bookTicker, depth, and orders matched against the depth at once"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__order_ids = itertools.count(1)
+
+    def _routes(self, app: web.Application) -> None:
+        app.router.add_get("/api/v3/ping", self._ping)
+        app.router.add_get("/api/v3/time", self._time)
+        app.router.add_get("/api/v3/exchangeInfo", self._exchange_info)
+        app.router.add_get("/api/v3/ticker/bookTicker", self._book_ticker)
+        app.router.add_get("/api/v3/depth", self._depth)
+        app.router.add_post("/api/v3/order", self._order)
+
+    async def _ping(self, request: web.Request) -> web.Response:
+        return web.json_response({})
+
+    async def _time(self, request: web.Request) -> web.Response:
+        return web.json_response({"serverTime": int(self._now() * 1000)})
+
+    async def _exchange_info(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "timezone": "UTC",
+                "symbols": [
+                    {
+                        "symbol": base + quote,
+                        "status": "TRADING",
+                        "baseAsset": base,
+                        "quoteAsset": quote,
+                        "filters": [
+                            {"filterType": "PRICE_FILTER", "tickSize": "0.01000000"},
+                            {
+                                "filterType": "LOT_SIZE",
+                                "minQty": str(self.lot_size),
+                                "maxQty": "9000.00000000",
+                                "stepSize": str(self.lot_size),
+                            },
+                            {"filterType": "NOTIONAL", "minNotional": "5.00000000"},
+                        ],
+                    }
+                    for base, quote in self.symbols
+                ],
+            }
+        )
+
+    async def _book_ticker(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "symbol": request.query["symbol"],
+                "bidPrice": str(self.bid),
+                "bidQty": str(self.level_size),
+                "askPrice": str(self.ask),
+                "askQty": str(self.level_size),
+            }
+        )
+
+    async def _depth(self, request: web.Request) -> web.Response:
+        bids, asks = self._levels(int(request.query.get("limit", 100)))
+        return web.json_response(
+            {
+                "lastUpdateId": 1,
+                "bids": [[str(p), str(q)] for p, q in bids],
+                "asks": [[str(p), str(q)] for p, q in asks],
+            }
+        )
+
+    async def _order(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        query_string = "&".join(f"{k}={v}" for k, v in form.items() if k != "signature")
+        expected = hmac.new(
+            self.api_secret.encode("utf-8"),
+            query_string.encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+        if form.get("signature") != expected:
+            return web.json_response(
+                {"code": -1022, "msg": "Signature for this request is not valid."},
+                status=400,
+            )
+        # Ref: https://developers.binance.com/docs/binance-spot-api-docs/rest-api/endpoint-security-type#timing-security
+        server_time = int(self._now() * 1000)
+        timestamp = int(form["timestamp"])
+        recv_window = int(form.get("recvWindow", RECV_WINDOW))
+        if timestamp >= server_time + 1000 or server_time - timestamp > recv_window:
+            return web.json_response(
+                {
+                    "code": -1021,
+                    "msg": "Timestamp for this request is outside of the recvWindow.",
+                },
+                status=400,
+            )
+        quantity = Decimal(form["quantity"])
+        time_in_force = form.get("timeInForce")
+        filled, price = self._match(
+            form["side"].lower(),
+            quantity,
+            Decimal(form["price"]) if form["type"] == "LIMIT" else None,
+        )
+        if time_in_force == "FOK" and filled < quantity:
+            filled = Decimal("0")
+        if filled >= quantity:
+            status = "FILLED"
+        elif time_in_force in ("IOC", "FOK"):
+            status = "EXPIRED"
+        else:
+            status = "PARTIALLY_FILLED" if filled else "NEW"
+        return web.json_response(
+            {
+                "symbol": form["symbol"],
+                "orderId": next(self.__order_ids),
+                "status": status,
+                "executedQty": str(filled),
+                "cummulativeQuoteQty": str(filled * price) if filled else "0",
+                "fills": (
+                    [{"price": str(price), "qty": str(filled)}] if filled else []
+                ),
+            }
+        )
+
+
+class MockOKXServer(MockExchangeServer):
+    """OKX v5 REST API: ticker, books, and orders matched against the books after fill_delay seconds"""
+
+    def __init__(self, *args, fill_delay: float = 0.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fill_delay = fill_delay
+        self.__order_ids = itertools.count(1)
+        self.__orders: Dict[str, dict] = {}
+
+    def _routes(self, app: web.Application) -> None:
+        app.router.add_get("/api/v5/public/time", self._time)
+        app.router.add_get("/api/v5/public/instruments", self._instruments)
+        app.router.add_get("/api/v5/market/ticker", self._ticker)
+        app.router.add_get("/api/v5/market/books", self._books)
+        app.router.add_post("/api/v5/trade/order", self._place_order)
+        app.router.add_get("/api/v5/trade/order", self._order_details)
+
+    def _is_signed(self, request: web.Request, payload: str) -> bool:
+        timestamp = request.headers.get("OK-ACCESS-TIMESTAMP", "")
+        pre_hash = timestamp + request.method + request.path + payload
+        expected = base64.b64encode(
+            hmac.new(
+                self.api_secret.encode("utf-8"),
+                pre_hash.encode("utf-8"),
+                hashlib.sha256,
+            ).digest()
+        ).decode("utf-8")
+        return request.headers.get("OK-ACCESS-SIGN") == expected
+
+    async def _time(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"code": "0", "msg": "", "data": [{"ts": str(int(self._now() * 1000))}]}
+        )
+
+    async def _instruments(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "code": "0",
+                "msg": "",
+                "data": [
+                    {
+                        "instType": "SPOT",
+                        "instId": f"{base}-{quote}",
+                        "baseCcy": base,
+                        "quoteCcy": quote,
+                        "lotSz": str(self.lot_size),
+                        "minSz": str(self.lot_size),
+                        "tickSz": "0.1",
+                        "state": "live",
+                    }
+                    for base, quote in self.symbols
+                ],
+            }
+        )
+
+    async def _ticker(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "code": "0",
+                "msg": "",
+                "data": [
+                    {
+                        "instId": request.query["instId"],
+                        "bidPx": str(self.bid),
+                        "bidSz": str(self.level_size),
+                        "askPx": str(self.ask),
+                        "askSz": str(self.level_size),
+                    }
+                ],
+            }
+        )
+
+    async def _books(self, request: web.Request) -> web.Response:
+        bids, asks = self._levels(int(request.query.get("sz", 1)))
+        return web.json_response(
+            {
+                "code": "0",
+                "msg": "",
+                "data": [
+                    {
+                        "bids": [[str(p), str(q), "0", "1"] for p, q in bids],
+                        "asks": [[str(p), str(q), "0", "1"] for p, q in asks],
+                    }
+                ],
+            }
+        )
+
+    async def _place_order(self, request: web.Request) -> web.Response:
+        text = await request.text()
+        if not self._is_signed(request, text):
+            return web.json_response(
+                {"code": "50113", "msg": "Invalid Sign", "data": []}, status=401
+            )
+        body = json.loads(text)
+        quantity = Decimal(body["sz"])
+        if quantity <= 0:
+            # NOTE: OKX fails the request and tells why the order was rejected in sCode and sMsg.
+            return web.json_response(
+                {
+                    "code": "1",
+                    "msg": "All operations failed",
+                    "data": [
+                        {"ordId": "", "sCode": "51000", "sMsg": "Parameter sz error"}
+                    ],
+                }
+            )
+        order_id = str(next(self.__order_ids))
+        filled, price = self._match(
+            body["side"], quantity, Decimal(body["px"]) if "px" in body else None
+        )
+        if body["ordType"] == "fok" and filled < quantity:
+            filled = Decimal("0")
+        if filled >= quantity:
+            state = "filled"
+        elif body["ordType"] in ("ioc", "fok"):
+            state = "canceled"
+        else:
+            state = "partially_filled" if filled else "live"
+        self.__orders[order_id] = {
+            "ordId": order_id,
+            "instId": body["instId"],
+            "side": body["side"],
+            "ordType": body["ordType"],
+            "px": body.get("px", ""),
+            "sz": body["sz"],
+            "accFillSz": str(filled),
+            "avgPx": str(price) if filled else "",
+            "state": state,
+            "cTime": str(int(time.time() * 1000)),
+            "filled_at": time.monotonic() + self.fill_delay,
+        }
+        return web.json_response(
+            {"code": "0", "msg": "", "data": [{"ordId": order_id, "sCode": "0"}]}
+        )
+
+    async def _order_details(self, request: web.Request) -> web.Response:
+        query = "?" + urllib.parse.urlencode(dict(request.query))
+        if not self._is_signed(request, query):
+            return web.json_response(
+                {"code": "50113", "msg": "Invalid Sign", "data": []}, status=401
+            )
+        order = self.__orders.get(request.query["ordId"])
+        if order is None:
+            return web.json_response(
+                {"code": "51603", "msg": "Order does not exist", "data": []}
+            )
+        data = {k: v for k, v in order.items() if k != "filled_at"}
+        if time.monotonic() < order["filled_at"]:
+            data.update(state="live", accFillSz="0", avgPx="")
+        return web.json_response({"code": "0", "msg": "", "data": [data]})
@@ -2,7 +2,6 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional
 
-
 # Points
 # - Hides domain complexity so the depandants don't need to create domain models. e.g., symbol is str. side is str.
 # - maintain invariant checks in the DTO class.
@@ -20,6 +19,12 @@ class OrderDTO:
     status: Optional[str] = None
     filled_price: Optional[Decimal] = None
     error: Optional[str] = None
+    filled_quantity: Optional[Decimal] = None
+    # market, limit, ioc or fok.
+    order_type: str = "market"
+    # Limit orders: how far the limit price may be from the routed quote. Defaults to the service setting.
+    max_slippage_bps: Optional[Decimal] = None
+    limit_price: Optional[Decimal] = None
 
     def __post_init__(self):
         """Validate DTO fields after initialization"""
@@ -28,3 +33,11 @@ class OrderDTO:
 
         if self.quantity <= Decimal("0"):
             raise ValueError("Quantity must be positive")
+
+        if self.order_type.lower() not in ("market", "limit", "ioc", "fok"):
+            raise ValueError(
+                f"Order type must be 'market', 'limit', 'ioc' or 'fok': {self.order_type}"
+            )
+
+        if self.max_slippage_bps is not None and self.max_slippage_bps < Decimal("0"):
+            raise ValueError("Max slippage must not be negative")
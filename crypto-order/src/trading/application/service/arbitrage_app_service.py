@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional, Sequence
+
+from trading.domain.model.instrument import InstrumentIndex
+from trading.domain.model.order import Order, OrderSide, OrderStatus, Symbol
+from trading.domain.repository.exchange_repository import ExchangeRepository
+from trading.domain.repository.market_repository import MarketRepository
+from trading.domain.service.arbitrage_detector import (
+    ArbitrageDetector,
+    ArbitrageOpportunity,
+)
+
+
+@dataclass(frozen=True)
+class ArbitrageLeg:
+    """Result of one side of an arbitrage"""
+
+    order: Order
+    # Quoted price the opportunity was detected at.
+    expected_price: Decimal
+    # Seconds from submitting the order to its result.
+    latency: float
+
+    @property
+    def filled(self) -> bool:
+        return self.order.status == OrderStatus.FILLED
+
+    @property
+    def filled_quantity(self) -> Decimal:
+        """Quantity the leg executed, including what a partially filled order filled"""
+        if self.order.status == OrderStatus.FILLED:
+            return self.order.filled_quantity or self.order.quantity
+        if self.order.status == OrderStatus.PARTIALLY_FILLED:
+            return self.order.filled_quantity or Decimal("0")
+        return Decimal("0")
+
+    @property
+    def slippage_bps(self) -> Optional[Decimal]:
+        """Fill price worse than the quote in basis points. Negative when the fill was better."""
+        if self.order.filled_price is None:
+            return None
+        slippage = self.order.filled_price - self.expected_price
+        if self.order.side == OrderSide.SELL:
+            slippage = -slippage
+        return slippage / self.expected_price * 10000
+
+
+@dataclass(frozen=True)
+class ArbitrageResult:
+    id: str
+    opportunity: ArbitrageOpportunity
+    buy: ArbitrageLeg
+    sell: ArbitrageLeg
+    # Quote currency earned after fees on the quantity both legs filled. None unless both legs filled some.
+    realized_profit: Optional[Decimal]
+
+    @property
+    def hedged(self) -> bool:
+        """Both legs filled the same quantity, possibly none, leaving no open position"""
+        return self.buy.filled_quantity == self.sell.filled_quantity
+
+
+class ArbitrageAppService:
+    """Application service detecting crossed markets and trading both sides of them"""
+
+    def __init__(
+        self,
+        detector: ArbitrageDetector,
+        market_repository: MarketRepository,
+        exchange_repository: ExchangeRepository,
+        logger: logging.Logger,
+        instruments: Optional[InstrumentIndex] = None,
+    ):
+        self.detector = detector
+        self.market_repository = market_repository
+        self.exchange_repository = exchange_repository
+        self.logger = logger
+        self.instruments = instruments or InstrumentIndex()
+
+    async def find_opportunities(
+        self, symbols: Sequence[Symbol]
+    ) -> List[ArbitrageOpportunity]:
+        """Opportunities among the current quotes of symbols, most profitable first"""
+        results = await asyncio.gather(
+            *[self.market_repository.get_all_markets(symbol) for symbol in symbols],
+            return_exceptions=True,
+        )
+        opportunities = []
+        for symbol, markets in zip(symbols, results):
+            if isinstance(markets, Exception):
+                self.logger.warning(f"Failed to get quotes of {symbol}: {str(markets)}")
+                continue
+            opportunity = self.detector.find_opportunity(markets)
+            if opportunity is not None:
+                opportunities.append(opportunity)
+        return sorted(opportunities, key=lambda o: o.net_profit_bps, reverse=True)
+
+    def _quantity(
+        self, opportunity: ArbitrageOpportunity, quantity: Decimal
+    ) -> Decimal:
+        # NOTE: Both legs need the same quantity, so normalize for one exchange, then the other.
+        for exchange_id in (opportunity.buy_exchange_id, opportunity.sell_exchange_id):
+            quantity = self.instruments.normalize_quantity(
+                exchange_id, opportunity.symbol, quantity
+            )
+        return quantity
+
+    def _proceeds(self, order: Order, quantity: Decimal) -> Decimal:
+        """Quote currency received for quantity of a filled order after fees, negative for buys"""
+        notional = order.filled_price * quantity
+        fee = notional * self.detector.fee(order.exchange_id)
+        return notional - fee if order.side == OrderSide.SELL else -notional - fee
+
+    async def _place_leg(self, order: Order, expected_price: Decimal) -> ArbitrageLeg:
+        order.quote_price = expected_price
+        started = time.perf_counter()
+        try:
+            result = await self.exchange_repository.place_order(order)
+        except Exception as e:
+            self.logger.error(
+                f"Arbitrage {order.side.value} leg on {order.exchange_id} failed: {str(e)}"
+            )
+            order.fail(str(e))
+            result = order
+        return ArbitrageLeg(
+            order=result,
+            expected_price=expected_price,
+            latency=time.perf_counter() - started,
+        )
+
+    async def execute(
+        self, opportunity: ArbitrageOpportunity, quantity: Decimal
+    ) -> ArbitrageResult:
+        """Buy and sell quantity on the two exchanges of opportunity concurrently"""
+        arbitrage_id = str(uuid.uuid4())
+        quantity = self._quantity(opportunity, quantity)
+
+        def _order(side: OrderSide, exchange_id: str) -> Order:
+            return Order(
+                id=str(uuid.uuid4()),
+                symbol=opportunity.symbol,
+                side=side,
+                quantity=quantity,
+                status=OrderStatus.PENDING,
+                created_at=datetime.now(),
+                exchange_id=exchange_id,
+                # NOTE: Journaled legs are found together by the arbitrage id.
+                parent_id=arbitrage_id,
+            )
+
+        buy, sell = await asyncio.gather(
+            self._place_leg(
+                _order(OrderSide.BUY, opportunity.buy_exchange_id),
+                opportunity.buy_price,
+            ),
+            self._place_leg(
+                _order(OrderSide.SELL, opportunity.sell_exchange_id),
+                opportunity.sell_price,
+            ),
+        )
+
+        realized_profit = None
+        # NOTE: Only the quantity both legs filled is a round trip. The rest is an open position.
+        hedged_quantity = min(buy.filled_quantity, sell.filled_quantity)
+        if (
+            hedged_quantity > 0
+            and buy.order.filled_price is not None
+            and sell.order.filled_price is not None
+        ):
+            realized_profit = self._proceeds(
+                sell.order, hedged_quantity
+            ) + self._proceeds(buy.order, hedged_quantity)
+        result = ArbitrageResult(
+            id=arbitrage_id,
+            opportunity=opportunity,
+            buy=buy,
+            sell=sell,
+            realized_profit=realized_profit,
+        )
+        for leg in (buy, sell):
+            self.logger.info(
+                f"Arbitrage {arbitrage_id} {leg.order.side.value} on {leg.order.exchange_id}: "
+                f"{leg.order.status.value} at {leg.order.filled_price}, "
+                f"latency {leg.latency * 1000:.1f} ms, slippage {leg.slippage_bps} bps"
+            )
+        if not result.hedged:
+            # NOTE: Unwinding is left to the trader, since the right price to do it at is a judgement call.
+            self.logger.error(
+                f"Arbitrage {arbitrage_id} is unhedged: bought {buy.filled_quantity}, "
+                f"sold {sell.filled_quantity}"
+            )
+        return result
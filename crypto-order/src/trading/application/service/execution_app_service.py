@@ -0,0 +1,149 @@
+import asyncio
+import dataclasses
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import AsyncIterator, List, Optional, Sequence
+
+from trading.application.dto.order_dto import OrderDTO
+from trading.domain.model.instrument import InstrumentIndex
+from trading.domain.model.order import Order, OrderEvent, OrderSide, OrderStatus
+from trading.domain.repository.exchange_repository import ExchangeRepository
+from trading.domain.repository.market_repository import MarketRepository
+from trading.domain.repository.order_journal_repository import OrderJournalRepository
+from trading.domain.service.execution_scheduler import ScheduledSlice
+from trading.domain.service.trading_service import TradingService
+
+
+@dataclass(frozen=True)
+class ExecutionProgress:
+    """State of a scheduled execution after one of its slices"""
+
+    slice: ScheduledSlice
+    slices: int
+    # None when earlier slices already filled the quantity due.
+    child: Optional[Order]
+    # Snapshot of the parent order. Its status is final after the last slice.
+    parent: Order
+
+    @property
+    def filled_quantity(self) -> Decimal:
+        return self.parent.filled_quantity or Decimal(0)
+
+    @property
+    def remaining_quantity(self) -> Decimal:
+        return self.parent.quantity - self.filled_quantity
+
+
+class ExecutionAppService:
+    """Application service working a parent order as child orders on a schedule"""
+
+    def __init__(
+        self,
+        trading_service: TradingService,
+        market_repository: MarketRepository,
+        exchange_repository: ExchangeRepository,
+        logger: logging.Logger,
+        instruments: Optional[InstrumentIndex] = None,
+        order_journal: Optional[OrderJournalRepository] = None,
+    ):
+        self.trading_service = trading_service
+        self.market_repository = market_repository
+        self.exchange_repository = exchange_repository
+        self.logger = logger
+        self.instruments = instruments or InstrumentIndex()
+        self.order_journal = order_journal
+
+    async def _journal(self, order: Order, latency: Optional[float] = None) -> None:
+        if self.order_journal is not None:
+            await self.order_journal.append(OrderEvent.of(order, latency=latency))
+
+    async def _place_slice(self, child: Order) -> Order:
+        # NOTE: Route every slice on fresh quotes. The best exchange changes over the horizon.
+        try:
+            markets = await self.market_repository.get_all_markets(child.symbol)
+            best_market = self.trading_service.find_best_market(markets, child.side)
+            child.exchange_id = best_market.exchange_id
+            child.quote_price = self.trading_service.quote_price(
+                best_market, child.side
+            )
+            return await self.exchange_repository.place_order(child)
+        except Exception as e:
+            self.logger.error(f"Slice {child.id} failed: {str(e)}")
+            child.fail(str(e))
+            return child
+
+    async def execute(
+        self, order_dto: OrderDTO, schedule: Sequence[ScheduledSlice]
+    ) -> AsyncIterator[ExecutionProgress]:
+        """
+        Place the slices of schedule as they fall due, yielding the progress after each.
+        Quantity a slice didn't fill, e.g. after a failure or lot size rounding, is added to the next slice.
+        """
+        parent = Order(
+            id=str(uuid.uuid4()),
+            symbol=self.instruments.resolve(order_dto.symbol),
+            side=OrderSide(order_dto.side.lower()),
+            quantity=order_dto.quantity,
+            status=OrderStatus.PENDING,
+            created_at=datetime.now(),
+            filled_quantity=Decimal(0),
+        )
+        await self._journal(parent)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        started_perf = time.perf_counter()
+        due_quantity = Decimal(0)
+        notional = Decimal(0)
+        errors: List[str] = []
+        for index, scheduled in enumerate(schedule):
+            # NOTE: Sleep until the offset from the start rather than for the interval, so that delays don't add up.
+            delay = started + scheduled.offset - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            due_quantity += scheduled.quantity
+            if index == len(schedule) - 1:
+                due_quantity = parent.quantity
+            quantity = due_quantity - parent.filled_quantity
+            child = None
+            if quantity > 0:
+                child = await self._place_slice(
+                    Order(
+                        id=str(uuid.uuid4()),
+                        symbol=parent.symbol,
+                        side=parent.side,
+                        quantity=quantity,
+                        status=OrderStatus.PENDING,
+                        created_at=datetime.now(),
+                        parent_id=parent.id,
+                    )
+                )
+                if child.status == OrderStatus.FAILED:
+                    errors.append(child.error)
+                elif child.filled_price is not None:
+                    filled = child.filled_quantity or child.quantity
+                    parent.filled_quantity += filled
+                    notional += filled * child.filled_price
+                    parent.filled_price = notional / parent.filled_quantity
+
+            if index == len(schedule) - 1:
+                if parent.filled_quantity >= parent.quantity:
+                    parent.status = OrderStatus.FILLED
+                elif parent.filled_quantity > 0:
+                    parent.status = OrderStatus.PARTIALLY_FILLED
+                else:
+                    parent.status = OrderStatus.FAILED
+                if errors:
+                    parent.error = "; ".join(errors)
+                await self._journal(parent, latency=time.perf_counter() - started_perf)
+            yield ExecutionProgress(
+                slice=scheduled,
+                slices=len(schedule),
+                child=child,
+                parent=dataclasses.replace(parent),
+            )
@@ -1,15 +1,43 @@
-from typing import List
+import asyncio
+import time
+from enum import Enum
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
 import uuid
 import traceback
 import logging
 from datetime import datetime
+from decimal import Decimal
 
 from trading.domain.service.trading_service import TradingService
-from trading.domain.model.order import Market, Order, OrderSide, Symbol
+from trading.domain.service.order_router import SmartOrderRouter
+from trading.domain.model.instrument import InstrumentIndex
+from trading.domain.model.order import (
+    Market,
+    Order,
+    OrderEvent,
+    OrderSide,
+    OrderType,
+    Symbol,
+)
+from trading.domain.model.order_book import OrderBook
 from trading.domain.repository.market_repository import MarketRepository
 from trading.application.dto.order_dto import OrderDTO
 from trading.domain.model.order import OrderStatus
 from trading.domain.repository.exchange_repository import ExchangeRepository
+from trading.domain.repository.order_journal_repository import OrderJournalRepository
+
+DEFAULT_DEPTH = 20
+DEFAULT_BATCH_CONCURRENCY = 10
+DEFAULT_MAX_SLIPPAGE_BPS = Decimal("10")
+
+
+class RoutingMode(Enum):
+    # Route on the best top-of-book price.
+    TOP_OF_BOOK = "top_of_book"
+    # Route on the volume-weighted fill price of the order quantity.
+    DEPTH = "depth"
+    # Split the quantity across exchanges by available depth.
+    SPLIT = "split"
 
 
 class TradingAppService:
@@ -21,17 +49,165 @@ class TradingAppService:
         market_repository: MarketRepository,
         exchange_repository: ExchangeRepository,
         logger: logging.Logger,
+        routing_mode: RoutingMode = RoutingMode.TOP_OF_BOOK,
+        depth: int = DEFAULT_DEPTH,
+        order_router: Optional[SmartOrderRouter] = None,
+        instruments: Optional[InstrumentIndex] = None,
+        order_journal: Optional[OrderJournalRepository] = None,
+        max_slippage_bps: Decimal = DEFAULT_MAX_SLIPPAGE_BPS,
     ):
         self.trading_service = trading_service
         self.market_repository = market_repository
         self.exchange_repository = exchange_repository
         self.logger = logger
+        self.routing_mode = routing_mode
+        self.depth = depth
+        self.order_router = order_router or SmartOrderRouter(logger=logger)
+        self.instruments = instruments or InstrumentIndex()
+        self.order_journal = order_journal
+        self.max_slippage_bps = max_slippage_bps
+
+    async def _journal(
+        self,
+        order: Order,
+        order_id: Optional[str] = None,
+        latency: Optional[float] = None,
+    ) -> None:
+        if self.order_journal is not None:
+            await self.order_journal.append(
+                OrderEvent.of(order, order_id=order_id, latency=latency)
+            )
+
+    async def _route(self, order: Order) -> Tuple[str, List[Market]]:
+        """Best exchange of the order, and the quotes of all exchanges for pricing and re-routing"""
+        if self.routing_mode == RoutingMode.DEPTH:
+            order_books: List[OrderBook] = (
+                await self.market_repository.get_all_order_books(
+                    order.symbol, self.depth
+                )
+            )
+            self.logger.debug(f"Order books: {order_books}")
+            best_book = self.trading_service.find_best_order_book(
+                order_books, order.side, order.quantity
+            )
+            return best_book.exchange_id, [book.to_market() for book in order_books]
+
+        # Get market data
+        markets: List[Market] = await self.market_repository.get_all_markets(
+            order.symbol
+        )
+        self.logger.debug(f"Markets: {markets}")
+
+        # Find best market
+        best_market = self.trading_service.find_best_market(markets, order.side)
+        return best_market.exchange_id, markets
+
+    def _should_reroute(self, result: Order) -> bool:
+        # NOTE: Only orders that are done with their exchange. A resting limit order may still fill.
+        if result.status == OrderStatus.PARTIALLY_FILLED:
+            return True
+        return result.status == OrderStatus.FAILED and result.order_type in (
+            OrderType.IOC,
+            OrderType.FOK,
+        )
+
+    async def _reroute(
+        self, order: Order, result: Order, markets: List[Market]
+    ) -> Order:
+        """Place what the best market didn't fill on the next-best markets within the limit price"""
+        results = [result]
+        remaining = order.quantity - (result.filled_quantity or Decimal("0"))
+        candidates = self.trading_service.rank_markets(
+            [m for m in markets if m.exchange_id != order.exchange_id], order.side
+        )
+        for market in candidates:
+            if remaining <= 0:
+                break
+            if (
+                order.limit_price is not None
+                and not self.trading_service.is_within_limit(
+                    market, order.side, order.limit_price
+                )
+            ):
+                self.logger.info(
+                    f"{market.exchange_id} is quoted beyond the limit price {order.limit_price}"
+                )
+                break
+            self.logger.info(
+                f"Re-routing {remaining} of order {order.id} to {market.exchange_id}"
+            )
+            child = await self._place_child_order(
+                Order(
+                    id=str(uuid.uuid4()),
+                    symbol=order.symbol,
+                    side=order.side,
+                    quantity=remaining,
+                    status=OrderStatus.PENDING,
+                    created_at=datetime.now(),
+                    exchange_id=market.exchange_id,
+                    parent_id=order.id,
+                    order_type=order.order_type,
+                    limit_price=order.limit_price,
+                    quote_price=self.trading_service.quote_price(market, order.side),
+                )
+            )
+            results.append(child)
+            if child.status == OrderStatus.FILLED:
+                remaining = Decimal("0")
+            elif child.status == OrderStatus.PARTIALLY_FILLED:
+                remaining -= child.filled_quantity or Decimal("0")
+        return self.order_router.aggregate(order, results)
+
+    async def _place_child_order(self, child: Order) -> Order:
+        try:
+            return await self.exchange_repository.place_order(child)
+        except Exception as e:
+            self.logger.error(f"Child order on {child.exchange_id} failed: {str(e)}")
+            child.fail(str(e))
+            return child
+
+    async def _place_split_order(
+        self, order: Order, max_slippage_bps: Decimal
+    ) -> Order:
+        order_books: List[OrderBook] = await self.market_repository.get_all_order_books(
+            order.symbol, self.depth
+        )
+        allocations = self.order_router.split(order_books, order.side, order.quantity)
+        limit_prices = {}
+        if order.order_type != OrderType.MARKET:
+            # NOTE: Each child is protected from the top of its own exchange's book.
+            limit_prices = {
+                book.exchange_id: self.trading_service.limit_price(
+                    book.to_market(), order.side, max_slippage_bps
+                )
+                for book in order_books
+                if book.exchange_id in allocations
+            }
+        children = self.order_router.create_child_orders(
+            order, allocations, limit_prices
+        )
+        books = {book.exchange_id: book for book in order_books}
+        for child in children:
+            child.quote_price = self.trading_service.quote_price(
+                books[child.exchange_id].to_market(), order.side
+            )
+        # Place child orders on all exchanges concurrently.
+        results = await asyncio.gather(
+            *[self._place_child_order(child) for child in children]
+        )
+        for result in results:
+            self.logger.info(
+                f"Child order {result.id} on {result.exchange_id}: {result.status.value} at {result.filled_price}"
+            )
+        return self.order_router.aggregate(order, list(results))
 
     async def place_market_order(self, order_dto: OrderDTO) -> OrderDTO:
         """Place a market order"""
+        order = None
+        started = time.perf_counter()
         try:
             # Create domain objects from simple DTO.
-            symbol = Symbol(base=order_dto.symbol[:3], quote=order_dto.symbol[3:])
+            symbol = self.instruments.resolve(order_dto.symbol)
 
             order = Order(
                 id=str(uuid.uuid4()),
@@ -40,17 +216,37 @@ class TradingAppService:
                 quantity=order_dto.quantity,
                 status=OrderStatus.PENDING,
                 created_at=datetime.now(),
+                order_type=OrderType(order_dto.order_type.lower()),
+            )
+            await self._journal(order)
+            max_slippage_bps = (
+                order_dto.max_slippage_bps
+                if order_dto.max_slippage_bps is not None
+                else self.max_slippage_bps
             )
 
-            # Get market data
-            markets: List[Market] = await self.market_repository.get_all_markets(symbol)
-            self.logger.debug(f"Markets: {markets}")
-
-            # Find best market
-            best_market = self.trading_service.find_best_market(markets, order.side)
-            order.exchange_id = best_market.exchange_id
-            # Place order on selected exchange
-            result = await self.exchange_repository.place_order(order)
+            if self.routing_mode == RoutingMode.SPLIT:
+                result = await self._place_split_order(order, max_slippage_bps)
+            else:
+                order.exchange_id, markets = await self._route(order)
+                best_market = next(
+                    m for m in markets if m.exchange_id == order.exchange_id
+                )
+                order.quote_price = self.trading_service.quote_price(
+                    best_market, order.side
+                )
+                if order.order_type != OrderType.MARKET:
+                    # NOTE: Protect the order from the book moving between the quote and the order.
+                    order.limit_price = self.trading_service.limit_price(
+                        best_market, order.side, max_slippage_bps
+                    )
+                # Place order on selected exchange
+                result = await self.exchange_repository.place_order(order)
+                if self._should_reroute(result):
+                    result = await self._reroute(order, result, markets)
+            await self._journal(
+                result, order_id=order.id, latency=time.perf_counter() - started
+            )
 
             # Return DTO
             return OrderDTO(
@@ -62,11 +258,17 @@ class TradingAppService:
                 status=result.status.value,
                 filled_price=result.filled_price,
                 error=result.error,
+                filled_quantity=result.filled_quantity,
+                order_type=result.order_type.value,
+                limit_price=result.limit_price,
             )
 
         except Exception as e:
             self.logger.info(traceback.format_exc())
             self.logger.error(f"An error occurred: {str(e)}")
+            if order is not None:
+                order.fail(str(e))
+                await self._journal(order, latency=time.perf_counter() - started)
             # Handle errors and return failed order DTO
             dto = OrderDTO(
                 symbol=order_dto.symbol,
@@ -76,3 +278,30 @@ class TradingAppService:
                 error=str(e),
             )
             return dto
+
+    async def place_market_orders(
+        self,
+        order_dtos: Iterable[OrderDTO],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> AsyncIterator[Tuple[int, OrderDTO]]:
+        """
+        Place many market orders concurrently with at most `concurrency` in flight.
+        Yields (input index, result) as each order completes, not in input order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _place(index: int, order_dto: OrderDTO) -> Tuple[int, OrderDTO]:
+            async with semaphore:
+                return index, await self.place_market_order(order_dto)
+
+        tasks = [
+            asyncio.create_task(_place(index, order_dto))
+            for index, order_dto in enumerate(order_dtos)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # NOTE: Don't leave orders running when the consumer stops early.
+            for task in tasks:
+                task.cancel()
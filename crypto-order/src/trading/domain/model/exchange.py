@@ -1,5 +1,23 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import FrozenSet, List, Tuple
+from .instrument import Instrument
 from .order import Order, Market, Symbol
+from .order_book import OrderBook
+
+
+@dataclass(frozen=True)
+class ExchangeCapabilities:
+    """Value object describing what an exchange supports"""
+
+    exchange_id: str
+    symbols: FrozenSet[Symbol]
+    order_book: bool = False
+    # Trading rules of the symbols, if the exchange publishes them.
+    instruments: Tuple[Instrument, ...] = ()
+
+    def supports(self, symbol: Symbol) -> bool:
+        return symbol in self.symbols
 
 
 class ExchangeAdapter(ABC):
@@ -10,3 +28,65 @@ class ExchangeAdapter(ABC):
     @abstractmethod
     async def place_order(self, order: Order) -> Order:
         pass
+
+    async def get_order_book(self, symbol: Symbol, depth: int) -> OrderBook:
+        raise NotImplementedError(
+            f"{type(self).__name__} doesn't provide order book depth"
+        )
+
+    async def list_instruments(self) -> List[Instrument]:
+        """Trading rules of the symbols currently tradable on the exchange"""
+        raise NotImplementedError(f"{type(self).__name__} doesn't list its instruments")
+
+    async def list_symbols(self) -> List[Symbol]:
+        """Symbols currently tradable on the exchange"""
+        try:
+            return [instrument.symbol for instrument in await self.list_instruments()]
+        except NotImplementedError:
+            raise NotImplementedError(
+                f"{type(self).__name__} doesn't list its symbols"
+            ) from None
+
+    async def get_capabilities(self, exchange_id: str) -> ExchangeCapabilities:
+        try:
+            instruments = tuple(await self.list_instruments())
+            symbols = [instrument.symbol for instrument in instruments]
+        except NotImplementedError:
+            instruments = ()
+            symbols = await self.list_symbols()
+        return ExchangeCapabilities(
+            exchange_id=exchange_id,
+            symbols=frozenset(symbols),
+            order_book=type(self).get_order_book is not ExchangeAdapter.get_order_book,
+            instruments=instruments,
+        )
+
+    async def get_server_time(self, throttle: bool = True) -> float:
+        """Exchange clock in seconds since the epoch. Pass throttle=False after throttle_server_time."""
+        raise NotImplementedError(f"{type(self).__name__} doesn't tell its time")
+
+    async def throttle_server_time(self) -> None:
+        """Waits for the rate limit of get_server_time, so that clock samples don't time the queueing"""
+        pass
+
+    def set_clock_offset(self, offset: float) -> None:
+        """Seconds the exchange clock is ahead of the local one. Adapters signing timestamps apply it."""
+        pass
+
+    # NOTE: Lifecycle hooks. Adapters holding connections override them.
+    async def open(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def warm_up(self, connections: int) -> int:
+        """Opens up to connections connections ahead of the first requests. Returns the connections opened."""
+        return 0
+
+    async def __aenter__(self) -> "ExchangeAdapter":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
@@ -0,0 +1,146 @@
+from dataclasses import dataclass
+from decimal import ROUND_DOWN, Decimal
+from typing import Dict, Iterable, Optional, Tuple
+
+from .exceptions import InvalidOrderException
+from .order import Symbol
+
+# NOTE: Used to split concatenated symbols like "DOGEUSDT" when no exchange lists them.
+# Longer quotes first, so that "USDT" wins over "USD".
+KNOWN_QUOTES = (
+    "FDUSD",
+    "USDT",
+    "USDC",
+    "TUSD",
+    "BUSD",
+    "EUR",
+    "USD",
+    "BTC",
+    "ETH",
+    "BNB",
+)
+
+
+def _without_exponent(value: Decimal) -> Decimal:
+    # NOTE: str(Decimal("1.2E+3")) would be sent to the exchange as is.
+    return value.quantize(Decimal(1)) if value == value.to_integral_value() else value
+
+
+def parse_symbol(text: str) -> Symbol:
+    """Parse symbols written as BTC/USDT, BTC-USDT or BTCUSDT"""
+    text = text.strip().upper()
+    for separator in ("/", "-", "_"):
+        if separator in text:
+            base, _, quote = text.partition(separator)
+            if base and quote:
+                return Symbol(base=base, quote=quote)
+            break
+    for quote in KNOWN_QUOTES:
+        if text.endswith(quote) and len(text) > len(quote):
+            return Symbol(base=text[: -len(quote)], quote=quote)
+    raise InvalidOrderException(f"Unknown symbol {text}")
+
+
+@dataclass(frozen=True)
+class Instrument:
+    """Value object holding the trading rules of a symbol on an exchange"""
+
+    exchange_id: str
+    symbol: Symbol
+    # Quantities are multiples of step_size in [min_quantity, max_quantity].
+    step_size: Decimal
+    min_quantity: Decimal
+    max_quantity: Optional[Decimal] = None
+    tick_size: Optional[Decimal] = None
+    # Minimum of quantity * price in the quote currency.
+    min_notional: Optional[Decimal] = None
+
+    def normalize_quantity(self, quantity: Decimal) -> Decimal:
+        """Round the quantity down to the step size, and validate it against the limits"""
+        if self.step_size > 0:
+            normalized = (quantity / self.step_size).to_integral_value(
+                rounding=ROUND_DOWN
+            ) * self.step_size.normalize()
+            normalized = _without_exponent(normalized)
+        else:
+            normalized = quantity
+        if normalized <= 0 or normalized < self.min_quantity:
+            raise InvalidOrderException(
+                f"Quantity {quantity} is below the minimum {self.min_quantity} of {self.symbol} on {self.exchange_id}"
+            )
+        if self.max_quantity is not None and normalized > self.max_quantity:
+            raise InvalidOrderException(
+                f"Quantity {quantity} is above the maximum {self.max_quantity} of {self.symbol} on {self.exchange_id}"
+            )
+        return normalized
+
+    def normalize_price(self, price: Decimal, rounding: str = ROUND_DOWN) -> Decimal:
+        """Round the price to the tick size, down by default"""
+        if not self.tick_size:
+            return price
+        return _without_exponent(
+            (price / self.tick_size).to_integral_value(rounding=rounding)
+            * self.tick_size.normalize()
+        )
+
+    def validate_notional(self, quantity: Decimal, price: Decimal) -> None:
+        """Reject orders worth less than the minimum order value of the exchange"""
+        if self.min_notional is not None and quantity * price < self.min_notional:
+            raise InvalidOrderException(
+                f"Order value {quantity * price} is below the minimum {self.min_notional} of {self.symbol} on {self.exchange_id}"
+            )
+
+
+class InstrumentIndex:
+    """Instruments by exchange and symbol, with O(1) lookups by either key"""
+
+    def __init__(self, instruments: Iterable[Instrument] = ()):
+        self.__instruments: Dict[Tuple[str, Symbol], Instrument] = {}
+        self.__symbols: Dict[str, Symbol] = {}
+        for instrument in instruments:
+            self.add(instrument)
+
+    def add(self, instrument: Instrument) -> None:
+        self.__instruments[(instrument.exchange_id, instrument.symbol)] = instrument
+        self.__symbols[str(instrument.symbol)] = instrument.symbol
+
+    def __len__(self) -> int:
+        return len(self.__instruments)
+
+    def get(self, exchange_id: str, symbol: Symbol) -> Optional[Instrument]:
+        return self.__instruments.get((exchange_id, symbol))
+
+    def resolve(self, text: str) -> Symbol:
+        """Symbol of text like "DOGEUSDT", preferring the listings of the exchanges over guessing"""
+        symbol = self.__symbols.get(text.strip().upper())
+        return symbol if symbol is not None else parse_symbol(text)
+
+    def normalize_quantity(
+        self, exchange_id: str, symbol: Symbol, quantity: Decimal
+    ) -> Decimal:
+        """Quantity normalized for the exchange. Unknown instruments are passed through unchanged."""
+        instrument = self.get(exchange_id, symbol)
+        if instrument is None:
+            return quantity
+        return instrument.normalize_quantity(quantity)
+
+    def normalize_price(
+        self,
+        exchange_id: str,
+        symbol: Symbol,
+        price: Decimal,
+        rounding: str = ROUND_DOWN,
+    ) -> Decimal:
+        """Price rounded to the tick size of the exchange. Unknown instruments are passed through unchanged."""
+        instrument = self.get(exchange_id, symbol)
+        if instrument is None:
+            return price
+        return instrument.normalize_price(price, rounding=rounding)
+
+    def validate_notional(
+        self, exchange_id: str, symbol: Symbol, quantity: Decimal, price: Decimal
+    ) -> None:
+        """Reject orders below the minimum order value of the exchange. Unknown instruments pass."""
+        instrument = self.get(exchange_id, symbol)
+        if instrument is not None:
+            instrument.validate_notional(quantity, price)
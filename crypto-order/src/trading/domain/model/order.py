@@ -10,9 +10,20 @@ class OrderSide(Enum):
     SELL = "sell"
 
 
+class OrderType(Enum):
+    MARKET = "market"
+    # Good till canceled. Rests on the book until filled.
+    LIMIT = "limit"
+    # Immediate or cancel. Fills what it can at the limit price or better, the rest is canceled.
+    IOC = "ioc"
+    # Fill or kill. Fills the whole quantity at once at the limit price or better, or nothing.
+    FOK = "fok"
+
+
 class OrderStatus(Enum):
     PENDING = "pending"
     FILLED = "filled"
+    PARTIALLY_FILLED = "partially_filled"
     FAILED = "failed"
 
 
@@ -27,9 +38,15 @@ class Price:
     def __gt__(self, other: "Price") -> bool:
         return self.amount > other.amount
 
-    def __eq__(self, other: "Price") -> bool:
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Price):
+            return NotImplemented
         return self.amount == other.amount
 
+    # NOTE: Defining __eq__ sets __hash__ to None. Hash by amount like equality, so that Markets are hashable.
+    def __hash__(self) -> int:
+        return hash(self.amount)
+
 
 @dataclass(frozen=True)
 class Symbol:
@@ -77,6 +94,13 @@ class Order:
     exchange_id: Optional[str] = None
     filled_price: Optional[Decimal] = None
     error: Optional[str] = None
+    parent_id: Optional[str] = None
+    filled_quantity: Optional[Decimal] = None
+    order_type: OrderType = OrderType.MARKET
+    # Worst price the order may fill at. None for market orders.
+    limit_price: Optional[Decimal] = None
+    # Quote the order was routed on. Market orders are checked against the minimum order value at it.
+    quote_price: Optional[Decimal] = None
 
     def fill(self, exchange_id: str, price: Decimal) -> None:
         self.status = OrderStatus.FILLED
@@ -86,3 +110,58 @@ class Order:
     def fail(self, error: str) -> None:
         self.status = OrderStatus.FAILED
         self.error = error
+
+
+@dataclass(frozen=True)
+class OrderEvent:
+    """
+    Value object recording the state of an order at a point in time.
+    The events of an order are its history, e.g. pending -> pending on binance -> filled.
+    """
+
+    order_id: str
+    symbol: Symbol
+    side: OrderSide
+    status: OrderStatus
+    quantity: Decimal
+    recorded_at: datetime
+    exchange_id: Optional[str] = None
+    # Id assigned by the exchange, when it differs from order_id.
+    exchange_order_id: Optional[str] = None
+    parent_id: Optional[str] = None
+    order_type: OrderType = OrderType.MARKET
+    limit_price: Optional[Decimal] = None
+    filled_quantity: Optional[Decimal] = None
+    filled_price: Optional[Decimal] = None
+    error: Optional[str] = None
+    # Seconds the step producing this state took, e.g. the round trip of the order request.
+    latency: Optional[float] = None
+
+    @classmethod
+    def of(
+        cls,
+        order: Order,
+        order_id: Optional[str] = None,
+        latency: Optional[float] = None,
+    ) -> "OrderEvent":
+        """Event of the current state of order. Pass order_id when the exchange replaced the id of the order."""
+        exchange_order_id = None
+        if order_id is not None and str(order.id) != order_id:
+            exchange_order_id = str(order.id)
+        return cls(
+            order_id=order_id or str(order.id),
+            symbol=order.symbol,
+            side=order.side,
+            status=order.status,
+            quantity=order.quantity,
+            recorded_at=datetime.now(),
+            exchange_id=order.exchange_id,
+            exchange_order_id=exchange_order_id,
+            parent_id=order.parent_id,
+            order_type=order.order_type,
+            limit_price=order.limit_price,
+            filled_quantity=order.filled_quantity,
+            filled_price=order.filled_price,
+            error=order.error,
+            latency=latency,
+        )
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from datetime import datetime
+from typing import Optional, Tuple
+
+from .order import Market, OrderSide, Price, Symbol
+
+
+@dataclass(frozen=True)
+class OrderBook:
+    """
+    Value object representing a snapshot of order book depth.
+    Levels are kept as parallel price/size ladders ordered from the best price,
+    so walking the book doesn't allocate an object per level.
+    """
+
+    exchange_id: str
+    symbol: Symbol
+    bid_prices: Tuple[Decimal, ...]
+    bid_sizes: Tuple[Decimal, ...]
+    ask_prices: Tuple[Decimal, ...]
+    ask_sizes: Tuple[Decimal, ...]
+    timestamp: datetime
+
+    def __post_init__(self):
+        if len(self.bid_prices) != len(self.bid_sizes):
+            raise ValueError("Bid prices and sizes must have the same length")
+        if len(self.ask_prices) != len(self.ask_sizes):
+            raise ValueError("Ask prices and sizes must have the same length")
+
+    def _ladder(
+        self, side: OrderSide
+    ) -> Tuple[Tuple[Decimal, ...], Tuple[Decimal, ...]]:
+        # NOTE: A buy order takes liquidity from the asks, a sell order from the bids.
+        if side == OrderSide.BUY:
+            return self.ask_prices, self.ask_sizes
+        return self.bid_prices, self.bid_sizes
+
+    def available_quantity(self, side: OrderSide) -> Decimal:
+        _, sizes = self._ladder(side)
+        return sum(sizes, Decimal("0"))
+
+    def expected_fill_price(
+        self, side: OrderSide, quantity: Decimal
+    ) -> Optional[Decimal]:
+        """Volume-weighted average price of filling quantity. None if the book is too thin."""
+        prices, sizes = self._ladder(side)
+        remaining = quantity
+        notional = Decimal("0")
+        for price, size in zip(prices, sizes):
+            take = min(size, remaining)
+            notional += take * price
+            remaining -= take
+            if remaining <= 0:
+                return notional / quantity
+        return None
+
+    def to_market(self) -> Market:
+        return Market(
+            exchange_id=self.exchange_id,
+            symbol=self.symbol,
+            best_bid=(
+                Price(amount=self.bid_prices[0], timestamp=self.timestamp)
+                if self.bid_prices
+                else None
+            ),
+            best_ask=(
+                Price(amount=self.ask_prices[0], timestamp=self.timestamp)
+                if self.ask_prices
+                else None
+            ),
+        )
@@ -0,0 +1,111 @@
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Optional
+
+from .order import Market, Price, Symbol
+
+# Decimal places of prices without a known tick size. Binance quotes all prices with 8.
+DEFAULT_PRICE_SCALE = 8
+
+
+def price_scale(tick_size: Optional[Decimal]) -> int:
+    """Decimal places of the tick size, i.e. the scale of the fixed-point prices of a Quote"""
+    if not tick_size:
+        return DEFAULT_PRICE_SCALE
+    return max(0, -tick_size.normalize().as_tuple().exponent)
+
+
+def parse_fixed(text: str, scale: int) -> int:
+    """
+    Parse a decimal string like "25.35190000" to an integer in units of 10**-scale without building a Decimal.
+    Raises ValueError if the price has non-zero digits beyond scale.
+    """
+    whole, _, fraction = text.partition(".")
+    if len(fraction) > scale:
+        if fraction[scale:].strip("0"):
+            raise ValueError(f"Price {text} is finer than {scale} decimals")
+        fraction = fraction[:scale]
+    return int(whole + fraction.ljust(scale, "0"))
+
+
+class Quote:
+    """
+    Top of book of a symbol on an exchange, kept compact for the streaming hot path.
+    - bid and ask are fixed-point integers in units of 10**-scale, compared without Decimal.
+    - received_at is time.monotonic(), taken once per quote.
+    Convert with to_market() where Decimal prices are needed, e.g. when placing an order.
+    """
+
+    __slots__ = ("exchange_id", "symbol", "bid", "ask", "scale", "received_at")
+
+    def __init__(
+        self,
+        exchange_id: str,
+        symbol: Symbol,
+        bid: int,
+        ask: int,
+        scale: int,
+        received_at: float,
+    ):
+        self.exchange_id = exchange_id
+        self.symbol = symbol
+        self.bid = bid
+        self.ask = ask
+        self.scale = scale
+        self.received_at = received_at
+
+    @classmethod
+    def parse(
+        cls, exchange_id: str, symbol: Symbol, bid: str, ask: str, scale: int
+    ) -> "Quote":
+        return cls(
+            exchange_id,
+            symbol,
+            parse_fixed(bid, scale),
+            parse_fixed(ask, scale),
+            scale,
+            time.monotonic(),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Quote(exchange_id={self.exchange_id!r}, symbol={self.symbol!r}, "
+            f"bid={self.best_bid}, ask={self.best_ask})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Quote):
+            return NotImplemented
+        # NOTE: Compared by value like Market. The receive time is not part of the value.
+        return (
+            self.exchange_id == other.exchange_id
+            and self.symbol == other.symbol
+            and self.best_bid == other.best_bid
+            and self.best_ask == other.best_ask
+        )
+
+    __hash__ = None
+
+    def is_price_valid(self) -> bool:
+        return self.bid < self.ask
+
+    def age(self) -> float:
+        return time.monotonic() - self.received_at
+
+    @property
+    def best_bid(self) -> Decimal:
+        return Decimal(self.bid).scaleb(-self.scale)
+
+    @property
+    def best_ask(self) -> Decimal:
+        return Decimal(self.ask).scaleb(-self.scale)
+
+    def to_market(self) -> Market:
+        timestamp = datetime.now() - timedelta(seconds=self.age())
+        return Market(
+            exchange_id=self.exchange_id,
+            symbol=self.symbol,
+            best_bid=Price(amount=self.best_bid, timestamp=timestamp),
+            best_ask=Price(amount=self.best_ask, timestamp=timestamp),
+        )
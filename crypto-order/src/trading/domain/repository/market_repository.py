@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List
 from ..model.order import OrderSide, Market, Symbol
+from ..model.order_book import OrderBook
 
 
 # Interface for Market Repository
@@ -8,3 +9,8 @@ class MarketRepository(ABC):
     @abstractmethod
     async def get_all_markets(self, symbol: Symbol) -> List[Market]:
         pass
+
+    async def get_all_order_books(self, symbol: Symbol, depth: int) -> List[OrderBook]:
+        raise NotImplementedError(
+            f"{type(self).__name__} doesn't provide order book depth"
+        )
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from ..model.order import OrderEvent
+
+
+# Interface for the append-only journal of order states
+class OrderJournalRepository(ABC):
+    @abstractmethod
+    async def append(self, event: OrderEvent) -> None:
+        pass
+
+    @abstractmethod
+    async def get_history(self, order_id: str) -> List[OrderEvent]:
+        """Events of an order and of its child orders, oldest first. Exchange order ids are accepted too."""
+        pass
+
+    @abstractmethod
+    async def find(
+        self,
+        exchange_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[OrderEvent]:
+        """Events recorded in [since, until), oldest first"""
+        pass
+
+    async def flush(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        await self.flush()
@@ -0,0 +1,89 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from ..model.order import Market, Symbol
+
+# Spot taker fee of the base tier on Binance and OKX.
+DEFAULT_TAKER_FEE = Decimal("0.001")
+
+
+@dataclass(frozen=True)
+class ArbitrageOpportunity:
+    """Value object of a crossed market: buying on one exchange below the bid of another"""
+
+    symbol: Symbol
+    buy_exchange_id: str
+    sell_exchange_id: str
+    # Best ask of the buy exchange and best bid of the sell exchange.
+    buy_price: Decimal
+    sell_price: Decimal
+    # Profit per unit of the base currency after the taker fees of both legs.
+    net_profit: Decimal
+    detected_at: datetime
+
+    @property
+    def gross_spread(self) -> Decimal:
+        return self.sell_price - self.buy_price
+
+    @property
+    def net_profit_bps(self) -> Decimal:
+        return self.net_profit / self.buy_price * 10000
+
+
+class ArbitrageDetector:
+    """Domain service finding crossed markets across exchanges, net of fees"""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        fees: Optional[Dict[str, Decimal]] = None,
+        default_fee: Decimal = DEFAULT_TAKER_FEE,
+        min_profit_bps: Decimal = Decimal("0"),
+    ):
+        self.logger = logger
+        self.fees = fees or {}
+        self.default_fee = default_fee
+        self.min_profit_bps = min_profit_bps
+
+    def fee(self, exchange_id: str) -> Decimal:
+        return self.fees.get(exchange_id, self.default_fee)
+
+    def find_opportunity(self, markets: List[Market]) -> Optional[ArbitrageOpportunity]:
+        """The most profitable buy/sell pair of exchanges, if it is profitable after fees"""
+        valid_markets = [m for m in markets if m.is_price_valid()]
+        best: Optional[ArbitrageOpportunity] = None
+        # NOTE: All pairs rather than best ask vs best bid, since fees differ per exchange.
+        for buy in valid_markets:
+            buy_cost = buy.best_ask.amount * (1 + self.fee(buy.exchange_id))
+            for sell in valid_markets:
+                if sell.exchange_id == buy.exchange_id or sell.symbol != buy.symbol:
+                    continue
+                net_profit = (
+                    sell.best_bid.amount * (1 - self.fee(sell.exchange_id)) - buy_cost
+                )
+                if best is None or net_profit > best.net_profit:
+                    best = ArbitrageOpportunity(
+                        symbol=buy.symbol,
+                        buy_exchange_id=buy.exchange_id,
+                        sell_exchange_id=sell.exchange_id,
+                        buy_price=buy.best_ask.amount,
+                        sell_price=sell.best_bid.amount,
+                        net_profit=net_profit,
+                        detected_at=datetime.now(),
+                    )
+
+        if best is None or best.net_profit <= 0:
+            return None
+        if best.net_profit_bps < self.min_profit_bps:
+            self.logger.debug(
+                f"Arbitrage on {best.symbol} below threshold: {best.net_profit_bps:.2f} bps"
+            )
+            return None
+        self.logger.info(
+            f"Arbitrage on {best.symbol}: buy on {best.buy_exchange_id} at {best.buy_price}, "
+            f"sell on {best.sell_exchange_id} at {best.sell_price}, net {best.net_profit_bps:.2f} bps"
+        )
+        return best
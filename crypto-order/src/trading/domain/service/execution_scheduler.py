@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List, Sequence, Tuple
+
+SECONDS_PER_DAY = 86400
+
+
+class ExecutionAlgorithm(Enum):
+    # Equal slices at equal intervals.
+    TWAP = "twap"
+    # Slices in proportion to the volume expected while each slice is worked.
+    VWAP = "vwap"
+
+
+@dataclass(frozen=True)
+class ScheduledSlice:
+    """Child order of a schedule, due offset seconds after the execution starts"""
+
+    index: int
+    offset: float
+    quantity: Decimal
+
+
+@dataclass(frozen=True)
+class VolumeProfile:
+    """
+    Traded volume by time of day in UTC, e.g. the average volume per hour over the last month.
+    Only the relative volumes matter.
+    """
+
+    volumes: Tuple[Decimal, ...]
+    bucket_seconds: int = 3600
+
+    def __post_init__(self):
+        if not self.volumes or any(v < 0 for v in self.volumes):
+            raise ValueError("A volume profile needs non-negative volumes")
+        if len(self.volumes) * self.bucket_seconds != SECONDS_PER_DAY:
+            raise ValueError(
+                f"{len(self.volumes)} buckets of {self.bucket_seconds}s don't cover a day"
+            )
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> "VolumeProfile":
+        """Profile of {"bucket_seconds": 3600, "volumes": [...]}"""
+        return cls(
+            volumes=tuple(Decimal(str(v)) for v in record["volumes"]),
+            bucket_seconds=int(record.get("bucket_seconds", 3600)),
+        )
+
+    def volume_between(self, start: float, end: float) -> Decimal:
+        """Expected volume between two epoch times"""
+        volume = Decimal(0)
+        time = start
+        while time < end:
+            bucket = int(time // self.bucket_seconds)
+            until = min(end, (bucket + 1) * self.bucket_seconds)
+            volume += (
+                self.volumes[bucket % len(self.volumes)]
+                * Decimal(str(until - time))
+                / self.bucket_seconds
+            )
+            time = until
+        return volume
+
+
+class ExecutionScheduler:
+    """Domain service slicing a parent order into child orders over a horizon"""
+
+    def _slices(
+        self, quantity: Decimal, duration: float, weights: Sequence[Decimal]
+    ) -> List[ScheduledSlice]:
+        total = sum(weights)
+        if total <= 0:
+            weights = [Decimal(1)] * len(weights)
+            total = Decimal(len(weights))
+        interval = duration / len(weights)
+        slices = []
+        for index, weight in enumerate(weights[:-1]):
+            slices.append(
+                ScheduledSlice(index, index * interval, quantity * weight / total)
+            )
+        # NOTE: The last slice takes the rounding remainder, so that slices sum up to the quantity.
+        slices.append(
+            ScheduledSlice(
+                len(weights) - 1,
+                (len(weights) - 1) * interval,
+                quantity - sum(s.quantity for s in slices),
+            )
+        )
+        return slices
+
+    def twap(
+        self, quantity: Decimal, duration: float, slices: int
+    ) -> List[ScheduledSlice]:
+        if slices < 1 or duration < 0:
+            raise ValueError(f"Invalid schedule of {slices} slices over {duration}s")
+        return self._slices(quantity, duration, [Decimal(1)] * slices)
+
+    def vwap(
+        self,
+        quantity: Decimal,
+        duration: float,
+        slices: int,
+        profile: VolumeProfile,
+        start: float,
+    ) -> List[ScheduledSlice]:
+        """Slices in proportion to the profile volume of their interval, starting at epoch time start"""
+        if slices < 1 or duration < 0:
+            raise ValueError(f"Invalid schedule of {slices} slices over {duration}s")
+        interval = duration / slices
+        weights = [
+            profile.volume_between(start + i * interval, start + (i + 1) * interval)
+            for i in range(slices)
+        ]
+        return self._slices(quantity, duration, weights)
@@ -0,0 +1,162 @@
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from ..model.order import Market, Symbol
+
+DEFAULT_CAPACITY = 64
+
+
+@dataclass(frozen=True)
+class ScanRow:
+    """Best venues of one symbol. Prices are None when no exchange has a valid quote."""
+
+    symbol: Symbol
+    best_bid: Optional[float]
+    best_bid_exchange: Optional[str]
+    best_ask: Optional[float]
+    best_ask_exchange: Optional[str]
+    # best_ask - best_bid across venues, negative when the market is crossed.
+    spread: Optional[float]
+    spread_bps: Optional[float]
+    # The best bid of one venue is above the best ask of another.
+    crossed: bool
+    venues: int
+
+
+@dataclass(frozen=True)
+class ScanResult:
+    """Result arrays of a scan, one element per symbol. Exchange indices are -1 without a quote."""
+
+    symbols: List[Symbol]
+    exchange_ids: List[str]
+    best_bid: np.ndarray
+    best_bid_exchange: np.ndarray
+    best_ask: np.ndarray
+    best_ask_exchange: np.ndarray
+    spread: np.ndarray
+    spread_bps: np.ndarray
+    crossed: np.ndarray
+    venues: np.ndarray
+
+    def rows(self) -> Iterator[ScanRow]:
+        def _value(array: np.ndarray, i: int) -> Optional[float]:
+            value = float(array[i])
+            return None if np.isnan(value) else value
+
+        def _exchange(array: np.ndarray, i: int) -> Optional[str]:
+            index = int(array[i])
+            return self.exchange_ids[index] if index >= 0 else None
+
+        for i, symbol in enumerate(self.symbols):
+            yield ScanRow(
+                symbol=symbol,
+                best_bid=_value(self.best_bid, i),
+                best_bid_exchange=_exchange(self.best_bid_exchange, i),
+                best_ask=_value(self.best_ask, i),
+                best_ask_exchange=_exchange(self.best_ask_exchange, i),
+                spread=_value(self.spread, i),
+                spread_bps=_value(self.spread_bps, i),
+                crossed=bool(self.crossed[i]),
+                venues=int(self.venues[i]),
+            )
+
+
+class MarketScanner:
+    """
+    Top of book of many symbols on many exchanges in symbol × exchange arrays.
+    Unlike TradingService.find_best_market per symbol, scan finds the best venues, spreads and crossed markets
+    of every symbol at once. Prices are float64, which is exact enough for monitoring but not for order prices.
+    """
+
+    def __init__(
+        self,
+        exchange_ids: Sequence[str],
+        symbols: Sequence[Symbol] = (),
+        capacity: int = DEFAULT_CAPACITY,
+    ):
+        self.exchange_ids = list(exchange_ids)
+        self.__exchange_index: Dict[str, int] = {
+            exchange_id: i for i, exchange_id in enumerate(self.exchange_ids)
+        }
+        self.__symbol_index: Dict[Symbol, int] = {}
+        self.symbols: List[Symbol] = []
+        shape = (max(capacity, len(symbols), 1), len(self.exchange_ids))
+        self.__bids = np.full(shape, np.nan)
+        self.__asks = np.full(shape, np.nan)
+        # Epoch seconds of the quotes, for the staleness check.
+        self.__updated_at = np.zeros(shape)
+        for symbol in symbols:
+            self.__row(symbol)
+
+    def __row(self, symbol: Symbol) -> int:
+        row = self.__symbol_index.get(symbol)
+        if row is not None:
+            return row
+        row = len(self.symbols)
+        if row == self.__bids.shape[0]:
+            # NOTE: Double the capacity, so that adding symbols stays amortized O(1).
+            grow = ((0, row), (0, 0))
+            self.__bids = np.pad(self.__bids, grow, constant_values=np.nan)
+            self.__asks = np.pad(self.__asks, grow, constant_values=np.nan)
+            self.__updated_at = np.pad(self.__updated_at, grow)
+        self.__symbol_index[symbol] = row
+        self.symbols.append(symbol)
+        return row
+
+    def update(self, market: Market) -> None:
+        """Store the quote of a market. Quotes of exchanges unknown to the scanner are ignored."""
+        column = self.__exchange_index.get(market.exchange_id)
+        if column is None:
+            return
+        row = self.__row(market.symbol)
+        bid, ask = market.best_bid, market.best_ask
+        self.__bids[row, column] = np.nan if bid is None else float(bid.amount)
+        self.__asks[row, column] = np.nan if ask is None else float(ask.amount)
+        timestamps = [p.timestamp.timestamp() for p in (bid, ask) if p is not None]
+        self.__updated_at[row, column] = min(timestamps) if timestamps else 0.0
+
+    def update_all(self, markets: Sequence[Market]) -> None:
+        for market in markets:
+            self.update(market)
+
+    def scan(
+        self, max_age: Optional[float] = None, now: Optional[float] = None
+    ) -> ScanResult:
+        """Best venues of every symbol. Quotes older than max_age seconds are left out."""
+        n = len(self.symbols)
+        bids, asks = self.__bids[:n], self.__asks[:n]
+
+        # NOTE: Same validity as Market.is_price_valid. NaN compares False, so missing quotes drop out too.
+        valid = bids < asks
+        if max_age is not None:
+            now = time.time() if now is None else now
+            valid &= (now - self.__updated_at[:n]) <= max_age
+
+        masked_bids = np.where(valid, bids, -np.inf)
+        masked_asks = np.where(valid, asks, np.inf)
+        venues = valid.sum(axis=1)
+        quoted = venues > 0
+
+        best_bid_exchange = np.where(quoted, masked_bids.argmax(axis=1), -1)
+        best_ask_exchange = np.where(quoted, masked_asks.argmin(axis=1), -1)
+        best_bid = np.where(quoted, masked_bids.max(axis=1), np.nan)
+        best_ask = np.where(quoted, masked_asks.min(axis=1), np.nan)
+        spread = best_ask - best_bid
+        with np.errstate(invalid="ignore", divide="ignore"):
+            spread_bps = spread / ((best_ask + best_bid) / 2) * 10000
+
+        return ScanResult(
+            symbols=list(self.symbols),
+            exchange_ids=list(self.exchange_ids),
+            best_bid=best_bid,
+            best_bid_exchange=best_bid_exchange,
+            best_ask=best_ask,
+            best_ask_exchange=best_ask_exchange,
+            spread=spread,
+            spread_bps=spread_bps,
+            crossed=quoted & (spread < 0),
+            venues=venues,
+        )
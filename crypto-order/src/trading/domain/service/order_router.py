@@ -0,0 +1,136 @@
+from typing import Dict, List, Optional
+import logging
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from ..model.order import Order, OrderSide, OrderStatus
+from ..model.order_book import OrderBook
+
+
+class SmartOrderRouter:
+    """Domain service splitting one order across exchanges by available depth"""
+
+    def __init__(
+        self, logger: logging.Logger, min_child_quantity: Decimal = Decimal("0")
+    ):
+        self.logger = logger
+        self.min_child_quantity = min_child_quantity
+
+    def split(
+        self, order_books: List[OrderBook], side: OrderSide, quantity: Decimal
+    ) -> Dict[str, Decimal]:
+        """
+        Allocate the quantity to exchanges by taking the best price levels across all books first.
+        Returns quantity per exchange id.
+        """
+        if not order_books:
+            raise ValueError("No order books available")
+
+        levels = []
+        for book in order_books:
+            prices, sizes = (
+                (book.ask_prices, book.ask_sizes)
+                if side == OrderSide.BUY
+                else (book.bid_prices, book.bid_sizes)
+            )
+            levels += [
+                (price, size, book.exchange_id) for price, size in zip(prices, sizes)
+            ]
+        # NOTE: Buy from the cheapest asks, sell to the highest bids.
+        levels.sort(key=lambda level: level[0], reverse=side == OrderSide.SELL)
+
+        allocations: Dict[str, Decimal] = {}
+        remaining = quantity
+        for _, size, exchange_id in levels:
+            take = min(size, remaining)
+            allocations[exchange_id] = allocations.get(exchange_id, Decimal("0")) + take
+            remaining -= take
+            if remaining <= 0:
+                break
+        if remaining > 0:
+            raise ValueError(f"Not enough depth for {quantity} across all exchanges")
+
+        # Fold allocations too small to be worth a separate order into the largest one.
+        largest = max(allocations, key=lambda exchange_id: allocations[exchange_id])
+        for exchange_id in list(allocations):
+            if (
+                exchange_id != largest
+                and allocations[exchange_id] < self.min_child_quantity
+            ):
+                allocations[largest] += allocations.pop(exchange_id)
+
+        self.logger.info(f"Split {side.name} {quantity} into {allocations}")
+        return allocations
+
+    def create_child_orders(
+        self,
+        parent: Order,
+        allocations: Dict[str, Decimal],
+        limit_prices: Optional[Dict[str, Decimal]] = None,
+    ) -> List[Order]:
+        """Children of the parent's order type. Limit orders take the limit price of their exchange."""
+        limit_prices = limit_prices or {}
+        return [
+            Order(
+                id=str(uuid.uuid4()),
+                symbol=parent.symbol,
+                side=parent.side,
+                quantity=quantity,
+                status=OrderStatus.PENDING,
+                created_at=datetime.now(),
+                exchange_id=exchange_id,
+                parent_id=parent.id,
+                order_type=parent.order_type,
+                limit_price=limit_prices.get(exchange_id, parent.limit_price),
+            )
+            for exchange_id, quantity in allocations.items()
+        ]
+
+    def aggregate(self, parent: Order, children: List[Order]) -> Order:
+        """Fold child fills into the parent with a quantity-weighted average filled price"""
+        filled, failed, pending = [], [], []
+        for child in children:
+            if child.status == OrderStatus.PENDING:
+                # NOTE: A resting limit child is live on its exchange. It hasn't failed, it may still fill.
+                pending.append(child)
+                continue
+            if child.status != OrderStatus.FILLED:
+                failed.append(child)
+            # NOTE: Partially filled children count with what they filled, e.g. IOC orders re-routed elsewhere.
+            if child.status in (OrderStatus.FILLED, OrderStatus.PARTIALLY_FILLED):
+                filled.append(child)
+
+        filled_quantity = sum(
+            (c.filled_quantity or c.quantity for c in filled), Decimal("0")
+        )
+        # NOTE: A fill can be confirmed without its price, e.g. when an OKX confirmation times out.
+        # It still counts towards the filled quantity, but only priced fills make the average.
+        priced = [c for c in filled if c.filled_price is not None]
+        priced_quantity = sum(
+            (c.filled_quantity or c.quantity for c in priced), Decimal("0")
+        )
+        if priced_quantity > 0:
+            notional = sum(
+                (c.filled_price * (c.filled_quantity or c.quantity) for c in priced),
+                Decimal("0"),
+            )
+            parent.filled_price = notional / priced_quantity
+        parent.filled_quantity = filled_quantity
+        parent.exchange_id = ",".join(c.exchange_id for c in filled) or None
+
+        if filled_quantity >= parent.quantity or not (failed or pending):
+            parent.status = OrderStatus.FILLED
+            return parent
+        if pending:
+            # NOTE: The parent is worked until its resting children are done.
+            parent.status = OrderStatus.PENDING
+        else:
+            parent.status = (
+                OrderStatus.PARTIALLY_FILLED if filled else OrderStatus.FAILED
+            )
+        if failed:
+            parent.error = "; ".join(
+                f"{c.exchange_id}: {c.error or c.status.value}" for c in failed
+            )
+        return parent
@@ -1,6 +1,8 @@
 from typing import List
 import logging
+from decimal import Decimal
 from ..model.order import OrderSide, Market
+from ..model.order_book import OrderBook
 
 
 class TradingService:
@@ -34,3 +36,64 @@ class TradingService:
                 f"Best market for SELL {best_market.symbol}: {best_market.exchange_id} with bid {best_market.best_bid.amount}"
             )
         return best_market
+
+    def rank_markets(self, markets: List[Market], side: OrderSide) -> List[Market]:
+        """Markets with valid prices, best first. Used to re-route what the best market didn't fill."""
+        valid_markets = [m for m in markets if m.is_price_valid()]
+        if side == OrderSide.BUY:
+            return sorted(valid_markets, key=lambda m: m.best_ask.amount)
+        return sorted(valid_markets, key=lambda m: m.best_bid.amount, reverse=True)
+
+    def quote_price(self, market: Market, side: OrderSide) -> Decimal:
+        """Price an order of side takes on market: the ask for buys, the bid for sells"""
+        return (
+            market.best_ask.amount if side == OrderSide.BUY else market.best_bid.amount
+        )
+
+    def limit_price(
+        self, market: Market, side: OrderSide, max_slippage_bps: Decimal
+    ) -> Decimal:
+        """Worst acceptable price: the quote of the routed market moved against the order by the tolerance"""
+        if side == OrderSide.BUY:
+            return market.best_ask.amount * (1 + max_slippage_bps / 10000)
+        return market.best_bid.amount * (1 - max_slippage_bps / 10000)
+
+    def is_within_limit(
+        self, market: Market, side: OrderSide, limit_price: Decimal
+    ) -> bool:
+        if side == OrderSide.BUY:
+            return market.best_ask.amount <= limit_price
+        return market.best_bid.amount >= limit_price
+
+    def find_best_order_book(
+        self, order_books: List[OrderBook], side: OrderSide, quantity: Decimal
+    ) -> OrderBook:
+        """Find the venue with the best volume-weighted fill price for the quantity"""
+        if not order_books:
+            raise ValueError("No order books available")
+
+        if not all(b.symbol == order_books[0].symbol for b in order_books):
+            raise ValueError(
+                f"Order books have different symbols: {set(b.symbol for b in order_books)}"
+            )
+
+        fill_prices = {}
+        for book in order_books:
+            fill_price = book.expected_fill_price(side, quantity)
+            if fill_price is None:
+                self.logger.info(
+                    f"Not enough depth on {book.exchange_id} for {quantity} {book.symbol}"
+                )
+                continue
+            fill_prices[book.exchange_id] = (book, fill_price)
+        if not fill_prices:
+            raise ValueError(f"Not enough depth for {quantity} on any exchange")
+
+        if side == OrderSide.BUY:
+            best_book, fill_price = min(fill_prices.values(), key=lambda b: b[1])
+        else:
+            best_book, fill_price = max(fill_prices.values(), key=lambda b: b[1])
+        self.logger.info(
+            f"Best market for {side.name} {quantity} {best_book.symbol}: {best_book.exchange_id} with expected fill price {fill_price}"
+        )
+        return best_book
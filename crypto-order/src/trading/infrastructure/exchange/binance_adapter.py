@@ -1,9 +1,6 @@
 from enum import Enum
-import hmac
-import hashlib
 import logging
-import time
-from typing import Dict
+from typing import Dict, List, Optional
 
 import aiohttp
 from decimal import Decimal
@@ -12,13 +9,42 @@ from datetime import datetime
 from trading.domain.model.order import Order, Market
 from trading.domain.model.order import Symbol
 from trading.domain.model.order import OrderStatus
+from trading.domain.model.order import OrderType
 from trading.domain.model.order import Price
+from trading.domain.model.order_book import OrderBook
 from trading.domain.model.exchange import ExchangeAdapter
+from trading.domain.model.instrument import Instrument
 from trading.domain.model.exceptions import MarketNotFoundException
+from trading.infrastructure.exchange.clock_sync import OffsetClock, sample_clock
+from trading.infrastructure.exchange.http_session import PooledSession
+from trading.infrastructure.exchange.json_decoder import (
+    DEFAULT_JSON_DECODER,
+    ResponseSchema,
+    get_decoder,
+)
+from trading.infrastructure.exchange.rate_limiter import (
+    BINANCE_LIMITS,
+    RateLimiter,
+    RequestPriority,
+    binance_depth_weight,
+)
+from trading.infrastructure.exchange.signing import BinanceRequestSigner
 
 # It is recommended to use a small recvWindow of 5000 or less! The max cannot go beyond 60,000!
 # Ref: https://github.com/binance/binance-spot-api-docs/blob/master/rest-api.md#signed-endpoint-examples-for-post-apiv3order
 
+# Error code of requests whose timestamp is outside of the recvWindow, or ahead of the server time.
+# Ref: https://developers.binance.com/docs/binance-spot-api-docs/errors#-1021-invalid_timestamp
+INVALID_TIMESTAMP = -1021
+
+# Fields read from order responses. Decoders with schema support skip the rest, e.g. most of the fills.
+# NOTE: The book ticker is decoded whole. It has no other fields worth skipping.
+ORDER_RESPONSE = ResponseSchema(
+    "BinanceOrder",
+    ("orderId", "status", "executedQty", "cummulativeQuoteQty"),
+    lists=(("fills", ResponseSchema("BinanceFill", ("price",))),),
+)
+
 
 class BinanceAdapter(ExchangeAdapter):
 
@@ -37,11 +63,80 @@ class BinanceAdapter(ExchangeAdapter):
         EXPIRED = "EXPIRED"
         EXPIRED_IN_MATCH = "EXPIRED_IN_MATCH"
 
-    def __init__(self, config: Dict[str, str], logger: logging.Logger):
-        self.__api_key = config["api_key"]
-        self.__api_secret = config["api_secret"]
+    TIME_IN_FORCE = {
+        OrderType.LIMIT: "GTC",
+        OrderType.IOC: "IOC",
+        OrderType.FOK: "FOK",
+    }
+
+    def __init__(
+        self,
+        config: Dict[str, str],
+        logger: logging.Logger,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        # NOTE: Timestamps are taken on the exchange clock, as far as the clock sync has measured it.
+        self.__clock = OffsetClock()
+        self.__signer = BinanceRequestSigner(
+            config["api_key"], config["api_secret"], clock=self.__clock
+        )
         self.__base_url = config.get("base_url", "https://testnet.binance.vision")
         self.__logger = logger
+        self.__http = PooledSession(config, logger=logger)
+        self.__decoder = get_decoder(config.get("json_decoder", DEFAULT_JSON_DECODER))
+        self.__rate_limiter = rate_limiter or RateLimiter(
+            "binance", BINANCE_LIMITS, logger=logger
+        )
+
+    async def open(self) -> None:
+        self.__http.open()
+
+    async def close(self) -> None:
+        await self.__http.close()
+
+    async def warm_up(self, connections: int) -> int:
+        # Test connectivity: https://developers.binance.com/docs/binance-spot-api-docs/rest-api/general-endpoints#test-connectivity
+        return await self.__http.warm_up(
+            f"{self.__base_url}/api/v3/ping",
+            connections,
+            before=lambda: self.__rate_limiter.acquire(
+                "GET /api/v3/ping", RequestPriority.QUOTE
+            ),
+        )
+
+    def set_clock_offset(self, offset: float) -> None:
+        self.__clock.offset = offset
+
+    async def throttle_server_time(self) -> None:
+        await self.__rate_limiter.acquire("GET /api/v3/time", RequestPriority.QUOTE)
+
+    async def get_server_time(self, throttle: bool = True) -> float:
+        # Check server time: https://developers.binance.com/docs/binance-spot-api-docs/rest-api/general-endpoints#check-server-time
+        session = self.__http.session
+        if throttle:
+            await self.throttle_server_time()
+        async with session.get(f"{self.__base_url}/api/v3/time") as response:
+            self.__track_limits(response)
+            response.raise_for_status()
+            data = self.__decoder.decode(await response.read())
+            return data["serverTime"] / 1000
+
+    def __is_timestamp_error(self, error: str) -> bool:
+        try:
+            data = self.__decoder.decode(error)
+        except ValueError:
+            return False
+        # NOTE: Error bodies aren't always objects, e.g. from a proxy in front of the API.
+        return isinstance(data, dict) and data.get("code") == INVALID_TIMESTAMP
+
+    def __track_limits(self, response: aiohttp.ClientResponse) -> None:
+        # Ref: https://developers.binance.com/docs/binance-spot-api-docs/rest-api/limits
+        used_weight = response.headers.get("X-MBX-USED-WEIGHT-1M")
+        if used_weight is not None:
+            self.__rate_limiter.sync_usage("weight", float(used_weight))
+        # NOTE: 429 is a rate limit warning and 418 an IP ban. Both tell how long to back off.
+        if response.status in (418, 429):
+            self.__rate_limiter.pause(float(response.headers.get("Retry-After", 60)))
 
     def __map_order_status(self, status: "BinanceAdapter.OrderStatus") -> OrderStatus:
         mapping = {
@@ -57,105 +152,204 @@ class BinanceAdapter(ExchangeAdapter):
         }
         return mapping.get(status, OrderStatus.FAILED)
 
-    def _generate_signature(self, query_string: str) -> str:
-        # NOTE: See https://developers.binance.com/docs/binance-spot-api-docs/rest-api/endpoint-security-type for more details
-        return hmac.new(
-            self.__api_secret.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-
     async def get_market(self, symbol: Symbol) -> Market:
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.__base_url}/api/v3/ticker/bookTicker"
-            params = {"symbol": str(symbol)}
-            self.__logger.debug(f"Getting market data for {symbol} from Binance")
-
-            async with session.get(url, params=params) as response:
-                self.__logger.debug(f"Response status: {response.status}")
-                try:
-                    response.raise_for_status()
-                except aiohttp.ClientResponseError as e:
-                    if e.status == 400:
-                        raise MarketNotFoundException(f"Market {symbol} not found")
-                    raise e
-
-                data = await response.json()
-                self.__logger.debug(f"Market data: {data}")
-
-                return Market(
-                    exchange_id="binance",
-                    symbol=symbol,
-                    best_bid=Price(
-                        amount=Decimal(data["bidPrice"]), timestamp=datetime.now()
-                    ),
-                    best_ask=Price(
-                        amount=Decimal(data["askPrice"]), timestamp=datetime.now()
-                    ),
-                )
+        session = self.__http.session
+        url = f"{self.__base_url}/api/v3/ticker/bookTicker"
+        params = {"symbol": str(symbol)}
+        self.__logger.debug(f"Getting market data for {symbol} from Binance")
+
+        await self.__rate_limiter.acquire(
+            "GET /api/v3/ticker/bookTicker", RequestPriority.QUOTE
+        )
+        async with session.get(url, params=params) as response:
+            self.__logger.debug(f"Response status: {response.status}")
+            self.__track_limits(response)
+            try:
+                response.raise_for_status()
+            except aiohttp.ClientResponseError as e:
+                if e.status == 400:
+                    raise MarketNotFoundException(f"Market {symbol} not found")
+                raise e
+
+            data = self.__decoder.decode(await response.read())
+            self.__logger.debug(f"Market data: {data}")
+
+            now = datetime.now()
+            return Market(
+                exchange_id="binance",
+                symbol=symbol,
+                best_bid=Price(amount=Decimal(data["bidPrice"]), timestamp=now),
+                best_ask=Price(amount=Decimal(data["askPrice"]), timestamp=now),
+            )
+
+    async def get_order_book(self, symbol: Symbol, depth: int) -> OrderBook:
+        # Order book: https://developers.binance.com/docs/binance-spot-api-docs/rest-api/market-data-endpoints#order-book
+        session = self.__http.session
+        url = f"{self.__base_url}/api/v3/depth"
+        params = {"symbol": str(symbol), "limit": depth}
+        self.__logger.debug(f"Getting order book for {symbol} from Binance")
+
+        await self.__rate_limiter.acquire(
+            "GET /api/v3/depth",
+            RequestPriority.QUOTE,
+            weight=binance_depth_weight(depth),
+        )
+        async with session.get(url, params=params) as response:
+            self.__logger.debug(f"Response status: {response.status}")
+            self.__track_limits(response)
+            try:
+                response.raise_for_status()
+            except aiohttp.ClientResponseError as e:
+                if e.status == 400:
+                    raise MarketNotFoundException(f"Market {symbol} not found")
+                raise e
+
+            data = self.__decoder.decode(await response.read())
+            # Levels are [price, quantity] pairs, best price first.
+            return OrderBook(
+                exchange_id="binance",
+                symbol=symbol,
+                bid_prices=tuple(Decimal(level[0]) for level in data["bids"]),
+                bid_sizes=tuple(Decimal(level[1]) for level in data["bids"]),
+                ask_prices=tuple(Decimal(level[0]) for level in data["asks"]),
+                ask_sizes=tuple(Decimal(level[1]) for level in data["asks"]),
+                timestamp=datetime.now(),
+            )
+
+    def __parse_instrument(self, info: dict) -> Instrument:
+        # Filters: https://developers.binance.com/docs/binance-spot-api-docs/filters
+        filters = {f["filterType"]: f for f in info.get("filters", [])}
+        lot_size = filters.get("LOT_SIZE", {})
+        price_filter = filters.get("PRICE_FILTER", {})
+        notional = filters.get("NOTIONAL") or filters.get("MIN_NOTIONAL") or {}
+        max_quantity = Decimal(lot_size.get("maxQty", "0"))
+        return Instrument(
+            exchange_id="binance",
+            symbol=Symbol(base=info["baseAsset"], quote=info["quoteAsset"]),
+            step_size=Decimal(lot_size.get("stepSize", "0")),
+            min_quantity=Decimal(lot_size.get("minQty", "0")),
+            max_quantity=max_quantity or None,
+            tick_size=Decimal(price_filter.get("tickSize", "0")) or None,
+            min_notional=(
+                Decimal(notional["minNotional"]) if "minNotional" in notional else None
+            ),
+        )
+
+    async def list_instruments(self) -> List[Instrument]:
+        # Exchange information: https://developers.binance.com/docs/binance-spot-api-docs/rest-api/general-endpoints#exchange-information
+        session = self.__http.session
+        url = f"{self.__base_url}/api/v3/exchangeInfo"
+        params = {"permissions": "SPOT"}
+        self.__logger.debug("Getting symbols from Binance")
+
+        await self.__rate_limiter.acquire(
+            "GET /api/v3/exchangeInfo", RequestPriority.QUOTE
+        )
+        async with session.get(url, params=params) as response:
+            self.__logger.debug(f"Response status: {response.status}")
+            self.__track_limits(response)
+            response.raise_for_status()
+            data = self.__decoder.decode(await response.read())
+            return [
+                self.__parse_instrument(info)
+                for info in data["symbols"]
+                if info.get("status") == "TRADING"
+            ]
 
     async def place_order(self, order: Order) -> Order:
         endpoint = "/api/v3/order"
-        timestamp = int(time.time() * 1000)
         params = {
             "symbol": str(order.symbol),
             "side": order.side.value.upper(),
             "type": "MARKET",
             "quantity": order.quantity,
-            "timestamp": timestamp,
         }
-
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        self.__logger.debug(f"Query string: {query_string}")
-
-        # NOTE: Generate signature and add to params.
-        # Ref: https://developers.binance.com/docs/binance-spot-api-docs/rest-api/endpoint-security-type
-        params["signature"] = self._generate_signature(query_string)
-
-        # NOTE: Put the API key in X-MBX-APIKEY header.
-        # Ref: https://developers.binance.com/docs/binance-spot-api-docs/rest-api/endpoint-security-type
-        headers = {"X-MBX-APIKEY": self.__api_key}
+        if order.order_type != OrderType.MARKET:
+            # NOTE: IOC and FOK are limit orders with another time in force.
+            # Ref: https://developers.binance.com/docs/binance-spot-api-docs/enums#time-in-force-timeinforce
+            params["type"] = "LIMIT"
+            params["timeInForce"] = self.TIME_IN_FORCE[order.order_type]
+            params["price"] = f"{order.limit_price:f}"
 
         try:
-            async with aiohttp.ClientSession() as session:
+            session = self.__http.session
+            for attempt in range(2):
+                await self.__rate_limiter.acquire(
+                    f"POST {endpoint}", RequestPriority.ORDER
+                )
+                # NOTE: Sign after waiting for the rate limiter, so that the timestamp is fresh when the request is sent.
+                # The API key goes in the X-MBX-APIKEY header of the signer.
+                query_string = self.__signer.sign(params)
+                self.__logger.debug(f"Query string: {query_string}")
                 async with session.post(
-                    f"{self.__base_url}{endpoint}", headers=headers, data=params
+                    f"{self.__base_url}{endpoint}",
+                    headers=self.__signer.headers,
+                    data=query_string,
                 ) as response:
+                    self.__track_limits(response)
                     try:
                         response.raise_for_status()
                     except aiohttp.ClientResponseError as e:
-                        if e.status == 400:
-                            self.__logger.info(f"Order failed: {await response.text()}")
-                            return Order(
-                                id=order.id,
-                                symbol=order.symbol,
-                                side=order.side,
-                                quantity=order.quantity,
-                                status=OrderStatus.FAILED,
-                                created_at=datetime.now(),
-                                exchange_id="binance",
+                        if e.status != 400:
+                            raise e
+                        error = await response.text()
+                        if attempt == 0 and self.__is_timestamp_error(error):
+                            # NOTE: The clock drifted past the recvWindow since the last sync.
+                            # Measure it again and sign once more rather than failing the order.
+                            self.__logger.warning(
+                                f"Binance rejected the order timestamp: {error}"
+                            )
+                            await self.throttle_server_time()
+                            sample = await sample_clock(
+                                lambda: self.get_server_time(throttle=False)
                             )
-                        raise e
+                            self.set_clock_offset(sample.offset)
+                            continue
+                        self.__logger.info(f"Order failed: {error}")
+                        return Order(
+                            id=order.id,
+                            symbol=order.symbol,
+                            side=order.side,
+                            quantity=order.quantity,
+                            status=OrderStatus.FAILED,
+                            created_at=datetime.now(),
+                            exchange_id="binance",
+                            parent_id=order.parent_id,
+                            order_type=order.order_type,
+                            limit_price=order.limit_price,
+                        )
 
-                    data = await response.json()
+                    data = self.__decoder.decode(await response.read(), ORDER_RESPONSE)
                     self.__logger.debug(f"Order response: {data}")
+                    status = self.__map_order_status(self.OrderStatus(data["status"]))
+                    filled_quantity = Decimal(data.get("executedQty") or "0")
                     fills = data.get("fills", [])
                     filled_price = (
                         Decimal(fills[0]["price"]) if len(fills) > 0 else None
                     )
+                    if filled_quantity > 0 and data.get("cummulativeQuoteQty"):
+                        # NOTE: Orders sweeping several levels have several fills. Report their average price.
+                        filled_price = (
+                            Decimal(data["cummulativeQuoteQty"]) / filled_quantity
+                        )
+                    if status == OrderStatus.FAILED and filled_quantity > 0:
+                        # NOTE: An IOC order expires with what it filled.
+                        status = OrderStatus.PARTIALLY_FILLED
 
                     return Order(
                         id=data["orderId"],
                         symbol=order.symbol,
                         side=order.side,
                         quantity=order.quantity,
-                        status=self.__map_order_status(
-                            self.OrderStatus(data["status"])
-                        ),
+                        status=status,
                         filled_price=filled_price,
                         created_at=datetime.now(),
                         exchange_id="binance",
+                        parent_id=order.parent_id,
+                        filled_quantity=filled_quantity or None,
+                        order_type=order.order_type,
+                        limit_price=order.limit_price,
                     )
         except Exception as e:
-            self.__logger.error(f"Error placing Binance market order: {str(e)}")
+            self.__logger.error(f"Error placing Binance order: {str(e)}")
             raise
@@ -0,0 +1,231 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from trading.domain.model.exchange import ExchangeAdapter, ExchangeCapabilities
+from trading.domain.model.instrument import Instrument
+from trading.domain.model.order import Symbol
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "crypto-order" / "capabilities.json"
+# NOTE: Listings change rarely. A day old list only costs a MarketNotFoundException on new listings.
+DEFAULT_MAX_AGE = 24 * 60 * 60
+# NOTE: Failures are cached briefly, so that a venue that is down doesn't cost every start the timeout.
+DEFAULT_FAILURE_MAX_AGE = 5 * 60
+# NOTE: Discovery runs before the first order, so it gets a startup budget, not a bulk download budget.
+DEFAULT_TIMEOUT = 3.0
+
+
+def _parse_symbol(text: str) -> Symbol:
+    return Symbol(*text.split("/", 1))
+
+
+def _format_symbol(symbol: Symbol) -> str:
+    return f"{symbol.base}/{symbol.quote}"
+
+
+def _optional_decimal(value: Optional[str]) -> Optional[Decimal]:
+    return None if value is None else Decimal(value)
+
+
+def _instrument_to_record(instrument: Instrument) -> List[Optional[str]]:
+    # NOTE: Rows rather than objects, since Binance alone lists thousands of symbols.
+    return [
+        _format_symbol(instrument.symbol),
+        str(instrument.step_size),
+        str(instrument.min_quantity),
+        *(
+            None if value is None else str(value)
+            for value in (
+                instrument.max_quantity,
+                instrument.tick_size,
+                instrument.min_notional,
+            )
+        ),
+    ]
+
+
+def _instrument_from_record(
+    exchange_id: str, record: List[Optional[str]]
+) -> Instrument:
+    symbol, step_size, min_quantity, max_quantity, tick_size, min_notional = record
+    return Instrument(
+        exchange_id=exchange_id,
+        symbol=_parse_symbol(symbol),
+        step_size=Decimal(step_size),
+        min_quantity=Decimal(min_quantity),
+        max_quantity=_optional_decimal(max_quantity),
+        tick_size=_optional_decimal(tick_size),
+        min_notional=_optional_decimal(min_notional),
+    )
+
+
+class CapabilityCache:
+    """Capabilities per exchange in a JSON file, so that discovery runs once per max_age and not per start"""
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        max_age: float = DEFAULT_MAX_AGE,
+        failure_max_age: float = DEFAULT_FAILURE_MAX_AGE,
+    ):
+        self.path = Path(path)
+        self.max_age = max_age
+        self.failure_max_age = failure_max_age
+
+    def __read(self) -> Dict[str, dict]:
+        # NOTE: A missing or corrupt file is an empty cache.
+        try:
+            records = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return records if isinstance(records, dict) else {}
+
+    def __write(self, records: Dict[str, dict]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # NOTE: Write then rename, so that a concurrent reader never sees a half written file.
+        temporary = self.path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(records))
+        temporary.replace(self.path)
+
+    def load(self) -> Dict[str, ExchangeCapabilities]:
+        """Fresh entries of the cache file"""
+        records = self.__read()
+        now = time.time()
+        capabilities = {}
+        for exchange_id, record in records.items():
+            if now - record.get("fetched_at", 0) > self.max_age:
+                continue
+            try:
+                capabilities[exchange_id] = ExchangeCapabilities(
+                    exchange_id=exchange_id,
+                    symbols=frozenset(
+                        _parse_symbol(symbol) for symbol in record["symbols"]
+                    ),
+                    order_book=record.get("order_book", False),
+                    instruments=tuple(
+                        _instrument_from_record(exchange_id, instrument)
+                        for instrument in record.get("instruments", [])
+                    ),
+                )
+            except (KeyError, TypeError, ValueError, ArithmeticError):
+                # NOTE: An entry written by another version is rediscovered.
+                continue
+        return capabilities
+
+    def load_failures(self) -> Set[str]:
+        """Exchanges whose discovery failed within failure_max_age"""
+        now = time.time()
+        return {
+            exchange_id
+            for exchange_id, record in self.__read().items()
+            if isinstance(record, dict)
+            and now - record.get("failed_at", 0) <= self.failure_max_age
+        }
+
+    def save(self, capabilities: Dict[str, ExchangeCapabilities]) -> None:
+        records = self.__read()
+        now = time.time()
+        for exchange_id, capability in capabilities.items():
+            records[exchange_id] = {
+                "fetched_at": now,
+                "order_book": capability.order_book,
+                "symbols": sorted(_format_symbol(s) for s in capability.symbols),
+                "instruments": [
+                    _instrument_to_record(instrument)
+                    for instrument in capability.instruments
+                ],
+            }
+        self.__write(records)
+
+    def save_failures(self, exchange_ids: Iterable[str]) -> None:
+        records = self.__read()
+        now = time.time()
+        for exchange_id in exchange_ids:
+            records[exchange_id] = {"failed_at": now}
+        self.__write(records)
+
+
+class CapabilityDiscovery:
+    """Queries every exchange concurrently for what it supports, reusing cached results"""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        cache: Optional[CapabilityCache] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.logger = logger
+        self.cache = cache
+        self.timeout = timeout
+
+    async def _discover_one(
+        self, exchange_id: str, exchange: ExchangeAdapter
+    ) -> Optional[ExchangeCapabilities]:
+        """Capabilities of the exchange, None if it doesn't list them. Raises when discovery failed."""
+        try:
+            return await asyncio.wait_for(
+                exchange.get_capabilities(exchange_id), self.timeout
+            )
+        except NotImplementedError:
+            self.logger.info(f"{exchange_id} doesn't list its symbols")
+        return None
+
+    async def discover(
+        self, exchanges: Dict[str, ExchangeAdapter]
+    ) -> Dict[str, ExchangeCapabilities]:
+        """
+        Capabilities of the exchanges that could be discovered.
+        Exchanges missing from the result are unknown and should be treated as supporting every symbol.
+        """
+        capabilities = {
+            exchange_id: capability
+            for exchange_id, capability in (
+                self.cache.load() if self.cache else {}
+            ).items()
+            if exchange_id in exchanges
+        }
+        recently_failed = self.cache.load_failures() if self.cache else set()
+        stale = [
+            exchange_id
+            for exchange_id in exchanges
+            if exchange_id not in capabilities and exchange_id not in recently_failed
+        ]
+        if recently_failed & set(exchanges):
+            self.logger.info(
+                f"Skipping discovery of {sorted(recently_failed & set(exchanges))}: it failed recently"
+            )
+        if not stale:
+            return capabilities
+
+        self.logger.info(f"Discovering capabilities of {stale}")
+        results = await asyncio.gather(
+            *[
+                self._discover_one(exchange_id, exchanges[exchange_id])
+                for exchange_id in stale
+            ],
+            return_exceptions=True,
+        )
+        discovered, failed = {}, []
+        for exchange_id, result in zip(stale, results):
+            if isinstance(result, BaseException):
+                self.logger.warning(
+                    f"Failed to discover capabilities of {exchange_id}: {str(result) or type(result).__name__}"
+                )
+                failed.append(exchange_id)
+            elif result is not None:
+                discovered[exchange_id] = result
+        if self.cache is not None and (discovered or failed):
+            try:
+                if discovered:
+                    self.cache.save(discovered)
+                if failed:
+                    self.cache.save_failures(failed)
+            except OSError as e:
+                self.logger.warning(f"Failed to cache capabilities: {str(e)}")
+        capabilities.update(discovered)
+        return capabilities
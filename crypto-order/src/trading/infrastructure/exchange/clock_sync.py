@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, Dict, Optional
+
+from trading.domain.model.exchange import ExchangeAdapter
+
+DEFAULT_SYNC_INTERVAL = 30.0
+# Samples the offset is estimated from. The one with the shortest round trip wins.
+DEFAULT_SAMPLES = 8
+# Samples taken at start, so that the first orders are already signed with a filtered estimate.
+# They are taken concurrently, so that startup waits one round trip.
+STARTUP_SAMPLES = 3
+
+
+@dataclass(frozen=True)
+class ClockSample:
+    """Seconds the exchange clock is ahead of the local one, and the round trip of the request that measured it"""
+
+    offset: float
+    rtt: float
+
+
+async def sample_clock(get_server_time: Callable[[], Awaitable[float]]) -> ClockSample:
+    """
+    Measures the offset of a server clock with one request.
+    The server is assumed to stamp its time halfway through the round trip, as NTP does.
+    get_server_time must not wait for a rate limit: the wait would be timed as round trip.
+    """
+    sent = time.time()
+    started = time.perf_counter()
+    server_time = await get_server_time()
+    rtt = time.perf_counter() - started
+    return ClockSample(offset=server_time - (sent + rtt / 2), rtt=rtt)
+
+
+class ClockOffsetEstimator:
+    """
+    Offset of an exchange clock over the last samples.
+    Only the sample with the shortest round trip is trusted: queueing delays make the others asymmetric.
+    """
+
+    def __init__(self, samples: int = DEFAULT_SAMPLES):
+        self.__samples: Deque[ClockSample] = deque(maxlen=samples)
+
+    def add(self, sample: ClockSample) -> None:
+        self.__samples.append(sample)
+
+    @property
+    def best(self) -> Optional[ClockSample]:
+        if not self.__samples:
+            return None
+        return min(self.__samples, key=lambda sample: sample.rtt)
+
+    @property
+    def offset(self) -> float:
+        best = self.best
+        return best.offset if best is not None else 0.0
+
+    @property
+    def rtt(self) -> Optional[float]:
+        best = self.best
+        return best.rtt if best is not None else None
+
+
+class OffsetClock:
+    """Local clock corrected by the offset of an exchange clock. Signers call it for request timestamps."""
+
+    def __init__(self, offset: float = 0.0):
+        self.offset = offset
+
+    def __call__(self) -> float:
+        return time.time() + self.offset
+
+
+class ClockSync:
+    """
+    Keeps the request timestamps of the adapters on their exchange clocks.
+    Every interval seconds each exchange's time endpoint is sampled, and the filtered offset is set on the adapter.
+    """
+
+    def __init__(
+        self,
+        exchanges: Dict[str, ExchangeAdapter],
+        logger: logging.Logger,
+        interval: float = DEFAULT_SYNC_INTERVAL,
+        samples: int = DEFAULT_SAMPLES,
+    ):
+        self.__exchanges = exchanges
+        self.__logger = logger
+        self.__interval = interval
+        self.__estimators = {
+            exchange_id: ClockOffsetEstimator(samples) for exchange_id in exchanges
+        }
+        # NOTE: Exchanges without a time endpoint are skipped after the first attempt.
+        self.__unsupported = set()
+        self.__task: Optional[asyncio.Task] = None
+
+    @property
+    def offsets(self) -> Dict[str, float]:
+        """Estimated offsets in seconds of the exchanges sampled so far"""
+        return {
+            exchange_id: estimator.offset
+            for exchange_id, estimator in self.__estimators.items()
+            if estimator.best is not None
+        }
+
+    async def __sync(self, exchange_id: str, adapter: ExchangeAdapter) -> None:
+        try:
+            # NOTE: The rate limit is waited for before the sample starts, so that queueing doesn't skew it.
+            await adapter.throttle_server_time()
+            sample = await sample_clock(lambda: adapter.get_server_time(throttle=False))
+        except NotImplementedError:
+            self.__unsupported.add(exchange_id)
+            return
+        except Exception as e:
+            # NOTE: A missed sample only leaves the previous estimate in place.
+            self.__logger.warning(f"Clock sync with {exchange_id} failed: {e}")
+            return
+        estimator = self.__estimators[exchange_id]
+        estimator.add(sample)
+        adapter.set_clock_offset(estimator.offset)
+        self.__logger.debug(
+            f"{exchange_id} clock offset {estimator.offset * 1000:.1f}ms "
+            f"(sample {sample.offset * 1000:.1f}ms, rtt {sample.rtt * 1000:.1f}ms)"
+        )
+
+    async def sync_once(self, samples: int = 1) -> None:
+        """Samples every exchange samples times, concurrently"""
+        await asyncio.gather(
+            *(
+                self.__sync(exchange_id, adapter)
+                for exchange_id, adapter in self.__exchanges.items()
+                if exchange_id not in self.__unsupported
+                for _ in range(samples)
+            )
+        )
+
+    async def start(self) -> None:
+        await self.sync_once(STARTUP_SAMPLES)
+        for exchange_id, offset in self.offsets.items():
+            self.__logger.info(
+                f"{exchange_id} clock offset {offset * 1000:.1f}ms "
+                f"(rtt {self.__estimators[exchange_id].rtt * 1000:.1f}ms)"
+            )
+        if self.__interval > 0:
+            self.__task = asyncio.create_task(self.__run())
+
+    async def stop(self) -> None:
+        if self.__task is None:
+            return
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+        self.__task = None
+
+    async def __run(self) -> None:
+        while True:
+            await asyncio.sleep(self.__interval)
+            await self.sync_once()
@@ -1,27 +1,172 @@
+import asyncio
+import importlib
 import logging
-from .binance_adapter import BinanceAdapter
-from .okx_adapter import OKXAdapter
-from typing import Dict
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import lru_cache
+from .rate_limiter import RequestScheduler
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Optional
 from trading.domain.model.exchange import ExchangeAdapter
+from trading.domain.model.instrument import InstrumentIndex
+
+if TYPE_CHECKING:
+    from .market_stream import MarketStore, MarketStream
+
+# NOTE: Adapters and streams are imported only when an exchange is created, because they pull in aiohttp.
+# Values are "module:class". Modules are relative to this package unless absolute.
+ADAPTERS: Dict[str, str] = {
+    "binance": ".binance_adapter:BinanceAdapter",
+    "okx": ".okx_adapter:OKXAdapter",
+}
+STREAMS: Dict[str, str] = {
+    "binance": ".market_stream:BinanceBookTickerStream",
+    "okx": ".market_stream:OKXTickerStream",
+}
+
+
+# NOTE: Other packages add exchanges by entry points without changes here, e.g. in their pyproject.toml:
+#   [project.entry-points."trading.exchanges"]
+#   kraken = "kraken_trading.adapter:KrakenAdapter"
+# Adapters are created as `Adapter(config, logger=logger, rate_limiter=rate_limiter)`.
+ENTRY_POINT_GROUP = "trading.exchanges"
+STREAM_ENTRY_POINT_GROUP = "trading.exchange_streams"
+
+# Keep-alive connections opened per exchange before the first request. See ExchangeFactory.warm_up_all.
+DEFAULT_WARM_CONNECTIONS = 2
+
+
+@lru_cache(maxsize=None)
+def _entry_points(group: str) -> Dict[str, str]:
+    from importlib.metadata import entry_points
+
+    return {
+        entry_point.name: entry_point.value for entry_point in entry_points(group=group)
+    }
+
+
+@lru_cache(maxsize=None)
+def _load(path: str) -> type:
+    module_name, _, class_name = path.partition(":")
+    module = importlib.import_module(module_name, package=__package__)
+    return getattr(module, class_name)
 
 
 class ExchangeFactory:
     # NOTE: provides a single point for creating exchange instances implementing the "ExchangeAdapter" interface.
+    @staticmethod
+    def adapters() -> Dict[str, str]:
+        """Adapter paths by exchange id. Built-in and registered exchanges take precedence over entry points."""
+        return {**_entry_points(ENTRY_POINT_GROUP), **ADAPTERS}
+
+    @staticmethod
+    def streams() -> Dict[str, str]:
+        return {**_entry_points(STREAM_ENTRY_POINT_GROUP), **STREAMS}
+
+    @staticmethod
+    def register(exchange_id: str, adapter: str, stream: Optional[str] = None) -> None:
+        """Register an exchange by "module:class" paths of its adapter and (optionally) its market stream"""
+        ADAPTERS[exchange_id] = adapter
+        if stream is not None:
+            STREAMS[exchange_id] = stream
+
     @staticmethod
     def create(
-        exchange_id: str, config: Dict[str, str], logger: logging.Logger
+        exchange_id: str,
+        config: Dict[str, str],
+        logger: logging.Logger,
+        scheduler: Optional[RequestScheduler] = None,
     ) -> ExchangeAdapter:
-        if exchange_id == "binance":
-            return BinanceAdapter(config, logger=logger)
-        if exchange_id == "okx":
-            return OKXAdapter(config, logger=logger)
-        raise ValueError(f"Unknown exchange: {exchange_id}")
+        adapters = ExchangeFactory.adapters()
+        if exchange_id not in adapters:
+            raise ValueError(f"Unknown exchange: {exchange_id}")
+        scheduler = scheduler or RequestScheduler(logger=logger)
+        adapter_class = _load(adapters[exchange_id])
+        return adapter_class(
+            config, logger=logger, rate_limiter=scheduler.limiter(exchange_id)
+        )
 
     @staticmethod
     def create_all(
-        exchange_configs: Dict[str, Dict[str, str]], logger: logging.Logger
+        exchange_configs: Dict[str, Dict[str, str]],
+        logger: logging.Logger,
+        scheduler: Optional[RequestScheduler] = None,
     ) -> Dict[str, ExchangeAdapter]:
+        # NOTE: All adapters share one scheduler so that every request of an exchange is counted once.
+        scheduler = scheduler or RequestScheduler(logger=logger)
+        return {
+            exchange_id: ExchangeFactory.create(exchange_id, config, logger, scheduler)
+            for exchange_id, config in exchange_configs.items()
+        }
+
+    @staticmethod
+    @asynccontextmanager
+    async def open_all(
+        exchanges: Dict[str, ExchangeAdapter],
+    ) -> AsyncIterator[Dict[str, ExchangeAdapter]]:
+        # NOTE: Opens the pooled connections of every adapter and closes them on exit,
+        # so all quotes and orders in the block reuse warm connections.
+        async with AsyncExitStack() as stack:
+            for exchange in exchanges.values():
+                await stack.enter_async_context(exchange)
+            yield exchanges
+
+    @staticmethod
+    async def warm_up_all(
+        exchanges: Dict[str, ExchangeAdapter],
+        connections: int,
+        logger: logging.Logger,
+    ) -> Dict[str, float]:
+        """
+        Opens connections to every exchange concurrently, so that the first quotes and orders run on hot sockets.
+        Returns the seconds each exchange took to warm up.
+        """
+
+        async def warm_up(exchange_id: str, exchange: ExchangeAdapter) -> float:
+            started = time.perf_counter()
+            opened = await exchange.warm_up(connections)
+            elapsed = time.perf_counter() - started
+            logger.info(
+                f"Warmed up {opened} connections to {exchange_id} in {elapsed * 1000:.1f}ms"
+            )
+            return elapsed
+
+        if connections <= 0:
+            return {}
+        elapsed = await asyncio.gather(
+            *(
+                warm_up(exchange_id, exchange)
+                for exchange_id, exchange in exchanges.items()
+            )
+        )
+        return dict(zip(exchanges, elapsed))
+
+    @staticmethod
+    def create_stream(
+        exchange_id: str,
+        config: Dict[str, str],
+        store: "MarketStore",
+        logger: logging.Logger,
+        instruments: Optional[InstrumentIndex] = None,
+    ) -> "MarketStream":
+        streams = ExchangeFactory.streams()
+        if exchange_id not in streams:
+            raise ValueError(f"Unknown exchange: {exchange_id}")
+        stream_class = _load(streams[exchange_id])
+        return stream_class(config, store=store, logger=logger, instruments=instruments)
+
+    @staticmethod
+    def create_all_streams(
+        exchange_configs: Dict[str, Dict[str, str]],
+        store: "MarketStore",
+        logger: logging.Logger,
+        instruments: Optional[InstrumentIndex] = None,
+    ) -> Dict[str, "MarketStream"]:
+        # NOTE: Exchanges without a market stream are skipped. They are served over REST.
+        streams = ExchangeFactory.streams()
         return {
-            exchange_id: ExchangeFactory.create(exchange_id, config, logger)
+            exchange_id: ExchangeFactory.create_stream(
+                exchange_id, config, store, logger, instruments
+            )
             for exchange_id, config in exchange_configs.items()
+            if exchange_id in streams
         }
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import aiohttp
+
+# NOTE: Defaults for the pooled connector. They can be overridden per exchange config.
+# Ref: https://docs.aiohttp.org/en/stable/client_reference.html#tcpconnector
+DEFAULT_LIMIT_PER_HOST = 10
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+DEFAULT_DNS_CACHE_TTL = 300
+
+
+class PooledSession:
+    """
+    Owns one aiohttp.ClientSession per exchange adapter.
+    Every quote and order of the adapter reuses the same connector, so
+    - TCP and TLS connections are kept alive between requests.
+    - DNS lookups are cached.
+    - The number of connections to the exchange host is bounded.
+    """
+
+    def __init__(self, config: Dict[str, Any], logger: logging.Logger):
+        self.__limit_per_host = int(
+            config.get("limit_per_host", DEFAULT_LIMIT_PER_HOST)
+        )
+        self.__keepalive_timeout = float(
+            config.get("keepalive_timeout", DEFAULT_KEEPALIVE_TIMEOUT)
+        )
+        self.__dns_cache_ttl = int(config.get("dns_cache_ttl", DEFAULT_DNS_CACHE_TTL))
+        self.__logger = logger
+        self.__session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # NOTE: Opened lazily so that adapters used without "async with" still share one session.
+        if self.__session is None or self.__session.closed:
+            self.open()
+        return self.__session
+
+    def open(self) -> aiohttp.ClientSession:
+        if self.__session is not None and not self.__session.closed:
+            return self.__session
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.__limit_per_host,
+            keepalive_timeout=self.__keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.__dns_cache_ttl,
+        )
+        self.__session = aiohttp.ClientSession(connector=connector)
+        self.__logger.debug(
+            f"Opened HTTP session: limit_per_host={self.__limit_per_host}, "
+            f"keepalive_timeout={self.__keepalive_timeout}, dns_cache_ttl={self.__dns_cache_ttl}"
+        )
+        return self.__session
+
+    async def close(self) -> None:
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+            self.__logger.debug("Closed HTTP session")
+        self.__session = None
+
+    async def warm_up(
+        self,
+        url: str,
+        connections: int,
+        before: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> int:
+        """
+        Opens up to connections keep-alive connections to the host of url by requesting url on each concurrently,
+        so that the first requests of the adapter don't pay for DNS, TCP and TLS setup.
+        before is awaited ahead of every request, e.g. to acquire the rate limiter. Returns the connections opened.
+        """
+        # NOTE: The first connection resolves the host into the connector's DNS cache. The others share the lookup.
+        session = self.session
+
+        async def ping() -> None:
+            if before is not None:
+                await before()
+            async with session.get(url) as response:
+                # NOTE: The connection only returns to the pool once the body is read.
+                await response.read()
+                response.raise_for_status()
+
+        results = await asyncio.gather(
+            *(ping() for _ in range(min(connections, self.__limit_per_host))),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            # NOTE: A failed warm-up only leaves the first requests to connect themselves.
+            self.__logger.warning(f"Warm-up of {url} failed: {errors[0]}")
+        return len(results) - len(errors)
@@ -0,0 +1,115 @@
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# NOTE: orjson and msgspec are optional. Without them responses are decoded by the standard library.
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_JSON_DECODER = "auto"
+
+
+@dataclass(frozen=True)
+class ResponseSchema:
+    """
+    Fields of an exchange response the adapters read. Decoders may drop every other field.
+    Missing fields are left out of the decoded record, so adapters read them with .get() as before.
+    """
+
+    name: str
+    fields: Tuple[str, ...]
+    # Fields holding lists of records, e.g. "data" of OKX responses, with the fields read from each record.
+    lists: Tuple[Tuple[str, "ResponseSchema"], ...] = ()
+
+
+class JsonDecoder:
+    """Decodes exchange responses with the standard library json module"""
+
+    name = "json"
+
+    def decode(
+        self, data: Union[bytes, str], schema: Optional[ResponseSchema] = None
+    ) -> Any:
+        return json.loads(data)
+
+
+class OrjsonDecoder(JsonDecoder):
+    name = "orjson"
+
+    def decode(
+        self, data: Union[bytes, str], schema: Optional[ResponseSchema] = None
+    ) -> Any:
+        return orjson.loads(data)
+
+
+def _struct(schema: ResponseSchema) -> type:
+    # NOTE: Fields missing from the response stay UNSET, which to_builtins() leaves out.
+    # An explicit null is decoded to None and kept, as the json and orjson decoders do.
+    fields: List[Tuple[str, Any, Any]] = [
+        (name, Any, msgspec.UNSET) for name in schema.fields
+    ]
+    for name, record in schema.lists:
+        fields.append(
+            (
+                name,
+                Union[Optional[List[_struct(record)]], msgspec.UnsetType],
+                msgspec.UNSET,
+            )
+        )
+    return msgspec.defstruct(schema.name, fields)
+
+
+class MsgspecDecoder(JsonDecoder):
+    """Decodes responses with a schema straight into structs of the fields read, skipping all others"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        self.__decoder = msgspec.json.Decoder()
+        self.__schema_decoders: Dict[ResponseSchema, Any] = {}
+
+    def decode(
+        self, data: Union[bytes, str], schema: Optional[ResponseSchema] = None
+    ) -> Any:
+        if schema is None:
+            return self.__decoder.decode(data)
+        decoder = self.__schema_decoders.get(schema)
+        if decoder is None:
+            decoder = msgspec.json.Decoder(_struct(schema))
+            self.__schema_decoders[schema] = decoder
+        return msgspec.to_builtins(decoder.decode(data))
+
+
+def available_decoders() -> List[str]:
+    """Names of the decoders that can be created, fastest first"""
+    names = []
+    if msgspec is not None:
+        names.append(MsgspecDecoder.name)
+    if orjson is not None:
+        names.append(OrjsonDecoder.name)
+    names.append(JsonDecoder.name)
+    return names
+
+
+@lru_cache(maxsize=None)
+def get_decoder(name: str = DEFAULT_JSON_DECODER) -> JsonDecoder:
+    """
+    Decoder by name: "msgspec", "orjson", "json", or "auto" for the fastest one installed.
+    Decoders are shared, so the structs compiled for a schema are reused by every adapter.
+    """
+    name = name.lower()
+    if name == "auto":
+        name = available_decoders()[0]
+    if name not in available_decoders():
+        raise ValueError(
+            f"JSON decoder {name} is not available. Choose from {available_decoders()}"
+        )
+    decoders = {d.name: d for d in (MsgspecDecoder, OrjsonDecoder, JsonDecoder)}
+    return decoders[name]()
@@ -0,0 +1,320 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import aiohttp
+
+from trading.domain.model.instrument import InstrumentIndex
+from trading.domain.model.order import Market, Symbol
+from trading.domain.model.quote import Quote, price_scale
+from trading.infrastructure.exchange.http_session import PooledSession
+from trading.infrastructure.exchange.json_decoder import (
+    DEFAULT_JSON_DECODER,
+    get_decoder,
+)
+
+DEFAULT_MAX_QUOTE_AGE = 5.0
+DEFAULT_HEARTBEAT_INTERVAL = 10.0
+DEFAULT_RECONNECT_DELAY = 0.5
+DEFAULT_MAX_RECONNECT_DELAY = 30.0
+
+
+class MarketStore:
+    """
+    In-memory latest Quote per (exchange, symbol), read as Markets.
+    - Updates older than the stored one (by exchange sequence) are dropped.
+      Gaps in the sequence need no resync: every update is a full top-of-book snapshot, not a delta.
+    - Quotes older than max_age seconds are treated as stale and not returned.
+    """
+
+    def __init__(self, max_age: float = DEFAULT_MAX_QUOTE_AGE):
+        self.__max_age = max_age
+        self.__quotes: Dict[Tuple[str, Symbol], Tuple[Quote, int]] = {}
+
+    def update(self, quote: Quote, sequence: int) -> bool:
+        key = (quote.exchange_id, quote.symbol)
+        current = self.__quotes.get(key)
+        if current is not None and sequence <= current[1]:
+            return False
+        self.__quotes[key] = (quote, sequence)
+        return True
+
+    def invalidate(self, exchange_id: str) -> None:
+        # NOTE: After a disconnect we may have missed updates, so nothing received before it is trusted.
+        for key in [k for k in self.__quotes if k[0] == exchange_id]:
+            del self.__quotes[key]
+
+    def get_quote(self, exchange_id: str, symbol: Symbol) -> Optional[Quote]:
+        stored = self.__quotes.get((exchange_id, symbol))
+        if stored is None or stored[0].age() > self.__max_age:
+            return None
+        return stored[0]
+
+    def get(self, exchange_id: str, symbol: Symbol) -> Optional[Market]:
+        # NOTE: Prices become Decimals only here, when a quote is read for routing an order.
+        quote = self.get_quote(exchange_id, symbol)
+        return None if quote is None else quote.to_market()
+
+    def get_all(self, symbol: Symbol, exchange_ids: Iterable[str]) -> List[Market]:
+        markets = [self.get(exchange_id, symbol) for exchange_id in exchange_ids]
+        return [market for market in markets if market is not None]
+
+
+class MarketStream(ABC):
+    """
+    Keeps a top-of-book WebSocket subscription open and writes every update to a MarketStore.
+    The connection is re-established with exponential backoff when it drops or goes silent.
+    """
+
+    exchange_id: str = ""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        store: MarketStore,
+        logger: logging.Logger,
+        default_url: str,
+        instruments: Optional[InstrumentIndex] = None,
+    ):
+        self._url = config.get("ws_url", default_url)
+        self._heartbeat_interval = float(
+            config.get("heartbeat_interval", DEFAULT_HEARTBEAT_INTERVAL)
+        )
+        self._reconnect_delay = float(
+            config.get("reconnect_delay", DEFAULT_RECONNECT_DELAY)
+        )
+        self._max_reconnect_delay = float(
+            config.get("max_reconnect_delay", DEFAULT_MAX_RECONNECT_DELAY)
+        )
+        self._store = store
+        self._logger = logger
+        self._http = PooledSession(config, logger=logger)
+        self._decoder = get_decoder(config.get("json_decoder", DEFAULT_JSON_DECODER))
+        self._instruments = instruments or InstrumentIndex()
+        self._symbols: Dict[str, Symbol] = {}
+        # Decimal places of the tick size by stream key, the scale of the quoted prices.
+        self._scales: Dict[str, int] = {}
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._task: Optional[asyncio.Task] = None
+        self._connected = asyncio.Event()
+
+    @abstractmethod
+    def _stream_key(self, symbol: Symbol) -> str:
+        """Identifier of the symbol in the exchange messages"""
+        pass
+
+    @abstractmethod
+    def _subscribe_message(self, stream_keys: List[str]) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def _parse(self, message: Dict[str, Any]) -> List[Tuple[Quote, int]]:
+        """Convert an exchange message to (quote, sequence) pairs. Non-quote messages give []."""
+        pass
+
+    async def _ping(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        await ws.ping()
+
+    async def subscribe(self, symbols: Iterable[Symbol]) -> None:
+        new_keys = []
+        for symbol in symbols:
+            key = self._stream_key(symbol)
+            if key not in self._symbols:
+                self._symbols[key] = symbol
+                instrument = self._instruments.get(self.exchange_id, symbol)
+                self._scales[key] = price_scale(
+                    instrument.tick_size if instrument is not None else None
+                )
+                new_keys.append(key)
+        if new_keys and self._ws is not None and not self._ws.closed:
+            await self._ws.send_json(self._subscribe_message(new_keys))
+
+    def is_subscribed(self, symbol: Symbol) -> bool:
+        return self._stream_key(symbol) in self._symbols
+
+    async def wait_connected(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._http.close()
+
+    async def _run(self) -> None:
+        delay = self._reconnect_delay
+        while True:
+            try:
+                await self._consume()
+                delay = self._reconnect_delay
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.warning(
+                    f"{self.exchange_id} market stream error: {str(e)}"
+                )
+            finally:
+                self._connected.clear()
+                self._ws = None
+                self._store.invalidate(self.exchange_id)
+            self._logger.info(
+                f"Reconnecting {self.exchange_id} market stream in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._max_reconnect_delay)
+
+    async def _consume(self) -> None:
+        async with self._http.session.ws_connect(self._url) as ws:
+            self._ws = ws
+            if self._symbols:
+                await ws.send_json(self._subscribe_message(list(self._symbols)))
+            self._connected.set()
+            self._logger.info(f"Connected {self.exchange_id} market stream {self._url}")
+
+            missed_heartbeats = 0
+            while True:
+                try:
+                    msg = await ws.receive(timeout=self._heartbeat_interval)
+                except asyncio.TimeoutError:
+                    # NOTE: A silent stream is a stale stream. Ping once, then reconnect.
+                    missed_heartbeats += 1
+                    if missed_heartbeats > 1:
+                        raise ConnectionError("Market stream went silent")
+                    await self._ping(ws)
+                    continue
+
+                missed_heartbeats = 0
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    self._handle_text(msg.data)
+                elif msg.type in (
+                    aiohttp.WSMsgType.CLOSE,
+                    aiohttp.WSMsgType.CLOSING,
+                    aiohttp.WSMsgType.CLOSED,
+                    aiohttp.WSMsgType.ERROR,
+                ):
+                    raise ConnectionError(f"Market stream closed: {msg.type.name}")
+
+    def _handle_text(self, text: str) -> None:
+        if text == "pong":
+            return
+        try:
+            message = self._decoder.decode(text)
+            updates = self._parse(message)
+        except (ValueError, KeyError) as e:
+            self._logger.warning(f"Ignored malformed {self.exchange_id} message: {e}")
+            return
+        for quote, sequence in updates:
+            if not self._store.update(quote, sequence):
+                self._logger.debug(
+                    f"Dropped out-of-order {self.exchange_id} update {sequence} for {quote.symbol}"
+                )
+
+
+class BinanceBookTickerStream(MarketStream):
+    # https://developers.binance.com/docs/binance-spot-api-docs/web-socket-streams#individual-symbol-book-ticker-streams
+    exchange_id = "binance"
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        store: MarketStore,
+        logger: logging.Logger,
+        instruments: Optional[InstrumentIndex] = None,
+    ):
+        super().__init__(
+            config,
+            store,
+            logger,
+            default_url="wss://stream.testnet.binance.vision/ws",
+            instruments=instruments,
+        )
+        self.__request_id = 0
+
+    def _stream_key(self, symbol: Symbol) -> str:
+        return str(symbol)
+
+    def _subscribe_message(self, stream_keys: List[str]) -> Dict[str, Any]:
+        self.__request_id += 1
+        return {
+            "method": "SUBSCRIBE",
+            "params": [f"{key.lower()}@bookTicker" for key in stream_keys],
+            "id": self.__request_id,
+        }
+
+    def _parse(self, message: Dict[str, Any]) -> List[Tuple[Quote, int]]:
+        # e.g. {"u":400900217,"s":"BNBUSDT","b":"25.35190000","B":"31.21000000","a":"25.36520000","A":"40.66000000"}
+        key = message.get("s")
+        symbol = self._symbols.get(key)
+        if symbol is None or "u" not in message:
+            return []
+        quote = Quote.parse(
+            self.exchange_id, symbol, message["b"], message["a"], self._scales[key]
+        )
+        return [(quote, int(message["u"]))]
+
+
+class OKXTickerStream(MarketStream):
+    # https://www.okx.com/docs-v5/en/#order-book-trading-market-data-ws-tickers-channel
+    exchange_id = "okx"
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        store: MarketStore,
+        logger: logging.Logger,
+        instruments: Optional[InstrumentIndex] = None,
+    ):
+        default_url = (
+            "wss://wspap.okx.com:8443/ws/v5/public"
+            if config.get("is_simulated", True)
+            else "wss://ws.okx.com:8443/ws/v5/public"
+        )
+        super().__init__(
+            config, store, logger, default_url=default_url, instruments=instruments
+        )
+
+    def _stream_key(self, symbol: Symbol) -> str:
+        return f"{symbol.base}-{symbol.quote}"
+
+    def _subscribe_message(self, stream_keys: List[str]) -> Dict[str, Any]:
+        return {
+            "op": "subscribe",
+            "args": [{"channel": "tickers", "instId": key} for key in stream_keys],
+        }
+
+    async def _ping(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        # NOTE: OKX expects the literal string "ping" and answers "pong".
+        await ws.send_str("ping")
+
+    def _parse(self, message: Dict[str, Any]) -> List[Tuple[Quote, int]]:
+        if message.get("arg", {}).get("channel") != "tickers" or "data" not in message:
+            return []
+        updates = []
+        for data in message["data"]:
+            key = data.get("instId")
+            symbol = self._symbols.get(key)
+            if symbol is None:
+                continue
+            quote = Quote.parse(
+                self.exchange_id,
+                symbol,
+                data["bidPx"],
+                data["askPx"],
+                self._scales[key],
+            )
+            # ts is the exchange time in milliseconds. It is monotonic per instrument.
+            updates.append((quote, int(data["ts"])))
+        return updates
@@ -1,54 +1,170 @@
 # Read https://www.okx.com/docs-v5/en/#overview-demo-trading-services for demo.
-import asyncio
-import base64
-import hmac
-import hashlib
 import json
 import logging
+from typing import List, Optional
+
 import aiohttp
 from decimal import Decimal
-from datetime import datetime, timezone
-import urllib.parse
+from datetime import datetime
 
 from trading.domain.model.exceptions import MarketNotFoundException
 from trading.domain.model.order import Order, Market, OrderSide
 from trading.domain.model.order import Symbol
 from trading.domain.model.order import OrderStatus
+from trading.domain.model.order import OrderType
 from trading.domain.model.order import Price
+from trading.domain.model.order_book import OrderBook
 from trading.domain.model.exchange import ExchangeAdapter
+from trading.domain.model.instrument import Instrument
 from trading.domain.model.order import Market
+from trading.infrastructure.exchange.clock_sync import OffsetClock
+from trading.infrastructure.exchange.http_session import PooledSession
+from trading.infrastructure.exchange.json_decoder import (
+    DEFAULT_JSON_DECODER,
+    ResponseSchema,
+    get_decoder,
+)
+from trading.infrastructure.exchange.rate_limiter import (
+    OKX_LIMITS,
+    RateLimiter,
+    RequestPriority,
+)
+from trading.infrastructure.exchange.signing import OKXRequestSigner
+from trading.infrastructure.exchange.okx_fill_confirmer import (
+    DEFAULT_FILL_TIMEOUT,
+    DEFAULT_POLL_INITIAL_INTERVAL,
+    DEFAULT_POLL_MAX_INTERVAL,
+    OKXFillConfirmer,
+    OKXOrderStream,
+)
+
+
+def _response(name: str, *fields: str) -> ResponseSchema:
+    # NOTE: OKX wraps every result in {"code": ..., "msg": ..., "data": [...]}.
+    return ResponseSchema(
+        name, ("code", "msg"), lists=(("data", ResponseSchema(f"{name}Data", fields)),)
+    )
+
+
+# Fields read from the responses on the order path. Decoders with schema support skip the rest.
+TICKER_RESPONSE = _response("OKXTicker", "bidPx", "askPx")
+PLACE_ORDER_RESPONSE = _response("OKXPlaceOrder", "ordId", "sCode", "sMsg")
+ORDER_DETAILS_RESPONSE = _response(
+    "OKXOrderDetails",
+    "instId",
+    "ordId",
+    "side",
+    "sz",
+    "state",
+    "accFillSz",
+    "avgPx",
+    "ordType",
+    "px",
+    "cTime",
+)
 
 
 class OKXAdapter(ExchangeAdapter):
 
-    def __init__(self, config: dict, logger: logging.Logger):
-        self.__api_key = config["api_key"]
-        self.__api_secret = config["api_secret"]
-        self.__api_passphrase = config["api_passphrase"]
-        self.__is_simulated = config.get("is_simulated", True)
+    # ordType of https://www.okx.com/docs-v5/en/#order-book-trading-trade-post-place-order
+    ORDER_TYPES = {order_type.value: order_type for order_type in OrderType}
+
+    def __init__(
+        self,
+        config: dict,
+        logger: logging.Logger,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        # NOTE: Timestamps are taken on the exchange clock, as far as the clock sync has measured it.
+        self.__clock = OffsetClock()
+        self.__signer = OKXRequestSigner(
+            config["api_key"],
+            config["api_secret"],
+            config["api_passphrase"],
+            is_simulated=config.get("is_simulated", True),
+            clock=self.__clock,
+        )
         self.__base_url = config.get("base_url", "https://www.okx.com")
         self.__logger = logger
+        self.__http = PooledSession(config, logger=logger)
+        self.__decoder = get_decoder(config.get("json_decoder", DEFAULT_JSON_DECODER))
+        self.__rate_limiter = rate_limiter or RateLimiter(
+            "okx", OKX_LIMITS, logger=logger
+        )
+        # NOTE: Create order API doesn't return the order state, so fills are confirmed separately.
+        self.__fill_confirmer = OKXFillConfirmer(
+            fetch_order=self.get_order_details,
+            logger=logger,
+            timeout=float(config.get("fill_timeout", DEFAULT_FILL_TIMEOUT)),
+            initial_interval=float(
+                config.get("fill_poll_initial_interval", DEFAULT_POLL_INITIAL_INTERVAL)
+            ),
+            max_interval=float(
+                config.get("fill_poll_max_interval", DEFAULT_POLL_MAX_INTERVAL)
+            ),
+        )
+        self.__order_stream = (
+            OKXOrderStream(
+                config,
+                on_update=self._on_order_update,
+                logger=logger,
+                clock=self.__clock,
+            )
+            if config.get("use_order_stream", False)
+            else None
+        )
 
-    def __symbol_to_okx_inst_id(self, symbol: Symbol) -> str:
-        return f"{symbol.base}-{symbol.quote}"
+    async def open(self) -> None:
+        self.__http.open()
+        if self.__order_stream is not None:
+            await self.__order_stream.start()
 
-    def _generate_signature(self, timestamp, method, request_path, params) -> str:
-        # https://www.okx.com/web3/build/docs/waas/rest-authentication#signature
-        if method == "GET" and params:
-            # For GET, parameters are appended as query string
-            query_string = "?" + urllib.parse.urlencode(params)
-            pre_hash = timestamp + method + request_path + query_string
-        elif method == "POST" and params:
-            # For POST, parameters are converted to JSON string
-            pre_hash = timestamp + method + request_path + json.dumps(params)
-        else:
-            pre_hash = timestamp + method + request_path
-        signature = hmac.new(
-            self.__api_secret.encode("utf-8"), pre_hash.encode("utf-8"), hashlib.sha256
-        ).digest()
-        encoded_signature = base64.b64encode(signature).decode("utf-8")
+    async def close(self) -> None:
+        if self.__order_stream is not None:
+            await self.__order_stream.stop()
+        await self.__http.close()
+
+    async def warm_up(self, connections: int) -> int:
+        # NOTE: OKX has no ping endpoint. The system time is the cheapest public request.
+        return await self.__http.warm_up(
+            f"{self.__base_url}/api/v5/public/time",
+            connections,
+            before=lambda: self.__rate_limiter.acquire(
+                "GET /api/v5/public/time", RequestPriority.QUOTE
+            ),
+        )
+
+    def _on_order_update(self, order_data: dict) -> None:
+        self.__fill_confirmer.resolve(self._parse_order(order_data))
 
-        return encoded_signature
+    def __track_limits(self, response: aiohttp.ClientResponse) -> None:
+        # NOTE: OKX answers 429 (code 50011) when an endpoint limit is exceeded. Limits are per 2 seconds.
+        if response.status == 429:
+            self.__rate_limiter.pause(2.0)
+
+    def set_clock_offset(self, offset: float) -> None:
+        self.__clock.offset = offset
+
+    async def throttle_server_time(self) -> None:
+        await self.__rate_limiter.acquire(
+            "GET /api/v5/public/time", RequestPriority.QUOTE
+        )
+
+    async def get_server_time(self, throttle: bool = True) -> float:
+        # System time: https://www.okx.com/docs-v5/en/#public-data-rest-api-get-system-time
+        session = self.__http.session
+        if throttle:
+            await self.throttle_server_time()
+        async with session.get(f"{self.__base_url}/api/v5/public/time") as response:
+            self.__track_limits(response)
+            response.raise_for_status()
+            _data = self.__decoder.decode(await response.read())
+            if not (_data.get("code") == "0" and len(_data["data"]) > 0):
+                raise ValueError(f"Failed to get system time: {_data.get('msg')}")
+            return int(_data["data"][0]["ts"]) / 1000
+
+    def __symbol_to_okx_inst_id(self, symbol: Symbol) -> str:
+        return f"{symbol.base}-{symbol.quote}"
 
     def _map_okx_state_to_order_status(self, state: str) -> OrderStatus:
         # Map OKX order state to OrderStatus
@@ -64,160 +180,237 @@ class OKXAdapter(ExchangeAdapter):
 
     async def get_market(self, symbol: Symbol) -> Market:
         # Top of the book: read https://www.okx.com/docs-v5/en/#order-book-trading-market-data-get-ticker
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.__base_url}/api/v5/market/ticker"
-            inst_id = self.__symbol_to_okx_inst_id(symbol=symbol)
-            params = {"instId": inst_id}
-            self.__logger.debug(f"Getting market data for {inst_id} from OKX")
+        session = self.__http.session
+        url = f"{self.__base_url}/api/v5/market/ticker"
+        inst_id = self.__symbol_to_okx_inst_id(symbol=symbol)
+        params = {"instId": inst_id}
+        self.__logger.debug(f"Getting market data for {inst_id} from OKX")
 
-            async with session.get(url, params=params) as response:
-                self.__logger.debug(f"Response status: {response.status}")
-                response.raise_for_status()
-                _data = await response.json()
-                if not (_data.get("code") == "0" and len(_data["data"]) > 0):
-                    raise MarketNotFoundException(
-                        f"Failed to get market data: {_data.get('msg')}"
-                    )
+        await self.__rate_limiter.acquire(
+            "GET /api/v5/market/ticker", RequestPriority.QUOTE
+        )
+        async with session.get(url, params=params) as response:
+            self.__logger.debug(f"Response status: {response.status}")
+            self.__track_limits(response)
+            response.raise_for_status()
+            _data = self.__decoder.decode(await response.read(), TICKER_RESPONSE)
+            if not (_data.get("code") == "0" and len(_data["data"]) > 0):
+                raise MarketNotFoundException(
+                    f"Failed to get market data: {_data.get('msg')}"
+                )
 
-                data = _data["data"][0]
-                self.__logger.debug(f"Market data: {data}")
+            data = _data["data"][0]
+            self.__logger.debug(f"Market data: {data}")
+
+            now = datetime.now()
+            return Market(
+                exchange_id="okx",
+                symbol=symbol,
+                best_bid=Price(amount=Decimal(data["bidPx"]), timestamp=now),
+                best_ask=Price(amount=Decimal(data["askPx"]), timestamp=now),
+            )
 
-                return Market(
+    async def get_order_book(self, symbol: Symbol, depth: int) -> OrderBook:
+        # Order book: https://www.okx.com/docs-v5/en/#order-book-trading-market-data-get-order-book
+        session = self.__http.session
+        url = f"{self.__base_url}/api/v5/market/books"
+        inst_id = self.__symbol_to_okx_inst_id(symbol=symbol)
+        params = {"instId": inst_id, "sz": depth}
+        self.__logger.debug(f"Getting order book for {inst_id} from OKX")
+
+        await self.__rate_limiter.acquire(
+            "GET /api/v5/market/books", RequestPriority.QUOTE
+        )
+        async with session.get(url, params=params) as response:
+            self.__logger.debug(f"Response status: {response.status}")
+            self.__track_limits(response)
+            response.raise_for_status()
+            _data = self.__decoder.decode(await response.read())
+            if not (_data.get("code") == "0" and len(_data["data"]) > 0):
+                raise MarketNotFoundException(
+                    f"Failed to get order book: {_data.get('msg')}"
+                )
+
+            data = _data["data"][0]
+            # Levels are [price, size, deprecated, number of orders], best price first.
+            return OrderBook(
+                exchange_id="okx",
+                symbol=symbol,
+                bid_prices=tuple(Decimal(level[0]) for level in data["bids"]),
+                bid_sizes=tuple(Decimal(level[1]) for level in data["bids"]),
+                ask_prices=tuple(Decimal(level[0]) for level in data["asks"]),
+                ask_sizes=tuple(Decimal(level[1]) for level in data["asks"]),
+                timestamp=datetime.now(),
+            )
+
+    async def list_instruments(self) -> List[Instrument]:
+        # Instruments: https://www.okx.com/docs-v5/en/#public-data-rest-api-get-instruments
+        session = self.__http.session
+        url = f"{self.__base_url}/api/v5/public/instruments"
+        params = {"instType": "SPOT"}
+        self.__logger.debug("Getting instruments from OKX")
+
+        await self.__rate_limiter.acquire(
+            "GET /api/v5/public/instruments", RequestPriority.QUOTE
+        )
+        async with session.get(url, params=params) as response:
+            self.__logger.debug(f"Response status: {response.status}")
+            self.__track_limits(response)
+            response.raise_for_status()
+            _data = self.__decoder.decode(await response.read())
+            if _data.get("code") != "0":
+                raise ValueError(f"Failed to get instruments: {_data.get('msg')}")
+            return [
+                Instrument(
                     exchange_id="okx",
-                    symbol=symbol,
-                    best_bid=Price(
-                        amount=Decimal(data["bidPx"]), timestamp=datetime.now()
-                    ),
-                    best_ask=Price(
-                        amount=Decimal(data["askPx"]), timestamp=datetime.now()
-                    ),
+                    symbol=Symbol(base=data["baseCcy"], quote=data["quoteCcy"]),
+                    step_size=Decimal(data.get("lotSz") or "0"),
+                    min_quantity=Decimal(data.get("minSz") or "0"),
+                    # NOTE: maxMktSz of market buys is in the quote currency, so it isn't a base quantity limit.
+                    tick_size=Decimal(data.get("tickSz") or "0") or None,
                 )
+                for data in _data["data"]
+                if data.get("state") == "live"
+            ]
 
     async def place_order(self, order):
         # place order API: https://www.okx.com/docs-v5/en/#order-book-trading-trade-post-place-order
-        async with aiohttp.ClientSession() as session:
-            requeust_path = "/api/v5/trade/order"
-            url = f"{self.__base_url}{requeust_path}"
-            inst_id = self.__symbol_to_okx_inst_id(symbol=order.symbol)
-            body = {
-                "instId": inst_id,
-                "tdMode": "cash",
-                "side": "buy" if order.side == OrderSide.BUY else OrderSide.SELL,
-                "ordType": "market",
-                "sz": str(order.quantity),
-            }
-            self.__logger.debug(f"Placing order {body} on OKX")
-            timestamp_iso = (
-                datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
-            )
-            headers = {
-                "OK-ACCESS-KEY": self.__api_key,
-                "OK-ACCESS-TIMESTAMP": timestamp_iso,
-                "OK-ACCESS-PASSPHRASE": self.__api_passphrase,
-                "OK-ACCESS-SIGN": self._generate_signature(
-                    timestamp_iso, "POST", requeust_path, body
-                ),
-                "Content-Type": "application/json",  # POST requests need this header
-            }
-            if self.__is_simulated:
-                headers["x-simulated-trading"] = "1"
-
-            async with session.post(
-                url, headers=headers, data=json.dumps(body)
-            ) as response:
-                self.__logger.debug(f"Response status: {response.status}")
-                response.raise_for_status()
-                _data = await response.json()
-                if not (_data.get("code") == "0" and len(_data["data"]) > 0):
-                    raise ValueError(f"Failed to place order: {_data.get('msg')}")
-
-                data = _data["data"][0]
-                self.__logger.debug(f"Order response: {data}")
-                # NOTE: unlike Binance, create order API in OKX doesn't return the order status.
-                await asyncio.sleep(0.5)
-                # TODO: Error handling
-                return await self.get_order_details(
-                    order_id=data["ordId"], inst_id=inst_id
+        session = self.__http.session
+        requeust_path = "/api/v5/trade/order"
+        url = f"{self.__base_url}{requeust_path}"
+        inst_id = self.__symbol_to_okx_inst_id(symbol=order.symbol)
+        body = {
+            "instId": inst_id,
+            "tdMode": "cash",
+            "side": order.side.value,
+            # NOTE: The order types of OKX have the same names as OrderType.
+            "ordType": order.order_type.value,
+            "sz": str(order.quantity),
+        }
+        if order.order_type == OrderType.MARKET:
+            # NOTE: Market buys are sized in the quote currency by default. Size them in the base currency like Binance,
+            # so that the quantity and the lot size rules mean the same on both exchanges.
+            body["tgtCcy"] = "base_ccy"
+        else:
+            body["px"] = f"{order.limit_price:f}"
+        self.__logger.debug(f"Placing order {body} on OKX")
+        # NOTE: Serialize once. The body is sent exactly as signed.
+        payload = json.dumps(body)
+
+        await self.__rate_limiter.acquire(
+            f"POST {requeust_path}", RequestPriority.ORDER
+        )
+        headers = self.__signer.headers("POST", requeust_path, body=payload)
+        async with session.post(url, headers=headers, data=payload) as response:
+            self.__logger.debug(f"Response status: {response.status}")
+            self.__track_limits(response)
+            response.raise_for_status()
+            _data = self.__decoder.decode(await response.read(), PLACE_ORDER_RESPONSE)
+            data = _data["data"][0] if _data.get("data") else {}
+            # NOTE: code is the result of the request, sCode the result of the order. sMsg tells why it was rejected.
+            if _data.get("code") != "0" or data.get("sCode") not in (None, "0"):
+                raise ValueError(
+                    f"Failed to place order: {data.get('sMsg') or _data.get('msg')}"
                 )
+            if not data.get("ordId"):
+                raise ValueError(f"Failed to place order: {_data.get('msg')}")
+            self.__logger.debug(f"Order response: {data}")
+        if order.order_type == OrderType.LIMIT:
+            # NOTE: A limit order rests on the book until it fills, so there is no final state to wait for.
+            # Return it accepted, as Binance does.
+            return Order(
+                id=data["ordId"],
+                symbol=order.symbol,
+                side=order.side,
+                quantity=order.quantity,
+                status=OrderStatus.PENDING,
+                created_at=datetime.now(),
+                exchange_id="okx",
+                parent_id=order.parent_id,
+                order_type=order.order_type,
+                limit_price=order.limit_price,
+            )
+        # NOTE: unlike Binance, create order API in OKX doesn't return the order status.
+        # Wait for the fill confirmed by polling or by the private orders channel.
+        result = await self.__fill_confirmer.confirm(
+            order_id=data["ordId"], inst_id=inst_id
+        )
+        result.parent_id = order.parent_id
+        return result
+
+    def _parse_order(self, order_data: dict) -> Order:
+        # Order fields are the same for the order details API and the orders channel.
+        # Parse the symbol from instId
+        symbol_parts = order_data["instId"].split("-")
+        symbol = Symbol(base=symbol_parts[0], quote=symbol_parts[1])
+
+        # Determine order side
+        side = OrderSide.BUY if order_data["side"] == "buy" else OrderSide.SELL
+
+        status = self._map_okx_state_to_order_status(order_data.get("state", ""))
+        filled_quantity = (
+            Decimal(order_data["accFillSz"]) if order_data.get("accFillSz") else None
+        )
+        if status == OrderStatus.FAILED and filled_quantity:
+            # NOTE: An IOC order is canceled with what it filled.
+            status = OrderStatus.PARTIALLY_FILLED
+
+        # cTime is unix timestamp format in milliseconds, e.g. 1597026383085
+        created_time = datetime.fromtimestamp(int(order_data.get("cTime", "0")) / 1000)
+
+        return Order(
+            id=order_data["ordId"],
+            symbol=symbol,
+            side=side,
+            quantity=Decimal(order_data.get("sz", "0")),
+            status=status,
+            created_at=created_time,
+            exchange_id="okx",
+            filled_price=(
+                Decimal(order_data.get("avgPx", "0"))
+                if order_data.get("avgPx")
+                else None
+            ),
+            filled_quantity=filled_quantity,
+            order_type=self.ORDER_TYPES.get(
+                order_data.get("ordType", ""), OrderType.MARKET
+            ),
+            limit_price=Decimal(order_data["px"]) if order_data.get("px") else None,
+        )
 
     async def get_order_details(self, order_id: str, inst_id: str) -> Order:
         # https://www.okx.com/docs-v5/en/#order-book-trading-trade-get-order-details
-        async with aiohttp.ClientSession() as session:
-            request_path = "/api/v5/trade/order"
-            url = f"{self.__base_url}{request_path}"
+        session = self.__http.session
+        request_path = "/api/v5/trade/order"
+        url = f"{self.__base_url}{request_path}"
 
-            # Parameters for the request
-            params = {"instId": inst_id, "ordId": order_id}
+        # Parameters for the request
+        params = {"instId": inst_id, "ordId": order_id}
 
-            # Get ISO timestamp
-            timestamp = (
-                datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+        try:
+            # NOTE: Order details confirm fills, so they share the priority of order placement.
+            await self.__rate_limiter.acquire(
+                f"GET {request_path}", RequestPriority.ORDER
             )
+            # GET parameters are signed as the query string.
+            headers = self.__signer.headers("GET", request_path, params=params)
+            async with session.get(url, headers=headers, params=params) as response:
+                self.__logger.debug(f"Response status: {response.status}")
+                self.__track_limits(response)
+                data = self.__decoder.decode(
+                    await response.read(), ORDER_DETAILS_RESPONSE
+                )
+                self.__logger.debug(f"Response: {data}")
+                response.raise_for_status()
+
+                # Check if the request was successful
+                if data.get("code") == "0" and len(data["data"]) > 0:
+                    return self._parse_order(data["data"][0])
+                else:
+                    error_msg = f"Failed to get order details: {data.get('msg', 'Unknown error')}"
+                    self.__logger.error(error_msg)
+                    raise Exception(error_msg)
 
-            # Generate signature for GET request with params
-            signature = self._generate_signature(timestamp, "GET", request_path, params)
-
-            headers = {
-                "OK-ACCESS-KEY": self.__api_key,
-                "OK-ACCESS-TIMESTAMP": timestamp,
-                "OK-ACCESS-PASSPHRASE": self.__api_passphrase,
-                "OK-ACCESS-SIGN": signature,
-            }
-
-            # Add simulated trading header if enabled
-            if self.__is_simulated:
-                headers["x-simulated-trading"] = "1"
-
-            try:
-                async with session.get(url, headers=headers, params=params) as response:
-                    self.__logger.debug(f"Response status: {response.status}")
-                    data = await response.json()
-                    self.__logger.debug(f"Response: {data}")
-                    response.raise_for_status()
-
-                    # Check if the request was successful
-                    if data.get("code") == "0" and len(data["data"]) > 0:
-                        order_data = data["data"][0]
-
-                        # Parse the symbol from instId
-                        symbol_parts = order_data["instId"].split("-")
-                        symbol = Symbol(base=symbol_parts[0], quote=symbol_parts[1])
-
-                        # Determine order side
-                        side = (
-                            OrderSide.BUY
-                            if order_data["side"] == "buy"
-                            else OrderSide.SELL
-                        )
-
-                        status = self._map_okx_state_to_order_status(
-                            order_data.get("state", "")
-                        )
-
-                        # cTime is unix timestamp format in milliseconds, e.g. 1597026383085
-                        created_time = datetime.fromtimestamp(
-                            int(order_data.get("cTime", "0")) / 1000
-                        )
-
-                        return Order(
-                            id=order_data["ordId"],
-                            symbol=symbol,
-                            side=side,
-                            quantity=Decimal(order_data.get("sz", "0")),
-                            status=status,
-                            created_at=created_time,
-                            exchange_id="okx",
-                            filled_price=(
-                                Decimal(order_data.get("avgPx", "0"))
-                                if order_data.get("avgPx")
-                                else None
-                            ),
-                        )
-                    else:
-                        error_msg = f"Failed to get order details: {data.get('msg', 'Unknown error')}"
-                        self.__logger.error(error_msg)
-                        raise Exception(error_msg)
-
-            except Exception as e:
-                self.__logger.error(f"Error getting order details: {str(e)}")
-                raise e
+        except Exception as e:
+            self.__logger.error(f"Error getting order details: {str(e)}")
+            raise e
@@ -0,0 +1,222 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import aiohttp
+
+from trading.domain.model.order import Order, OrderStatus
+from trading.infrastructure.exchange.http_session import PooledSession
+from trading.infrastructure.exchange.signing import Clock, OKXRequestSigner
+
+DEFAULT_FILL_TIMEOUT = 5.0
+DEFAULT_POLL_INITIAL_INTERVAL = 0.05
+DEFAULT_POLL_MAX_INTERVAL = 0.5
+DEFAULT_POLL_BACKOFF = 2.0
+# NOTE: Bound for push updates that arrive before the order placement response.
+MAX_EARLY_UPDATES = 1024
+
+
+class OKXFillConfirmer:
+    """
+    Resolves a per-order future as soon as OKX knows the final state of the order.
+    - Polls order details with exponential backoff until the deadline.
+    - Push updates from the private orders channel (OKXOrderStream) resolve the future earlier.
+    Whichever comes first wins.
+    """
+
+    def __init__(
+        self,
+        fetch_order: Callable[[str, str], Awaitable[Order]],
+        logger: logging.Logger,
+        timeout: float = DEFAULT_FILL_TIMEOUT,
+        initial_interval: float = DEFAULT_POLL_INITIAL_INTERVAL,
+        max_interval: float = DEFAULT_POLL_MAX_INTERVAL,
+        backoff: float = DEFAULT_POLL_BACKOFF,
+    ):
+        self.__fetch_order = fetch_order
+        self.__logger = logger
+        self.__timeout = timeout
+        self.__initial_interval = initial_interval
+        self.__max_interval = max_interval
+        self.__backoff = backoff
+        self.__futures: Dict[str, asyncio.Future] = {}
+        self.__early_updates: "OrderedDict[str, Order]" = OrderedDict()
+
+    @staticmethod
+    def is_final(order: Order) -> bool:
+        # NOTE: Partially filled orders are final: IOC orders canceled after a partial fill.
+        return order.status in (
+            OrderStatus.FILLED,
+            OrderStatus.PARTIALLY_FILLED,
+            OrderStatus.FAILED,
+        )
+
+    def confirm(self, order_id: str, inst_id: str) -> asyncio.Future:
+        """Return a future resolved with the order in its final state (or its last known state at the deadline)"""
+        future = self.__futures.get(order_id)
+        if future is not None:
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        early = self.__early_updates.pop(order_id, None)
+        if early is not None:
+            future.set_result(early)
+            return future
+
+        self.__futures[order_id] = future
+        poller = asyncio.create_task(self._poll(order_id, inst_id, future))
+
+        def _cleanup(_: asyncio.Future) -> None:
+            self.__futures.pop(order_id, None)
+            poller.cancel()
+
+        future.add_done_callback(_cleanup)
+        return future
+
+    def resolve(self, order: Order) -> None:
+        """Push update of an order, e.g. from the private orders channel"""
+        if not self.is_final(order):
+            return
+        future = self.__futures.get(order.id)
+        if future is None:
+            self.__early_updates[order.id] = order
+            while len(self.__early_updates) > MAX_EARLY_UPDATES:
+                self.__early_updates.popitem(last=False)
+        elif not future.done():
+            self.__logger.debug(f"Order {order.id} confirmed by push: {order.status}")
+            future.set_result(order)
+
+    async def _poll(self, order_id: str, inst_id: str, future: asyncio.Future) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.__timeout
+        interval = self.__initial_interval
+        last_order: Optional[Order] = None
+        last_error: Optional[Exception] = None
+        while not future.done():
+            await asyncio.sleep(min(interval, max(deadline - loop.time(), 0)))
+            try:
+                last_order = await self.__fetch_order(order_id, inst_id)
+            except Exception as e:
+                # NOTE: Right after placement OKX may not know the order yet. Keep polling.
+                last_error = e
+                self.__logger.debug(f"Polling order {order_id} failed: {str(e)}")
+
+            if future.done():
+                return
+            if last_order is not None and self.is_final(last_order):
+                self.__logger.debug(f"Order {order_id} confirmed by polling")
+                future.set_result(last_order)
+                return
+            if loop.time() >= deadline:
+                self.__logger.warning(
+                    f"Order {order_id} not final after {self.__timeout}s"
+                )
+                if last_order is not None:
+                    future.set_result(last_order)
+                else:
+                    future.set_exception(
+                        TimeoutError(
+                            f"Failed to get order {order_id} details: {last_error}"
+                        )
+                    )
+                return
+            interval = min(interval * self.__backoff, self.__max_interval)
+
+
+class OKXOrderStream:
+    """
+    Private orders channel of OKX. Every order update is passed to on_update.
+    Ref: https://www.okx.com/docs-v5/en/#order-book-trading-trade-ws-order-channel
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        on_update: Callable[[Dict[str, Any]], None],
+        logger: logging.Logger,
+        clock: Clock = time.time,
+    ):
+        self.__signer = OKXRequestSigner(
+            config["api_key"],
+            config["api_secret"],
+            config["api_passphrase"],
+            clock=clock,
+        )
+        self.__url = config.get(
+            "private_ws_url",
+            (
+                "wss://wspap.okx.com:8443/ws/v5/private"
+                if config.get("is_simulated", True)
+                else "wss://ws.okx.com:8443/ws/v5/private"
+            ),
+        )
+        self.__reconnect_delay = float(config.get("reconnect_delay", 0.5))
+        self.__on_update = on_update
+        self.__logger = logger
+        self.__http = PooledSession(config, logger=logger)
+        self.__task: Optional[asyncio.Task] = None
+        self.__subscribed = asyncio.Event()
+
+    def _login_args(self) -> Dict[str, str]:
+        return self.__signer.login_args()
+
+    async def wait_subscribed(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self.__subscribed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def start(self) -> None:
+        if self.__task is None:
+            self.__task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+            self.__task = None
+        await self.__http.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._consume()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.__logger.warning(f"OKX order stream error: {str(e)}")
+            finally:
+                self.__subscribed.clear()
+            # NOTE: Polling still confirms fills while the stream reconnects.
+            await asyncio.sleep(self.__reconnect_delay)
+
+    async def _consume(self) -> None:
+        async with self.__http.session.ws_connect(self.__url, heartbeat=20) as ws:
+            await ws.send_json({"op": "login", "args": [self._login_args()]})
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    break
+                message = msg.json()
+                event = message.get("event")
+                if event == "login":
+                    await ws.send_json(
+                        {
+                            "op": "subscribe",
+                            "args": [{"channel": "orders", "instType": "SPOT"}],
+                        }
+                    )
+                elif event == "subscribe":
+                    self.__subscribed.set()
+                    self.__logger.info("Subscribed to OKX orders channel")
+                elif event == "error":
+                    raise ConnectionError(
+                        f"OKX order stream error {message.get('code')}: {message.get('msg')}"
+                    )
+                for order_data in message.get("data", []):
+                    self.__on_update(order_data)
@@ -1,3 +0,0 @@
-class OtherAdapter(ExchangeAdapter):
-    async def get_market(self, symbol: Symbol) -> Market:
-        pass
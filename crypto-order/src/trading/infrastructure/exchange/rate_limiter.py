@@ -0,0 +1,292 @@
+import asyncio
+import itertools
+import logging
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Dict, List, Optional, Tuple
+
+
+class RequestPriority(IntEnum):
+    """Lower value is served first"""
+
+    ORDER = 0
+    QUOTE = 1
+
+
+@dataclass(frozen=True)
+class BucketLimit:
+    capacity: float
+    # Tokens regained per second.
+    refill_rate: float
+
+
+@dataclass(frozen=True)
+class ExchangeLimits:
+    buckets: Dict[str, BucketLimit]
+    # "METHOD /path" -> [(bucket name, weight)]. Unknown endpoints cost `default_cost`.
+    endpoints: Dict[str, List[Tuple[str, float]]]
+    default_cost: List[Tuple[str, float]] = field(default_factory=list)
+
+
+# Binance shares one request weight budget per IP across endpoints. Orders have their own count limit.
+# Ref: https://developers.binance.com/docs/binance-spot-api-docs/rest-api/limits
+BINANCE_LIMITS = ExchangeLimits(
+    buckets={
+        "weight": BucketLimit(capacity=6000, refill_rate=6000 / 60),
+        "orders": BucketLimit(capacity=100, refill_rate=100 / 10),
+    },
+    endpoints={
+        "GET /api/v3/ticker/bookTicker": [("weight", 2)],
+        # NOTE: Weight of the depth endpoint depends on the limit. See binance_depth_weight.
+        "GET /api/v3/depth": [("weight", 5)],
+        "POST /api/v3/order": [("weight", 1), ("orders", 1)],
+        "GET /api/v3/exchangeInfo": [("weight", 20)],
+        "GET /api/v3/time": [("weight", 1)],
+        "GET /api/v3/ping": [("weight", 1)],
+    },
+    default_cost=[("weight", 1)],
+)
+
+# OKX limits every endpoint separately.
+# Ref: "Rate Limit" of each endpoint in https://www.okx.com/docs-v5/en/
+OKX_LIMITS = ExchangeLimits(
+    buckets={
+        "ticker": BucketLimit(capacity=20, refill_rate=20 / 2),
+        "books": BucketLimit(capacity=40, refill_rate=40 / 2),
+        "place_order": BucketLimit(capacity=60, refill_rate=60 / 2),
+        "order_details": BucketLimit(capacity=60, refill_rate=60 / 2),
+        "instruments": BucketLimit(capacity=20, refill_rate=20 / 2),
+        "time": BucketLimit(capacity=10, refill_rate=10 / 2),
+    },
+    endpoints={
+        "GET /api/v5/market/ticker": [("ticker", 1)],
+        "GET /api/v5/market/books": [("books", 1)],
+        "POST /api/v5/trade/order": [("place_order", 1)],
+        "GET /api/v5/trade/order": [("order_details", 1)],
+        "GET /api/v5/public/instruments": [("instruments", 1)],
+        "GET /api/v5/public/time": [("time", 1)],
+    },
+)
+
+EXCHANGE_LIMITS: Dict[str, ExchangeLimits] = {
+    "binance": BINANCE_LIMITS,
+    "okx": OKX_LIMITS,
+}
+
+
+def binance_depth_weight(limit: int) -> float:
+    # https://developers.binance.com/docs/binance-spot-api-docs/rest-api/market-data-endpoints#order-book
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 25
+    if limit <= 1000:
+        return 50
+    return 250
+
+
+class _TokenBucket:
+    def __init__(self, limit: BucketLimit, now: float):
+        self.capacity = limit.capacity
+        self.refill_rate = limit.refill_rate
+        self.tokens = limit.capacity
+        self.updated_at = now
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate
+        )
+        self.updated_at = now
+
+    def time_until(self, weight: float) -> float:
+        # NOTE: A weight above the capacity waits for a full bucket instead of forever.
+        return max(min(weight, self.capacity) - self.tokens, 0) / self.refill_rate
+
+
+@dataclass
+class _Waiter:
+    priority: RequestPriority
+    sequence: int
+    cost: List[Tuple[str, float]]
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter of one exchange.
+    Requests wait in priority order per bucket, so order placement overtakes queued quote fetches,
+    while requests on other buckets are not blocked by them.
+    """
+
+    def __init__(
+        self, exchange_id: str, limits: ExchangeLimits, logger: logging.Logger
+    ):
+        self.exchange_id = exchange_id
+        self.__limits = limits
+        self.__logger = logger
+        self.__buckets: Optional[Dict[str, _TokenBucket]] = None
+        self.__waiters: List[_Waiter] = []
+        self.__sequence = itertools.count()
+        self.__timer: Optional[asyncio.TimerHandle] = None
+        self.__paused_until = 0.0
+        self.__granted = 0
+        self.__total_wait = 0.0
+        self.__max_wait = 0.0
+
+    def _buckets(self, now: float) -> Dict[str, _TokenBucket]:
+        # NOTE: Created lazily because the loop clock is only available inside the loop.
+        if self.__buckets is None:
+            self.__buckets = {
+                name: _TokenBucket(limit, now)
+                for name, limit in self.__limits.buckets.items()
+            }
+        return self.__buckets
+
+    def cost(
+        self, endpoint: str, weight: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
+        cost = self.__limits.endpoints.get(endpoint, self.__limits.default_cost)
+        if weight is None:
+            return cost
+        # NOTE: The weight override applies to the first (shared) bucket of the endpoint.
+        return [(cost[0][0], weight)] + cost[1:] if cost else cost
+
+    async def acquire(
+        self,
+        endpoint: str,
+        priority: RequestPriority = RequestPriority.QUOTE,
+        weight: Optional[float] = None,
+    ) -> None:
+        """Wait until the endpoint can be called without exceeding the exchange limits"""
+        cost = self.cost(endpoint, weight)
+        if not cost:
+            return
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            priority=priority,
+            sequence=next(self.__sequence),
+            cost=cost,
+            future=loop.create_future(),
+            enqueued_at=loop.time(),
+        )
+        self.__waiters.append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self.__waiters:
+                self.__waiters.remove(waiter)
+            raise
+
+    def sync_usage(self, bucket: str, used: float) -> None:
+        """Align a bucket with the usage reported by the exchange, e.g. X-MBX-USED-WEIGHT-1M"""
+        now = asyncio.get_running_loop().time()
+        buckets = self._buckets(now)
+        if bucket not in buckets:
+            return
+        buckets[bucket].refill(now)
+        buckets[bucket].tokens = min(
+            buckets[bucket].tokens, buckets[bucket].capacity - used
+        )
+
+    def pause(self, seconds: float) -> None:
+        """Stop sending requests, e.g. after 429 with Retry-After"""
+        loop = asyncio.get_running_loop()
+        self.__paused_until = max(self.__paused_until, loop.time() + seconds)
+        self.__logger.warning(f"{self.exchange_id} requests paused for {seconds}s")
+        self._schedule(seconds)
+
+    def _schedule(self, delay: float) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+        self.__timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # NOTE: Dispatching now supersedes the pending wake-up. Cancelling the handle that fired is a no-op.
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if now < self.__paused_until:
+            self._schedule(self.__paused_until - now)
+            return
+
+        # NOTE: Cancelled waiters leave the queue only once their task resumes. Drop them before granting,
+        # so that they neither take tokens nor get a result set on their cancelled future.
+        self.__waiters = [w for w in self.__waiters if not w.future.done()]
+
+        buckets = self._buckets(now)
+        for bucket in buckets.values():
+            bucket.refill(now)
+
+        # NOTE: A waiter that can't be served blocks lower priority waiters on the same buckets only.
+        blocked = set()
+        next_wake_up = None
+        for waiter in sorted(self.__waiters, key=lambda w: (w.priority, w.sequence)):
+            names = [name for name, _ in waiter.cost]
+            if blocked.intersection(names):
+                continue
+            wait = max(buckets[name].time_until(weight) for name, weight in waiter.cost)
+            if wait > 0:
+                blocked.update(names)
+                next_wake_up = wait if next_wake_up is None else min(next_wake_up, wait)
+                continue
+            for name, weight in waiter.cost:
+                buckets[name].tokens -= weight
+            self.__waiters.remove(waiter)
+            waited = now - waiter.enqueued_at
+            self.__granted += 1
+            self.__total_wait += waited
+            self.__max_wait = max(self.__max_wait, waited)
+            waiter.future.set_result(None)
+
+        if next_wake_up is not None:
+            self._schedule(next_wake_up)
+
+    def metrics(self) -> Dict[str, float]:
+        return {
+            "queue_depth": len(self.__waiters),
+            "queued_orders": sum(
+                1 for w in self.__waiters if w.priority == RequestPriority.ORDER
+            ),
+            "queued_quotes": sum(
+                1 for w in self.__waiters if w.priority == RequestPriority.QUOTE
+            ),
+            "granted": self.__granted,
+            "average_wait": (
+                self.__total_wait / self.__granted if self.__granted else 0.0
+            ),
+            "max_wait": self.__max_wait,
+        }
+
+
+class RequestScheduler:
+    """One rate limiter per exchange, shared by every adapter and stream of the process"""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        limits: Optional[Dict[str, ExchangeLimits]] = None,
+    ):
+        self.__logger = logger
+        self.__limits = limits or EXCHANGE_LIMITS
+        self.__limiters: Dict[str, RateLimiter] = {}
+
+    def limiter(self, exchange_id: str) -> RateLimiter:
+        if exchange_id not in self.__limiters:
+            self.__limiters[exchange_id] = RateLimiter(
+                exchange_id,
+                self.__limits.get(
+                    exchange_id, ExchangeLimits(buckets={}, endpoints={})
+                ),
+                logger=self.__logger,
+            )
+        return self.__limiters[exchange_id]
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        return {
+            exchange_id: limiter.metrics()
+            for exchange_id, limiter in self.__limiters.items()
+        }
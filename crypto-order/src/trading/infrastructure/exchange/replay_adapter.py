@@ -0,0 +1,155 @@
+import asyncio
+import bisect
+import logging
+import uuid
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+
+from trading.domain.model.exceptions import MarketNotFoundException
+from trading.domain.model.exchange import ExchangeAdapter
+from trading.domain.model.order import Market, Order, OrderSide, OrderStatus, Symbol
+from trading.infrastructure.exchange.quote_tape import TapeEntry
+
+
+class QuoteReplay:
+    """
+    Plays the quotes of a tape, keeping the latest quote per exchange and symbol.
+    With speed=1.0 quotes arrive with their original timing, with speed=10.0 ten times faster,
+    and with speed=None as fast as the consumer takes them.
+    """
+
+    def __init__(
+        self,
+        entries: Sequence[TapeEntry],
+        logger: logging.Logger,
+        speed: Optional[float] = 1.0,
+    ):
+        if speed is not None and speed <= 0:
+            raise ValueError(f"Replay speed must be positive, got {speed}")
+        self.entries = sorted(entries, key=lambda entry: entry.timestamp)
+        self.logger = logger
+        self.speed = speed
+        self.position = 0
+        # Latest quote by symbol, then exchange.
+        self.__latest: Dict[Symbol, Dict[str, Market]] = {}
+        self.__timestamps = [entry.timestamp for entry in self.entries]
+
+    @property
+    def time(self) -> Optional[float]:
+        """Tape time of the last quote played"""
+        if self.position == 0:
+            return None
+        return self.entries[self.position - 1].timestamp
+
+    @property
+    def finished(self) -> bool:
+        return self.position >= len(self.entries)
+
+    def step(self) -> Optional[TapeEntry]:
+        """Play the next quote"""
+        if self.finished:
+            return None
+        entry = self.entries[self.position]
+        self.position += 1
+        market = entry.market
+        self.__latest.setdefault(market.symbol, {})[market.exchange_id] = market
+        return entry
+
+    def advance_to(self, timestamp: float) -> None:
+        """Play every quote up to and including tape time timestamp"""
+        end = bisect.bisect_right(self.__timestamps, timestamp)
+        while self.position < end:
+            self.step()
+
+    async def play(self) -> AsyncIterator[TapeEntry]:
+        """Play the tape, yielding each quote once it is current"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        first = self.entries[0].timestamp if self.entries else 0.0
+        while not self.finished:
+            if self.speed is not None:
+                due = (
+                    started
+                    + (self.entries[self.position].timestamp - first) / self.speed
+                )
+                delay = due - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            yield self.step()
+
+    def market(self, exchange_id: str, symbol: Symbol) -> Optional[Market]:
+        return self.__latest.get(symbol, {}).get(exchange_id)
+
+    def markets(self, symbol: Symbol) -> List[Market]:
+        """Latest quotes of symbol on every exchange, in the order the exchanges first appeared"""
+        return list(self.__latest.get(symbol, {}).values())
+
+    def exchange_ids(self) -> List[str]:
+        return list(dict.fromkeys(e.market.exchange_id for e in self.entries))
+
+
+class ReplayExchangeAdapter(ExchangeAdapter):
+    """
+    Exchange serving the quotes of a QuoteReplay as of its current position.
+    Market orders fill at once at the replayed top of book, so that routing can be tested end to end.
+    """
+
+    def __init__(
+        self,
+        exchange_id: str,
+        replay: QuoteReplay,
+        logger: logging.Logger,
+    ):
+        self.__exchange_id = exchange_id
+        self.__replay = replay
+        self.__logger = logger
+
+    async def get_market(self, symbol: Symbol) -> Market:
+        market = self.__replay.market(self.__exchange_id, symbol)
+        if market is None:
+            raise MarketNotFoundException(
+                f"No replayed quote for {symbol} on {self.__exchange_id}"
+            )
+        return market
+
+    async def list_symbols(self) -> List[Symbol]:
+        return list(
+            dict.fromkeys(
+                entry.market.symbol
+                for entry in self.__replay.entries
+                if entry.market.exchange_id == self.__exchange_id
+            )
+        )
+
+    async def place_order(self, order: Order) -> Order:
+        market = await self.get_market(order.symbol)
+        price = market.best_ask if order.side == OrderSide.BUY else market.best_bid
+        if price is None:
+            raise MarketNotFoundException(
+                f"No replayed {order.side.value} price for {order.symbol} on {self.__exchange_id}"
+            )
+        self.__logger.debug(
+            f"Replay fill of {order.side.value} {order.quantity} {order.symbol} on {self.__exchange_id} at {price.amount}"
+        )
+        return Order(
+            id=str(uuid.uuid4()),
+            symbol=order.symbol,
+            side=order.side,
+            quantity=order.quantity,
+            status=OrderStatus.FILLED,
+            created_at=datetime.now(),
+            exchange_id=self.__exchange_id,
+            filled_price=price.amount,
+            filled_quantity=order.quantity,
+            parent_id=order.parent_id,
+        )
+
+
+def create_replay_exchanges(
+    replay: QuoteReplay, logger: logging.Logger
+) -> Dict[str, ReplayExchangeAdapter]:
+    """One replay adapter per exchange on the tape"""
+    return {
+        exchange_id: ReplayExchangeAdapter(exchange_id, replay, logger=logger)
+        for exchange_id in replay.exchange_ids()
+    }
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from trading.domain.model.order import Market, Symbol
+from trading.domain.model.order_book import OrderBook
+from trading.domain.repository.market_repository import MarketRepository
+
+DEFAULT_MAX_AGE = 1.0
+DEFAULT_MAX_ENTRIES = 256
+
+
+@dataclass
+class QuoteCacheMetrics:
+    """Counters to tune the staleness budget against fill quality"""
+
+    hits: int = 0
+    misses: int = 0
+    shared: int = 0
+    evictions: int = 0
+    total_hit_age: float = 0.0
+    max_hit_age: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        requests = self.hits + self.misses + self.shared
+        return self.hits / requests if requests else 0.0
+
+    @property
+    def average_hit_age(self) -> float:
+        return self.total_hit_age / self.hits if self.hits else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "evictions": self.evictions,
+            "hit_ratio": self.hit_ratio,
+            "average_hit_age": self.average_hit_age,
+            "max_hit_age": self.max_hit_age,
+        }
+
+
+class CachedMarketRepositoryImpl(MarketRepository):
+    """
+    TTL cache around another MarketRepository.
+    - A cached quote is served while its Price.timestamp is within the max age of its exchange.
+    - Concurrent callers for the same symbol share one in-flight fetch.
+    - At most max_entries symbols are kept. The least recently used one is evicted first.
+    """
+
+    def __init__(
+        self,
+        repository: MarketRepository,
+        logger: logging.Logger,
+        max_age: Optional[Dict[str, float]] = None,
+        default_max_age: float = DEFAULT_MAX_AGE,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.repository = repository
+        self.logger = logger
+        self.max_age = max_age or {}
+        self.default_max_age = default_max_age
+        self.max_entries = max_entries
+        self.metrics = QuoteCacheMetrics()
+        self.__entries: "OrderedDict[str, List[Market]]" = OrderedDict()
+        self.__in_flight: Dict[str, asyncio.Task] = {}
+
+    def _age(self, market: Market, now: datetime) -> float:
+        # NOTE: The oldest side decides the age of the quote.
+        timestamp = min(market.best_bid.timestamp, market.best_ask.timestamp)
+        return (now - timestamp).total_seconds()
+
+    def _is_fresh(self, market: Market, now: datetime) -> bool:
+        if market.best_bid is None or market.best_ask is None:
+            return False
+        max_age = self.max_age.get(market.exchange_id, self.default_max_age)
+        return self._age(market, now) <= max_age
+
+    def invalidate(self, symbol: Optional[Symbol] = None) -> None:
+        if symbol is None:
+            self.__entries.clear()
+        else:
+            self.__entries.pop(str(symbol), None)
+
+    async def get_all_markets(self, symbol: Symbol) -> List[Market]:
+        key = str(symbol)
+        now = datetime.now()
+        markets = self.__entries.get(key)
+        if markets and all(self._is_fresh(m, now) for m in markets):
+            self.__entries.move_to_end(key)
+            age = max(self._age(m, now) for m in markets)
+            self.metrics.hits += 1
+            self.metrics.total_hit_age += age
+            self.metrics.max_hit_age = max(self.metrics.max_hit_age, age)
+            self.logger.debug(f"Quote cache hit for {symbol}, age {age:.3f}s")
+            return list(markets)
+
+        in_flight = self.__in_flight.get(key)
+        if in_flight is not None:
+            self.metrics.shared += 1
+            return list(await asyncio.shield(in_flight))
+
+        self.metrics.misses += 1
+        # NOTE: The fetch runs in its own task, so that cancelling the caller that started it
+        # doesn't cancel it for the callers sharing it.
+        task = asyncio.create_task(self.__fetch(key, symbol))
+        self.__in_flight[key] = task
+        return list(await asyncio.shield(task))
+
+    async def __fetch(self, key: str, symbol: Symbol) -> List[Market]:
+        try:
+            markets = await self.repository.get_all_markets(symbol)
+        finally:
+            del self.__in_flight[key]
+        self._store(key, markets)
+        return markets
+
+    async def get_all_order_books(self, symbol: Symbol, depth: int) -> List[OrderBook]:
+        # NOTE: Depth is used for sizing the order, so it is always fetched fresh.
+        return await self.repository.get_all_order_books(symbol, depth)
+
+    def _store(self, key: str, markets: List[Market]) -> None:
+        if not markets:
+            return
+        self.__entries[key] = markets
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_entries:
+            evicted, _ = self.__entries.popitem(last=False)
+            self.metrics.evictions += 1
+            self.logger.debug(f"Evicted {evicted} from quote cache")
@@ -1,21 +1,84 @@
 from abc import ABC, abstractmethod
+import dataclasses
 import logging
-from typing import Dict, List
+import time
+from decimal import ROUND_DOWN, ROUND_UP
+from typing import Dict, List, Optional
 
 from trading.domain.model.exchange import ExchangeAdapter
-from trading.domain.model.order import Order, Market
+from trading.domain.model.instrument import InstrumentIndex
+from trading.domain.model.order import (
+    Market,
+    Order,
+    OrderEvent,
+    OrderSide,
+    OrderStatus,
+)
 from trading.domain.repository.exchange_repository import ExchangeRepository
+from trading.domain.repository.order_journal_repository import OrderJournalRepository
 
 
 # Interface for Exchange Repository
 class ExchangeRepositoryImpl(ExchangeRepository):
-    def __init__(self, exchanges: Dict[str, ExchangeAdapter], logger: logging.Logger):
+    def __init__(
+        self,
+        exchanges: Dict[str, ExchangeAdapter],
+        logger: logging.Logger,
+        instruments: Optional[InstrumentIndex] = None,
+        order_journal: Optional[OrderJournalRepository] = None,
+    ):
         self.exchanges = exchanges
         self.logger = logger
+        self.instruments = instruments or InstrumentIndex()
+        self.order_journal = order_journal
+
+    async def _journal(self, event: OrderEvent) -> None:
+        if self.order_journal is not None:
+            await self.order_journal.append(event)
 
     async def place_order(self, order: Order) -> Order:
         exchange = self.exchanges.get(order.exchange_id)
         if exchange is None:
             raise ValueError(f"Exchange {order.exchange_id} not found")
-        order = await exchange.place_order(order)
-        return order
+        # NOTE: Reject orders the exchange would reject before paying for the round trip.
+        quantity = self.instruments.normalize_quantity(
+            order.exchange_id, order.symbol, order.quantity
+        )
+        if quantity != order.quantity:
+            self.logger.info(
+                f"Quantity {order.quantity} rounded to {quantity} on {order.exchange_id}"
+            )
+            order.quantity = quantity
+        if order.limit_price is not None:
+            # NOTE: Round towards the quote, so that the tick size doesn't widen the slippage tolerance.
+            order.limit_price = self.instruments.normalize_price(
+                order.exchange_id,
+                order.symbol,
+                order.limit_price,
+                rounding=ROUND_DOWN if order.side == OrderSide.BUY else ROUND_UP,
+            )
+        price = (
+            order.limit_price if order.limit_price is not None else order.quote_price
+        )
+        if price is not None:
+            self.instruments.validate_notional(
+                order.exchange_id, order.symbol, order.quantity, price
+            )
+
+        await self._journal(OrderEvent.of(order))
+        started = time.perf_counter()
+        try:
+            result = await exchange.place_order(order)
+        except Exception as e:
+            failed = dataclasses.replace(order, status=OrderStatus.FAILED, error=str(e))
+            await self._journal(
+                OrderEvent.of(failed, latency=time.perf_counter() - started)
+            )
+            raise
+        # NOTE: Adapters may return the order under the id assigned by the exchange.
+        await self._journal(
+            OrderEvent.of(
+                result, order_id=str(order.id), latency=time.perf_counter() - started
+            )
+        )
+        return result
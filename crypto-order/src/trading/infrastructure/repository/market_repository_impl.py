@@ -1,34 +1,128 @@
 import asyncio
-from typing import List, Dict, Optional, Type
+from collections import deque
+from typing import Awaitable, Callable, List, Dict, Optional, Type, TypeVar
 import logging
 
 from trading.domain.model.exceptions import MarketNotFoundException
-from trading.domain.model.exchange import ExchangeAdapter
+from trading.domain.model.exchange import ExchangeAdapter, ExchangeCapabilities
 from trading.infrastructure.exchange.exchange_factory import ExchangeFactory
 from trading.domain.repository.market_repository import MarketRepository
 from trading.domain.model.order import Market, Symbol
+from trading.domain.model.order_book import OrderBook
+
+T = TypeVar("T")
+
+LATENCY_WINDOW = 100
+# NOTE: Below this many samples the p95 is too noisy to decide when to hedge.
+HEDGE_MIN_SAMPLES = 20
+
+
+class LatencyWindow:
+    """Latencies of the last successful requests to one exchange"""
+
+    def __init__(self, size: int = LATENCY_WINDOW):
+        self.__samples: deque = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self.__samples)
+
+    def record(self, latency: float) -> None:
+        self.__samples.append(latency)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        if not self.__samples:
+            return None
+        ordered = sorted(self.__samples)
+        return ordered[min(int(len(ordered) * percent / 100), len(ordered) - 1)]
 
 
 class MarketRepositoryImpl(MarketRepository):
+    """
+    Fetches quotes from every exchange concurrently.
+    Without a deadline it waits for all exchanges. With a deadline (or a quorum) it returns the quotes
+    that arrived in time and drops the slow exchanges, so one slow venue can't stall the order.
+    """
 
     def __init__(
         self,
         exchanges: Dict[str, ExchangeAdapter],
         logger: logging.Logger,
+        deadline: Optional[float] = None,
+        quorum: Optional[int] = None,
+        timeouts: Dict[str, float] = None,
+        default_timeout: Optional[float] = None,
+        hedge: bool = False,
+        capabilities: Dict[str, ExchangeCapabilities] = None,
     ):
         self.exchanges = exchanges
         self.logger = logger
+        # Exchanges with known capabilities are only asked for the symbols they list.
+        self.capabilities = capabilities or {}
+        # Seconds to wait for quotes of all exchanges before routing on the ones that arrived.
+        self.deadline = deadline
+        # Number of quotes to return as soon as they arrived. Defaults to all exchanges.
+        self.quorum = quorum
+        self.timeouts = timeouts or {}
+        self.default_timeout = default_timeout
+        # Send a duplicate request when a request is slower than the p95 latency of its exchange.
+        self.hedge = hedge
+        self.latencies: Dict[str, LatencyWindow] = {
+            exchange_id: LatencyWindow() for exchange_id in exchanges
+        }
+
+    async def _fetch_hedged(
+        self, exchange_id: str, fetch: Callable[[], Awaitable[T]]
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        latencies = self.latencies.setdefault(exchange_id, LatencyWindow())
+        hedge_after = (
+            latencies.percentile(95)
+            if self.hedge and len(latencies) >= HEDGE_MIN_SAMPLES
+            else None
+        )
+
+        pending = {asyncio.ensure_future(fetch())}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=hedge_after, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    self.logger.info(
+                        f"{exchange_id} slower than p95 {hedge_after:.3f}s. Sending a hedged request."
+                    )
+                    hedge_after = None
+                    pending.add(asyncio.ensure_future(fetch()))
+                    continue
+                for task in done:
+                    if task.exception() is None:
+                        latencies.record(loop.time() - started)
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
 
-    async def _get_market_safe(
-        self, exchange: ExchangeAdapter, symbol
-    ) -> Optional[Market]:
+    async def _fetch_safe(
+        self, exchange_id: str, fetch: Callable[[], Awaitable[T]]
+    ) -> Optional[T]:
+        exchange = self.exchanges[exchange_id]
+        timeout = self.timeouts.get(exchange_id, self.default_timeout)
         try:
-            return await exchange.get_market(symbol)
+            return await asyncio.wait_for(
+                self._fetch_hedged(exchange_id, fetch), timeout
+            )
         except MarketNotFoundException as e:
             self.logger.warning(
                 f"Market not found on {exchange}: {str(e)}",
             )
             return None
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Request to {exchange_id} timed out after {timeout}s")
+            return None
         except Exception as e:
             self.logger.error(
                 f"Error getting market data from {exchange}: {str(e)}",
@@ -36,20 +130,95 @@ class MarketRepositoryImpl(MarketRepository):
             )
             return None
 
+    async def _get_market_safe(self, exchange_id: str, symbol) -> Optional[Market]:
+        exchange = self.exchanges[exchange_id]
+        return await self._fetch_safe(exchange_id, lambda: exchange.get_market(symbol))
+
+    async def _gather(
+        self, name: str, fetches: Dict[str, Awaitable[Optional[T]]]
+    ) -> List[T]:
+        """Collect results in exchange order until all arrived, the quorum is met or the deadline passed"""
+        if self.deadline is None and self.quorum is None:
+            # Run all exchange queries concurrently
+            results = await asyncio.gather(*fetches.values())
+            # Filter out None results (from failed requests)
+            return [result for result in results if result is not None]
+
+        loop = asyncio.get_running_loop()
+        deadline = None if self.deadline is None else loop.time() + self.deadline
+        quorum = self.quorum or len(fetches)
+        tasks = {
+            asyncio.ensure_future(fetch): exchange_id
+            for exchange_id, fetch in fetches.items()
+        }
+        pending = set(tasks)
+        arrived: Dict[str, T] = {}
+        while pending and len(arrived) < quorum:
+            timeout = None if deadline is None else deadline - loop.time()
+            if timeout is not None and timeout <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.result() is not None:
+                    arrived[tasks[task]] = task.result()
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            dropped = sorted(tasks[task] for task in pending)
+            if len(arrived) >= quorum:
+                self.logger.info(
+                    f"Routing on {name} of {sorted(arrived)}. Dropped {dropped}: quorum of {quorum} reached"
+                )
+            else:
+                self.logger.warning(
+                    f"Routing on {name} of {sorted(arrived)}. Dropped {dropped}: deadline of {self.deadline}s passed"
+                )
+        return [
+            arrived[exchange_id] for exchange_id in fetches if exchange_id in arrived
+        ]
+
+    def _exchanges_for(self, symbol: Symbol) -> Dict[str, ExchangeAdapter]:
+        exchanges = {
+            exchange_id: exchange
+            for exchange_id, exchange in self.exchanges.items()
+            if exchange_id not in self.capabilities
+            or self.capabilities[exchange_id].supports(symbol)
+        }
+        if len(exchanges) < len(self.exchanges):
+            self.logger.debug(
+                f"{symbol} is not listed on {sorted(set(self.exchanges) - set(exchanges))}"
+            )
+        return exchanges
+
     async def get_all_markets(self, symbol: Symbol) -> List[Market]:
-        markets = []
         self.logger.debug(f"Getting markets for symbol {symbol}")
         self.logger.debug(f"Exchanges: {self.exchanges}")
-        # Run all exchange queries concurrently
-        results = await asyncio.gather(
-            *[
-                self._get_market_safe(exchange, symbol)
-                for exchange in self.exchanges.values()
-            ]
+        markets = await self._gather(
+            "markets",
+            {
+                exchange_id: self._get_market_safe(exchange_id, symbol)
+                for exchange_id in self._exchanges_for(symbol)
+            },
         )
-
-        # Filter out None results (from failed requests)
-        markets = [market for market in results if market is not None]
         self.logger.debug(f"All markets: {markets}")
 
         return markets
+
+    async def get_all_order_books(self, symbol: Symbol, depth: int) -> List[OrderBook]:
+        self.logger.debug(f"Getting order books for symbol {symbol}")
+        order_books = await self._gather(
+            "order books",
+            {
+                exchange_id: self._fetch_safe(
+                    exchange_id,
+                    lambda exchange=exchange: exchange.get_order_book(symbol, depth),
+                )
+                for exchange_id, exchange in self._exchanges_for(symbol).items()
+            },
+        )
+        self.logger.debug(f"All order books: {order_books}")
+
+        return order_books
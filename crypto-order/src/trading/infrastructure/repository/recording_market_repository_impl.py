@@ -0,0 +1,39 @@
+import logging
+from typing import List
+
+from trading.domain.model.order import Market, Symbol
+from trading.domain.model.order_book import OrderBook
+from trading.domain.repository.market_repository import MarketRepository
+from trading.infrastructure.exchange.quote_tape import QuoteTapeWriter
+
+
+class RecordingMarketRepositoryImpl(MarketRepository):
+    """
+    Records every quote served by another MarketRepository to a quote tape,
+    so that routing decisions can be replayed with ReplayExchangeAdapter.
+    """
+
+    def __init__(
+        self,
+        repository: MarketRepository,
+        tape: QuoteTapeWriter,
+        logger: logging.Logger,
+    ):
+        self.repository = repository
+        self.tape = tape
+        self.logger = logger
+
+    async def get_all_markets(self, symbol: Symbol) -> List[Market]:
+        markets = await self.repository.get_all_markets(symbol)
+        for market in markets:
+            try:
+                self.tape.record(market)
+            except (OSError, ValueError) as e:
+                # NOTE: Recording is best effort. It must not fail the order.
+                self.logger.warning(
+                    f"Failed to record quote of {market.exchange_id}: {str(e)}"
+                )
+        return markets
+
+    async def get_all_order_books(self, symbol: Symbol, depth: int) -> List[OrderBook]:
+        return await self.repository.get_all_order_books(symbol, depth)
@@ -0,0 +1,284 @@
+import asyncio
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import List, Optional, Set
+
+from trading.domain.model.order import (
+    OrderEvent,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    Symbol,
+)
+from trading.domain.repository.order_journal_repository import OrderJournalRepository
+
+DEFAULT_JOURNAL_PATH = Path.home() / ".local" / "share" / "crypto-order" / "orders.db"
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 0.05
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS order_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_id TEXT NOT NULL,
+    exchange_order_id TEXT,
+    parent_id TEXT,
+    exchange_id TEXT,
+    symbol TEXT NOT NULL,
+    side TEXT NOT NULL,
+    status TEXT NOT NULL,
+    order_type TEXT NOT NULL DEFAULT 'market',
+    limit_price TEXT,
+    quantity TEXT NOT NULL,
+    filled_quantity TEXT,
+    filled_price TEXT,
+    error TEXT,
+    latency REAL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS order_events_order_id ON order_events (order_id);
+CREATE INDEX IF NOT EXISTS order_events_exchange_order_id ON order_events (exchange_order_id);
+CREATE INDEX IF NOT EXISTS order_events_parent_id ON order_events (parent_id);
+CREATE INDEX IF NOT EXISTS order_events_exchange_id ON order_events (exchange_id, recorded_at);
+CREATE INDEX IF NOT EXISTS order_events_recorded_at ON order_events (recorded_at);
+"""
+
+# NOTE: Columns added after the first release. Journals created before get them on connect.
+ADDED_COLUMNS = {
+    "order_type": "TEXT NOT NULL DEFAULT 'market'",
+    "limit_price": "TEXT",
+}
+
+COLUMNS = (
+    "order_id",
+    "exchange_order_id",
+    "parent_id",
+    "exchange_id",
+    "symbol",
+    "side",
+    "status",
+    "order_type",
+    "limit_price",
+    "quantity",
+    "filled_quantity",
+    "filled_price",
+    "error",
+    "latency",
+    "recorded_at",
+)
+
+INSERT = f"INSERT INTO order_events ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+SELECT = f"SELECT {', '.join(COLUMNS)} FROM order_events"
+
+
+def _optional_str(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _optional_decimal(value: Optional[str]) -> Optional[Decimal]:
+    return None if value is None else Decimal(value)
+
+
+def _to_row(event: OrderEvent) -> tuple:
+    # NOTE: Decimals are stored as text, so that they are read back exactly.
+    return (
+        event.order_id,
+        event.exchange_order_id,
+        event.parent_id,
+        event.exchange_id,
+        f"{event.symbol.base}/{event.symbol.quote}",
+        event.side.value,
+        event.status.value,
+        event.order_type.value,
+        _optional_str(event.limit_price),
+        str(event.quantity),
+        _optional_str(event.filled_quantity),
+        _optional_str(event.filled_price),
+        event.error,
+        event.latency,
+        event.recorded_at.timestamp(),
+    )
+
+
+def _from_row(row: tuple) -> OrderEvent:
+    (
+        order_id,
+        exchange_order_id,
+        parent_id,
+        exchange_id,
+        symbol,
+        side,
+        status,
+        order_type,
+        limit_price,
+        quantity,
+        filled_quantity,
+        filled_price,
+        error,
+        latency,
+        recorded_at,
+    ) = row
+    base, _, quote = symbol.partition("/")
+    return OrderEvent(
+        order_id=order_id,
+        symbol=Symbol(base=base, quote=quote),
+        side=OrderSide(side),
+        status=OrderStatus(status),
+        quantity=Decimal(quantity),
+        recorded_at=datetime.fromtimestamp(recorded_at),
+        exchange_id=exchange_id,
+        exchange_order_id=exchange_order_id,
+        parent_id=parent_id,
+        order_type=OrderType(order_type),
+        limit_price=_optional_decimal(limit_price),
+        filled_quantity=_optional_decimal(filled_quantity),
+        filled_price=_optional_decimal(filled_price),
+        error=error,
+        latency=latency,
+    )
+
+
+class SqliteOrderJournalRepositoryImpl(OrderJournalRepository):
+    """
+    Order journal in an append-only SQLite table in WAL mode.
+    Events are buffered and committed in batches, so that an order doesn't wait for an fsync
+    and a burst of orders shares one. Events of the last flush_interval can be lost on a crash.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        path: Path = DEFAULT_JOURNAL_PATH,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self.logger = logger
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.__pending: List[OrderEvent] = []
+        self.__timer: Optional[asyncio.TimerHandle] = None
+        self.__flushes: Set[asyncio.Task] = set()
+        # NOTE: One thread owns the connection. It serializes writes and keeps sqlite off the event loop.
+        self.__executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="order-journal"
+        )
+        self.__connection: Optional[sqlite3.Connection] = None
+
+    def __connect(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            # NOTE: In WAL mode a commit appends to the log, and readers don't block the writer.
+            # synchronous=FULL fsyncs every commit, which batching keeps to one per flush.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=FULL")
+            connection.executescript(SCHEMA)
+            self.__migrate(connection)
+            self.__connection = connection
+        return self.__connection
+
+    @staticmethod
+    def __migrate(connection: sqlite3.Connection) -> None:
+        existing = {
+            row[1] for row in connection.execute("PRAGMA table_info(order_events)")
+        }
+        with connection:
+            for column, definition in ADDED_COLUMNS.items():
+                if column not in existing:
+                    connection.execute(
+                        f"ALTER TABLE order_events ADD COLUMN {column} {definition}"
+                    )
+
+    async def __run(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__executor, function, *args
+        )
+
+    def __write(self, events: List[OrderEvent]) -> None:
+        connection = self.__connect()
+        with connection:
+            connection.executemany(INSERT, [_to_row(event) for event in events])
+
+    def __query(self, sql: str, params: tuple) -> List[OrderEvent]:
+        return [_from_row(row) for row in self.__connect().execute(sql, params)]
+
+    def __flush_soon(self) -> None:
+        self.__timer = None
+        task = asyncio.create_task(self.flush())
+        self.__flushes.add(task)
+        task.add_done_callback(self.__flushes.discard)
+
+    async def append(self, event: OrderEvent) -> None:
+        self.__pending.append(event)
+        if len(self.__pending) >= self.batch_size:
+            if self.__timer is not None:
+                self.__timer.cancel()
+            self.__flush_soon()
+        elif self.__timer is None:
+            self.__timer = asyncio.get_running_loop().call_later(
+                self.flush_interval, self.__flush_soon
+            )
+
+    async def flush(self) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        events, self.__pending = self.__pending, []
+        if not events:
+            return
+        try:
+            await self.__run(self.__write, events)
+        except (sqlite3.Error, OSError) as e:
+            # NOTE: A broken journal must not fail orders. The events are logged instead.
+            self.logger.error(f"Failed to journal {len(events)} order events: {str(e)}")
+            for event in events:
+                self.logger.error(f"Lost order event: {event}")
+
+    async def get_history(self, order_id: str) -> List[OrderEvent]:
+        await self.flush()
+        # NOTE: Every event of a child order carries its parent_id, including the results of the adapters.
+        return await self.__run(
+            self.__query,
+            f"{SELECT} WHERE order_id = ? OR exchange_order_id = ? OR parent_id = ?"
+            " ORDER BY seq",
+            (order_id, order_id, order_id),
+        )
+
+    async def find(
+        self,
+        exchange_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[OrderEvent]:
+        await self.flush()
+        conditions, params = [], []
+        if exchange_id is not None:
+            conditions.append("exchange_id = ?")
+            params.append(exchange_id)
+        if since is not None:
+            conditions.append("recorded_at >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            conditions.append("recorded_at < ?")
+            params.append(until.timestamp())
+        sql = SELECT
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY recorded_at, seq"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return await self.__run(self.__query, sql, tuple(params))
+
+    async def close(self) -> None:
+        await asyncio.gather(*self.__flushes)
+        await self.flush()
+        if self.__connection is not None:
+            await self.__run(self.__connection.close)
+            self.__connection = None
+        self.__executor.shutdown(wait=False)
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional, Set
+
+from trading.domain.model.exchange import ExchangeCapabilities
+from trading.domain.model.order import Market, Symbol
+from trading.domain.model.order_book import OrderBook
+from trading.domain.repository.market_repository import MarketRepository
+from trading.infrastructure.exchange.market_stream import MarketStore, MarketStream
+
+
+class StreamingMarketRepositoryImpl(MarketRepository):
+    """
+    Serves markets from the latest streamed quotes, so routing doesn't wait on the network.
+    Venues without a fresh quote (not subscribed yet, reconnecting, stale) are fetched
+    through the fallback repository if one is given.
+    """
+
+    def __init__(
+        self,
+        streams: Dict[str, MarketStream],
+        store: MarketStore,
+        logger: logging.Logger,
+        fallback: Optional[MarketRepository] = None,
+        rest_only: Iterable[str] = (),
+        capabilities: Dict[str, ExchangeCapabilities] = None,
+    ):
+        self.streams = streams
+        self.store = store
+        self.logger = logger
+        self.fallback = fallback
+        # Exchanges without a market stream. They are always fetched through the fallback.
+        self.rest_only = set(rest_only)
+        # Exchanges with known capabilities are only expected to quote the symbols they list.
+        self.capabilities = capabilities or {}
+
+    def _lists(self, exchange_id: str, symbol: Symbol) -> bool:
+        return exchange_id not in self.capabilities or self.capabilities[
+            exchange_id
+        ].supports(symbol)
+
+    def _streams_for(self, symbol: Symbol) -> Dict[str, MarketStream]:
+        return {
+            exchange_id: stream
+            for exchange_id, stream in self.streams.items()
+            if self._lists(exchange_id, symbol)
+        }
+
+    def _rest_only_for(self, symbol: Symbol) -> Set[str]:
+        return {
+            exchange_id
+            for exchange_id in self.rest_only
+            if self._lists(exchange_id, symbol)
+        }
+
+    async def start(self, symbols: List[Symbol]) -> None:
+        for exchange_id, stream in self.streams.items():
+            await stream.subscribe(
+                [symbol for symbol in symbols if self._lists(exchange_id, symbol)]
+            )
+            await stream.start()
+
+    async def stop(self) -> None:
+        await asyncio.gather(*[stream.stop() for stream in self.streams.values()])
+
+    async def wait_ready(self, symbol: Symbol, timeout: float) -> bool:
+        """Wait until every stream listing the symbol has a fresh quote for it or timeout expires"""
+        streams = self._streams_for(symbol)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while len(self.store.get_all(symbol, streams)) < len(streams):
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(0.01)
+        return True
+
+    async def get_all_markets(self, symbol: Symbol) -> List[Market]:
+        streams = self._streams_for(symbol)
+        for stream in streams.values():
+            if not stream.is_subscribed(symbol):
+                await stream.subscribe([symbol])
+
+        markets = self.store.get_all(symbol, streams)
+        # NOTE: Venues that don't list the symbol aren't missing, so they don't send every order to REST.
+        missing = (set(streams) | self._rest_only_for(symbol)) - {
+            m.exchange_id for m in markets
+        }
+        if missing:
+            self.logger.debug(f"No fresh streamed quote for {symbol} on {missing}")
+            if self.fallback is not None:
+                fetched = await self.fallback.get_all_markets(symbol)
+                markets += [m for m in fetched if m.exchange_id in missing]
+
+        self.logger.debug(f"All markets: {markets}")
+        return markets
+
+    async def get_all_order_books(self, symbol: Symbol, depth: int) -> List[OrderBook]:
+        # NOTE: Only top of book is streamed. Depth comes from the fallback repository.
+        if self.fallback is None:
+            return await super().get_all_order_books(symbol, depth)
+        return await self.fallback.get_all_order_books(symbol, depth)
@@ -0,0 +1,183 @@
+import csv
+import json
+from dataclasses import asdict, fields
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from trading.application.dto.order_dto import OrderDTO
+from trading.domain.model.exceptions import InvalidOrderException
+from trading.domain.model.instrument import parse_symbol
+from trading.domain.model.order import OrderEvent, Symbol
+
+BATCH_FORMATS = ["csv", "jsonl"]
+_DTO_FIELDS = {f.name for f in fields(OrderDTO)}
+_DECIMAL_FIELDS = (
+    "quantity",
+    "filled_price",
+    "filled_quantity",
+    "max_slippage_bps",
+    "limit_price",
+)
+
+
+def _guess_format(stream: TextIO) -> str:
+    name = getattr(stream, "name", "")
+    if isinstance(name, str) and name.lower().endswith(".csv"):
+        return "csv"
+    return "jsonl"
+
+
+def order_from_record(record: Dict[str, Any]) -> OrderDTO:
+    """
+    Build an order from a {"symbol": ..., "side": ..., "quantity": ...} record. Raises ValueError if invalid.
+    Optional "order_type" and "max_slippage_bps" fields make it a limit order.
+    """
+    try:
+        max_slippage_bps = str(record.get("max_slippage_bps") or "").strip()
+        return OrderDTO(
+            symbol=str(record["symbol"]).strip().upper(),
+            side=str(record["side"]).strip(),
+            quantity=Decimal(str(record["quantity"]).strip()),
+            order_type=str(record.get("order_type") or "market").strip().lower(),
+            max_slippage_bps=Decimal(max_slippage_bps) if max_slippage_bps else None,
+        )
+    except KeyError as e:
+        raise ValueError(f"missing field {e}")
+    except InvalidOperation as e:
+        raise ValueError(f"invalid number: {e}")
+
+
+def _to_dto(record: Dict[str, Any], line: int) -> OrderDTO:
+    try:
+        return order_from_record(record)
+    except ValueError as e:
+        raise ValueError(f"Line {line}: {e}")
+
+
+def read_orders(
+    stream: TextIO, file_format: Optional[str] = None
+) -> Iterator[OrderDTO]:
+    """
+    Read orders from CSV (header: symbol,side,quantity) or JSONL ({"symbol": ..., "side": ..., "quantity": ...}).
+    Raises ValueError with the line number on the first invalid order.
+    """
+    file_format = (file_format or _guess_format(stream)).lower()
+    if file_format == "csv":
+        # NOTE: Line 1 is the header.
+        for line, record in enumerate(csv.DictReader(stream), start=2):
+            yield _to_dto(record, line)
+        return
+
+    for line, text in enumerate(stream, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {line}: invalid JSON: {e}")
+        yield _to_dto(record, line)
+
+
+def order_symbols(order_dtos: Iterable[OrderDTO]) -> List[Symbol]:
+    """Distinct symbols of the orders, in order of appearance. Unknown symbols are left to fail with their order."""
+    symbols: List[Symbol] = []
+    for order_dto in order_dtos:
+        try:
+            symbol = parse_symbol(order_dto.symbol)
+        except InvalidOrderException:
+            continue
+        if symbol not in symbols:
+            symbols.append(symbol)
+    return symbols
+
+
+def dto_to_dict(dto: OrderDTO, index: Optional[int] = None) -> Dict[str, Any]:
+    """Decimals are written as strings to keep precision."""
+    record: Dict[str, Any] = {} if index is None else {"index": index}
+    for key, value in asdict(dto).items():
+        record[key] = str(value) if isinstance(value, Decimal) else value
+    return record
+
+
+def dto_from_dict(record: Dict[str, Any]) -> OrderDTO:
+    """Inverse of dto_to_dict"""
+    values = {key: value for key, value in record.items() if key in _DTO_FIELDS}
+    for key in _DECIMAL_FIELDS:
+        if values.get(key) is not None:
+            values[key] = Decimal(values[key])
+    return OrderDTO(**values)
+
+
+def dto_to_json(dto: OrderDTO, index: Optional[int] = None) -> str:
+    """Serialize a result to one JSONL line. Decimals are written as strings to keep precision."""
+    return json.dumps(dto_to_dict(dto, index))
+
+
+def _to_record(value: Any) -> Dict[str, Any]:
+    """JSON-ready fields of a dataclass like OrderEvent"""
+    record: Dict[str, Any] = {}
+    for field in fields(value):
+        item = getattr(value, field.name)
+        if isinstance(item, (Decimal, Symbol)):
+            item = str(item)
+        elif isinstance(item, Enum):
+            item = item.value
+        elif isinstance(item, datetime):
+            item = item.isoformat()
+        record[field.name] = item
+    return record
+
+
+def event_to_json(event: OrderEvent) -> str:
+    return json.dumps(_to_record(event))
+
+
+def scan_row_to_json(row: Any, scan: int) -> str:
+    """A symbol of a MarketScanner scan"""
+    return json.dumps({"scan": scan, **_to_record(row)})
+
+
+def opportunity_to_json(opportunity: Any) -> str:
+    """An ArbitrageOpportunity with its derived spread and profit"""
+    record = _to_record(opportunity)
+    record["gross_spread"] = str(opportunity.gross_spread)
+    record["net_profit_bps"] = f"{opportunity.net_profit_bps:.4f}"
+    return json.dumps({"type": "opportunity", **record})
+
+
+def arbitrage_result_to_json(result: Any) -> str:
+    """An ArbitrageResult with the fill, latency and slippage of each leg"""
+    legs = []
+    for leg in (result.buy, result.sell):
+        order = _to_record(leg.order)
+        legs.append(
+            {
+                "id": order["id"],
+                "side": order["side"],
+                "exchange_id": order["exchange_id"],
+                "status": order["status"],
+                "quantity": order["quantity"],
+                "filled_quantity": order["filled_quantity"],
+                "filled_price": order["filled_price"],
+                "error": order["error"],
+                "expected_price": str(leg.expected_price),
+                "latency": leg.latency,
+                "slippage_bps": (
+                    None if leg.slippage_bps is None else f"{leg.slippage_bps:.4f}"
+                ),
+            }
+        )
+    return json.dumps(
+        {
+            "type": "execution",
+            "id": result.id,
+            "symbol": str(result.opportunity.symbol),
+            "hedged": result.hedged,
+            "realized_profit": (
+                None if result.realized_profit is None else str(result.realized_profit)
+            ),
+            "legs": legs,
+        }
+    )
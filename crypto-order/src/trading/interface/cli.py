@@ -1,6 +1,12 @@
+import json
 import logging
 import asyncio
-from typing import List
+import os
+import signal
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
 import click
 import functools
 from decimal import Decimal
@@ -11,12 +17,66 @@ from trading.infrastructure.repository.exchange_repository_impl import (
 from trading.domain.model.exchange import ExchangeAdapter
 from trading.domain.repository.market_repository import MarketRepository
 from trading.domain.service.trading_service import TradingService
-from trading.application.service.trading_app_service import TradingAppService
+from trading.application.service.trading_app_service import (
+    DEFAULT_DEPTH,
+    DEFAULT_MAX_SLIPPAGE_BPS,
+    RoutingMode,
+    TradingAppService,
+)
+from trading.application.service.arbitrage_app_service import ArbitrageAppService
+from trading.application.service.execution_app_service import ExecutionAppService
 from trading.application.dto.order_dto import OrderDTO
 from trading.infrastructure.repository.market_repository_impl import (
     MarketRepositoryImpl,
 )
-from trading.infrastructure.exchange.exchange_factory import ExchangeFactory
+from trading.infrastructure.repository.cached_market_repository_impl import (
+    CachedMarketRepositoryImpl,
+)
+from trading.infrastructure.exchange.exchange_factory import (
+    DEFAULT_WARM_CONNECTIONS,
+    ExchangeFactory,
+)
+from trading.infrastructure.exchange.rate_limiter import RequestScheduler
+from trading.infrastructure.exchange.capability_discovery import (
+    DEFAULT_CACHE_PATH,
+    CapabilityCache,
+    CapabilityDiscovery,
+)
+from trading.infrastructure.repository.recording_market_repository_impl import (
+    RecordingMarketRepositoryImpl,
+)
+from trading.infrastructure.exchange.quote_tape import QuoteTapeWriter
+from trading.infrastructure.exchange.clock_sync import DEFAULT_SYNC_INTERVAL, ClockSync
+from trading.infrastructure.repository.sqlite_order_journal_repository_impl import (
+    DEFAULT_JOURNAL_PATH,
+    SqliteOrderJournalRepositoryImpl,
+)
+from trading.domain.model.exceptions import InvalidOrderException
+from trading.domain.model.instrument import InstrumentIndex, parse_symbol
+from trading.domain.model.order import Symbol
+from trading.domain.service.execution_scheduler import (
+    ExecutionAlgorithm,
+    ExecutionScheduler,
+    VolumeProfile,
+)
+from trading.domain.service.arbitrage_detector import (
+    DEFAULT_TAKER_FEE,
+    ArbitrageDetector,
+)
+from trading.interface.batch_io import (
+    BATCH_FORMATS,
+    arbitrage_result_to_json,
+    dto_to_json,
+    event_to_json,
+    opportunity_to_json,
+    order_symbols,
+    read_orders,
+    scan_row_to_json,
+)
+from trading.interface.daemon_client import DEFAULT_HOST, DEFAULT_PORT, DaemonClient
+
+# NOTE: Modules importing aiohttp (adapters, streams, the daemon server) are imported where they are used,
+# so that `--help` and orders submitted to the daemon don't pay for them. See `--profile-startup`.
 
 
 def async_command(f):
@@ -29,44 +89,402 @@ def async_command(f):
     return wrapper
 
 
+def _apply(f, options):
+    for option in reversed(options):
+        f = option(f)
+    return f
+
+
+def exchange_options(f):
+    """Options shared by every command that talks to the exchanges"""
+    options = [
+        click.option("--binance-key", envvar="BINANCE_API_KEY", help="Binance API key"),
+        click.option(
+            "--binance-secret", envvar="BINANCE_API_SECRET", help="Binance API secret"
+        ),
+        click.option("--okx-key", envvar="OKX_API_KEY", help="OKX API key"),
+        click.option("--okx-secret", envvar="OKX_API_SECRET", help="OKX API secret"),
+        click.option(
+            "--okx-api-passphrase",
+            envvar="OKX_API_PASSPHRASE",
+            help="OKX API passphrase",
+        ),
+        click.option(
+            "--okx-order-stream/--no-okx-order-stream",
+            default=False,
+            help="Confirm OKX fills by the private orders WebSocket channel in addition to polling",
+        ),
+        click.option(
+            "--market-data",
+            type=click.Choice(["rest", "stream"], case_sensitive=False),
+            default="rest",
+            help="Fetch quotes per order over REST or route on streamed WebSocket quotes",
+        ),
+        click.option(
+            "--stream-wait",
+            type=float,
+            default=2.0,
+            help="Seconds to wait for the first streamed quotes (stream mode only)",
+        ),
+        click.option(
+            "--quote-deadline",
+            type=float,
+            default=0.0,
+            help="Seconds to wait for quotes before routing on the exchanges that answered. 0 waits for all.",
+        ),
+        click.option(
+            "--request-timeout",
+            type=float,
+            default=5.0,
+            help="Seconds before a quote request to one exchange is abandoned",
+        ),
+        click.option(
+            "--hedge/--no-hedge",
+            default=False,
+            help="Send a duplicate quote request when an exchange is slower than its p95 latency",
+        ),
+        click.option(
+            "--symbol-discovery/--no-symbol-discovery",
+            default=True,
+            help="Ask only the exchanges listing the symbol for quotes, and round order quantities to their lot sizes. Listings are cached on disk.",
+        ),
+        click.option(
+            "--capability-cache",
+            type=click.Path(dir_okay=False),
+            default=str(DEFAULT_CACHE_PATH),
+            help="File caching the symbols and trading rules listed by each exchange",
+        ),
+        click.option(
+            "--record-quotes",
+            type=click.Path(dir_okay=False),
+            default=None,
+            help="Append every quote routed on to this quote tape file, for replay with benchmarks.bench_replay",
+        ),
+        click.option(
+            "--warm-connections",
+            type=click.IntRange(min=0),
+            default=DEFAULT_WARM_CONNECTIONS,
+            help="Keep-alive connections opened to each exchange at startup, so that the first orders don't pay for DNS, TCP and TLS setup. 0 disables the warm-up.",
+        ),
+        click.option(
+            "--clock-sync-interval",
+            type=click.FloatRange(min=0),
+            default=DEFAULT_SYNC_INTERVAL,
+            help="Seconds between samples of the exchange clocks that signed request timestamps are corrected to. 0 samples them at startup only.",
+        ),
+        click.option(
+            "--log-level",
+            type=click.Choice(
+                ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], case_sensitive=False
+            ),
+            default="INFO",
+            help="Set the logging level",
+        ),
+    ]
+    return _apply(f, options)
+
+
+def routing_options(f):
+    """Options of the commands routing orders by TradingAppService.place_market_order"""
+    options = [
+        click.option(
+            "--routing",
+            type=click.Choice(
+                [mode.value for mode in RoutingMode], case_sensitive=False
+            ),
+            default=RoutingMode.TOP_OF_BOOK.value,
+            help="Route on the best top-of-book price, on the expected fill price over the book depth, or split across exchanges",
+        ),
+        click.option(
+            "--depth",
+            type=int,
+            default=DEFAULT_DEPTH,
+            help="Order book levels fetched per exchange (depth and split routing only)",
+        ),
+    ]
+    return _apply(f, options)
+
+
+def journal_options(f):
+    """Options of the commands placing orders"""
+    options = [
+        click.option(
+            "--journal/--no-journal",
+            default=True,
+            help="Record every order state in the order journal. See the `orders` command.",
+        ),
+        click.option(
+            "--journal-path",
+            type=click.Path(dir_okay=False),
+            default=str(DEFAULT_JOURNAL_PATH),
+            help="SQLite file of the order journal",
+        ),
+    ]
+    return _apply(f, options)
+
+
 # Configure logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@click.command()
+def build_exchange_configs(
+    binance_key: str,
+    binance_secret: str,
+    okx_key: str,
+    okx_secret: str,
+    okx_api_passphrase: str,
+    okx_order_stream: bool = False,
+) -> Dict[str, Dict[str, str]]:
+    exchange_configs = {
+        "binance": {"api_key": binance_key, "api_secret": binance_secret},
+        "okx": {
+            "api_key": okx_key,
+            "api_secret": okx_secret,
+            "api_passphrase": okx_api_passphrase,
+            "use_order_stream": okx_order_stream,
+        },
+    }
+    # NOTE: Exchanges added by plugins read their credentials from <EXCHANGE ID>_API_KEY etc.
+    for exchange_id in ExchangeFactory.adapters():
+        prefix = exchange_id.upper()
+        if exchange_id in exchange_configs or f"{prefix}_API_KEY" not in os.environ:
+            continue
+        exchange_configs[exchange_id] = {
+            "api_key": os.environ[f"{prefix}_API_KEY"],
+            "api_secret": os.environ.get(f"{prefix}_API_SECRET", ""),
+            "api_passphrase": os.environ.get(f"{prefix}_API_PASSPHRASE", ""),
+        }
+    return exchange_configs
+
+
+@asynccontextmanager
+async def create_app_service(
+    exchange_configs: Dict[str, Dict[str, str]],
+    logger: logging.Logger,
+    market_data: str = "rest",
+    stream_symbols: List[Symbol] = (),
+    stream_wait: float = 0.0,
+    routing: str = RoutingMode.TOP_OF_BOOK.value,
+    depth: int = DEFAULT_DEPTH,
+    quote_max_age: float = 0.0,
+    quote_deadline: float = 0.0,
+    request_timeout: Optional[float] = None,
+    hedge: bool = False,
+    symbol_discovery: bool = False,
+    capability_cache: Optional[str] = None,
+    journal: bool = False,
+    journal_path: Optional[str] = None,
+    record_quotes: Optional[str] = None,
+    warm_connections: int = DEFAULT_WARM_CONNECTIONS,
+    clock_sync_interval: float = DEFAULT_SYNC_INTERVAL,
+) -> AsyncIterator[TradingAppService]:
+    """Build the application graph on one set of adapters and close it on exit"""
+    scheduler = RequestScheduler(logger=logger)
+    exchanges: Dict[str, ExchangeAdapter] = ExchangeFactory.create_all(
+        exchange_configs=exchange_configs, logger=logger, scheduler=scheduler
+    )
+    async with ExchangeFactory.open_all(exchanges):
+        # NOTE: Warm up first, so that discovery, clock sync and the first orders run on open connections.
+        await ExchangeFactory.warm_up_all(exchanges, warm_connections, logger=logger)
+        capabilities = {}
+        if symbol_discovery:
+            capabilities = await CapabilityDiscovery(
+                logger=logger,
+                cache=CapabilityCache(capability_cache or DEFAULT_CACHE_PATH),
+            ).discover(exchanges)
+        instruments = InstrumentIndex(
+            instrument
+            for capability in capabilities.values()
+            for instrument in capability.instruments
+        )
+        logger.debug(f"Loaded {len(instruments)} instruments")
+        market_repository: MarketRepository = MarketRepositoryImpl(
+            exchanges=exchanges,
+            logger=logger,
+            deadline=quote_deadline or None,
+            default_timeout=request_timeout,
+            hedge=hedge,
+            capabilities=capabilities,
+        )
+        streaming_repository = None
+        if market_data.lower() == "stream":
+            from trading.infrastructure.exchange.market_stream import MarketStore
+            from trading.infrastructure.repository.streaming_market_repository_impl import (
+                StreamingMarketRepositoryImpl,
+            )
+
+            store = MarketStore()
+            streams = ExchangeFactory.create_all_streams(
+                exchange_configs=exchange_configs,
+                store=store,
+                logger=logger,
+                instruments=instruments,
+            )
+            streaming_repository = StreamingMarketRepositoryImpl(
+                streams=streams,
+                store=store,
+                logger=logger,
+                fallback=market_repository,
+                rest_only=set(exchanges) - set(streams),
+                capabilities=capabilities,
+            )
+            await streaming_repository.start(list(stream_symbols))
+            for stream_symbol in stream_symbols:
+                if not await streaming_repository.wait_ready(
+                    stream_symbol, stream_wait
+                ):
+                    logger.warning(
+                        f"Streamed quotes for {stream_symbol} are not ready. Falling back to REST."
+                    )
+            market_repository = streaming_repository
+        tape = None
+        if record_quotes:
+            tape = QuoteTapeWriter(record_quotes, logger=logger)
+            market_repository = RecordingMarketRepositoryImpl(
+                repository=market_repository, tape=tape, logger=logger
+            )
+        if quote_max_age > 0:
+            market_repository = CachedMarketRepositoryImpl(
+                repository=market_repository,
+                logger=logger,
+                default_max_age=quote_max_age,
+            )
+        trading_service = TradingService(logger=logger)
+
+        order_journal = None
+        if journal:
+            order_journal = SqliteOrderJournalRepositoryImpl(
+                logger=logger, path=journal_path or DEFAULT_JOURNAL_PATH
+            )
+        exchange_repository = ExchangeRepositoryImpl(
+            exchanges=exchanges,
+            logger=logger,
+            instruments=instruments,
+            order_journal=order_journal,
+        )
+        app_service = TradingAppService(
+            trading_service=trading_service,
+            market_repository=market_repository,
+            exchange_repository=exchange_repository,
+            logger=logger,
+            routing_mode=RoutingMode(routing.lower()),
+            depth=depth,
+            instruments=instruments,
+            order_journal=order_journal,
+        )
+        # NOTE: Signed requests are stamped on the exchange clocks, so local drift doesn't get orders rejected.
+        clock_sync = ClockSync(
+            exchanges=exchanges, logger=logger, interval=clock_sync_interval
+        )
+        await clock_sync.start()
+        try:
+            yield app_service
+        finally:
+            await clock_sync.stop()
+            if order_journal is not None:
+                await order_journal.close()
+            if tape is not None:
+                tape.close()
+            if streaming_repository is not None:
+                await streaming_repository.stop()
+            if isinstance(market_repository, CachedMarketRepositoryImpl):
+                logger.info(
+                    f"Quote cache metrics: {market_repository.metrics.as_dict()}"
+                )
+            logger.info(f"Rate limiter metrics: {scheduler.metrics()}")
+
+
+@click.group()
+@click.option(
+    "--profile-startup",
+    is_flag=True,
+    help="Run the command with import timing and report the slowest imports",
+)
+@click.pass_context
+def cli(ctx: click.Context, profile_startup: bool):
+    """Buy or sell cryptocurrency on the exchange with the best price"""
+    if profile_startup:
+        from trading.interface.startup_profile import run_profiled
+
+        argv = [arg for arg in sys.argv if arg != "--profile-startup"]
+        ctx.exit(run_profiled(argv))
+
+
+def echo_result(result: OrderDTO) -> None:
+    if result.status == "filled":
+        click.echo(f"Order filled on {result.exchange_id} at {result.filled_price}")
+    elif result.status == "partially_filled":
+        click.echo(
+            f"Order partially filled: {result.filled_quantity} on {result.exchange_id} "
+            f"at {result.filled_price}. Failed: {result.error}"
+        )
+    else:
+        click.echo(f"Order failed: {result.error}")
+
+
+@cli.command()
 @click.option("--symbol", default="BTCUSDT", help="Trading symbol")
 @click.option("--symbol-base", default="BTC", help="Trading base symbol")
 @click.option("--symbol-quote", default="USDT", help="Trading quote symbol")
 @click.option("--side", type=click.Choice(["buy", "sell"]), required=True)
 @click.option("--quantity", type=float, required=True)
-@click.option("--binance-key", envvar="BINANCE_API_KEY", help="Binance API key")
 @click.option(
-    "--binance-secret", envvar="BINANCE_API_SECRET", help="Binance API secret"
+    "--order-type",
+    type=click.Choice(["market", "limit", "ioc", "fok"], case_sensitive=False),
+    default="market",
+    help="Limit, IOC and FOK orders are priced at the routed quote plus --max-slippage-bps. "
+    "What IOC and FOK orders don't fill is re-routed to the next-best exchange.",
 )
-@click.option("--okx-key", envvar="OKX_API_KEY", help="OKX API key")
-@click.option("--okx-secret", envvar="OKX_API_SECRET", help="OKX API secret")
 @click.option(
-    "--okx-api-passphrase", envvar="OKX_API_PASSPHRASE", help="OKX API passphrase"
+    "--max-slippage-bps",
+    type=float,
+    default=float(DEFAULT_MAX_SLIPPAGE_BPS),
+    help="Distance of the limit price from the routed quote",
 )
 @click.option(
-    "--log-level",
-    type=click.Choice(
-        ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], case_sensitive=False
-    ),
-    default="INFO",
-    help="Set the logging level",
+    "--daemon-socket",
+    envvar="TRADING_DAEMON_SOCKET",
+    help="Submit the order to the daemon listening on this Unix socket",
 )
-@async_command
-async def trade(
+@click.option(
+    "--daemon-url",
+    envvar="TRADING_DAEMON_URL",
+    help="Submit the order to the daemon listening on this URL, e.g. http://127.0.0.1:8765",
+)
+@exchange_options
+@routing_options
+@journal_options
+def trade(
     symbol: str,
+    symbol_base: str,
+    symbol_quote: str,
     side: str,
     quantity: float,
+    order_type: str,
+    max_slippage_bps: float,
+    daemon_socket: str,
+    daemon_url: str,
     binance_key: str,
     binance_secret: str,
     okx_key: str,
     okx_secret: str,
     okx_api_passphrase: str,
+    okx_order_stream: bool,
+    market_data: str,
+    stream_wait: float,
+    routing: str,
+    depth: int,
+    quote_deadline: float,
+    request_timeout: float,
+    hedge: bool,
+    symbol_discovery: bool,
+    capability_cache: str,
+    journal: bool,
+    journal_path: str,
+    record_quotes: Optional[str],
+    warm_connections: int,
+    clock_sync_interval: float,
     log_level: str,
 ):
     """CLI interface for placing trades"""
@@ -77,43 +495,742 @@ async def trade(
         f"Initializing trade: symbol={symbol}, side={side}, quantity={quantity}"
     )
 
+    order_dto = OrderDTO(
+        symbol=symbol,
+        side=side,
+        quantity=Decimal(str(quantity)),
+        order_type=order_type.lower(),
+        max_slippage_bps=Decimal(str(max_slippage_bps)),
+    )
+    if daemon_socket or daemon_url:
+        # NOTE: The daemon owns the exchange connections. Exchange options are ignored here.
+        client = DaemonClient(socket_path=daemon_socket, url=daemon_url)
+        try:
+            result = client.place_market_order(order_dto)
+        except OSError as e:
+            raise click.ClickException(f"Trading daemon is not reachable: {e}")
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        echo_result(result)
+        return
+
     # Initialize application service
-    exchange_configs = {
-        "binance": {"api_key": binance_key, "api_secret": binance_secret},
-        "okx": {
-            "api_key": okx_key,
-            "api_secret": okx_secret,
-            "api_passphrase": okx_api_passphrase,
-        },
-    }
-    exchanges: List[ExchangeAdapter] = ExchangeFactory.create_all(
-        exchange_configs=exchange_configs, logger=logger
+    exchange_configs = build_exchange_configs(
+        binance_key,
+        binance_secret,
+        okx_key,
+        okx_secret,
+        okx_api_passphrase,
+        okx_order_stream,
     )
-    market_repository: MarketRepository = MarketRepositoryImpl(
-        exchanges=exchanges,
+
+    async def place_order() -> OrderDTO:
+        async with create_app_service(
+            exchange_configs=exchange_configs,
+            logger=logger,
+            market_data=market_data,
+            stream_symbols=order_symbols([order_dto]),
+            stream_wait=stream_wait,
+            routing=routing,
+            depth=depth,
+            quote_deadline=quote_deadline,
+            request_timeout=request_timeout,
+            hedge=hedge,
+            symbol_discovery=symbol_discovery,
+            capability_cache=capability_cache,
+            journal=journal,
+            journal_path=journal_path,
+            record_quotes=record_quotes,
+            warm_connections=warm_connections,
+            clock_sync_interval=clock_sync_interval,
+        ) as app_service:
+            # Execute trade
+            return await app_service.place_market_order(order_dto)
+
+    # Display result
+    echo_result(asyncio.run(place_order()))
+
+
+@cli.command()
+@click.option(
+    "--file",
+    "orders_file",
+    type=click.File("r"),
+    default="-",
+    help="CSV or JSONL file with symbol, side and quantity per order. '-' reads stdin.",
+)
+@click.option(
+    "--format",
+    "file_format",
+    type=click.Choice(BATCH_FORMATS, case_sensitive=False),
+    default=None,
+    help="Input format. Guessed from the file extension when omitted (stdin: jsonl).",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=10,
+    help="Maximum number of orders in flight",
+)
+@click.option(
+    "--quote-max-age",
+    type=float,
+    default=1.0,
+    help="Seconds a quote is reused across orders of the same symbol. 0 disables the cache.",
+)
+@exchange_options
+@routing_options
+@journal_options
+@async_command
+async def batch(
+    orders_file,
+    file_format: str,
+    concurrency: int,
+    quote_max_age: float,
+    binance_key: str,
+    binance_secret: str,
+    okx_key: str,
+    okx_secret: str,
+    okx_api_passphrase: str,
+    okx_order_stream: bool,
+    market_data: str,
+    stream_wait: float,
+    routing: str,
+    depth: int,
+    quote_deadline: float,
+    request_timeout: float,
+    hedge: bool,
+    symbol_discovery: bool,
+    capability_cache: str,
+    journal: bool,
+    journal_path: str,
+    record_quotes: Optional[str],
+    warm_connections: int,
+    clock_sync_interval: float,
+    log_level: str,
+):
+    """Place many orders concurrently. Results are written to stdout as JSONL."""
+    logger = logging.getLogger(__name__)
+    logger.setLevel(log_level.upper())
+
+    try:
+        order_dtos = list(read_orders(orders_file, file_format))
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--file")
+    logger.info(f"Placing {len(order_dtos)} orders with concurrency {concurrency}")
+
+    exchange_configs = build_exchange_configs(
+        binance_key,
+        binance_secret,
+        okx_key,
+        okx_secret,
+        okx_api_passphrase,
+        okx_order_stream,
+    )
+    async with create_app_service(
+        exchange_configs=exchange_configs,
         logger=logger,
+        market_data=market_data,
+        stream_symbols=order_symbols(order_dtos),
+        stream_wait=stream_wait,
+        routing=routing,
+        depth=depth,
+        quote_deadline=quote_deadline,
+        request_timeout=request_timeout,
+        hedge=hedge,
+        quote_max_age=quote_max_age,
+        symbol_discovery=symbol_discovery,
+        capability_cache=capability_cache,
+        journal=journal,
+        journal_path=journal_path,
+        record_quotes=record_quotes,
+        warm_connections=warm_connections,
+        clock_sync_interval=clock_sync_interval,
+    ) as app_service:
+        async for index, result in app_service.place_market_orders(
+            order_dtos, concurrency=concurrency
+        ):
+            click.echo(dto_to_json(result, index=index))
+
+
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    default=None,
+    help="Listen on this Unix socket instead of TCP",
+)
+@click.option("--host", default=DEFAULT_HOST, help="Host to listen on")
+@click.option("--port", type=int, default=DEFAULT_PORT, help="Port to listen on")
+@click.option("--symbol-base", default="BTC", help="Base symbol streamed from start")
+@click.option("--symbol-quote", default="USDT", help="Quote symbol streamed from start")
+@click.option(
+    "--quote-max-age",
+    type=float,
+    default=0.0,
+    help="Seconds a quote is reused across orders of the same symbol. 0 disables the cache.",
+)
+@exchange_options
+@routing_options
+@journal_options
+@async_command
+async def daemon(
+    socket_path: str,
+    host: str,
+    port: int,
+    symbol_base: str,
+    symbol_quote: str,
+    quote_max_age: float,
+    binance_key: str,
+    binance_secret: str,
+    okx_key: str,
+    okx_secret: str,
+    okx_api_passphrase: str,
+    okx_order_stream: bool,
+    market_data: str,
+    stream_wait: float,
+    routing: str,
+    depth: int,
+    quote_deadline: float,
+    request_timeout: float,
+    hedge: bool,
+    symbol_discovery: bool,
+    capability_cache: str,
+    journal: bool,
+    journal_path: str,
+    record_quotes: Optional[str],
+    warm_connections: int,
+    clock_sync_interval: float,
+    log_level: str,
+):
+    """Keep the exchanges connected and accept orders from `trade --daemon-socket/--daemon-url`"""
+    from trading.interface.daemon import OrderDaemon, serve_until_stopped
+
+    logger = logging.getLogger(__name__)
+    logger.setLevel(log_level.upper())
+
+    exchange_configs = build_exchange_configs(
+        binance_key,
+        binance_secret,
+        okx_key,
+        okx_secret,
+        okx_api_passphrase,
+        okx_order_stream,
     )
-    trading_service = TradingService(logger=logger)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
 
-    exchange_repository = ExchangeRepositoryImpl(exchanges=exchanges, logger=logger)
-    app_service = TradingAppService(
-        trading_service=trading_service,
-        market_repository=market_repository,
-        exchange_repository=exchange_repository,
+    async with create_app_service(
+        exchange_configs=exchange_configs,
         logger=logger,
+        market_data=market_data,
+        stream_symbols=[Symbol(base=symbol_base, quote=symbol_quote)],
+        stream_wait=stream_wait,
+        routing=routing,
+        depth=depth,
+        quote_max_age=quote_max_age,
+        quote_deadline=quote_deadline,
+        request_timeout=request_timeout,
+        hedge=hedge,
+        symbol_discovery=symbol_discovery,
+        capability_cache=capability_cache,
+        journal=journal,
+        journal_path=journal_path,
+        record_quotes=record_quotes,
+        warm_connections=warm_connections,
+        clock_sync_interval=clock_sync_interval,
+    ) as app_service:
+        await serve_until_stopped(
+            OrderDaemon(app_service, logger=logger),
+            stop,
+            socket_path=socket_path,
+            host=host,
+            port=port,
+        )
+    logger.info("Order daemon stopped")
+
+
+def format_scan(result) -> str:
+    header = f"{'symbol':<12} {'bid':>14} {'bid venue':<10} {'ask':>14} {'ask venue':<10} {'spread bps':>10}"
+    lines = [header, "-" * len(header)]
+    for row in result.rows():
+        if row.best_bid is None:
+            lines.append(f"{str(row.symbol):<12} {'no quotes':>14}")
+            continue
+        lines.append(
+            f"{str(row.symbol):<12} {row.best_bid:>14.8g} {row.best_bid_exchange:<10} "
+            f"{row.best_ask:>14.8g} {row.best_ask_exchange:<10} {row.spread_bps:>10.2f}"
+            + ("  CROSSED" if row.crossed else "")
+        )
+    return "\n".join(lines)
+
+
+@cli.command()
+@click.option(
+    "--symbols",
+    default="BTCUSDT,ETHUSDT",
+    help="Comma separated symbols to scan, e.g. BTCUSDT,ETHUSDT,DOGEUSDT",
+)
+@click.option("--interval", type=float, default=1.0, help="Seconds between scans")
+@click.option(
+    "--count",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Number of scans. 0 scans until interrupted.",
+)
+@click.option(
+    "--max-age",
+    type=float,
+    default=None,
+    help="Leave out quotes older than this many seconds",
+)
+@click.option(
+    "--json", "as_json", is_flag=True, help="Print every symbol of every scan as JSONL"
+)
+@exchange_options
+@async_command
+async def scan(
+    symbols: str,
+    interval: float,
+    count: int,
+    max_age: Optional[float],
+    as_json: bool,
+    binance_key: str,
+    binance_secret: str,
+    okx_key: str,
+    okx_secret: str,
+    okx_api_passphrase: str,
+    okx_order_stream: bool,
+    market_data: str,
+    stream_wait: float,
+    quote_deadline: float,
+    request_timeout: float,
+    hedge: bool,
+    symbol_discovery: bool,
+    capability_cache: str,
+    record_quotes: Optional[str],
+    warm_connections: int,
+    clock_sync_interval: float,
+    log_level: str,
+):
+    """Show the best bid and ask venue, spread and crossed markets of many symbols"""
+    from trading.domain.service.market_scanner import MarketScanner
+
+    logger = logging.getLogger(__name__)
+    logger.setLevel(log_level.upper())
+
+    try:
+        scan_symbols = [parse_symbol(s) for s in symbols.split(",") if s.strip()]
+    except InvalidOrderException as e:
+        raise click.BadParameter(str(e), param_hint="--symbols")
+
+    exchange_configs = build_exchange_configs(
+        binance_key,
+        binance_secret,
+        okx_key,
+        okx_secret,
+        okx_api_passphrase,
+        okx_order_stream,
     )
+    scanner = MarketScanner(exchange_ids=list(exchange_configs), symbols=scan_symbols)
+    async with create_app_service(
+        exchange_configs=exchange_configs,
+        logger=logger,
+        market_data=market_data,
+        stream_symbols=scan_symbols,
+        stream_wait=stream_wait,
+        quote_deadline=quote_deadline,
+        request_timeout=request_timeout,
+        hedge=hedge,
+        symbol_discovery=symbol_discovery,
+        capability_cache=capability_cache,
+        record_quotes=record_quotes,
+        warm_connections=warm_connections,
+        clock_sync_interval=clock_sync_interval,
+    ) as app_service:
+        scans = 0
+        while True:
+            results = await asyncio.gather(
+                *[
+                    app_service.market_repository.get_all_markets(symbol)
+                    for symbol in scan_symbols
+                ],
+                return_exceptions=True,
+            )
+            for symbol, markets in zip(scan_symbols, results):
+                if isinstance(markets, Exception):
+                    logger.warning(f"Failed to get quotes of {symbol}: {str(markets)}")
+                    continue
+                scanner.update_all(markets)
+            result = scanner.scan(max_age=max_age)
 
-    order_dto = OrderDTO(symbol=symbol, side=side, quantity=Decimal(str(quantity)))
+            if as_json:
+                for row in result.rows():
+                    click.echo(scan_row_to_json(row, scan=scans))
+            else:
+                click.echo(format_scan(result))
+            scans += 1
+            if count and scans >= count:
+                break
+            await asyncio.sleep(interval)
 
-    # Execute trade
-    result = await app_service.place_market_order(order_dto)
 
-    # Display result
-    if result.status == "filled":
-        click.echo(f"Order filled on {result.exchange_id} at {result.filled_price}")
+def parse_fees(fees: List[str]) -> Dict[str, Decimal]:
+    """Taker fees from EXCHANGE=RATE options, e.g. binance=0.00075"""
+    parsed = {}
+    for fee in fees:
+        exchange_id, _, rate = fee.partition("=")
+        try:
+            parsed[exchange_id.strip().lower()] = Decimal(rate.strip())
+        except ArithmeticError:
+            raise click.BadParameter(
+                f"Expected EXCHANGE=RATE, got {fee}", param_hint="--fee"
+            )
+    return parsed
+
+
+@cli.command()
+@click.option(
+    "--symbols",
+    default="BTCUSDT,ETHUSDT",
+    help="Comma separated symbols to watch, e.g. BTCUSDT,ETHUSDT,DOGEUSDT",
+)
+@click.option(
+    "--fee",
+    "fees",
+    multiple=True,
+    help="Taker fee rate of an exchange as EXCHANGE=RATE, e.g. binance=0.00075. Repeatable.",
+)
+@click.option(
+    "--default-fee",
+    type=float,
+    default=float(DEFAULT_TAKER_FEE),
+    help="Taker fee rate of exchanges without --fee",
+)
+@click.option(
+    "--min-profit-bps",
+    type=float,
+    default=0.0,
+    help="Ignore opportunities earning less than this after fees",
+)
+@click.option(
+    "--execute/--no-execute",
+    default=False,
+    help="Buy and sell both sides of each opportunity. By default opportunities are only reported.",
+)
+@click.option(
+    "--quantity",
+    type=float,
+    default=None,
+    help="Base quantity traded per opportunity (required with --execute)",
+)
+@click.option("--interval", type=float, default=1.0, help="Seconds between checks")
+@click.option(
+    "--count",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Number of checks. 0 checks until interrupted.",
+)
+@exchange_options
+@journal_options
+@async_command
+async def arbitrage(
+    symbols: str,
+    fees: List[str],
+    default_fee: float,
+    min_profit_bps: float,
+    execute: bool,
+    quantity: Optional[float],
+    interval: float,
+    count: int,
+    binance_key: str,
+    binance_secret: str,
+    okx_key: str,
+    okx_secret: str,
+    okx_api_passphrase: str,
+    okx_order_stream: bool,
+    market_data: str,
+    stream_wait: float,
+    quote_deadline: float,
+    request_timeout: float,
+    hedge: bool,
+    symbol_discovery: bool,
+    capability_cache: str,
+    journal: bool,
+    journal_path: str,
+    record_quotes: Optional[str],
+    warm_connections: int,
+    clock_sync_interval: float,
+    log_level: str,
+):
+    """Report crossed markets across exchanges as JSONL, and optionally trade them"""
+    logger = logging.getLogger(__name__)
+    logger.setLevel(log_level.upper())
+
+    try:
+        watch_symbols = [parse_symbol(s) for s in symbols.split(",") if s.strip()]
+    except InvalidOrderException as e:
+        raise click.BadParameter(str(e), param_hint="--symbols")
+    if execute and quantity is None:
+        raise click.UsageError("--quantity is required with --execute")
+
+    exchange_configs = build_exchange_configs(
+        binance_key,
+        binance_secret,
+        okx_key,
+        okx_secret,
+        okx_api_passphrase,
+        okx_order_stream,
+    )
+    detector = ArbitrageDetector(
+        logger=logger,
+        fees=parse_fees(fees),
+        default_fee=Decimal(str(default_fee)),
+        min_profit_bps=Decimal(str(min_profit_bps)),
+    )
+    async with create_app_service(
+        exchange_configs=exchange_configs,
+        logger=logger,
+        market_data=market_data,
+        stream_symbols=watch_symbols,
+        stream_wait=stream_wait,
+        quote_deadline=quote_deadline,
+        request_timeout=request_timeout,
+        hedge=hedge,
+        symbol_discovery=symbol_discovery,
+        capability_cache=capability_cache,
+        journal=journal,
+        journal_path=journal_path,
+        record_quotes=record_quotes,
+        warm_connections=warm_connections,
+        clock_sync_interval=clock_sync_interval,
+    ) as app_service:
+        arbitrage_service = ArbitrageAppService(
+            detector=detector,
+            market_repository=app_service.market_repository,
+            exchange_repository=app_service.exchange_repository,
+            logger=logger,
+            instruments=app_service.instruments,
+        )
+        checks = 0
+        while True:
+            opportunities = await arbitrage_service.find_opportunities(watch_symbols)
+            for opportunity in opportunities:
+                click.echo(opportunity_to_json(opportunity))
+            if execute and opportunities:
+                # NOTE: Opportunities of different symbols don't compete, so trade them all at once.
+                results = await asyncio.gather(
+                    *[
+                        arbitrage_service.execute(opportunity, Decimal(str(quantity)))
+                        for opportunity in opportunities
+                    ]
+                )
+                for result in results:
+                    click.echo(arbitrage_result_to_json(result))
+            checks += 1
+            if count and checks >= count:
+                break
+            await asyncio.sleep(interval)
+
+
+def format_progress(progress) -> str:
+    parent = progress.parent
+    line = f"[{progress.slice.index + 1}/{progress.slices}] "
+    child = progress.child
+    if child is None:
+        line += "nothing due"
+    elif child.status.value == "failed":
+        line += f"{child.quantity} failed: {child.error}"
     else:
-        click.echo(f"Order failed: {result.error}")
+        line += f"{child.filled_quantity or child.quantity} on {child.exchange_id} at {child.filled_price}"
+    return (
+        line
+        + f" | filled {progress.filled_quantity}/{parent.quantity}, average price {parent.filled_price}"
+    )
+
+
+@cli.command()
+@click.option("--symbol", default="BTCUSDT", help="Trading symbol")
+@click.option("--side", type=click.Choice(["buy", "sell"]), required=True)
+@click.option("--quantity", type=float, required=True)
+@click.option(
+    "--algorithm",
+    type=click.Choice([a.value for a in ExecutionAlgorithm], case_sensitive=False),
+    default=ExecutionAlgorithm.TWAP.value,
+    help="Equal slices (twap) or slices in proportion to the volume profile (vwap)",
+)
+@click.option(
+    "--duration",
+    type=click.FloatRange(min=0),
+    required=True,
+    help="Seconds to work the order over",
+)
+@click.option(
+    "--slices", type=click.IntRange(min=1), default=10, help="Number of child orders"
+)
+@click.option(
+    "--volume-profile",
+    type=click.Path(dir_okay=False, exists=True),
+    default=None,
+    help='JSON file of the traded volume by time of day in UTC, {"bucket_seconds": 3600, "volumes": [...]} (vwap only)',
+)
+@exchange_options
+@journal_options
+@async_command
+async def algo(
+    symbol: str,
+    side: str,
+    quantity: float,
+    algorithm: str,
+    duration: float,
+    slices: int,
+    volume_profile: Optional[str],
+    binance_key: str,
+    binance_secret: str,
+    okx_key: str,
+    okx_secret: str,
+    okx_api_passphrase: str,
+    okx_order_stream: bool,
+    market_data: str,
+    stream_wait: float,
+    quote_deadline: float,
+    request_timeout: float,
+    hedge: bool,
+    symbol_discovery: bool,
+    capability_cache: str,
+    journal: bool,
+    journal_path: str,
+    record_quotes: Optional[str],
+    warm_connections: int,
+    clock_sync_interval: float,
+    log_level: str,
+):
+    """Work a large order as child orders over time, routing each on fresh quotes"""
+    logger = logging.getLogger(__name__)
+    logger.setLevel(log_level.upper())
+
+    try:
+        algo_symbol = parse_symbol(symbol)
+    except InvalidOrderException as e:
+        raise click.BadParameter(str(e), param_hint="--symbol")
+    order_dto = OrderDTO(symbol=symbol, side=side, quantity=Decimal(str(quantity)))
+    scheduler = ExecutionScheduler()
+    if ExecutionAlgorithm(algorithm.lower()) == ExecutionAlgorithm.VWAP:
+        if volume_profile is None:
+            raise click.UsageError("--volume-profile is required with vwap")
+        try:
+            with open(volume_profile) as f:
+                profile = VolumeProfile.from_dict(json.load(f))
+        except (ValueError, KeyError, TypeError) as e:
+            raise click.BadParameter(str(e), param_hint="--volume-profile")
+        schedule = scheduler.vwap(
+            order_dto.quantity, duration, slices, profile, start=time.time()
+        )
+    else:
+        schedule = scheduler.twap(order_dto.quantity, duration, slices)
+
+    exchange_configs = build_exchange_configs(
+        binance_key,
+        binance_secret,
+        okx_key,
+        okx_secret,
+        okx_api_passphrase,
+        okx_order_stream,
+    )
+    async with create_app_service(
+        exchange_configs=exchange_configs,
+        logger=logger,
+        market_data=market_data,
+        stream_symbols=[algo_symbol],
+        stream_wait=stream_wait,
+        quote_deadline=quote_deadline,
+        request_timeout=request_timeout,
+        hedge=hedge,
+        symbol_discovery=symbol_discovery,
+        capability_cache=capability_cache,
+        journal=journal,
+        journal_path=journal_path,
+        record_quotes=record_quotes,
+        warm_connections=warm_connections,
+        clock_sync_interval=clock_sync_interval,
+    ) as app_service:
+        execution_service = ExecutionAppService(
+            trading_service=app_service.trading_service,
+            market_repository=app_service.market_repository,
+            exchange_repository=app_service.exchange_repository,
+            logger=logger,
+            instruments=app_service.instruments,
+            order_journal=app_service.order_journal,
+        )
+        parent = None
+        exchange_ids = []
+        async for progress in execution_service.execute(order_dto, schedule):
+            click.echo(format_progress(progress))
+            parent = progress.parent
+            if progress.child is not None and progress.child.exchange_id:
+                exchange_ids.append(progress.child.exchange_id)
+
+    echo_result(
+        OrderDTO(
+            symbol=str(parent.symbol),
+            side=parent.side.value,
+            quantity=parent.quantity,
+            exchange_id=",".join(dict.fromkeys(exchange_ids)) or None,
+            order_id=parent.id,
+            status=parent.status.value,
+            filled_price=parent.filled_price,
+            filled_quantity=parent.filled_quantity,
+            error=parent.error,
+        )
+    )
+
+
+@cli.command()
+@click.option(
+    "--order-id",
+    default=None,
+    help="History of one order and its child orders. Exchange order ids are accepted too.",
+)
+@click.option(
+    "--exchange", "exchange_id", default=None, help="Only orders on this exchange"
+)
+@click.option(
+    "--since", type=click.DateTime(), default=None, help="Recorded at or after"
+)
+@click.option("--until", type=click.DateTime(), default=None, help="Recorded before")
+@click.option("--limit", type=click.IntRange(min=1), default=None)
+@click.option(
+    "--journal-path",
+    type=click.Path(dir_okay=False, exists=True),
+    default=str(DEFAULT_JOURNAL_PATH),
+    help="SQLite file of the order journal",
+)
+@async_command
+async def orders(
+    order_id: Optional[str],
+    exchange_id: Optional[str],
+    since,
+    until,
+    limit: Optional[int],
+    journal_path: str,
+):
+    """Print journaled order events as JSONL, oldest first"""
+    logger = logging.getLogger(__name__)
+    journal = SqliteOrderJournalRepositoryImpl(logger=logger, path=journal_path)
+    try:
+        if order_id is not None:
+            events = await journal.get_history(order_id)
+        else:
+            events = await journal.find(
+                exchange_id=exchange_id, since=since, until=until, limit=limit
+            )
+    finally:
+        await journal.close()
+    for event in events:
+        click.echo(event_to_json(event))
 
 
 if __name__ == "__main__":
-    trade()
+    cli()
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Optional
+
+from aiohttp import web
+
+from trading.application.service.trading_app_service import TradingAppService
+from trading.interface.batch_io import dto_to_dict, order_from_record
+from trading.interface.daemon_client import DEFAULT_HOST, DEFAULT_PORT
+
+
+class OrderDaemon:
+    """
+    Local order API in front of one long-lived TradingAppService.
+    Adapters, connections and market data stay warm between orders, so an order only pays for the exchange round trips.
+    - POST /orders {"symbol": "BTCUSDT", "side": "buy", "quantity": "1"} -> result order
+    - GET /health -> status and counters
+    """
+
+    def __init__(self, app_service: TradingAppService, logger: logging.Logger):
+        self.app_service = app_service
+        self.logger = logger
+        self.orders = 0
+        self.total_latency = 0.0
+        self.__runner: Optional[web.AppRunner] = None
+
+    def application(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/orders", self._place_order)
+        app.router.add_get("/health", self._health)
+        return app
+
+    async def _place_order(self, request: web.Request) -> web.Response:
+        try:
+            order_dto = order_from_record(await request.json())
+        except ValueError as e:
+            return web.json_response({"error": str(e)}, status=400)
+
+        started = time.perf_counter()
+        result = await self.app_service.place_market_order(order_dto)
+        latency = time.perf_counter() - started
+        self.orders += 1
+        self.total_latency += latency
+        self.logger.info(
+            f"Order {result.order_id} {result.status} in {latency * 1000:.1f}ms"
+        )
+        return web.json_response(dto_to_dict(result))
+
+    async def _health(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "status": "ok",
+                "orders": self.orders,
+                "average_latency": (
+                    self.total_latency / self.orders if self.orders else 0.0
+                ),
+            }
+        )
+
+    async def start(
+        self,
+        socket_path: Optional[str] = None,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+    ) -> None:
+        """Listen on the Unix socket if given, otherwise on host:port"""
+        self.__runner = web.AppRunner(self.application())
+        await self.__runner.setup()
+        if socket_path:
+            site = web.UnixSite(self.__runner, socket_path)
+            # NOTE: Anyone who can connect can trade. The socket is created private to the user,
+            # so that it is never reachable with the default umask, not even until a chmod.
+            umask = os.umask(0o177)
+            try:
+                await site.start()
+            finally:
+                os.umask(umask)
+            self.logger.info(f"Order daemon listening on {socket_path}")
+        else:
+            site = web.TCPSite(self.__runner, host, port)
+            await site.start()
+            self.logger.info(f"Order daemon listening on http://{host}:{port}")
+
+    async def stop(self) -> None:
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+            self.__runner = None
+
+
+async def serve_until_stopped(
+    daemon: OrderDaemon, stop: asyncio.Event, **listen_options
+) -> None:
+    await daemon.start(**listen_options)
+    try:
+        await stop.wait()
+    finally:
+        await daemon.stop()
@@ -0,0 +1,74 @@
+import http.client
+import json
+import socket
+import urllib.parse
+from typing import Optional
+
+from trading.application.dto.order_dto import OrderDTO
+from trading.interface.batch_io import dto_from_dict
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.__socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.__socket_path)
+
+
+class DaemonClient:
+    """
+    Thin client submitting orders to a running OrderDaemon.
+    NOTE: Uses the blocking stdlib HTTP client on purpose. A one-shot `trade` then skips importing asyncio and aiohttp.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        url: Optional[str] = None,
+        timeout: float = 30.0,
+    ):
+        self.__socket_path = socket_path
+        self.__url = urllib.parse.urlsplit(
+            url or f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+        )
+        self.__timeout = timeout
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self.__socket_path:
+            return _UnixHTTPConnection(self.__socket_path, timeout=self.__timeout)
+        return http.client.HTTPConnection(
+            self.__url.hostname, self.__url.port, timeout=self.__timeout
+        )
+
+    def place_market_order(self, order_dto: OrderDTO) -> OrderDTO:
+        """Raises OSError if the daemon is not reachable and ValueError if it rejects the order"""
+        record = {
+            "symbol": order_dto.symbol,
+            "side": order_dto.side,
+            "quantity": str(order_dto.quantity),
+            "order_type": order_dto.order_type,
+        }
+        if order_dto.max_slippage_bps is not None:
+            record["max_slippage_bps"] = str(order_dto.max_slippage_bps)
+        connection = self._connection()
+        try:
+            connection.request(
+                "POST",
+                self.__url.path.rstrip("/") + "/orders",
+                body=json.dumps(record),
+                headers={"Content-Type": "application/json"},
+            )
+            response = connection.getresponse()
+            data = json.loads(response.read())
+        finally:
+            connection.close()
+        if response.status != 200:
+            raise ValueError(f"Order rejected by daemon: {data.get('error')}")
+        return dto_from_dict(data)
@@ -0,0 +1,79 @@
+import os
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple
+
+# "import time:       711 |      27650 |     aiohttp.web" (microseconds)
+_IMPORT_TIME = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    # 0 for modules imported by the program itself, deeper for their dependencies.
+    level: int
+
+
+def parse_import_times(lines: Iterable[str]) -> Tuple[List[ImportTiming], List[str]]:
+    """Split `python -X importtime` stderr into timings and the other lines"""
+    timings, others = [], []
+    for line in lines:
+        match = _IMPORT_TIME.match(line)
+        if match is None:
+            if not line.startswith("import time: self [us]"):
+                others.append(line)
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append(
+            ImportTiming(
+                module=module,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                level=(len(indent) - 1) // 2,
+            )
+        )
+    return timings, others
+
+
+def format_report(timings: List[ImportTiming], elapsed: float, top: int = 15) -> str:
+    total_us = sum(t.cumulative_us for t in timings if t.level == 0)
+    lines = [
+        f"Startup profile: {elapsed * 1000:.1f}ms wall time, {total_us / 1000:.1f}ms importing {len(timings)} modules",
+        f"{'cumulative ms':>13} {'self ms':>8}  module",
+    ]
+    slowest = sorted(
+        (t for t in timings if t.level <= 1),
+        key=lambda t: t.cumulative_us,
+        reverse=True,
+    )
+    for timing in slowest[:top]:
+        lines.append(
+            f"{timing.cumulative_us / 1000:>13.1f} {timing.self_us / 1000:>8.1f}  "
+            f"{'  ' * timing.level}{timing.module}"
+        )
+    return "\n".join(lines)
+
+
+def run_profiled(argv: List[str], top: int = 15) -> int:
+    """
+    Run the command again in a child interpreter with -X importtime and report the slowest imports.
+    Imports deferred until the command runs are included. Returns the exit code of the command.
+    """
+    started = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        stderr=subprocess.PIPE,
+        text=True,
+        env=os.environ.copy(),
+    )
+    elapsed = time.perf_counter() - started
+    timings, others = parse_import_times(process.stderr.splitlines())
+    for line in others:
+        print(line, file=sys.stderr)
+    print(format_report(timings, elapsed, top=top), file=sys.stderr)
+    return process.returncode
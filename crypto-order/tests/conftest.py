@@ -1,10 +1,16 @@
+import asyncio
+import json
 import pytest
+import pytest_asyncio
 import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Dict
 
+from aiohttp import WSMsgType, web
+from aiohttp.test_utils import TestServer
+
 # Add src directory to Python path
 project_root = str(Path(__file__).parent.parent)
 if project_root not in sys.path:
@@ -24,6 +30,24 @@ from src.trading.domain.repository.market_repository import MarketRepository
 # from trading.infrastructure.exchange.okx_adapter import OKXAdapter
 
 
+def make_market(
+    exchange_id: str,
+    bid="100",
+    ask="101",
+    symbol: Symbol = None,
+    timestamp: datetime = None,
+    age: float = 0.0,
+) -> Market:
+    """Market quoted age seconds ago, or at timestamp. A bid or ask of None leaves that side out."""
+    timestamp = (timestamp or datetime.now()) - timedelta(seconds=age)
+    return Market(
+        exchange_id=exchange_id,
+        symbol=symbol or Symbol(base="BTC", quote="USDT"),
+        best_bid=None if bid is None else Price(Decimal(bid), timestamp),
+        best_ask=None if ask is None else Price(Decimal(ask), timestamp),
+    )
+
+
 @pytest.fixture
 def symbol() -> Symbol:
     return Symbol(base="BTC", quote="USDT")
@@ -85,3 +109,81 @@ class MockMarketRepository(MarketRepository):
 @pytest.fixture
 def mock_market_repository() -> MarketRepository:
     return MockMarketRepository()
+
+
+class FakeWebSocketServer:
+    """
+    Local WebSocket server standing in for an exchange market data stream.
+    Tests push messages to every connected client and can drop connections.
+    """
+
+    def __init__(self):
+        self.received: list = []
+        self.connections: list = []
+        self.connection_count = 0
+        self._connected = asyncio.Event()
+        self._server = None
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/ws", self._handle)
+        self._server = TestServer(app)
+        await self._server.start_server()
+
+    async def close(self) -> None:
+        await self.drop_connections()
+        await self._server.close()
+
+    @property
+    def url(self) -> str:
+        return str(self._server.make_url("/ws"))
+
+    async def wait_for_connection(self, count: int = 1, timeout: float = 2.0) -> None:
+        async def _wait():
+            while self.connection_count < count:
+                self._connected.clear()
+                await self._connected.wait()
+
+        await asyncio.wait_for(_wait(), timeout)
+
+    async def wait_for_message(self, count: int = 1, timeout: float = 2.0) -> None:
+        async def _wait():
+            while len(self.received) < count:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(_wait(), timeout)
+
+    async def send(self, message) -> None:
+        for ws in list(self.connections):
+            if isinstance(message, str):
+                await ws.send_str(message)
+            else:
+                await ws.send_json(message)
+
+    async def drop_connections(self) -> None:
+        for ws in list(self.connections):
+            await ws.close()
+
+    async def _handle(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections.append(ws)
+        self.connection_count += 1
+        self._connected.set()
+        try:
+            async for msg in ws:
+                if msg.type == WSMsgType.TEXT:
+                    self.received.append(
+                        msg.data if msg.data == "ping" else json.loads(msg.data)
+                    )
+        finally:
+            self.connections.remove(ws)
+        return ws
+
+
+@pytest_asyncio.fixture
+async def fake_ws_server():
+    server = FakeWebSocketServer()
+    await server.start()
+    yield server
+    await server.close()
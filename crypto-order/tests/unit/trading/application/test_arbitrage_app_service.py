@@ -0,0 +1,164 @@
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+from src.trading.application.service.arbitrage_app_service import (
+    ArbitrageAppService,
+    OrderStatus,
+)
+from src.trading.domain.model.instrument import Instrument, InstrumentIndex
+from src.trading.domain.model.order import Symbol
+from src.trading.domain.repository.exchange_repository import ExchangeRepository
+from src.trading.domain.repository.market_repository import MarketRepository
+from src.trading.domain.service.arbitrage_detector import ArbitrageDetector
+
+from conftest import make_market
+
+pytest_plugins = ("pytest_asyncio",)
+logger = Mock()
+
+BTC_USDT = Symbol(base="BTC", quote="USDT")
+ETH_USDT = Symbol(base="ETH", quote="USDT")
+
+
+MARKETS = {
+    BTC_USDT: [
+        make_market("binance", "100", "101", BTC_USDT),
+        make_market("okx", "102", "103", BTC_USDT),
+    ],
+    ETH_USDT: [
+        make_market("binance", "10", "11", ETH_USDT),
+        make_market("okx", "10", "11", ETH_USDT),
+    ],
+}
+
+
+class TestArbitrageAppService:
+    @pytest.fixture
+    def market_repository(self):
+        repository = Mock(spec=MarketRepository)
+        repository.get_all_markets = AsyncMock(side_effect=MARKETS.get)
+        return repository
+
+    @pytest.fixture
+    def exchange_repository(self):
+        # Fill each leg one unit worse than the quote.
+        fill_prices = {"binance": Decimal("102"), "okx": Decimal("101")}
+
+        async def place_order(order):
+            order.fill(order.exchange_id, fill_prices[order.exchange_id])
+            order.filled_quantity = order.quantity
+            return order
+
+        repository = Mock(spec=ExchangeRepository)
+        repository.place_order = AsyncMock(side_effect=place_order)
+        return repository
+
+    @pytest.fixture
+    def service(self, market_repository, exchange_repository):
+        return ArbitrageAppService(
+            detector=ArbitrageDetector(logger=logger, default_fee=Decimal("0.001")),
+            market_repository=market_repository,
+            exchange_repository=exchange_repository,
+            logger=logger,
+            instruments=InstrumentIndex(
+                [
+                    Instrument(
+                        "binance",
+                        BTC_USDT,
+                        step_size=Decimal("0.01"),
+                        min_quantity=Decimal("0.01"),
+                    ),
+                    Instrument(
+                        "okx",
+                        BTC_USDT,
+                        step_size=Decimal("0.1"),
+                        min_quantity=Decimal("0.1"),
+                    ),
+                ]
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_opportunities(self, service):
+        (opportunity,) = await service.find_opportunities([BTC_USDT, ETH_USDT])
+
+        assert opportunity.symbol == BTC_USDT
+        assert (opportunity.buy_exchange_id, opportunity.sell_exchange_id) == (
+            "binance",
+            "okx",
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_quotes_are_skipped(self, service, market_repository):
+        market_repository.get_all_markets.side_effect = ValueError("timeout")
+
+        assert await service.find_opportunities([BTC_USDT]) == []
+
+    @pytest.mark.asyncio
+    async def test_execute_places_both_legs(self, service, exchange_repository):
+        (opportunity,) = await service.find_opportunities([BTC_USDT])
+
+        result = await service.execute(opportunity, Decimal("1.25"))
+
+        buy, sell = (
+            call.args[0] for call in exchange_repository.place_order.await_args_list
+        )
+        assert (buy.side.value, buy.exchange_id) == ("buy", "binance")
+        assert (sell.side.value, sell.exchange_id) == ("sell", "okx")
+        # Rounded to the coarser lot size of the two exchanges.
+        assert buy.quantity == sell.quantity == Decimal("1.2")
+        assert buy.parent_id == sell.parent_id == result.id
+        assert result.hedged
+        assert result.buy.slippage_bps == Decimal(1) / 101 * 10000
+        assert result.sell.slippage_bps == Decimal(1) / 102 * 10000
+        assert result.buy.latency >= 0 and result.sell.latency >= 0
+        # 101 * 1.2 * 0.999 - 102 * 1.2 * 1.001
+        assert result.realized_profit == Decimal("-1.4436")
+
+    @pytest.mark.asyncio
+    async def test_execute_with_a_failed_leg(self, service, exchange_repository):
+        (opportunity,) = await service.find_opportunities([BTC_USDT])
+        place_order = exchange_repository.place_order.side_effect
+
+        async def fail_on_okx(order):
+            if order.exchange_id == "okx":
+                raise ValueError("Insufficient balance")
+            return await place_order(order)
+
+        exchange_repository.place_order.side_effect = fail_on_okx
+
+        result = await service.execute(opportunity, Decimal("1"))
+
+        assert result.buy.filled
+        assert result.sell.order.status.value == "failed"
+        assert result.sell.order.error == "Insufficient balance"
+        assert result.sell.slippage_bps is None
+        assert result.realized_profit is None
+        assert not result.hedged
+
+    @pytest.mark.asyncio
+    async def test_execute_with_a_partially_filled_leg(
+        self, service, exchange_repository
+    ):
+        (opportunity,) = await service.find_opportunities([BTC_USDT])
+        place_order = exchange_repository.place_order.side_effect
+
+        async def partially_fill_on_okx(order):
+            order = await place_order(order)
+            if order.exchange_id == "okx":
+                order.status = OrderStatus.PARTIALLY_FILLED
+                order.filled_quantity = Decimal("0.5")
+            return order
+
+        exchange_repository.place_order.side_effect = partially_fill_on_okx
+        logger.error.reset_mock()
+
+        result = await service.execute(opportunity, Decimal("1.25"))
+
+        assert result.buy.filled_quantity == Decimal("1.2")
+        assert result.sell.filled_quantity == Decimal("0.5")
+        assert not result.hedged
+        assert "unhedged: bought 1.2, sold 0.5" in logger.error.call_args.args[0]
+        # 101 * 0.5 * 0.999 - 102 * 0.5 * 1.001
+        assert result.realized_profit == Decimal("-0.6015")
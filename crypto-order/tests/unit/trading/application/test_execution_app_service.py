@@ -0,0 +1,133 @@
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+from src.trading.application.dto.order_dto import OrderDTO
+from src.trading.application.service import execution_app_service
+from src.trading.application.service.execution_app_service import (
+    ExecutionAppService,
+)
+from src.trading.domain.model.order import Symbol
+from src.trading.domain.repository.exchange_repository import ExchangeRepository
+from src.trading.domain.repository.market_repository import MarketRepository
+from src.trading.domain.service.execution_scheduler import ExecutionScheduler
+
+from conftest import make_market
+
+pytest_plugins = ("pytest_asyncio",)
+logger = Mock()
+
+BTC_USDT = Symbol(base="BTC", quote="USDT")
+
+
+class TestExecutionAppService:
+    @pytest.fixture
+    def market_repository(self):
+        # The cheaper exchange changes between slices.
+        repository = Mock(spec=MarketRepository)
+        repository.get_all_markets = AsyncMock(
+            side_effect=[
+                [make_market("binance", "99", "100"), make_market("okx", "100", "101")],
+                [
+                    make_market("binance", "101", "102"),
+                    make_market("okx", "100", "101"),
+                ],
+                [make_market("binance", "99", "100"), make_market("okx", "100", "101")],
+            ]
+        )
+        return repository
+
+    @pytest.fixture
+    def exchange_repository(self):
+        async def place_order(order):
+            order.fill(
+                order.exchange_id,
+                Decimal(100 if order.exchange_id == "binance" else 101),
+            )
+            return order
+
+        repository = Mock(spec=ExchangeRepository)
+        repository.place_order = AsyncMock(side_effect=place_order)
+        return repository
+
+    @pytest.fixture
+    def service(self, market_repository, exchange_repository):
+        return ExecutionAppService(
+            # NOTE: The TradingService of the module under test, so that OrderSide compares equal.
+            trading_service=execution_app_service.TradingService(logger=logger),
+            market_repository=market_repository,
+            exchange_repository=exchange_repository,
+            logger=logger,
+        )
+
+    @pytest.mark.asyncio
+    async def test_twap_reroutes_every_slice(self, service, exchange_repository):
+        schedule = ExecutionScheduler().twap(Decimal("3"), 0.02, 3)
+
+        progress = [
+            p
+            async for p in service.execute(
+                OrderDTO(symbol="BTCUSDT", side="buy", quantity=Decimal("3")),
+                schedule,
+            )
+        ]
+
+        assert [p.child.exchange_id for p in progress] == ["binance", "okx", "binance"]
+        assert [p.filled_quantity for p in progress] == [1, 2, 3]
+        assert [p.parent.status.value for p in progress] == [
+            "pending",
+            "pending",
+            "filled",
+        ]
+        parent = progress[-1].parent
+        assert parent.filled_price == Decimal(301) / 3
+        assert progress[-1].remaining_quantity == 0
+        children = [
+            call.args[0] for call in exchange_repository.place_order.await_args_list
+        ]
+        assert all(child.parent_id == parent.id for child in children)
+
+    @pytest.mark.asyncio
+    async def test_unfilled_quantity_moves_to_the_next_slice(
+        self, service, exchange_repository
+    ):
+        place_order = exchange_repository.place_order.side_effect
+        calls = []
+
+        async def fail_first(order):
+            calls.append(order.quantity)
+            if len(calls) == 1:
+                raise ValueError("Rate limited")
+            return await place_order(order)
+
+        exchange_repository.place_order.side_effect = fail_first
+        schedule = ExecutionScheduler().twap(Decimal("3"), 0, 3)
+
+        progress = [
+            p
+            async for p in service.execute(
+                OrderDTO(symbol="BTCUSDT", side="buy", quantity=Decimal("3")),
+                schedule,
+            )
+        ]
+
+        assert calls == [1, 2, 1]
+        assert progress[0].child.error == "Rate limited"
+        assert progress[-1].parent.status.value == "filled"
+        assert progress[-1].parent.error == "Rate limited"
+
+    @pytest.mark.asyncio
+    async def test_all_slices_failed(self, service, market_repository):
+        market_repository.get_all_markets.side_effect = ValueError("No markets")
+        schedule = ExecutionScheduler().twap(Decimal("1"), 0, 2)
+
+        progress = [
+            p
+            async for p in service.execute(
+                OrderDTO(symbol="BTCUSDT", side="sell", quantity=Decimal("1")),
+                schedule,
+            )
+        ]
+
+        assert progress[-1].parent.status.value == "failed"
+        assert progress[-1].filled_quantity == 0
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from decimal import Decimal
 from datetime import datetime
@@ -12,10 +13,15 @@ from src.trading.domain.model.order import (
     Symbol,
     Price,
 )
+from src.trading.domain.model.order_book import OrderBook
 from src.trading.domain.service.trading_service import TradingService
 from src.trading.domain.repository.market_repository import MarketRepository
 from src.trading.domain.repository.exchange_repository import ExchangeRepository
-from src.trading.application.service.trading_app_service import TradingAppService
+from src.trading.application.service import trading_app_service
+from src.trading.application.service.trading_app_service import (
+    RoutingMode,
+    TradingAppService,
+)
 from src.trading.application.dto.order_dto import OrderDTO
 
 pytest_plugins = ("pytest_asyncio",)
@@ -144,14 +150,71 @@ class TestTradingAppService:
         assert result.status == OrderStatus.FAILED.value
         assert "No markets available" in result.error
 
+    @pytest.mark.asyncio
+    async def test_order_states_are_journaled(
+        self,
+        mock_trading_service,
+        mock_market_repository,
+        mock_exchange_repository,
+    ):
+        # Arrange
+        journal = Mock()
+        journal.append = AsyncMock()
+        app_service = TradingAppService(
+            trading_service=mock_trading_service,
+            market_repository=mock_market_repository,
+            exchange_repository=mock_exchange_repository,
+            logger=logger,
+            order_journal=journal,
+        )
+        order_dto = OrderDTO(symbol="BTCUSDT", side="buy", quantity=Decimal("1.0"))
+        mock_trading_service.find_best_market.side_effect = ValueError(
+            "No markets available"
+        )
+
+        # Act
+        await app_service.place_market_order(order_dto)
+
+        # Assert
+        created, failed = [call.args[0] for call in journal.append.await_args_list]
+        assert created.order_id == failed.order_id
+        assert (created.status.value, failed.status.value) == ("pending", "failed")
+        assert failed.error == "No markets available"
+
+    @pytest.mark.asyncio
+    async def test_symbols_are_not_split_at_three_characters(
+        self,
+        app_service,
+        mock_market_repository,
+        mock_trading_service,
+        mock_exchange_repository,
+    ):
+        # Arrange
+        order_dto = OrderDTO(symbol="DOGEUSDT", side="buy", quantity=Decimal("10"))
+        mock_trading_service.find_best_market.return_value = Mock(exchange_id="binance")
+        mock_exchange_repository.place_order.side_effect = lambda order: order
+
+        # Act
+        result = await app_service.place_market_order(order_dto)
+
+        # Assert
+        symbol = mock_market_repository.get_all_markets.await_args.args[0]
+        assert (symbol.base, symbol.quote) == ("DOGE", "USDT")
+        assert result.symbol == "DOGEUSDT"
+
     @pytest.mark.asyncio
     async def test_market_order_placement_with_exchange_error(
         self,
         app_service,
+        mock_trading_service,
+        mock_market_repository,
         mock_exchange_repository,
+        sample_markets,
     ):
         # Arrange
         order_dto = OrderDTO(symbol="BTCUSDT", side="buy", quantity=Decimal("1.0"))
+        mock_market_repository.get_all_markets.return_value = sample_markets
+        mock_trading_service.find_best_market.return_value = sample_markets[0]
         mock_exchange_repository.place_order.side_effect = Exception(
             "Exchange API error"
         )
@@ -162,3 +225,296 @@ class TestTradingAppService:
         # Assert
         assert result.status == OrderStatus.FAILED.value
         assert "Exchange API error" in result.error
+
+    @pytest.mark.asyncio
+    async def test_depth_routing_uses_order_books(
+        self,
+        mock_trading_service,
+        mock_market_repository,
+        mock_exchange_repository,
+    ):
+        # Arrange
+        app_service = TradingAppService(
+            trading_service=mock_trading_service,
+            market_repository=mock_market_repository,
+            exchange_repository=mock_exchange_repository,
+            logger=logger,
+            routing_mode=RoutingMode.DEPTH,
+            depth=5,
+        )
+        order_dto = OrderDTO(symbol="BTCUSDT", side="buy", quantity=Decimal("2.0"))
+        best_book = Mock(exchange_id="okx")
+        best_book.to_market.return_value = Mock(exchange_id="okx")
+        mock_market_repository.get_all_order_books = AsyncMock(return_value=[best_book])
+        mock_trading_service.find_best_order_book.return_value = best_book
+        mock_exchange_repository.place_order.side_effect = lambda order: order
+
+        # Act
+        result = await app_service.place_market_order(order_dto)
+
+        # Assert
+        assert result.exchange_id == "okx"
+        mock_market_repository.get_all_order_books.assert_awaited_once()
+        assert mock_market_repository.get_all_order_books.await_args.args[1] == 5
+        mock_market_repository.get_all_markets.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_split_routing_places_child_orders_concurrently(
+        self,
+        mock_trading_service,
+        mock_market_repository,
+        mock_exchange_repository,
+    ):
+        # Arrange
+        app_service = TradingAppService(
+            trading_service=mock_trading_service,
+            market_repository=mock_market_repository,
+            exchange_repository=mock_exchange_repository,
+            logger=logger,
+            routing_mode=RoutingMode.SPLIT,
+        )
+        order_dto = OrderDTO(symbol="BTCUSDT", side="buy", quantity=Decimal("2.0"))
+        now = datetime.now()
+        mock_market_repository.get_all_order_books = AsyncMock(
+            return_value=[
+                OrderBook(
+                    exchange_id=exchange_id,
+                    symbol=Symbol(base="BTC", quote="USDT"),
+                    bid_prices=(),
+                    bid_sizes=(),
+                    ask_prices=(Decimal(price),),
+                    ask_sizes=(Decimal("1"),),
+                    timestamp=now,
+                )
+                for exchange_id, price in (("binance", "100"), ("okx", "102"))
+            ]
+        )
+
+        def place_order(order):
+            if order.exchange_id == "okx":
+                raise Exception("Exchange API error")
+            order.fill(order.exchange_id, Decimal("100"))
+            return order
+
+        mock_exchange_repository.place_order.side_effect = place_order
+
+        # Act
+        result = await app_service.place_market_order(order_dto)
+
+        # Assert
+        assert mock_exchange_repository.place_order.await_count == 2
+        assert result.status == OrderStatus.PARTIALLY_FILLED.value
+        assert result.exchange_id == "binance"
+        assert result.filled_quantity == Decimal("1")
+        assert result.filled_price == Decimal("100")
+        assert "Exchange API error" in result.error
+
+    @pytest.mark.asyncio
+    async def test_batch_orders_respect_concurrency_limit(
+        self,
+        app_service,
+        mock_market_repository,
+        mock_trading_service,
+        mock_exchange_repository,
+        sample_markets,
+    ):
+        # Arrange
+        order_dtos = [
+            OrderDTO(symbol="BTCUSDT", side="buy", quantity=Decimal(str(i + 1)))
+            for i in range(6)
+        ]
+        mock_market_repository.get_all_markets.return_value = sample_markets
+        mock_trading_service.find_best_market.return_value = sample_markets[0]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def place_order(order):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            order.fill(order.exchange_id, Decimal("50000.00"))
+            return order
+
+        mock_exchange_repository.place_order.side_effect = place_order
+
+        # Act
+        results = [
+            result
+            async for result in app_service.place_market_orders(
+                order_dtos, concurrency=2
+            )
+        ]
+
+        # Assert
+        assert max_in_flight == 2
+        assert sorted(index for index, _ in results) == list(range(6))
+        for index, result in results:
+            assert result.quantity == order_dtos[index].quantity
+            assert result.status == OrderStatus.FILLED.value
+
+
+class TestLimitOrderRouting:
+    # NOTE: Domain classes of the module under test, so that enums compare equal inside the service.
+    OrderStatus = trading_app_service.OrderStatus
+
+    @pytest.fixture
+    def markets(self) -> List[Market]:
+        symbol = Symbol(base="BTC", quote="USDT")
+        now = datetime.now()
+        return [
+            Market(
+                exchange_id="binance",
+                symbol=symbol,
+                best_bid=Price(amount=Decimal("49990"), timestamp=now),
+                best_ask=Price(amount=Decimal("50000"), timestamp=now),
+            ),
+            Market(
+                exchange_id="okx",
+                symbol=symbol,
+                best_bid=Price(amount=Decimal("49995"), timestamp=now),
+                best_ask=Price(amount=Decimal("50005"), timestamp=now),
+            ),
+        ]
+
+    @pytest.fixture
+    def exchange_repository(self):
+        # binance fills 1.5 of any order, okx fills everything.
+        async def place_order(order):
+            filled = (
+                min(order.quantity, Decimal("1.5"))
+                if order.exchange_id == "binance"
+                else order.quantity
+            )
+            order.fill(
+                order.exchange_id, Decimal(50000 + 5 * (order.exchange_id == "okx"))
+            )
+            order.filled_quantity = filled
+            if filled < order.quantity:
+                order.status = self.OrderStatus.PARTIALLY_FILLED
+            return order
+
+        repository = Mock(spec=ExchangeRepository)
+        repository.place_order = AsyncMock(side_effect=place_order)
+        return repository
+
+    @pytest.fixture
+    def app_service(self, markets, exchange_repository):
+        market_repository = Mock(spec=MarketRepository)
+        market_repository.get_all_markets = AsyncMock(return_value=markets)
+        return TradingAppService(
+            trading_service=trading_app_service.TradingService(logger=logger),
+            market_repository=market_repository,
+            exchange_repository=exchange_repository,
+            logger=logger,
+        )
+
+    @pytest.mark.asyncio
+    async def test_partial_ioc_fill_is_rerouted(self, app_service, exchange_repository):
+        result = await app_service.place_market_order(
+            OrderDTO(
+                symbol="BTCUSDT",
+                side="buy",
+                quantity=Decimal("2"),
+                order_type="ioc",
+                max_slippage_bps=Decimal("10"),
+            )
+        )
+
+        parent, child = (
+            call.args[0] for call in exchange_repository.place_order.await_args_list
+        )
+        # The best ask plus 10 bps.
+        assert parent.limit_price == child.limit_price == Decimal("50050")
+        assert (child.exchange_id, child.quantity) == ("okx", Decimal("0.5"))
+        assert child.parent_id == parent.id
+        assert child.order_type.value == "ioc"
+        assert result.status == "filled"
+        assert result.exchange_id == "binance,okx"
+        assert result.filled_quantity == Decimal("2")
+        assert result.filled_price == Decimal("50001.25")
+        assert result.order_type == "ioc"
+
+    @pytest.mark.asyncio
+    async def test_no_reroute_beyond_the_limit_price(
+        self, app_service, exchange_repository
+    ):
+        result = await app_service.place_market_order(
+            OrderDTO(
+                symbol="BTCUSDT",
+                side="buy",
+                quantity=Decimal("2"),
+                order_type="ioc",
+                max_slippage_bps=Decimal("0"),
+            )
+        )
+
+        exchange_repository.place_order.assert_awaited_once()
+        assert result.status == "partially_filled"
+        assert result.filled_quantity == Decimal("1.5")
+        assert result.limit_price == Decimal("50000")
+
+    @pytest.mark.asyncio
+    async def test_market_orders_have_no_limit_price(
+        self, app_service, exchange_repository
+    ):
+        result = await app_service.place_market_order(
+            OrderDTO(symbol="BTCUSDT", side="sell", quantity=Decimal("1"))
+        )
+
+        assert exchange_repository.place_order.await_args.args[0].limit_price is None
+        # NOTE: Market orders carry the routed quote for the minimum order value check.
+        assert exchange_repository.place_order.await_args.args[
+            0
+        ].quote_price == Decimal("49995")
+        assert result.status == "filled"
+        assert result.order_type == "market"
+
+    @pytest.mark.asyncio
+    async def test_split_children_are_limit_orders_protected_per_exchange(
+        self, exchange_repository
+    ):
+        now = datetime.now()
+        market_repository = Mock(spec=MarketRepository)
+        market_repository.get_all_order_books = AsyncMock(
+            return_value=[
+                OrderBook(
+                    exchange_id=exchange_id,
+                    symbol=Symbol(base="BTC", quote="USDT"),
+                    bid_prices=(),
+                    bid_sizes=(),
+                    ask_prices=(Decimal(price),),
+                    ask_sizes=(Decimal("1"),),
+                    timestamp=now,
+                )
+                for exchange_id, price in (("binance", "50000"), ("okx", "50010"))
+            ]
+        )
+        app_service = TradingAppService(
+            trading_service=trading_app_service.TradingService(logger=logger),
+            market_repository=market_repository,
+            exchange_repository=exchange_repository,
+            logger=logger,
+            routing_mode=trading_app_service.RoutingMode.SPLIT,
+        )
+
+        await app_service.place_market_order(
+            OrderDTO(
+                symbol="BTCUSDT",
+                side="buy",
+                quantity=Decimal("2"),
+                order_type="ioc",
+                max_slippage_bps=Decimal("10"),
+            )
+        )
+
+        children = {
+            call.args[0].exchange_id: call.args[0]
+            for call in exchange_repository.place_order.await_args_list
+        }
+        assert {c.order_type.value for c in children.values()} == {"ioc"}
+        # The best ask of each book plus 10 bps.
+        assert children["binance"].limit_price == Decimal("50050")
+        assert children["okx"].limit_price == Decimal("50060.01")
+        assert children["okx"].quote_price == Decimal("50010")
@@ -0,0 +1,95 @@
+import pytest
+from decimal import Decimal
+
+from src.trading.domain.model.instrument import (
+    Instrument,
+    InstrumentIndex,
+    InvalidOrderException,
+    Symbol,
+    parse_symbol,
+)
+
+
+def make_instrument(**overrides) -> Instrument:
+    fields = {
+        "exchange_id": "binance",
+        "symbol": Symbol(base="DOGE", quote="USDT"),
+        "step_size": Decimal("1.00000000"),
+        "min_quantity": Decimal("1.00000000"),
+        "max_quantity": Decimal("9000000.00000000"),
+        "tick_size": Decimal("0.00001000"),
+        "min_notional": Decimal("1.00000000"),
+    }
+    fields.update(overrides)
+    return Instrument(**fields)
+
+
+class TestParseSymbol:
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            pytest.param("BTCUSDT", Symbol(base="BTC", quote="USDT")),
+            pytest.param("DOGEUSDT", Symbol(base="DOGE", quote="USDT")),
+            pytest.param("doge/usdt", Symbol(base="DOGE", quote="USDT")),
+            pytest.param("DOGE-USDC", Symbol(base="DOGE", quote="USDC")),
+            pytest.param("ETHBTC", Symbol(base="ETH", quote="BTC")),
+        ],
+    )
+    def test_parse(self, text, expected):
+        assert parse_symbol(text) == expected
+
+    def test_unknown_quote(self):
+        with pytest.raises(InvalidOrderException):
+            parse_symbol("FOOBAR")
+
+
+class TestInstrument:
+
+    @pytest.mark.parametrize(
+        "step_size,quantity,expected",
+        [
+            pytest.param(Decimal("0.00100000"), Decimal("1.23456"), "1.234"),
+            pytest.param(Decimal("1.00000000"), Decimal("12.9"), "12"),
+            pytest.param(Decimal("10"), Decimal("1234"), "1230"),
+            pytest.param(Decimal("0"), Decimal("1.23456"), "1.23456"),
+        ],
+    )
+    def test_quantity_is_rounded_down_to_step(self, step_size, quantity, expected):
+        instrument = make_instrument(step_size=step_size, min_quantity=Decimal("0"))
+        assert str(instrument.normalize_quantity(quantity)) == expected
+
+    def test_quantity_below_minimum(self):
+        with pytest.raises(InvalidOrderException, match="below the minimum"):
+            make_instrument().normalize_quantity(Decimal("0.5"))
+
+    def test_quantity_above_maximum(self):
+        with pytest.raises(InvalidOrderException, match="above the maximum"):
+            make_instrument().normalize_quantity(Decimal("9000001"))
+
+    def test_price_is_rounded_down_to_tick(self):
+        assert str(make_instrument().normalize_price(Decimal("0.1234567"))) == "0.12345"
+
+    def test_notional(self):
+        make_instrument().validate_notional(Decimal("10"), Decimal("0.1"))
+        with pytest.raises(InvalidOrderException):
+            make_instrument().validate_notional(Decimal("9"), Decimal("0.1"))
+
+
+class TestInstrumentIndex:
+
+    def test_resolve_prefers_listed_symbols(self):
+        # NOTE: Without the listing, "USDCUSDT" could not be told apart from guessing.
+        usdc = make_instrument(symbol=Symbol(base="USDC", quote="USDT"))
+        index = InstrumentIndex([usdc])
+
+        assert index.resolve("usdcusdt") is usdc.symbol
+        assert index.resolve("DOGEUSDT") == Symbol(base="DOGE", quote="USDT")
+
+    def test_normalize_quantity_per_exchange(self):
+        index = InstrumentIndex([make_instrument()])
+        symbol = Symbol(base="DOGE", quote="USDT")
+
+        assert index.normalize_quantity("binance", symbol, Decimal("3.7")) == 3
+        # Unknown instruments are left to the exchange.
+        assert index.normalize_quantity("okx", symbol, Decimal("3.7")) == Decimal("3.7")
@@ -48,6 +48,22 @@ class TestPrice:
         with pytest.raises(AttributeError):
             price.amount = Decimal("200.00")
 
+    def test_equal_prices_hash_equal(self):
+        price1 = Price(amount=Decimal("100.0"), timestamp=datetime.now())
+        price2 = Price(amount=Decimal("100.00"), timestamp=datetime.now())
+        assert price1 == price2
+        assert len({price1, price2}) == 1
+
+    def test_market_is_hashable(self, symbol):
+        now = datetime.now()
+        market = Market(
+            exchange_id="binance",
+            symbol=symbol,
+            best_bid=Price(amount=Decimal("100.00"), timestamp=now),
+            best_ask=Price(amount=Decimal("101.00"), timestamp=now),
+        )
+        assert {market: 1}[market] == 1
+
 
 class TestMarket:
     def test_market_price_validity(self, symbol):
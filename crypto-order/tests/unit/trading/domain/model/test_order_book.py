@@ -0,0 +1,63 @@
+import pytest
+from decimal import Decimal
+from datetime import datetime
+
+from src.trading.domain.model.order import OrderSide, Symbol
+from src.trading.domain.model.order_book import OrderBook
+
+
+def make_order_book(asks, bids=(), exchange_id="binance") -> OrderBook:
+    return OrderBook(
+        exchange_id=exchange_id,
+        symbol=Symbol(base="BTC", quote="USDT"),
+        bid_prices=tuple(Decimal(p) for p, _ in bids),
+        bid_sizes=tuple(Decimal(s) for _, s in bids),
+        ask_prices=tuple(Decimal(p) for p, _ in asks),
+        ask_sizes=tuple(Decimal(s) for _, s in asks),
+        timestamp=datetime.now(),
+    )
+
+
+class TestOrderBook:
+
+    @pytest.mark.parametrize(
+        "quantity,expected",
+        [
+            pytest.param(Decimal("0.5"), Decimal("100")),
+            pytest.param(Decimal("1"), Decimal("100")),
+            pytest.param(Decimal("2"), Decimal("101")),
+            pytest.param(Decimal("4"), Decimal("102.5")),
+            pytest.param(Decimal("5"), None),
+        ],
+    )
+    def test_expected_fill_price_walks_asks_for_buy(self, quantity, expected):
+        book = make_order_book(asks=[("100", "1"), ("102", "1"), ("104", "2")])
+        assert book.expected_fill_price(OrderSide.BUY, quantity) == expected
+
+    def test_expected_fill_price_walks_bids_for_sell(self):
+        book = make_order_book(asks=[("101", "1")], bids=[("100", "1"), ("98", "1")])
+        assert book.expected_fill_price(OrderSide.SELL, Decimal("2")) == Decimal("99")
+
+    def test_available_quantity(self):
+        book = make_order_book(asks=[("100", "1"), ("102", "1.5")])
+        assert book.available_quantity(OrderSide.BUY) == Decimal("2.5")
+        assert book.available_quantity(OrderSide.SELL) == Decimal("0")
+
+    def test_to_market_uses_top_of_book(self):
+        market = make_order_book(
+            asks=[("101", "1"), ("102", "1")], bids=[("100", "1")]
+        ).to_market()
+        assert market.best_ask.amount == Decimal("101")
+        assert market.best_bid.amount == Decimal("100")
+
+    def test_ladders_must_have_same_length(self):
+        with pytest.raises(ValueError):
+            OrderBook(
+                exchange_id="binance",
+                symbol=Symbol(base="BTC", quote="USDT"),
+                bid_prices=(Decimal("100"),),
+                bid_sizes=(),
+                ask_prices=(),
+                ask_sizes=(),
+                timestamp=datetime.now(),
+            )
@@ -0,0 +1,75 @@
+import pytest
+from decimal import Decimal
+
+from src.trading.domain.model.order import Symbol
+from src.trading.domain.model.quote import (
+    DEFAULT_PRICE_SCALE,
+    Quote,
+    parse_fixed,
+    price_scale,
+)
+
+BTCUSDT = Symbol(base="BTC", quote="USDT")
+
+
+class TestFixedPoint:
+
+    @pytest.mark.parametrize(
+        ["tick_size", "expected"],
+        [
+            pytest.param(Decimal("0.01"), 2),
+            pytest.param(Decimal("0.00100000"), 3),
+            pytest.param(Decimal("1"), 0),
+            pytest.param(Decimal("10"), 0),
+            pytest.param(None, DEFAULT_PRICE_SCALE),
+        ],
+    )
+    def test_price_scale(self, tick_size, expected):
+        assert price_scale(tick_size) == expected
+
+    @pytest.mark.parametrize(
+        ["text", "scale", "expected"],
+        [
+            pytest.param("25.35190000", 4, 253519),
+            pytest.param("25.3", 4, 253000),
+            pytest.param("25", 2, 2500),
+            pytest.param("0.00000123", 8, 123),
+        ],
+    )
+    def test_parse_fixed(self, text, scale, expected):
+        assert parse_fixed(text, scale) == expected
+
+    def test_parse_fixed_rejects_prices_finer_than_scale(self):
+        with pytest.raises(ValueError):
+            parse_fixed("25.351", 2)
+
+
+class TestQuote:
+
+    def test_to_market_converts_to_decimal(self):
+        quote = Quote.parse("binance", BTCUSDT, "50000.10", "50000.25", scale=2)
+
+        market = quote.to_market()
+
+        assert market.exchange_id == "binance"
+        assert market.best_bid.amount == Decimal("50000.10")
+        assert market.best_ask.amount == Decimal("50000.25")
+        assert market.best_bid.timestamp == market.best_ask.timestamp
+
+    @pytest.mark.parametrize(
+        ["bid", "ask", "expected"],
+        [
+            pytest.param("100", "101", True),
+            pytest.param("101", "100", False),
+            pytest.param("100", "100", False),
+        ],
+    )
+    def test_price_validity(self, bid, ask, expected):
+        assert (
+            Quote.parse("okx", BTCUSDT, bid, ask, scale=2).is_price_valid() == expected
+        )
+
+    def test_quote_has_no_instance_dict(self):
+        quote = Quote.parse("okx", BTCUSDT, "100", "101", scale=2)
+        with pytest.raises(AttributeError):
+            quote.spread = 1
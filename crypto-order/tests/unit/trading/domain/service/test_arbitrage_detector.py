@@ -0,0 +1,93 @@
+from decimal import Decimal
+from unittest.mock import Mock
+
+from src.trading.domain.model.order import Symbol
+from src.trading.domain.service.arbitrage_detector import ArbitrageDetector
+
+from conftest import make_market
+
+logger = Mock()
+
+BTC_USDT = Symbol(base="BTC", quote="USDT")
+
+
+class TestArbitrageDetector:
+
+    def test_crossed_market_net_of_fees(self):
+        detector = ArbitrageDetector(logger=logger, default_fee=Decimal("0.001"))
+
+        opportunity = detector.find_opportunity(
+            [make_market("binance", "100", "101"), make_market("okx", "102", "103")]
+        )
+
+        assert opportunity.buy_exchange_id == "binance"
+        assert opportunity.sell_exchange_id == "okx"
+        assert (opportunity.buy_price, opportunity.sell_price) == (101, 102)
+        assert opportunity.gross_spread == 1
+        # 102 * 0.999 - 101 * 1.001
+        assert opportunity.net_profit == Decimal("0.797")
+        assert opportunity.net_profit_bps == Decimal("0.797") / 101 * 10000
+
+    def test_fees_larger_than_the_spread(self):
+        detector = ArbitrageDetector(
+            logger=logger, fees={"okx": Decimal("0.01")}, default_fee=Decimal("0")
+        )
+
+        assert (
+            detector.find_opportunity(
+                [make_market("binance", "100", "101"), make_market("okx", "102", "103")]
+            )
+            is None
+        )
+
+    def test_fees_choose_the_venue_pair(self):
+        # Selling on okx has the higher bid, but its fee makes other the better venue.
+        detector = ArbitrageDetector(
+            logger=logger,
+            fees={"okx": Decimal("0.005")},
+            default_fee=Decimal("0"),
+        )
+
+        opportunity = detector.find_opportunity(
+            [
+                make_market("binance", "100", "101"),
+                make_market("okx", "102.5", "103"),
+                make_market("other", "102", "103"),
+            ]
+        )
+
+        assert opportunity.sell_exchange_id == "other"
+        assert opportunity.net_profit == 1
+
+    def test_no_opportunity(self):
+        detector = ArbitrageDetector(logger=logger)
+
+        assert (
+            detector.find_opportunity(
+                [make_market("binance", "100", "101"), make_market("okx", "100", "101")]
+            )
+            is None
+        )
+        # Invalid and one-sided quotes are not crossed markets.
+        assert (
+            detector.find_opportunity(
+                [make_market("binance", "105", "104"), make_market("okx", None, "103")]
+            )
+            is None
+        )
+
+    def test_min_profit_threshold(self):
+        markets = [
+            make_market("binance", "100", "101"),
+            make_market("okx", "102", "103"),
+        ]
+
+        assert ArbitrageDetector(
+            logger=logger, default_fee=Decimal("0"), min_profit_bps=Decimal("99")
+        ).find_opportunity(markets)
+        assert (
+            ArbitrageDetector(
+                logger=logger, default_fee=Decimal("0"), min_profit_bps=Decimal("100")
+            ).find_opportunity(markets)
+            is None
+        )
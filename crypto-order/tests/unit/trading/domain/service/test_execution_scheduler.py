@@ -0,0 +1,66 @@
+import pytest
+from decimal import Decimal
+
+from src.trading.domain.service.execution_scheduler import (
+    ExecutionScheduler,
+    VolumeProfile,
+)
+
+# Midnight UTC.
+MIDNIGHT = 1_700_006_400.0
+
+
+class TestExecutionScheduler:
+
+    def test_twap_slices(self):
+        schedule = ExecutionScheduler().twap(Decimal("1"), 60, 3)
+
+        assert [s.offset for s in schedule] == [0, 20, 40]
+        assert [s.index for s in schedule] == [0, 1, 2]
+        # The last slice takes the rounding remainder.
+        assert schedule[0].quantity == schedule[1].quantity == Decimal(1) / 3
+        assert sum(s.quantity for s in schedule) == 1
+
+    def test_invalid_schedule(self):
+        with pytest.raises(ValueError):
+            ExecutionScheduler().twap(Decimal("1"), 60, 0)
+
+    def test_vwap_follows_the_volume_profile(self):
+        # Hourly volume, with the first hour of the day trading three times the second.
+        profile = VolumeProfile(volumes=(Decimal(3), Decimal(1)) + (Decimal(1),) * 22)
+
+        schedule = ExecutionScheduler().vwap(
+            Decimal("4"), 7200, 2, profile, start=MIDNIGHT
+        )
+
+        assert [s.offset for s in schedule] == [0, 3600]
+        assert [s.quantity for s in schedule] == [3, 1]
+
+    def test_vwap_across_buckets_and_midnight(self):
+        profile = VolumeProfile(
+            volumes=(Decimal(2),) + (Decimal(0),) * 22 + (Decimal(6),)
+        )
+
+        # 23:30 to 00:30 is half of the last hour and half of the first.
+        assert profile.volume_between(MIDNIGHT - 1800, MIDNIGHT + 1800) == 4
+        schedule = ExecutionScheduler().vwap(
+            Decimal("1"), 3600, 2, profile, start=MIDNIGHT - 1800
+        )
+        assert [s.quantity for s in schedule] == [Decimal("0.75"), Decimal("0.25")]
+
+    def test_vwap_without_volume_falls_back_to_twap(self):
+        profile = VolumeProfile(volumes=(Decimal(0),) * 24)
+
+        schedule = ExecutionScheduler().vwap(
+            Decimal("1"), 60, 2, profile, start=MIDNIGHT
+        )
+
+        assert [s.quantity for s in schedule] == [Decimal("0.5"), Decimal("0.5")]
+
+    def test_profile_must_cover_a_day(self):
+        with pytest.raises(ValueError):
+            VolumeProfile(volumes=(Decimal(1),) * 23)
+        profile = VolumeProfile.from_dict(
+            {"bucket_seconds": 21600, "volumes": [1, 2, 3, 4]}
+        )
+        assert profile.volumes == (1, 2, 3, 4)
@@ -0,0 +1,108 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from src.trading.domain.model.order import OrderSide, Symbol
+from src.trading.domain.service.market_scanner import MarketScanner
+from src.trading.domain.service.trading_service import TradingService
+
+from conftest import make_market
+
+logger = Mock()
+
+BTC_USDT = Symbol(base="BTC", quote="USDT")
+ETH_USDT = Symbol(base="ETH", quote="USDT")
+
+
+class TestMarketScanner:
+
+    def test_best_venues_per_symbol(self):
+        scanner = MarketScanner(["binance", "okx"])
+        scanner.update_all(
+            [
+                make_market("binance", "100", "102", BTC_USDT),
+                make_market("okx", "101", "103", BTC_USDT),
+                make_market("binance", "10", "11", ETH_USDT),
+            ]
+        )
+
+        btc, eth = scanner.scan().rows()
+
+        assert (btc.best_bid, btc.best_bid_exchange) == (101, "okx")
+        assert (btc.best_ask, btc.best_ask_exchange) == (102, "binance")
+        assert btc.spread == 1
+        assert btc.spread_bps == pytest.approx(1 / 101.5 * 10000)
+        assert (eth.best_bid_exchange, eth.best_ask_exchange, eth.venues) == (
+            "binance",
+            "binance",
+            1,
+        )
+
+    def test_crossed_market(self):
+        scanner = MarketScanner(["binance", "okx"])
+        scanner.update_all(
+            [
+                make_market("binance", "100", "101", BTC_USDT),
+                make_market("okx", "102", "103", BTC_USDT),
+            ]
+        )
+
+        (row,) = scanner.scan().rows()
+
+        assert row.crossed
+        assert row.spread == -1
+
+    def test_invalid_missing_and_stale_quotes_are_left_out(self):
+        scanner = MarketScanner(["binance", "okx", "other"], symbols=[ETH_USDT])
+        old = datetime.now() - timedelta(seconds=10)
+        scanner.update_all(
+            [
+                # Bid above ask on one venue is not a valid quote.
+                make_market("binance", "105", "104", BTC_USDT),
+                make_market("okx", None, "103", BTC_USDT),
+                make_market("other", "100", "101", BTC_USDT, timestamp=old),
+            ]
+        )
+
+        eth, btc = scanner.scan().rows()
+        _, btc_fresh = scanner.scan(max_age=5).rows()
+
+        assert (eth.best_bid, eth.venues, eth.crossed) == (None, 0, False)
+        assert (btc.best_bid_exchange, btc.venues) == ("other", 1)
+        assert btc_fresh.best_bid is None
+
+    def test_symbols_beyond_capacity(self):
+        scanner = MarketScanner(["binance"], capacity=2)
+        symbols = [Symbol(base=f"C{i}", quote="USDT") for i in range(10)]
+        for i, symbol in enumerate(symbols):
+            scanner.update(make_market("binance", str(i + 1), str(i + 2), symbol))
+
+        result = scanner.scan()
+
+        assert result.symbols == symbols
+        assert list(result.best_bid) == [i + 1 for i in range(10)]
+
+    def test_same_choice_as_trading_service(self):
+        rng = random.Random(1)
+        exchanges = ["binance", "okx", "a", "b"]
+        symbols = [Symbol(base=f"C{i}", quote="USDT") for i in range(50)]
+        scanner = MarketScanner(exchanges)
+        markets = {symbol: [] for symbol in symbols}
+        for symbol in symbols:
+            for exchange_id in exchanges:
+                bid = rng.randint(900, 1000)
+                market = make_market(exchange_id, bid, bid + rng.randint(1, 5), symbol)
+                markets[symbol].append(market)
+                scanner.update(market)
+        trading_service = TradingService(logger=logger)
+
+        for row in scanner.scan().rows():
+            best_ask = trading_service.find_best_market(
+                markets[row.symbol], OrderSide.BUY
+            )
+            best_bid = trading_service.find_best_market(
+                markets[row.symbol], OrderSide.SELL
+            )
+            assert row.best_ask_exchange == best_ask.exchange_id
+            assert row.best_bid_exchange == best_bid.exchange_id
@@ -0,0 +1,167 @@
+import pytest
+from decimal import Decimal
+from datetime import datetime
+from unittest.mock import Mock
+
+from src.trading.domain.service.order_router import SmartOrderRouter
+from src.trading.domain.model.order import Order, OrderSide, OrderStatus, Symbol
+from src.trading.domain.model.order_book import OrderBook
+
+logger = Mock()
+
+
+def make_order_book(exchange_id, asks=(), bids=()) -> OrderBook:
+    return OrderBook(
+        exchange_id=exchange_id,
+        symbol=Symbol(base="BTC", quote="USDT"),
+        bid_prices=tuple(Decimal(p) for p, _ in bids),
+        bid_sizes=tuple(Decimal(s) for _, s in bids),
+        ask_prices=tuple(Decimal(p) for p, _ in asks),
+        ask_sizes=tuple(Decimal(s) for _, s in asks),
+        timestamp=datetime.now(),
+    )
+
+
+def make_parent(quantity: str = "3") -> Order:
+    return Order(
+        id="parent-id",
+        symbol=Symbol(base="BTC", quote="USDT"),
+        side=OrderSide.BUY,
+        quantity=Decimal(quantity),
+        status=OrderStatus.PENDING,
+        created_at=datetime.now(),
+    )
+
+
+class TestSmartOrderRouterSplit:
+
+    def test_buy_takes_cheapest_levels_across_exchanges(self):
+        router = SmartOrderRouter(logger=logger)
+        books = [
+            make_order_book("binance", asks=[("100", "1"), ("103", "5")]),
+            make_order_book("okx", asks=[("101", "1"), ("102", "1")]),
+        ]
+
+        allocations = router.split(books, OrderSide.BUY, Decimal("3.5"))
+
+        assert allocations == {"binance": Decimal("1.5"), "okx": Decimal("2")}
+
+    def test_sell_takes_highest_bids(self):
+        router = SmartOrderRouter(logger=logger)
+        books = [
+            make_order_book("binance", bids=[("100", "1")]),
+            make_order_book("okx", bids=[("101", "1")]),
+        ]
+
+        allocations = router.split(books, OrderSide.SELL, Decimal("1"))
+
+        assert allocations == {"okx": Decimal("1")}
+
+    def test_small_allocations_are_folded_into_largest(self):
+        router = SmartOrderRouter(logger=logger, min_child_quantity=Decimal("0.5"))
+        books = [
+            make_order_book("binance", asks=[("100", "0.1")]),
+            make_order_book("okx", asks=[("101", "5")]),
+        ]
+
+        allocations = router.split(books, OrderSide.BUY, Decimal("2"))
+
+        assert allocations == {"okx": Decimal("2")}
+
+    def test_not_enough_depth(self):
+        router = SmartOrderRouter(logger=logger)
+        with pytest.raises(ValueError):
+            router.split(
+                [make_order_book("binance", asks=[("100", "1")])],
+                OrderSide.BUY,
+                Decimal("2"),
+            )
+
+
+class TestSmartOrderRouterAggregate:
+
+    def test_weighted_average_price_of_filled_children(self):
+        router = SmartOrderRouter(logger=logger)
+        parent = make_parent("3")
+        children = router.create_child_orders(
+            parent, {"binance": Decimal("1"), "okx": Decimal("2")}
+        )
+        children[0].fill("binance", Decimal("100"))
+        children[1].fill("okx", Decimal("103"))
+
+        result = router.aggregate(parent, children)
+
+        assert all(c.parent_id == "parent-id" for c in children)
+        assert result.status == OrderStatus.FILLED
+        assert result.filled_price == Decimal("102")
+        assert result.filled_quantity == Decimal("3")
+
+    def test_partial_failure(self):
+        router = SmartOrderRouter(logger=logger)
+        parent = make_parent("3")
+        children = router.create_child_orders(
+            parent, {"binance": Decimal("1"), "okx": Decimal("2")}
+        )
+        children[0].fill("binance", Decimal("100"))
+        children[1].fail("Exchange API error")
+
+        result = router.aggregate(parent, children)
+
+        assert result.status == OrderStatus.PARTIALLY_FILLED
+        assert result.filled_price == Decimal("100")
+        assert result.filled_quantity == Decimal("1")
+        assert result.exchange_id == "binance"
+        assert "okx: Exchange API error" in result.error
+
+    def test_partial_fill_completed_by_rerouted_child(self):
+        router = SmartOrderRouter(logger=logger)
+        parent = make_parent("3")
+        partial = router.create_child_orders(parent, {"binance": Decimal("3")})[0]
+        partial.fill("binance", Decimal("100"))
+        partial.status = OrderStatus.PARTIALLY_FILLED
+        partial.filled_quantity = Decimal("2")
+        rerouted = router.create_child_orders(parent, {"okx": Decimal("1")})[0]
+        rerouted.fill("okx", Decimal("103"))
+
+        result = router.aggregate(parent, [partial, rerouted])
+
+        assert result.status == OrderStatus.FILLED
+        assert result.filled_quantity == Decimal("3")
+        assert result.filled_price == Decimal("101")
+        assert result.exchange_id == "binance,okx"
+
+    def test_fill_without_price_counts_towards_filled_quantity(self):
+        router = SmartOrderRouter(logger=logger)
+        parent = make_parent("3")
+        children = router.create_child_orders(
+            parent, {"binance": Decimal("1"), "okx": Decimal("2")}
+        )
+        children[0].fill("binance", Decimal("100"))
+        # e.g. the confirmation of the OKX fill timed out before its price arrived.
+        children[1].status = OrderStatus.FILLED
+        children[1].exchange_id = "okx"
+
+        result = router.aggregate(parent, children)
+
+        assert result.status == OrderStatus.FILLED
+        assert result.filled_quantity == Decimal("3")
+        assert result.filled_price == Decimal("100")
+        assert result.exchange_id == "binance,okx"
+
+    def test_resting_children_are_not_failures(self):
+        router = SmartOrderRouter(logger=logger)
+        parent = make_parent("3")
+        children = router.create_child_orders(
+            parent,
+            {"binance": Decimal("1"), "okx": Decimal("1"), "bybit": Decimal("1")},
+        )
+        children[0].fill("binance", Decimal("100"))
+        # The okx limit order rests on the book.
+        children[2].fail("Insufficient balance")
+
+        result = router.aggregate(parent, children)
+
+        assert result.status == OrderStatus.PENDING
+        assert result.filled_quantity == Decimal("1")
+        assert result.exchange_id == "binance"
+        assert result.error == "bybit: Insufficient balance"
@@ -5,6 +5,9 @@ from unittest.mock import Mock
 
 from src.trading.domain.service.trading_service import TradingService
 from src.trading.domain.model.order import OrderSide, Market, Symbol, Price
+from src.trading.domain.model.order_book import OrderBook
+
+from conftest import make_market
 
 logger = Mock()
 
@@ -141,3 +144,71 @@ class TestTradingService:
                 ],
                 side=OrderSide.BUY,
             )
+
+
+class TestTradingServiceDepthRouting:
+    def make_order_book(self, exchange_id, asks, bids=()):
+        return OrderBook(
+            exchange_id=exchange_id,
+            symbol=Symbol(base="BTC", quote="USDT"),
+            bid_prices=tuple(Decimal(p) for p, _ in bids),
+            bid_sizes=tuple(Decimal(s) for _, s in bids),
+            ask_prices=tuple(Decimal(p) for p, _ in asks),
+            ask_sizes=tuple(Decimal(s) for _, s in asks),
+            timestamp=datetime.now(),
+        )
+
+    def test_deeper_book_wins_over_better_top_of_book(self):
+        service = TradingService(logger=logger)
+        thin = self.make_order_book("binance", asks=[("100", "0.1"), ("110", "10")])
+        deep = self.make_order_book("okx", asks=[("101", "10")])
+
+        best = service.find_best_order_book([thin, deep], OrderSide.BUY, Decimal("1"))
+
+        assert best.exchange_id == "okx"
+
+    def test_sell_picks_highest_expected_fill_price(self):
+        service = TradingService(logger=logger)
+        binance = self.make_order_book("binance", asks=[], bids=[("100", "1")])
+        okx = self.make_order_book("okx", asks=[], bids=[("99", "1")])
+
+        best = service.find_best_order_book(
+            [binance, okx], OrderSide.SELL, Decimal("1")
+        )
+
+        assert best.exchange_id == "binance"
+
+    def test_not_enough_depth(self):
+        service = TradingService(logger=logger)
+        book = self.make_order_book("binance", asks=[("100", "0.1")])
+        with pytest.raises(ValueError):
+            service.find_best_order_book([book], OrderSide.BUY, Decimal("1"))
+
+
+class TestTradingServiceLimitPrice:
+    def test_limit_price_moves_against_the_order(self):
+        service = TradingService(logger=logger)
+        market = make_market("binance", "100", "101")
+
+        assert service.limit_price(market, OrderSide.BUY, Decimal("10")) == Decimal(
+            "101.101"
+        )
+        assert service.limit_price(market, OrderSide.SELL, Decimal("10")) == Decimal(
+            "99.9"
+        )
+
+    def test_rank_markets_best_first(self):
+        service = TradingService(logger=logger)
+        binance = make_market("binance", "100", "102")
+        okx = make_market("okx", "99", "101")
+
+        assert service.rank_markets([binance, okx], OrderSide.BUY) == [okx, binance]
+        assert service.rank_markets([okx, binance], OrderSide.SELL) == [binance, okx]
+
+    def test_is_within_limit(self):
+        service = TradingService(logger=logger)
+        market = make_market("binance", "100", "101")
+
+        assert service.is_within_limit(market, OrderSide.BUY, Decimal("101"))
+        assert not service.is_within_limit(market, OrderSide.BUY, Decimal("100.5"))
+        assert not service.is_within_limit(market, OrderSide.SELL, Decimal("100.5"))
@@ -0,0 +1,234 @@
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+
+import aiohttp
+
+from benchmarks.mock_exchange import FaultProfile, MockBinanceServer, MockOKXServer
+from src.trading.infrastructure.exchange.binance_adapter import BinanceAdapter
+from src.trading.infrastructure.exchange.json_decoder import available_decoders
+from src.trading.infrastructure.exchange.okx_adapter import (
+    OKXAdapter,
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    Symbol,
+)
+
+logger = Mock()
+
+
+def make_order(
+    side: OrderSide,
+    quantity: Decimal = Decimal("1"),
+    order_type: OrderType = OrderType.MARKET,
+    limit_price: Decimal = None,
+) -> Order:
+    return Order(
+        id="test-order-id",
+        symbol=Symbol(base="BTC", quote="USDT"),
+        side=side,
+        quantity=quantity,
+        status=OrderStatus.PENDING,
+        created_at=datetime.now(),
+        order_type=order_type,
+        limit_price=limit_price,
+    )
+
+
+class TestBinanceAdapterOnMockExchange:
+
+    @pytest.mark.asyncio
+    async def test_get_market_and_place_signed_order(self):
+        async with MockBinanceServer() as server:
+            async with BinanceAdapter(server.config(), logger=logger) as adapter:
+                market = await adapter.get_market(Symbol(base="BTC", quote="USDT"))
+                order = await adapter.place_order(make_order(OrderSide.BUY))
+
+        assert market.best_ask.amount == Decimal("50010")
+        assert order.status == OrderStatus.FILLED
+        assert order.filled_price == Decimal("50010")
+
+    @pytest.mark.asyncio
+    async def test_ioc_order_fills_up_to_the_limit_price(self):
+        # One unit per level: asks at 50010, 50011, 50012, ...
+        async with MockBinanceServer() as server:
+            async with BinanceAdapter(server.config(), logger=logger) as adapter:
+                order = await adapter.place_order(
+                    make_order(
+                        OrderSide.BUY,
+                        quantity=Decimal("2.5"),
+                        order_type=OrderType.IOC,
+                        limit_price=Decimal("50011"),
+                    )
+                )
+
+        assert order.status == OrderStatus.PARTIALLY_FILLED
+        assert order.filled_quantity == Decimal("2")
+        assert order.filled_price == Decimal("50010.5")
+        assert (order.order_type, order.limit_price) == (
+            OrderType.IOC,
+            Decimal("50011"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_fok_order_is_killed(self):
+        async with MockBinanceServer() as server:
+            async with BinanceAdapter(server.config(), logger=logger) as adapter:
+                order = await adapter.place_order(
+                    make_order(
+                        OrderSide.SELL,
+                        quantity=Decimal("2.5"),
+                        order_type=OrderType.FOK,
+                        limit_price=Decimal("49999"),
+                    )
+                )
+
+        assert order.status == OrderStatus.FAILED
+        assert order.filled_quantity is None
+        assert order.filled_price is None
+
+    @pytest.mark.asyncio
+    async def test_wrong_secret_fails_order(self):
+        async with MockBinanceServer(api_secret="other") as server:
+            config = server.config(api_secret="secret")
+            async with BinanceAdapter(config, logger=logger) as adapter:
+                order = await adapter.place_order(make_order(OrderSide.SELL))
+
+        assert order.status == OrderStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_order_rejected_for_timestamp_is_signed_again_on_server_time(self):
+        # The exchange clock is 10s ahead: past the 5s recvWindow.
+        async with MockBinanceServer(clock_offset=10) as server:
+            async with BinanceAdapter(server.config(), logger=logger) as adapter:
+                first = await adapter.place_order(make_order(OrderSide.BUY))
+                second = await adapter.place_order(make_order(OrderSide.BUY))
+
+        assert (first.status, second.status) == (OrderStatus.FILLED,) * 2
+        assert server.requests["GET /api/v3/time"] == 1
+        assert server.requests["POST /api/v3/order"] == 3
+
+    @pytest.mark.asyncio
+    async def test_error_body_that_is_not_an_object_fails_order(self):
+        profile = FaultProfile(error_rate=1, error_status=400, error_body=["Bad"])
+        async with MockBinanceServer(profile=profile) as server:
+            async with BinanceAdapter(server.config(), logger=logger) as adapter:
+                order = await adapter.place_order(make_order(OrderSide.BUY))
+
+        assert order.status == OrderStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_raise(self):
+        async with MockBinanceServer(profile=FaultProfile(error_rate=1)) as server:
+            async with BinanceAdapter(server.config(), logger=logger) as adapter:
+                with pytest.raises(aiohttp.ClientResponseError):
+                    await adapter.get_market(Symbol(base="BTC", quote="USDT"))
+
+
+class TestOKXAdapterOnMockExchange:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("side", [OrderSide.BUY, OrderSide.SELL])
+    async def test_place_order_waits_for_fill(self, side):
+        async with MockOKXServer(fill_delay=0.05) as server:
+            config = server.config(fill_poll_initial_interval=0.01)
+            async with OKXAdapter(config, logger=logger) as adapter:
+                order = await adapter.place_order(make_order(side))
+
+        assert order.status == OrderStatus.FILLED
+        assert order.side == side
+        assert order.filled_price == (
+            Decimal("50010") if side == OrderSide.BUY else Decimal("50000")
+        )
+        assert server.requests["GET /api/v5/trade/order"] >= 2
+
+    @pytest.mark.asyncio
+    async def test_ioc_order_canceled_after_partial_fill(self):
+        async with MockOKXServer() as server:
+            config = server.config(fill_poll_initial_interval=0.01)
+            async with OKXAdapter(config, logger=logger) as adapter:
+                order = await adapter.place_order(
+                    make_order(
+                        OrderSide.SELL,
+                        quantity=Decimal("3"),
+                        order_type=OrderType.IOC,
+                        limit_price=Decimal("49999"),
+                    )
+                )
+
+        assert order.status == OrderStatus.PARTIALLY_FILLED
+        assert order.filled_quantity == Decimal("2")
+        assert order.filled_price == Decimal("49999.5")
+        assert (order.order_type, order.limit_price) == (
+            OrderType.IOC,
+            Decimal("49999"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_limit_order_rests_on_the_book(self):
+        async with MockOKXServer() as server:
+            async with OKXAdapter(server.config(), logger=logger) as adapter:
+                order = await adapter.place_order(
+                    make_order(
+                        OrderSide.BUY,
+                        order_type=OrderType.LIMIT,
+                        limit_price=Decimal("49000"),
+                    )
+                )
+
+        assert order.status == OrderStatus.PENDING
+        assert order.filled_price is None
+        assert (order.order_type, order.limit_price) == (
+            OrderType.LIMIT,
+            Decimal("49000"),
+        )
+        # Returned as accepted, without waiting for a fill.
+        assert server.requests.get("GET /api/v5/trade/order", 0) == 0
+
+    @pytest.mark.asyncio
+    async def test_rejected_order_raises_the_rejection_reason(self):
+        async with MockOKXServer() as server:
+            async with OKXAdapter(server.config(), logger=logger) as adapter:
+                with pytest.raises(ValueError, match="Parameter sz error"):
+                    await adapter.place_order(
+                        make_order(OrderSide.BUY, quantity=Decimal("0"))
+                    )
+
+    @pytest.mark.asyncio
+    async def test_get_order_book(self):
+        async with MockOKXServer() as server:
+            async with OKXAdapter(server.config(), logger=logger) as adapter:
+                book = await adapter.get_order_book(
+                    Symbol(base="BTC", quote="USDT"), depth=5
+                )
+
+        assert len(book.ask_prices) == 5
+        assert book.ask_prices[0] == Decimal("50010")
+
+
+class TestJsonDecodersOnMockExchange:
+
+    @pytest.mark.parametrize("decoder", available_decoders())
+    @pytest.mark.asyncio
+    async def test_adapters_decode_with_every_decoder(self, decoder):
+        async with MockBinanceServer() as binance, MockOKXServer() as okx:
+            async with BinanceAdapter(
+                {**binance.config(), "json_decoder": decoder}, logger=logger
+            ) as binance_adapter, OKXAdapter(
+                {**okx.config(), "json_decoder": decoder}, logger=logger
+            ) as okx_adapter:
+                markets = [
+                    await binance_adapter.get_market(Symbol(base="BTC", quote="USDT")),
+                    await okx_adapter.get_market(Symbol(base="BTC", quote="USDT")),
+                ]
+                orders = [
+                    await binance_adapter.place_order(make_order(OrderSide.BUY)),
+                    await okx_adapter.place_order(make_order(OrderSide.SELL)),
+                ]
+
+        assert [m.best_ask.amount for m in markets] == [Decimal("50010")] * 2
+        assert [o.status for o in orders] == [OrderStatus.FILLED, OrderStatus.FILLED]
+        assert orders[1].filled_quantity == Decimal("1")
@@ -0,0 +1,182 @@
+import asyncio
+import json
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+from benchmarks.mock_exchange import MockBinanceServer, MockOKXServer
+from src.trading.infrastructure.exchange.binance_adapter import BinanceAdapter
+from src.trading.infrastructure.exchange.capability_discovery import (
+    CapabilityCache,
+    CapabilityDiscovery,
+    ExchangeCapabilities,
+    Instrument,
+    Symbol,
+)
+from src.trading.infrastructure.exchange.okx_adapter import OKXAdapter
+
+logger = Mock()
+
+BTC_USDT = Symbol(base="BTC", quote="USDT")
+ETH_USDT = Symbol(base="ETH", quote="USDT")
+
+
+def make_exchange(symbols, delay: float = 0.0) -> Mock:
+    async def get_capabilities(exchange_id):
+        await asyncio.sleep(delay)
+        return ExchangeCapabilities(
+            exchange_id=exchange_id, symbols=frozenset(symbols), order_book=True
+        )
+
+    exchange = Mock()
+    exchange.get_capabilities = AsyncMock(side_effect=get_capabilities)
+    return exchange
+
+
+class TestCapabilityDiscovery:
+
+    @pytest.mark.asyncio
+    async def test_discovers_exchanges_concurrently(self):
+        exchanges = {
+            "binance": make_exchange([BTC_USDT], delay=0.1),
+            "okx": make_exchange([ETH_USDT], delay=0.1),
+        }
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        capabilities = await CapabilityDiscovery(logger=logger).discover(exchanges)
+
+        assert loop.time() - started < 0.19
+        assert capabilities["binance"].supports(BTC_USDT)
+        assert not capabilities["okx"].supports(BTC_USDT)
+
+    @pytest.mark.asyncio
+    async def test_cached_capabilities_skip_discovery(self, tmp_path):
+        cache = CapabilityCache(tmp_path / "capabilities.json")
+        exchanges = {"binance": make_exchange([BTC_USDT, ETH_USDT])}
+        await CapabilityDiscovery(logger=logger, cache=cache).discover(exchanges)
+
+        capabilities = await CapabilityDiscovery(logger=logger, cache=cache).discover(
+            exchanges
+        )
+
+        exchanges["binance"].get_capabilities.assert_awaited_once()
+        assert capabilities["binance"].symbols == frozenset([BTC_USDT, ETH_USDT])
+        assert capabilities["binance"].order_book
+
+    @pytest.mark.asyncio
+    async def test_cached_instruments_round_trip(self, tmp_path):
+        instrument = Instrument(
+            exchange_id="binance",
+            symbol=BTC_USDT,
+            step_size=Decimal("0.00001000"),
+            min_quantity=Decimal("0.00001000"),
+            tick_size=Decimal("0.01000000"),
+        )
+        cache = CapabilityCache(tmp_path / "capabilities.json")
+        cache.save(
+            {
+                "binance": ExchangeCapabilities(
+                    exchange_id="binance",
+                    symbols=frozenset([BTC_USDT]),
+                    instruments=(instrument,),
+                )
+            }
+        )
+
+        assert cache.load()["binance"].instruments == (instrument,)
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_is_refreshed(self, tmp_path):
+        path = tmp_path / "capabilities.json"
+        path.write_text(
+            json.dumps(
+                {"binance": {"fetched_at": 0, "order_book": True, "symbols": []}}
+            )
+        )
+        exchanges = {"binance": make_exchange([BTC_USDT])}
+
+        capabilities = await CapabilityDiscovery(
+            logger=logger, cache=CapabilityCache(path)
+        ).discover(exchanges)
+
+        assert capabilities["binance"].supports(BTC_USDT)
+        assert json.loads(path.read_text())["binance"]["symbols"] == ["BTC/USDT"]
+
+    @pytest.mark.asyncio
+    async def test_corrupt_cache_is_ignored(self, tmp_path):
+        path = tmp_path / "capabilities.json"
+        path.write_text("{not json")
+
+        capabilities = await CapabilityDiscovery(
+            logger=logger, cache=CapabilityCache(path)
+        ).discover({"binance": make_exchange([BTC_USDT])})
+
+        assert capabilities["binance"].supports(BTC_USDT)
+
+    @pytest.mark.asyncio
+    async def test_failed_discovery_leaves_exchange_unknown(self):
+        failing = Mock()
+        failing.get_capabilities = AsyncMock(side_effect=Exception("Timeout"))
+        unlisted = Mock()
+        unlisted.get_capabilities = AsyncMock(side_effect=NotImplementedError)
+
+        capabilities = await CapabilityDiscovery(logger=logger).discover(
+            {"binance": failing, "other": unlisted}
+        )
+
+        assert capabilities == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_discovery_is_not_retried_until_it_expires(self, tmp_path):
+        path = tmp_path / "capabilities.json"
+        failing = Mock()
+        failing.get_capabilities = AsyncMock(side_effect=asyncio.TimeoutError)
+        listed = make_exchange([BTC_USDT])
+
+        for _ in range(2):
+            capabilities = await CapabilityDiscovery(
+                logger=logger, cache=CapabilityCache(path)
+            ).discover({"binance": failing, "okx": listed})
+
+        assert set(capabilities) == {"okx"}
+        assert failing.get_capabilities.await_count == 1
+        assert listed.get_capabilities.await_count == 1
+
+        failing.get_capabilities.side_effect = None
+        failing.get_capabilities.return_value = ExchangeCapabilities(
+            exchange_id="binance", symbols=frozenset([BTC_USDT])
+        )
+        capabilities = await CapabilityDiscovery(
+            logger=logger, cache=CapabilityCache(path, failure_max_age=-1)
+        ).discover({"binance": failing, "okx": listed})
+
+        assert capabilities["binance"].supports(BTC_USDT)
+        assert CapabilityCache(path).load_failures() == set()
+
+
+class TestAdapterCapabilities:
+
+    @pytest.mark.asyncio
+    async def test_binance_lists_trading_symbols(self):
+        async with MockBinanceServer(symbols=(("BTC", "USDT"),)) as server:
+            async with BinanceAdapter(server.config(), logger=logger) as adapter:
+                capabilities = await adapter.get_capabilities("binance")
+
+        assert capabilities.symbols == frozenset([BTC_USDT])
+        assert capabilities.order_book
+        (instrument,) = capabilities.instruments
+        assert instrument.step_size == Decimal("0.00001")
+        assert instrument.max_quantity == Decimal("9000")
+        assert instrument.tick_size == Decimal("0.01")
+        assert instrument.min_notional == Decimal("5")
+
+    @pytest.mark.asyncio
+    async def test_okx_lists_live_instruments(self):
+        async with MockOKXServer(lot_size=Decimal("0.0001")) as server:
+            async with OKXAdapter(server.config(), logger=logger) as adapter:
+                symbols = await adapter.list_symbols()
+                instruments = await adapter.list_instruments()
+
+        assert set(symbols) == {BTC_USDT, ETH_USDT}
+        assert {i.min_quantity for i in instruments} == {Decimal("0.0001")}
@@ -0,0 +1,160 @@
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from benchmarks.mock_exchange import MockBinanceServer, MockOKXServer
+from src.trading.infrastructure.exchange.binance_adapter import BinanceAdapter
+from src.trading.infrastructure.exchange.clock_sync import (
+    STARTUP_SAMPLES,
+    ClockOffsetEstimator,
+    ClockSample,
+    ClockSync,
+    OffsetClock,
+    sample_clock,
+)
+from src.trading.infrastructure.exchange.okx_adapter import OKXAdapter
+
+logger = Mock()
+
+
+class TestClockOffsetEstimator:
+
+    def test_no_samples_means_no_offset(self):
+        estimator = ClockOffsetEstimator()
+
+        assert estimator.offset == 0.0
+        assert estimator.rtt is None
+
+    def test_offset_of_the_shortest_round_trip_wins(self):
+        estimator = ClockOffsetEstimator()
+        estimator.add(ClockSample(offset=0.30, rtt=0.200))
+        estimator.add(ClockSample(offset=0.10, rtt=0.010))
+        estimator.add(ClockSample(offset=-0.20, rtt=0.150))
+
+        assert estimator.offset == 0.10
+        assert estimator.rtt == 0.010
+
+    def test_old_samples_leave_the_window(self):
+        estimator = ClockOffsetEstimator(samples=2)
+        estimator.add(ClockSample(offset=0.10, rtt=0.010))
+        estimator.add(ClockSample(offset=0.50, rtt=0.100))
+        estimator.add(ClockSample(offset=0.40, rtt=0.050))
+
+        assert estimator.offset == 0.40
+
+
+class TestSampleClock:
+
+    @pytest.mark.asyncio
+    async def test_offset_is_measured_at_the_middle_of_the_round_trip(self):
+        async def get_server_time() -> float:
+            await asyncio.sleep(0.02)
+            return time.time() + 5
+
+        sample = await sample_clock(get_server_time)
+
+        assert sample.rtt >= 0.02
+        assert sample.offset == pytest.approx(5, abs=0.02)
+
+
+def test_offset_clock():
+    clock = OffsetClock()
+    clock.offset = -60
+
+    assert clock() == pytest.approx(time.time() - 60, abs=0.01)
+
+
+class TestClockSync:
+
+    @pytest.mark.asyncio
+    async def test_adapters_sign_on_the_exchange_clocks(self):
+        async with MockBinanceServer(clock_offset=10) as binance_server:
+            async with MockOKXServer(clock_offset=-3) as okx_server:
+                exchanges = {
+                    "binance": BinanceAdapter(binance_server.config(), logger=logger),
+                    "okx": OKXAdapter(okx_server.config(), logger=logger),
+                }
+                for adapter in exchanges.values():
+                    await adapter.open()
+                try:
+                    clock_sync = ClockSync(exchanges, logger=logger, interval=0)
+                    await clock_sync.start()
+                    offsets = clock_sync.offsets
+                finally:
+                    for adapter in exchanges.values():
+                        await adapter.close()
+
+        assert offsets["binance"] == pytest.approx(10, abs=0.1)
+        assert offsets["okx"] == pytest.approx(-3, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_offset_is_set_on_the_adapters_in_the_background(self):
+        adapter = Mock()
+        adapter.throttle_server_time = AsyncMock()
+        adapter.get_server_time = AsyncMock(side_effect=lambda **_: time.time() + 2)
+        unsupported = Mock()
+        unsupported.throttle_server_time = AsyncMock()
+        unsupported.get_server_time = AsyncMock(side_effect=NotImplementedError)
+        clock_sync = ClockSync(
+            {"a": adapter, "b": unsupported}, logger=logger, interval=0.01
+        )
+
+        await clock_sync.start()
+        await asyncio.sleep(0.05)
+        await clock_sync.stop()
+
+        assert adapter.get_server_time.await_count > 3
+        assert adapter.set_clock_offset.call_args.args[0] == pytest.approx(2, abs=0.05)
+        assert unsupported.get_server_time.await_count == STARTUP_SAMPLES
+        assert set(clock_sync.offsets) == {"a"}
+
+    @pytest.mark.asyncio
+    async def test_failed_samples_keep_the_estimate(self):
+        adapter = Mock()
+        adapter.throttle_server_time = AsyncMock()
+        adapter.get_server_time = AsyncMock(
+            side_effect=[
+                time.time() + 1,
+                OSError("unreachable"),
+                OSError("unreachable"),
+            ]
+        )
+        clock_sync = ClockSync({"a": adapter}, logger=logger, interval=0)
+
+        await clock_sync.start()
+
+        assert clock_sync.offsets["a"] == pytest.approx(1, abs=0.05)
+        assert adapter.set_clock_offset.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_startup_samples_are_taken_concurrently(self):
+        async def get_server_time(throttle: bool = True) -> float:
+            await asyncio.sleep(0.05)
+            return time.time()
+
+        adapter = Mock()
+        adapter.throttle_server_time = AsyncMock()
+        adapter.get_server_time = AsyncMock(side_effect=get_server_time)
+        clock_sync = ClockSync({"a": adapter}, logger=logger, interval=0)
+
+        started = time.perf_counter()
+        await clock_sync.start()
+
+        assert time.perf_counter() - started < 0.1
+        assert adapter.get_server_time.await_count == STARTUP_SAMPLES
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_wait_is_not_timed_as_round_trip(self):
+        async def throttle_server_time():
+            await asyncio.sleep(0.2)
+
+        adapter = Mock()
+        adapter.throttle_server_time = AsyncMock(side_effect=throttle_server_time)
+        adapter.get_server_time = AsyncMock(side_effect=lambda **_: time.time() + 2)
+        clock_sync = ClockSync({"a": adapter}, logger=logger, interval=0)
+
+        await clock_sync.start()
+
+        assert clock_sync.offsets["a"] == pytest.approx(2, abs=0.02)
+        adapter.get_server_time.assert_awaited_with(throttle=False)
@@ -0,0 +1,111 @@
+import pytest
+from unittest.mock import Mock
+
+from benchmarks.mock_exchange import FaultProfile, MockBinanceServer, MockOKXServer
+from src.trading.infrastructure.exchange.http_session import PooledSession
+from src.trading.infrastructure.exchange.binance_adapter import BinanceAdapter
+from src.trading.infrastructure.exchange.okx_adapter import OKXAdapter
+from src.trading.infrastructure.exchange import exchange_factory
+from src.trading.infrastructure.exchange.exchange_factory import ExchangeFactory
+
+logger = Mock()
+
+
+class TestPooledSession:
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused(self):
+        http = PooledSession({"limit_per_host": 2}, logger=logger)
+        session = http.session
+        assert http.session is session
+        assert session.connector.limit_per_host == 2
+        await http.close()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_session_reopens_after_close(self):
+        http = PooledSession({}, logger=logger)
+        first = http.session
+        await http.close()
+        second = http.session
+        assert second is not first
+        assert not second.closed
+        await http.close()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_keep_alive_connections(self):
+        async with MockBinanceServer() as server:
+            http = PooledSession({"limit_per_host": 3}, logger=logger)
+            opened = await http.warm_up(f"{server.url}/api/v3/ping", 5)
+            # NOTE: Later requests reuse the warm connections.
+            async with http.session.get(f"{server.url}/api/v3/ping") as response:
+                await response.read()
+            await http.close()
+
+        assert opened == 3
+        assert len(server.connections) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_warm_up_does_not_raise(self):
+        async with MockBinanceServer(profile=FaultProfile(error_rate=1)) as server:
+            http = PooledSession({}, logger=logger)
+            opened = await http.warm_up(f"{server.url}/api/v3/ping", 2)
+            await http.close()
+
+        assert opened == 0
+
+
+class TestExchangeFactoryOpenAll:
+
+    @pytest.mark.asyncio
+    async def test_open_all_closes_adapters_on_exit(self, exchange_configs):
+        exchange = BinanceAdapter(exchange_configs["binance"], logger=logger)
+        exchange.close = Mock(wraps=exchange.close)
+        async with ExchangeFactory.open_all({"binance": exchange}) as exchanges:
+            assert exchanges["binance"] is exchange
+        exchange.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_all_pings_every_exchange(self):
+        async with MockBinanceServer() as binance, MockOKXServer() as okx:
+            exchanges = {
+                "binance": BinanceAdapter(binance.config(), logger=logger),
+                "okx": OKXAdapter(okx.config(), logger=logger),
+            }
+            async with ExchangeFactory.open_all(exchanges):
+                elapsed = await ExchangeFactory.warm_up_all(exchanges, 2, logger=logger)
+                skipped = await ExchangeFactory.warm_up_all(exchanges, 0, logger=logger)
+
+        assert set(elapsed) == {"binance", "okx"}
+        assert skipped == {}
+        assert binance.requests["GET /api/v3/ping"] == 2
+        assert okx.requests["GET /api/v5/public/time"] == 2
+        assert (len(binance.connections), len(okx.connections)) == (2, 2)
+
+
+class TestExchangeFactoryRegistry:
+
+    def test_create_loads_adapter_by_exchange_id(self, exchange_configs):
+        exchange = ExchangeFactory.create(
+            "binance", exchange_configs["binance"], logger=logger
+        )
+        assert type(exchange).__name__ == "BinanceAdapter"
+
+    def test_unknown_exchange(self):
+        with pytest.raises(ValueError, match="Unknown exchange"):
+            ExchangeFactory.create("unknown", {}, logger=logger)
+
+    def test_entry_points_extend_builtin_exchanges(self, monkeypatch):
+        monkeypatch.setattr(
+            exchange_factory,
+            "_entry_points",
+            lambda group: {
+                "binance": "plugin.binance:Adapter",
+                "kraken": "trading_kraken.adapter:KrakenAdapter",
+            },
+        )
+
+        adapters = ExchangeFactory.adapters()
+
+        assert adapters["kraken"] == "trading_kraken.adapter:KrakenAdapter"
+        assert adapters["binance"] == exchange_factory.ADAPTERS["binance"]
@@ -0,0 +1,66 @@
+import json
+import pytest
+
+from src.trading.infrastructure.exchange.json_decoder import (
+    ResponseSchema,
+    available_decoders,
+    get_decoder,
+)
+
+ORDER = ResponseSchema(
+    "TestOrder",
+    ("orderId", "status"),
+    lists=(("fills", ResponseSchema("TestFill", ("price",))),),
+)
+RESPONSE = {
+    "symbol": "BTCUSDT",
+    "orderId": 28,
+    "status": "FILLED",
+    "fills": [{"price": "50010.00", "qty": "1", "commission": "0.001"}],
+}
+
+
+class TestJsonDecoder:
+
+    @pytest.mark.parametrize("name", available_decoders())
+    def test_decode_without_schema_keeps_every_field(self, name):
+        data = json.dumps(RESPONSE).encode()
+
+        assert get_decoder(name).decode(data) == RESPONSE
+
+    @pytest.mark.parametrize("name", available_decoders())
+    def test_decode_with_schema_keeps_the_fields_read(self, name):
+        record = get_decoder(name).decode(json.dumps(RESPONSE).encode(), ORDER)
+
+        assert record["orderId"] == 28
+        assert record["status"] == "FILLED"
+        assert record["fills"][0]["price"] == "50010.00"
+
+    @pytest.mark.parametrize("name", available_decoders())
+    def test_missing_fields_are_left_out(self, name):
+        record = get_decoder(name).decode(b'{"status": "NEW"}', ORDER)
+
+        assert record.get("orderId") is None
+        assert "fills" not in record
+
+    def test_decoders_agree_on_nulls_and_missing_fields(self):
+        data = b'{"orderId": null, "fills": [{"price": null}, {}]}'
+
+        records = [
+            get_decoder(name).decode(data, ORDER) for name in available_decoders()
+        ]
+
+        assert records[0] == {"orderId": None, "fills": [{"price": None}, {}]}
+        assert all(record == records[0] for record in records)
+
+    @pytest.mark.parametrize("name", available_decoders())
+    def test_invalid_json_raises_value_error(self, name):
+        with pytest.raises(ValueError):
+            get_decoder(name).decode(b"<html>Bad Gateway</html>", ORDER)
+
+    def test_auto_picks_the_fastest_installed(self):
+        assert get_decoder("auto").name == available_decoders()[0]
+
+    def test_unknown_decoder(self):
+        with pytest.raises(ValueError):
+            get_decoder("simdjson")
@@ -0,0 +1,233 @@
+import asyncio
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+from src.trading.domain.model.exchange import ExchangeCapabilities
+from src.trading.domain.model.instrument import Instrument, InstrumentIndex
+from src.trading.domain.model.order import Market, Price, Symbol
+from src.trading.domain.model.quote import Quote
+from src.trading.infrastructure.exchange.market_stream import (
+    BinanceBookTickerStream,
+    MarketStore,
+    OKXTickerStream,
+)
+from src.trading.infrastructure.repository.streaming_market_repository_impl import (
+    StreamingMarketRepositoryImpl,
+)
+
+logger = Mock()
+BTCUSDT = Symbol(base="BTC", quote="USDT")
+
+
+def binance_ticker(update_id: int, bid: str, ask: str) -> dict:
+    return {"u": update_id, "s": "BTCUSDT", "b": bid, "B": "1", "a": ask, "A": "1"}
+
+
+def okx_ticker(ts: int, bid: str, ask: str) -> dict:
+    return {
+        "arg": {"channel": "tickers", "instId": "BTC-USDT"},
+        "data": [{"instId": "BTC-USDT", "bidPx": bid, "askPx": ask, "ts": str(ts)}],
+    }
+
+
+async def wait_for_quote(store, exchange_id, symbol, timeout=2.0):
+    async def _wait():
+        while store.get(exchange_id, symbol) is None:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(_wait(), timeout)
+    return store.get(exchange_id, symbol)
+
+
+class TestMarketStore:
+    def make_quote(self, bid: str) -> Quote:
+        return Quote.parse("binance", BTCUSDT, bid, str(int(bid) + 1), scale=2)
+
+    def test_out_of_order_update_is_dropped(self):
+        store = MarketStore()
+        assert store.update(self.make_quote("100"), sequence=2)
+        assert not store.update(self.make_quote("99"), sequence=1)
+        assert store.get("binance", BTCUSDT).best_bid.amount == Decimal("100")
+
+    def test_stale_quote_is_not_returned(self):
+        store = MarketStore(max_age=0)
+        store.update(self.make_quote("100"), sequence=1)
+        assert store.get("binance", BTCUSDT) is None
+
+    def test_invalidate_removes_exchange_quotes(self):
+        store = MarketStore()
+        store.update(self.make_quote("100"), sequence=1)
+        store.invalidate("binance")
+        assert store.get_all(BTCUSDT, ["binance"]) == []
+
+
+class TestMarketStream:
+
+    @pytest.mark.asyncio
+    async def test_binance_stream_subscribes_and_stores_quotes(self, fake_ws_server):
+        store = MarketStore()
+        stream = BinanceBookTickerStream(
+            {"ws_url": fake_ws_server.url}, store=store, logger=logger
+        )
+        await stream.subscribe([BTCUSDT])
+        await stream.start()
+        try:
+            await fake_ws_server.wait_for_message()
+            assert fake_ws_server.received[0]["params"] == ["btcusdt@bookTicker"]
+
+            await fake_ws_server.send(binance_ticker(1, "100.0", "100.5"))
+            market = await wait_for_quote(store, "binance", BTCUSDT)
+            assert market.best_bid.amount == Decimal("100.0")
+            assert market.best_ask.amount == Decimal("100.5")
+        finally:
+            await stream.stop()
+
+    @pytest.mark.asyncio
+    async def test_prices_are_parsed_at_the_tick_size(self, fake_ws_server):
+        store = MarketStore()
+        instruments = InstrumentIndex(
+            [
+                Instrument(
+                    exchange_id="binance",
+                    symbol=BTCUSDT,
+                    step_size=Decimal("0.00001"),
+                    min_quantity=Decimal("0.00001"),
+                    tick_size=Decimal("0.01"),
+                )
+            ]
+        )
+        stream = BinanceBookTickerStream(
+            {"ws_url": fake_ws_server.url},
+            store=store,
+            logger=logger,
+            instruments=instruments,
+        )
+        await stream.subscribe([BTCUSDT])
+        await stream.start()
+        try:
+            await fake_ws_server.wait_for_message()
+            await fake_ws_server.send(
+                binance_ticker(1, "50000.12000000", "50000.13000000")
+            )
+            await wait_for_quote(store, "binance", BTCUSDT)
+            quote = store.get_quote("binance", BTCUSDT)
+            assert (quote.bid, quote.ask, quote.scale) == (5000012, 5000013, 2)
+        finally:
+            await stream.stop()
+
+    @pytest.mark.asyncio
+    async def test_okx_stream_reconnects_and_resubscribes(self, fake_ws_server):
+        store = MarketStore()
+        stream = OKXTickerStream(
+            {"ws_url": fake_ws_server.url, "reconnect_delay": 0.01},
+            store=store,
+            logger=logger,
+        )
+        await stream.subscribe([BTCUSDT])
+        await stream.start()
+        try:
+            await fake_ws_server.wait_for_message()
+            await fake_ws_server.send(okx_ticker(1000, "100.0", "100.5"))
+            await wait_for_quote(store, "okx", BTCUSDT)
+
+            await fake_ws_server.drop_connections()
+            await fake_ws_server.wait_for_connection(count=2)
+            await fake_ws_server.wait_for_message(count=2)
+            # Quotes received before the disconnect are not trusted anymore.
+            assert store.get("okx", BTCUSDT) is None
+            assert fake_ws_server.received[1]["args"] == [
+                {"channel": "tickers", "instId": "BTC-USDT"}
+            ]
+
+            await fake_ws_server.send(okx_ticker(2000, "101.0", "101.5"))
+            market = await wait_for_quote(store, "okx", BTCUSDT)
+            assert market.best_bid.amount == Decimal("101.0")
+        finally:
+            await stream.stop()
+
+    @pytest.mark.asyncio
+    async def test_silent_stream_is_pinged(self, fake_ws_server):
+        stream = OKXTickerStream(
+            {"ws_url": fake_ws_server.url, "heartbeat_interval": 0.05},
+            store=MarketStore(),
+            logger=logger,
+        )
+        await stream.start()
+        try:
+            await fake_ws_server.wait_for_message()
+            assert fake_ws_server.received[0] == "ping"
+        finally:
+            await stream.stop()
+
+
+class TestStreamingMarketRepository:
+
+    @pytest.mark.asyncio
+    async def test_missing_venues_fall_back_to_rest(self, fake_ws_server):
+        store = MarketStore()
+        stream = BinanceBookTickerStream(
+            {"ws_url": fake_ws_server.url}, store=store, logger=logger
+        )
+        rest_market = Market(
+            exchange_id="binance",
+            symbol=BTCUSDT,
+            best_bid=Price(amount=Decimal("90"), timestamp=datetime.now()),
+            best_ask=Price(amount=Decimal("91"), timestamp=datetime.now()),
+        )
+        fallback = Mock()
+        fallback.get_all_markets = AsyncMock(return_value=[rest_market])
+        repository = StreamingMarketRepositoryImpl(
+            streams={"binance": stream}, store=store, logger=logger, fallback=fallback
+        )
+        await repository.start([BTCUSDT])
+        try:
+            assert await repository.get_all_markets(BTCUSDT) == [rest_market]
+
+            await fake_ws_server.wait_for_message()
+            await fake_ws_server.send(binance_ticker(1, "100.0", "100.5"))
+            assert await repository.wait_ready(BTCUSDT, timeout=2.0)
+            markets = await repository.get_all_markets(BTCUSDT)
+            assert [m.best_bid.amount for m in markets] == [Decimal("100.0")]
+            fallback.get_all_markets.assert_awaited_once()
+        finally:
+            await repository.stop()
+
+    @pytest.mark.asyncio
+    async def test_venues_not_listing_the_symbol_are_not_missing(self, fake_ws_server):
+        store = MarketStore()
+        stream = BinanceBookTickerStream(
+            {"ws_url": fake_ws_server.url}, store=store, logger=logger
+        )
+        unlisted = Mock()
+        unlisted.subscribe = AsyncMock()
+        unlisted.start = AsyncMock()
+        unlisted.stop = AsyncMock()
+        fallback = Mock()
+        fallback.get_all_markets = AsyncMock(return_value=[])
+        repository = StreamingMarketRepositoryImpl(
+            streams={"binance": stream, "okx": unlisted},
+            store=store,
+            logger=logger,
+            fallback=fallback,
+            rest_only={"kraken"},
+            capabilities={
+                "okx": ExchangeCapabilities(exchange_id="okx", symbols=frozenset()),
+                "kraken": ExchangeCapabilities(
+                    exchange_id="kraken", symbols=frozenset()
+                ),
+            },
+        )
+        await repository.start([BTCUSDT])
+        try:
+            await fake_ws_server.wait_for_message()
+            await fake_ws_server.send(binance_ticker(1, "100.0", "100.5"))
+            assert await repository.wait_ready(BTCUSDT, timeout=2.0)
+            markets = await repository.get_all_markets(BTCUSDT)
+
+            assert [m.exchange_id for m in markets] == ["binance"]
+            fallback.get_all_markets.assert_not_awaited()
+            unlisted.subscribe.assert_awaited_once_with([])
+        finally:
+            await repository.stop()
@@ -0,0 +1,92 @@
+import asyncio
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+from src.trading.infrastructure.exchange.okx_fill_confirmer import (
+    OKXFillConfirmer,
+    Order,
+    OrderStatus,
+)
+from src.trading.domain.model.order import OrderSide, Symbol
+
+logger = Mock()
+
+
+def make_order(status: OrderStatus, order_id: str = "okx-order-id") -> Order:
+    return Order(
+        id=order_id,
+        symbol=Symbol(base="BTC", quote="USDT"),
+        side=OrderSide.BUY,
+        quantity=Decimal("1"),
+        status=status,
+        created_at=datetime.now(),
+        exchange_id="okx",
+        filled_price=Decimal("50000") if status == OrderStatus.FILLED else None,
+    )
+
+
+class TestOKXFillConfirmer:
+
+    @pytest.mark.asyncio
+    async def test_polls_until_filled(self):
+        fetch_order = AsyncMock(
+            side_effect=[
+                Exception("Order does not exist"),
+                make_order(OrderStatus.PENDING),
+                make_order(OrderStatus.FILLED),
+            ]
+        )
+        confirmer = OKXFillConfirmer(
+            fetch_order, logger=logger, initial_interval=0.001, max_interval=0.002
+        )
+
+        order = await confirmer.confirm("okx-order-id", "BTC-USDT")
+
+        assert order.status == OrderStatus.FILLED
+        assert fetch_order.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_returns_last_known_state_at_deadline(self):
+        fetch_order = AsyncMock(return_value=make_order(OrderStatus.PENDING))
+        confirmer = OKXFillConfirmer(
+            fetch_order, logger=logger, timeout=0.05, initial_interval=0.01
+        )
+
+        order = await confirmer.confirm("okx-order-id", "BTC-USDT")
+
+        assert order.status == OrderStatus.PENDING
+
+    @pytest.mark.asyncio
+    async def test_deadline_without_any_details_raises(self):
+        fetch_order = AsyncMock(side_effect=Exception("Order does not exist"))
+        confirmer = OKXFillConfirmer(
+            fetch_order, logger=logger, timeout=0.02, initial_interval=0.005
+        )
+
+        with pytest.raises(TimeoutError):
+            await confirmer.confirm("okx-order-id", "BTC-USDT")
+
+    @pytest.mark.asyncio
+    async def test_push_update_resolves_before_polling(self):
+        fetch_order = AsyncMock(return_value=make_order(OrderStatus.PENDING))
+        confirmer = OKXFillConfirmer(fetch_order, logger=logger, initial_interval=10)
+
+        future = confirmer.confirm("okx-order-id", "BTC-USDT")
+        confirmer.resolve(make_order(OrderStatus.FILLED))
+        order = await asyncio.wait_for(future, timeout=1)
+
+        assert order.status == OrderStatus.FILLED
+        fetch_order.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_push_update_before_confirm_is_kept(self):
+        fetch_order = AsyncMock()
+        confirmer = OKXFillConfirmer(fetch_order, logger=logger)
+
+        confirmer.resolve(make_order(OrderStatus.FILLED))
+        order = await confirmer.confirm("okx-order-id", "BTC-USDT")
+
+        assert order.status == OrderStatus.FILLED
+        fetch_order.assert_not_awaited()
@@ -0,0 +1,92 @@
+import pytest
+from decimal import Decimal
+from unittest.mock import Mock
+
+from src.trading.infrastructure.exchange.quote_tape import (
+    QuoteTapeWriter,
+    Symbol,
+    load_tape,
+)
+
+from conftest import make_market
+
+logger = Mock()
+# NOTE: The tape reads quotes back with the Symbol of the module under test.
+BTC_USDT = Symbol(base="BTC", quote="USDT")
+
+
+class TestQuoteTape:
+
+    def test_quotes_round_trip(self, tmp_path):
+        path = tmp_path / "quotes.tape"
+        markets = [
+            make_market("binance", "50000.01", "50000.02", BTC_USDT),
+            make_market("okx", "0.00001234", "123000", Symbol("DOGE", "USDT")),
+            make_market("okx", "-1.5", None, BTC_USDT),
+        ]
+        with QuoteTapeWriter(path, logger=logger) as tape:
+            for index, market in enumerate(markets):
+                tape.record(market, timestamp=1700000000.0 + index)
+
+        entries = load_tape(path)
+
+        assert [e.timestamp for e in entries] == [
+            1700000000.0,
+            1700000001.0,
+            1700000002.0,
+        ]
+        for entry, market in zip(entries, markets):
+            assert entry.market.exchange_id == market.exchange_id
+            assert entry.market.symbol == market.symbol
+            assert entry.market.best_bid.amount == market.best_bid.amount
+        assert str(entries[1].market.best_bid.amount) == "0.00001234"
+        assert entries[1].market.best_ask.amount == Decimal("123000")
+        assert entries[2].market.best_ask is None
+
+    def test_quotes_are_compact(self, tmp_path):
+        path = tmp_path / "quotes.tape"
+        with QuoteTapeWriter(path, logger=logger) as tape:
+            for _ in range(1000):
+                tape.record(make_market("binance", "50000.01", "50000.02"))
+
+        assert path.stat().st_size < 1000 * 32 + 64
+
+    def test_appending_to_existing_tape(self, tmp_path):
+        path = tmp_path / "quotes.tape"
+        with QuoteTapeWriter(path, logger=logger) as tape:
+            tape.record(make_market("binance", "1", "2"))
+        with QuoteTapeWriter(path, logger=logger) as tape:
+            tape.record(make_market("okx", "3", "4"))
+            tape.record(make_market("binance", "5", "6"))
+
+        entries = load_tape(path)
+
+        assert [e.market.exchange_id for e in entries] == ["binance", "okx", "binance"]
+        assert entries[2].market.best_bid.amount == 5
+
+    @pytest.mark.parametrize(
+        "price", [Decimal("123456789012345678901.23"), Decimal("1E-130")]
+    )
+    def test_price_that_does_not_fit_raises_value_error(self, tmp_path, price):
+        path = tmp_path / "quotes.tape"
+        with QuoteTapeWriter(path, logger=logger) as tape:
+            with pytest.raises(ValueError):
+                tape.record(make_market("binance", str(price), "2"))
+            tape.record(make_market("binance", "1", "2"))
+
+        assert [e.market.best_bid.amount for e in load_tape(path)] == [Decimal("1")]
+
+    def test_truncated_tape(self, tmp_path):
+        path = tmp_path / "quotes.tape"
+        with QuoteTapeWriter(path, logger=logger) as tape:
+            tape.record(make_market("binance", "1", "2"))
+            tape.record(make_market("binance", "3", "4"))
+        path.write_bytes(path.read_bytes()[:-5])
+
+        assert len(load_tape(path)) == 1
+
+    def test_not_a_tape(self, tmp_path):
+        path = tmp_path / "quotes.tape"
+        path.write_bytes(b"hello")
+        with pytest.raises(ValueError):
+            load_tape(path)
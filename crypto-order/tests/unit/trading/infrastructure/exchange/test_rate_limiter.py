@@ -0,0 +1,183 @@
+import asyncio
+import time
+import pytest
+from unittest.mock import Mock
+
+from src.trading.infrastructure.exchange.rate_limiter import (
+    BucketLimit,
+    ExchangeLimits,
+    RateLimiter,
+    RequestPriority,
+    RequestScheduler,
+    binance_depth_weight,
+)
+
+logger = Mock()
+
+# 2 tokens per bucket, refilled at 20 tokens per second (one token per 50ms).
+LIMITS = ExchangeLimits(
+    buckets={
+        "weight": BucketLimit(capacity=2, refill_rate=20),
+        "orders": BucketLimit(capacity=2, refill_rate=20),
+    },
+    endpoints={
+        "GET /quote": [("weight", 1)],
+        "POST /order": [("orders", 1)],
+    },
+)
+
+
+class TestRateLimiter:
+
+    @pytest.mark.asyncio
+    async def test_acquire_within_capacity_does_not_wait(self):
+        limiter = RateLimiter("test", LIMITS, logger=logger)
+
+        await asyncio.wait_for(limiter.acquire("GET /quote"), 0.01)
+        await asyncio.wait_for(limiter.acquire("GET /quote"), 0.01)
+
+        assert limiter.metrics()["granted"] == 2
+        assert limiter.metrics()["max_wait"] < 0.01
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self):
+        limiter = RateLimiter("test", LIMITS, logger=logger)
+        loop = asyncio.get_running_loop()
+        await limiter.acquire("GET /quote")
+        await limiter.acquire("GET /quote")
+
+        started = loop.time()
+        await limiter.acquire("GET /quote")
+
+        assert loop.time() - started >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_order_overtakes_queued_quotes(self):
+        limits = ExchangeLimits(
+            buckets={"weight": BucketLimit(capacity=1, refill_rate=20)},
+            endpoints={"GET /quote": [("weight", 1)], "POST /order": [("weight", 1)]},
+        )
+        limiter = RateLimiter("test", limits, logger=logger)
+        await limiter.acquire("GET /quote")
+        served = []
+
+        async def request(endpoint, priority, name):
+            await limiter.acquire(endpoint, priority)
+            served.append(name)
+
+        tasks = [
+            asyncio.create_task(request("GET /quote", RequestPriority.QUOTE, "q1")),
+            asyncio.create_task(request("GET /quote", RequestPriority.QUOTE, "q2")),
+        ]
+        await asyncio.sleep(0)
+        tasks.append(
+            asyncio.create_task(request("POST /order", RequestPriority.ORDER, "o1"))
+        )
+        await asyncio.sleep(0)
+        assert limiter.metrics()["queued_orders"] == 1
+        assert limiter.metrics()["queued_quotes"] == 2
+
+        await asyncio.gather(*tasks)
+
+        assert served == ["o1", "q1", "q2"]
+
+    @pytest.mark.asyncio
+    async def test_exhausted_bucket_does_not_block_other_buckets(self):
+        limiter = RateLimiter("test", LIMITS, logger=logger)
+        await limiter.acquire("GET /quote")
+        await limiter.acquire("GET /quote")
+        queued_quote = asyncio.create_task(limiter.acquire("GET /quote"))
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(
+            limiter.acquire("POST /order", RequestPriority.ORDER), 0.01
+        )
+
+        assert not queued_quote.done()
+        await queued_quote
+
+    @pytest.mark.asyncio
+    async def test_sync_usage_takes_tokens_used_elsewhere(self):
+        limiter = RateLimiter("test", LIMITS, logger=logger)
+        loop = asyncio.get_running_loop()
+
+        limiter.sync_usage("weight", 2)
+        started = loop.time()
+        await limiter.acquire("GET /quote")
+
+        assert loop.time() - started >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_pause_holds_every_request(self):
+        limiter = RateLimiter("test", LIMITS, logger=logger)
+        loop = asyncio.get_running_loop()
+
+        limiter.pause(0.1)
+        started = loop.time()
+        await limiter.acquire("POST /order", RequestPriority.ORDER)
+
+        assert loop.time() - started >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        limiter = RateLimiter("test", LIMITS, logger=logger)
+        await limiter.acquire("GET /quote")
+        await limiter.acquire("GET /quote")
+        waiter = asyncio.create_task(limiter.acquire("GET /quote"))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter.metrics()["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_not_granted_before_it_resumes(self):
+        limits = ExchangeLimits(
+            buckets={"weight": BucketLimit(capacity=2, refill_rate=20)},
+            endpoints={"GET /quote": [("weight", 1)], "POST /order": [("weight", 1)]},
+        )
+        limiter = RateLimiter("test", limits, logger=logger)
+        await limiter.acquire("GET /quote")
+        await limiter.acquire("GET /quote")
+        waiter = asyncio.create_task(limiter.acquire("GET /quote"))
+        await asyncio.sleep(0)
+
+        # NOTE: The cancelled task hasn't resumed yet when the bucket refills and the next request dispatches.
+        waiter.cancel()
+        time.sleep(0.1)
+        await asyncio.wait_for(
+            limiter.acquire("POST /order", RequestPriority.ORDER), 0.01
+        )
+        # The cancelled waiter's token is still there.
+        await asyncio.wait_for(limiter.acquire("GET /quote"), 0.01)
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.metrics()["granted"] == 4
+
+    @pytest.mark.asyncio
+    async def test_weight_override(self):
+        limiter = RateLimiter("test", LIMITS, logger=logger)
+
+        assert limiter.cost("GET /quote", weight=2) == [("weight", 2)]
+        assert limiter.cost("GET /unknown") == []
+        await asyncio.wait_for(limiter.acquire("GET /unknown"), 0.01)
+
+
+class TestRequestScheduler:
+
+    def test_limiter_is_shared_per_exchange(self):
+        scheduler = RequestScheduler(logger=logger, limits={"test": LIMITS})
+
+        assert scheduler.limiter("test") is scheduler.limiter("test")
+        assert scheduler.limiter("test") is not scheduler.limiter("other")
+        assert set(scheduler.metrics()) == {"test", "other"}
+
+
+def test_binance_depth_weight():
+    assert binance_depth_weight(20) == 5
+    assert binance_depth_weight(500) == 25
+    assert binance_depth_weight(1000) == 50
+    assert binance_depth_weight(5000) == 250
@@ -0,0 +1,148 @@
+import asyncio
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+from src.trading.infrastructure.exchange.replay_adapter import (
+    MarketNotFoundException,
+    Order,
+    OrderSide,
+    OrderStatus,
+    QuoteReplay,
+    ReplayExchangeAdapter,
+    Symbol,
+    create_replay_exchanges,
+)
+from src.trading.infrastructure.exchange.quote_tape import (
+    Market,
+    Price,
+    QuoteTapeWriter,
+    TapeEntry,
+    load_tape,
+)
+from src.trading.infrastructure.repository.recording_market_repository_impl import (
+    RecordingMarketRepositoryImpl,
+)
+
+logger = Mock()
+
+BTC_USDT = Symbol(base="BTC", quote="USDT")
+
+
+def make_entry(timestamp: float, exchange_id: str, bid: str, ask: str) -> TapeEntry:
+    quoted_at = datetime.fromtimestamp(timestamp)
+    return TapeEntry(
+        timestamp=timestamp,
+        market=Market(
+            exchange_id=exchange_id,
+            symbol=BTC_USDT,
+            best_bid=Price(amount=Decimal(bid), timestamp=quoted_at),
+            best_ask=Price(amount=Decimal(ask), timestamp=quoted_at),
+        ),
+    )
+
+
+def make_order(side: OrderSide) -> Order:
+    return Order(
+        id="order-1",
+        symbol=BTC_USDT,
+        side=side,
+        quantity=Decimal("0.5"),
+        status=OrderStatus.PENDING,
+        created_at=datetime.now(),
+    )
+
+
+@pytest.fixture
+def entries():
+    return [
+        make_entry(100.0, "binance", "99", "101"),
+        make_entry(100.5, "okx", "99", "100"),
+        make_entry(101.0, "binance", "100", "100.5"),
+    ]
+
+
+class TestQuoteReplay:
+
+    def test_advance_to_tape_time(self, entries):
+        replay = QuoteReplay(entries, logger=logger, speed=None)
+
+        replay.advance_to(100.5)
+
+        assert replay.time == 100.5
+        assert {m.exchange_id for m in replay.markets(BTC_USDT)} == {"binance", "okx"}
+        assert replay.market("binance", BTC_USDT).best_ask.amount == 101
+
+    @pytest.mark.asyncio
+    async def test_play_as_fast_as_possible(self, entries):
+        replay = QuoteReplay(entries, logger=logger, speed=None)
+
+        played = [entry async for entry in replay.play()]
+
+        assert played == entries
+        assert replay.finished
+
+    @pytest.mark.asyncio
+    async def test_play_keeps_original_timing_scaled_by_speed(self, entries):
+        # The tape spans 1s. At 10x it takes 0.1s.
+        replay = QuoteReplay(entries, logger=logger, speed=10)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        arrivals = [loop.time() - started async for _ in replay.play()]
+
+        assert arrivals[0] < 0.04
+        assert 0.04 <= arrivals[1] < 0.09
+        assert 0.09 <= arrivals[2] < 0.3
+
+    def test_invalid_speed(self, entries):
+        with pytest.raises(ValueError):
+            QuoteReplay(entries, logger=logger, speed=0)
+
+
+class TestReplayExchangeAdapter:
+
+    @pytest.mark.asyncio
+    async def test_serves_quotes_as_of_replay_position(self, entries):
+        replay = QuoteReplay(entries, logger=logger, speed=None)
+        exchanges = create_replay_exchanges(replay, logger=logger)
+        assert list(exchanges) == ["binance", "okx"]
+
+        with pytest.raises(MarketNotFoundException):
+            await exchanges["okx"].get_market(BTC_USDT)
+        replay.advance_to(100.5)
+        market = await exchanges["okx"].get_market(BTC_USDT)
+
+        assert market.best_ask.amount == 100
+        assert await exchanges["okx"].list_symbols() == [BTC_USDT]
+
+    @pytest.mark.asyncio
+    async def test_market_orders_fill_at_replayed_top_of_book(self, entries):
+        replay = QuoteReplay(entries, logger=logger, speed=None)
+        adapter = ReplayExchangeAdapter("binance", replay, logger=logger)
+        replay.advance_to(101.0)
+
+        bought = await adapter.place_order(make_order(OrderSide.BUY))
+        sold = await adapter.place_order(make_order(OrderSide.SELL))
+
+        assert (bought.status, bought.filled_price) == (OrderStatus.FILLED, 100.5)
+        assert sold.filled_price == 100
+
+
+class TestRecordingMarketRepositoryImpl:
+
+    @pytest.mark.asyncio
+    async def test_recorded_quotes_replay(self, tmp_path, entries):
+        markets = [entry.market for entry in entries[:2]]
+        repository = Mock()
+        repository.get_all_markets = AsyncMock(return_value=markets)
+        path = tmp_path / "quotes.tape"
+        with QuoteTapeWriter(path, logger=logger) as tape:
+            recording = RecordingMarketRepositoryImpl(repository, tape, logger=logger)
+            assert await recording.get_all_markets(BTC_USDT) == markets
+
+        replay = QuoteReplay(load_tape(path), logger=logger, speed=None)
+        replay.advance_to(float("inf"))
+
+        assert replay.markets(BTC_USDT) == markets
@@ -0,0 +1,117 @@
+import base64
+import hashlib
+import hmac
+import pytest
+from datetime import datetime, timezone
+
+from src.trading.infrastructure.exchange.signing import (
+    BinanceRequestSigner,
+    HmacSigner,
+    IsoTimestamps,
+    OKXRequestSigner,
+)
+
+SECRET = "test-secret"
+
+
+def reference_digest(message: str) -> bytes:
+    return hmac.new(SECRET.encode(), message.encode(), hashlib.sha256).digest()
+
+
+class TestHmacSigner:
+
+    def test_copies_of_the_keyed_state_sign_independently(self):
+        signer = HmacSigner(SECRET)
+
+        assert signer.digest("a") == reference_digest("a")
+        assert signer.hexdigest("b") == reference_digest("b").hex()
+        assert signer.b64digest("a") == base64.b64encode(reference_digest("a")).decode()
+
+
+class TestIsoTimestamps:
+
+    @pytest.mark.parametrize(
+        "seconds",
+        [
+            pytest.param(1607418537.715),
+            pytest.param(1607418537.0),
+            pytest.param(1607418537.9999),
+            pytest.param(1607418538.001),
+        ],
+    )
+    def test_format_matches_strftime(self, seconds):
+        timestamps = IsoTimestamps()
+        timestamps.format(seconds - 1)
+
+        expected = (
+            datetime.fromtimestamp(int(seconds * 1000) / 1000, timezone.utc).strftime(
+                "%Y-%m-%dT%H:%M:%S.%f"
+            )[:-3]
+            + "Z"
+        )
+        assert timestamps.format(seconds) == expected
+
+
+class TestBinanceRequestSigner:
+
+    def test_sign_appends_timestamp_and_signature(self):
+        signer = BinanceRequestSigner("key", SECRET, clock=lambda: 1700000000.123)
+
+        query_string = signer.sign({"symbol": "BTCUSDT", "side": "BUY"})
+
+        signed = "symbol=BTCUSDT&side=BUY&timestamp=1700000000123"
+        assert query_string == f"{signed}&signature={reference_digest(signed).hex()}"
+        assert signer.headers["X-MBX-APIKEY"] == "key"
+
+
+class TestOKXRequestSigner:
+
+    def test_post_headers(self):
+        signer = OKXRequestSigner(
+            "key", SECRET, "passphrase", clock=lambda: 1607418537.715
+        )
+
+        headers = signer.headers("POST", "/api/v5/trade/order", body='{"sz": "1"}')
+
+        timestamp = "2020-12-08T09:08:57.715Z"
+        assert headers["OK-ACCESS-TIMESTAMP"] == timestamp
+        assert (
+            headers["OK-ACCESS-SIGN"]
+            == base64.b64encode(
+                reference_digest(timestamp + 'POST/api/v5/trade/order{"sz": "1"}')
+            ).decode()
+        )
+        assert headers["Content-Type"] == "application/json"
+        assert headers["x-simulated-trading"] == "1"
+
+    def test_get_parameters_are_signed_as_query_string(self):
+        signer = OKXRequestSigner(
+            "key",
+            SECRET,
+            "passphrase",
+            is_simulated=False,
+            clock=lambda: 1607418537.715,
+        )
+
+        headers = signer.headers(
+            "GET", "/api/v5/trade/order", params={"instId": "BTC-USDT", "ordId": "1"}
+        )
+
+        assert (
+            headers["OK-ACCESS-SIGN"]
+            == base64.b64encode(
+                reference_digest(
+                    "2020-12-08T09:08:57.715ZGET/api/v5/trade/order?instId=BTC-USDT&ordId=1"
+                )
+            ).decode()
+        )
+        assert "Content-Type" not in headers
+        assert "x-simulated-trading" not in headers
+
+    def test_headers_are_not_shared_between_requests(self):
+        signer = OKXRequestSigner("key", SECRET, "passphrase")
+
+        first = signer.headers("GET", "/api/v5/account/balance")
+        first["extra"] = "1"
+
+        assert "extra" not in signer.headers("GET", "/api/v5/account/balance")
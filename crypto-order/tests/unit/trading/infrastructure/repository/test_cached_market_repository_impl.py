@@ -0,0 +1,110 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.trading.domain.model.order import Symbol
+from src.trading.infrastructure.repository.cached_market_repository_impl import (
+    CachedMarketRepositoryImpl,
+)
+
+from conftest import make_market
+
+logger = Mock()
+
+
+class TestCachedMarketRepository:
+
+    @pytest.mark.asyncio
+    async def test_fresh_quotes_are_served_from_cache(self, symbol):
+        repository = Mock()
+        repository.get_all_markets = AsyncMock(
+            return_value=[make_market("binance", symbol=symbol)]
+        )
+        cache = CachedMarketRepositoryImpl(repository, logger=logger, default_max_age=5)
+
+        await cache.get_all_markets(symbol)
+        await cache.get_all_markets(symbol)
+
+        repository.get_all_markets.assert_awaited_once()
+        assert cache.metrics.hits == 1
+        assert cache.metrics.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_max_age_is_per_exchange(self, symbol):
+        repository = Mock()
+        repository.get_all_markets = AsyncMock(
+            return_value=[
+                make_market("binance", symbol=symbol, age=0.5),
+                make_market("okx", symbol=symbol, age=0.5),
+            ]
+        )
+        cache = CachedMarketRepositoryImpl(
+            repository, logger=logger, max_age={"okx": 0.1}, default_max_age=5
+        )
+
+        await cache.get_all_markets(symbol)
+        await cache.get_all_markets(symbol)
+
+        assert repository.get_all_markets.await_count == 2
+        assert cache.metrics.hits == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self, symbol):
+        release = asyncio.Event()
+
+        async def slow_fetch(_symbol):
+            await release.wait()
+            return [make_market("binance", symbol=symbol)]
+
+        repository = Mock()
+        repository.get_all_markets = AsyncMock(side_effect=slow_fetch)
+        cache = CachedMarketRepositoryImpl(repository, logger=logger)
+
+        tasks = [asyncio.create_task(cache.get_all_markets(symbol)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        repository.get_all_markets.assert_awaited_once()
+        assert all(len(markets) == 1 for markets in results)
+        assert cache.metrics.shared == 4
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_leaves_the_shared_fetch_running(self, symbol):
+        release = asyncio.Event()
+
+        async def slow_fetch(_symbol):
+            await release.wait()
+            return [make_market("binance", symbol=symbol)]
+
+        repository = Mock()
+        repository.get_all_markets = AsyncMock(side_effect=slow_fetch)
+        cache = CachedMarketRepositoryImpl(repository, logger=logger)
+
+        owner = asyncio.create_task(cache.get_all_markets(symbol))
+        await asyncio.sleep(0)
+        sharing = asyncio.create_task(cache.get_all_markets(symbol))
+        await asyncio.sleep(0)
+        owner.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert len(await sharing) == 1
+        assert owner.cancelled()
+        repository.get_all_markets.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_symbol_is_evicted(self):
+        symbols = [Symbol(base=base, quote="USDT") for base in ("BTC", "ETH", "SOL")]
+        repository = Mock()
+        repository.get_all_markets = AsyncMock(
+            side_effect=lambda s: [make_market("binance", symbol=s)]
+        )
+        cache = CachedMarketRepositoryImpl(repository, logger=logger, max_entries=2)
+
+        for s in symbols:
+            await cache.get_all_markets(s)
+        await cache.get_all_markets(symbols[0])
+
+        assert cache.metrics.evictions == 2
+        assert repository.get_all_markets.await_count == 4
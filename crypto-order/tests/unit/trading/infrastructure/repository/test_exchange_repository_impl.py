@@ -0,0 +1,202 @@
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+from src.trading.domain.model.instrument import (
+    Instrument,
+    InstrumentIndex,
+    InvalidOrderException,
+)
+from src.trading.domain.model.order import (
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    Symbol,
+)
+from src.trading.infrastructure.repository import exchange_repository_impl
+from src.trading.infrastructure.repository.exchange_repository_impl import (
+    ExchangeRepositoryImpl,
+)
+
+logger = Mock()
+
+DOGE_USDT = Symbol(base="DOGE", quote="USDT")
+
+
+def make_order(quantity: str) -> Order:
+    return Order(
+        id="order-1",
+        symbol=DOGE_USDT,
+        side=OrderSide.BUY,
+        quantity=Decimal(quantity),
+        status=OrderStatus.PENDING,
+        created_at=datetime.now(),
+        exchange_id="binance",
+    )
+
+
+@pytest.fixture
+def exchange():
+    exchange = Mock()
+    exchange.place_order = AsyncMock(side_effect=lambda order: order)
+    return exchange
+
+
+@pytest.fixture
+def repository(exchange):
+    instruments = InstrumentIndex(
+        [
+            Instrument(
+                exchange_id="binance",
+                symbol=DOGE_USDT,
+                step_size=Decimal("1"),
+                min_quantity=Decimal("1"),
+            )
+        ]
+    )
+    return ExchangeRepositoryImpl(
+        {"binance": exchange}, logger=logger, instruments=instruments
+    )
+
+
+class TestExchangeRepositoryImpl:
+
+    @pytest.mark.asyncio
+    async def test_quantity_is_rounded_to_lot_size(self, repository, exchange):
+        order = await repository.place_order(make_order("12.7"))
+
+        assert order.quantity == Decimal("12")
+        exchange.place_order.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_quantity_below_minimum_is_not_sent(self, repository, exchange):
+        with pytest.raises(InvalidOrderException):
+            await repository.place_order(make_order("0.5"))
+
+        exchange.place_order.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_order_states_are_journaled(self, exchange):
+        journal = Mock()
+        journal.append = AsyncMock()
+        # The exchange answers with its own order id.
+        exchange.place_order.side_effect = lambda order: Order(
+            id=12345,
+            symbol=order.symbol,
+            side=order.side,
+            quantity=order.quantity,
+            status=OrderStatus.FILLED,
+            created_at=datetime.now(),
+            exchange_id="binance",
+            filled_price=Decimal("0.1"),
+        )
+        repository = ExchangeRepositoryImpl(
+            {"binance": exchange}, logger=logger, order_journal=journal
+        )
+
+        await repository.place_order(make_order("10"))
+
+        submitted, filled = [call.args[0] for call in journal.append.await_args_list]
+        assert (submitted.order_id, submitted.status.value) == ("order-1", "pending")
+        assert (filled.order_id, filled.exchange_order_id) == ("order-1", "12345")
+        assert filled.status.value == "filled"
+        assert filled.latency is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_order_is_journaled(self, exchange):
+        journal = Mock()
+        journal.append = AsyncMock()
+        exchange.place_order.side_effect = Exception("Exchange API error")
+        repository = ExchangeRepositoryImpl(
+            {"binance": exchange}, logger=logger, order_journal=journal
+        )
+        order = make_order("10")
+
+        with pytest.raises(Exception, match="Exchange API error"):
+            await repository.place_order(order)
+
+        failed = journal.append.await_args_list[-1].args[0]
+        assert failed.status.value == "failed"
+        assert failed.error == "Exchange API error"
+        # The order itself is left to the caller.
+        assert order.status == OrderStatus.PENDING
+
+    @pytest.mark.parametrize(
+        ["side", "expected"],
+        [
+            pytest.param("buy", Decimal("0.1234")),
+            pytest.param("sell", Decimal("0.1235")),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_limit_price_is_rounded_to_tick_size_within_tolerance(
+        self, exchange, side, expected
+    ):
+        instruments = InstrumentIndex(
+            [
+                Instrument(
+                    exchange_id="binance",
+                    symbol=DOGE_USDT,
+                    step_size=Decimal("1"),
+                    min_quantity=Decimal("1"),
+                    tick_size=Decimal("0.0001"),
+                )
+            ]
+        )
+        repository = ExchangeRepositoryImpl(
+            {"binance": exchange}, logger=logger, instruments=instruments
+        )
+        order = make_order("10")
+        order.side = exchange_repository_impl.OrderSide(side)
+        order.order_type = OrderType.IOC
+        order.limit_price = Decimal("0.123456")
+
+        order = await repository.place_order(order)
+
+        assert order.limit_price == expected
+
+    @pytest.mark.parametrize(
+        "quantity,quote_price,limit_price,rejected",
+        [
+            # 10 DOGE at 0.12 USDT is 1.2 USDT, below the 5 USDT minimum.
+            pytest.param("10", "0.12", None, True),
+            pytest.param("50", "0.12", None, False),
+            # The limit price is checked rather than the quote.
+            pytest.param("50", "0.12", "0.09", True),
+            # Orders not routed on a quote are left to the exchange.
+            pytest.param("10", None, None, False),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_order_value_below_minimum_is_not_sent(
+        self, exchange, quantity, quote_price, limit_price, rejected
+    ):
+        instruments = InstrumentIndex(
+            [
+                Instrument(
+                    exchange_id="binance",
+                    symbol=DOGE_USDT,
+                    step_size=Decimal("1"),
+                    min_quantity=Decimal("1"),
+                    min_notional=Decimal("5"),
+                )
+            ]
+        )
+        repository = ExchangeRepositoryImpl(
+            {"binance": exchange}, logger=logger, instruments=instruments
+        )
+        order = make_order(quantity)
+        order.quote_price = quote_price and Decimal(quote_price)
+        if limit_price is not None:
+            order.order_type = OrderType.IOC
+            order.limit_price = Decimal(limit_price)
+
+        if rejected:
+            with pytest.raises(InvalidOrderException, match="below the minimum 5"):
+                await repository.place_order(order)
+            exchange.place_order.assert_not_awaited()
+        else:
+            await repository.place_order(order)
+            exchange.place_order.assert_awaited_once()
@@ -0,0 +1,157 @@
+import asyncio
+import pytest
+from unittest.mock import Mock
+
+from src.trading.infrastructure.repository.market_repository_impl import (
+    ExchangeCapabilities,
+    HEDGE_MIN_SAMPLES,
+    LatencyWindow,
+    MarketRepositoryImpl,
+)
+
+from conftest import make_market
+
+logger = Mock()
+
+
+def make_exchange(exchange_id: str, delays) -> Mock:
+    """Exchange answering after the given delays, one per call. The last delay repeats."""
+    delays = list(delays)
+    exchange = Mock()
+    exchange.calls = 0
+
+    async def get_market(symbol):
+        delay = delays[min(exchange.calls, len(delays) - 1)]
+        exchange.calls += 1
+        await asyncio.sleep(delay)
+        return make_market(exchange_id, symbol=symbol)
+
+    exchange.get_market = get_market
+    return exchange
+
+
+class TestMarketRepositoryImpl:
+
+    @pytest.mark.asyncio
+    async def test_waits_for_all_exchanges_without_deadline(self, symbol):
+        repository = MarketRepositoryImpl(
+            {
+                "binance": make_exchange("binance", [0.05]),
+                "okx": make_exchange("okx", [0]),
+            },
+            logger=logger,
+        )
+
+        markets = await repository.get_all_markets(symbol)
+
+        assert [m.exchange_id for m in markets] == ["binance", "okx"]
+
+    @pytest.mark.asyncio
+    async def test_deadline_drops_slow_exchange(self, symbol):
+        repository = MarketRepositoryImpl(
+            {
+                "binance": make_exchange("binance", [0]),
+                "okx": make_exchange("okx", [10]),
+            },
+            logger=logger,
+            deadline=0.05,
+        )
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        markets = await repository.get_all_markets(symbol)
+
+        assert loop.time() - started < 1
+        assert [m.exchange_id for m in markets] == ["binance"]
+
+    @pytest.mark.asyncio
+    async def test_quorum_returns_fastest_quotes(self, symbol):
+        repository = MarketRepositoryImpl(
+            {
+                "binance": make_exchange("binance", [10]),
+                "okx": make_exchange("okx", [0]),
+            },
+            logger=logger,
+            quorum=1,
+        )
+
+        markets = await asyncio.wait_for(repository.get_all_markets(symbol), 1)
+
+        assert [m.exchange_id for m in markets] == ["okx"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_per_exchange(self, symbol):
+        repository = MarketRepositoryImpl(
+            {
+                "binance": make_exchange("binance", [0]),
+                "okx": make_exchange("okx", [10]),
+            },
+            logger=logger,
+            timeouts={"okx": 0.05},
+        )
+
+        markets = await asyncio.wait_for(repository.get_all_markets(symbol), 1)
+
+        assert [m.exchange_id for m in markets] == ["binance"]
+
+    @pytest.mark.asyncio
+    async def test_hedges_request_slower_than_p95(self, symbol):
+        # The first request hangs, the hedged duplicate answers at once.
+        exchange = make_exchange("binance", [10, 0])
+        repository = MarketRepositoryImpl(
+            {"binance": exchange}, logger=logger, hedge=True
+        )
+        for _ in range(HEDGE_MIN_SAMPLES):
+            repository.latencies["binance"].record(0.01)
+
+        markets = await asyncio.wait_for(repository.get_all_markets(symbol), 1)
+
+        assert [m.exchange_id for m in markets] == ["binance"]
+        assert exchange.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_before_enough_samples(self, symbol):
+        exchange = make_exchange("binance", [0.05])
+        repository = MarketRepositoryImpl(
+            {"binance": exchange}, logger=logger, hedge=True
+        )
+        repository.latencies["binance"].record(0.01)
+
+        await repository.get_all_markets(symbol)
+
+        assert exchange.calls == 1
+        assert len(repository.latencies["binance"]) == 2
+
+
+def test_latency_window_percentile():
+    window = LatencyWindow(size=100)
+    assert window.percentile(95) is None
+    for latency in range(1, 101):
+        window.record(latency / 1000)
+
+    assert window.percentile(95) == 0.096
+    assert window.percentile(100) == 0.1
+
+
+class TestMarketRepositoryCapabilities:
+
+    @pytest.mark.asyncio
+    async def test_only_exchanges_listing_the_symbol_are_asked(self, symbol):
+        binance = make_exchange("binance", [0])
+        okx = make_exchange("okx", [0])
+        repository = MarketRepositoryImpl(
+            {"binance": binance, "okx": okx, "other": make_exchange("other", [0])},
+            logger=logger,
+            capabilities={
+                "binance": ExchangeCapabilities(
+                    exchange_id="binance", symbols=frozenset([symbol])
+                ),
+                "okx": ExchangeCapabilities(exchange_id="okx", symbols=frozenset()),
+            },
+        )
+
+        markets = await repository.get_all_markets(symbol)
+
+        # NOTE: "other" has no known capabilities, so it is still asked.
+        assert [m.exchange_id for m in markets] == ["binance", "other"]
+        assert okx.calls == 0
@@ -0,0 +1,201 @@
+import asyncio
+import sqlite3
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+
+from src.trading.infrastructure.repository.sqlite_order_journal_repository_impl import (
+    SELECT,
+    OrderEvent,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    SqliteOrderJournalRepositoryImpl,
+    Symbol,
+)
+
+logger = Mock()
+
+BTC_USDT = Symbol(base="BTC", quote="USDT")
+
+
+def make_event(order_id: str, status=OrderStatus.PENDING, **fields) -> OrderEvent:
+    event = {
+        "order_id": order_id,
+        "symbol": BTC_USDT,
+        "side": OrderSide.BUY,
+        "status": status,
+        "quantity": Decimal("0.00100000"),
+        "recorded_at": datetime.now(),
+    }
+    event.update(fields)
+    return OrderEvent(**event)
+
+
+def count_rows(path) -> int:
+    with sqlite3.connect(path) as connection:
+        return connection.execute("SELECT COUNT(*) FROM order_events").fetchone()[0]
+
+
+@pytest_asyncio.fixture
+async def journal(tmp_path):
+    journal = SqliteOrderJournalRepositoryImpl(
+        logger=logger, path=tmp_path / "orders.db", flush_interval=10
+    )
+    yield journal
+    await journal.close()
+
+
+class TestSqliteOrderJournalRepositoryImpl:
+
+    @pytest.mark.asyncio
+    async def test_events_round_trip(self, journal):
+        event = make_event(
+            "order-1",
+            OrderStatus.FILLED,
+            exchange_id="binance",
+            exchange_order_id="12345",
+            filled_price=Decimal("50000.01"),
+            filled_quantity=Decimal("0.001"),
+            latency=0.0123,
+        )
+        await journal.append(event)
+
+        assert await journal.get_history("order-1") == [event]
+
+    @pytest.mark.asyncio
+    async def test_order_type_and_limit_price_round_trip(self, journal):
+        event = make_event(
+            "order-1",
+            OrderStatus.PARTIALLY_FILLED,
+            order_type=OrderType.IOC,
+            limit_price=Decimal("50050.00"),
+            filled_quantity=Decimal("0.0005"),
+        )
+        await journal.append(event)
+
+        assert await journal.get_history("order-1") == [event]
+
+    @pytest.mark.asyncio
+    async def test_journal_without_order_type_is_migrated(self, tmp_path):
+        path = tmp_path / "orders.db"
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "CREATE TABLE order_events (seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " order_id TEXT NOT NULL, exchange_order_id TEXT, parent_id TEXT,"
+                " exchange_id TEXT, symbol TEXT NOT NULL, side TEXT NOT NULL,"
+                " status TEXT NOT NULL, quantity TEXT NOT NULL, filled_quantity TEXT,"
+                " filled_price TEXT, error TEXT, latency REAL, recorded_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "INSERT INTO order_events (order_id, symbol, side, status, quantity, recorded_at)"
+                " VALUES ('old', 'BTC/USDT', 'buy', 'filled', '0.001', 0)"
+            )
+        journal = SqliteOrderJournalRepositoryImpl(logger=logger, path=path)
+        try:
+            await journal.append(
+                make_event("new", order_type=OrderType.FOK, limit_price=Decimal("1"))
+            )
+
+            assert [
+                (e.order_id, e.order_type, e.limit_price)
+                for e in await journal.find()
+            ] == [
+                ("old", OrderType.MARKET, None),
+                ("new", OrderType.FOK, Decimal("1")),
+            ]
+        finally:
+            await journal.close()
+
+    @pytest.mark.asyncio
+    async def test_events_are_committed_in_batches(self, tmp_path):
+        path = tmp_path / "orders.db"
+        journal = SqliteOrderJournalRepositoryImpl(
+            logger=logger, path=path, batch_size=3, flush_interval=10
+        )
+        await journal.append(make_event("order-1"))
+        await journal.append(make_event("order-2"))
+        await journal.flush()
+        assert count_rows(path) == 2
+
+        for order_id in ("order-3", "order-4", "order-5"):
+            await journal.append(make_event(order_id))
+        # A full batch is flushed without waiting for flush_interval.
+        for _ in range(100):
+            if count_rows(path) == 5:
+                break
+            await asyncio.sleep(0.01)
+
+        assert count_rows(path) == 5
+        await journal.close()
+
+    @pytest.mark.asyncio
+    async def test_pending_events_are_flushed_after_interval(self, tmp_path):
+        path = tmp_path / "orders.db"
+        journal = SqliteOrderJournalRepositoryImpl(
+            logger=logger, path=path, flush_interval=0.01
+        )
+        await journal.append(make_event("order-1"))
+        await asyncio.sleep(0.2)
+
+        assert count_rows(path) == 1
+        await journal.close()
+
+    @pytest.mark.asyncio
+    async def test_history_includes_child_orders(self, journal):
+        await journal.append(make_event("parent"))
+        await journal.append(make_event("child", parent_id="parent"))
+        await journal.append(
+            make_event(
+                "child", OrderStatus.FILLED, exchange_order_id="42", parent_id="parent"
+            )
+        )
+        await journal.append(make_event("parent", OrderStatus.FILLED))
+        await journal.append(make_event("other"))
+
+        history = await journal.get_history("parent")
+
+        assert [(e.order_id, e.status) for e in history] == [
+            ("parent", OrderStatus.PENDING),
+            ("child", OrderStatus.PENDING),
+            ("child", OrderStatus.FILLED),
+            ("parent", OrderStatus.FILLED),
+        ]
+        assert [e.order_id for e in await journal.get_history("42")] == ["child"]
+
+    @pytest.mark.asyncio
+    async def test_find_by_exchange_and_time(self, journal):
+        now = datetime.now()
+        await journal.append(
+            make_event(
+                "old", exchange_id="binance", recorded_at=now - timedelta(hours=2)
+            )
+        )
+        await journal.append(make_event("new", exchange_id="binance", recorded_at=now))
+        await journal.append(make_event("okx", exchange_id="okx", recorded_at=now))
+
+        events = await journal.find(
+            exchange_id="binance", since=now - timedelta(hours=1)
+        )
+
+        assert [e.order_id for e in events] == ["new"]
+        assert len(await journal.find(limit=2)) == 2
+
+    @pytest.mark.asyncio
+    async def test_lookups_use_indexes(self, journal, tmp_path):
+        await journal.append(make_event("order-1"))
+        await journal.flush()
+
+        with sqlite3.connect(tmp_path / "orders.db") as connection:
+            for where in (
+                "order_id = 'order-1'",
+                "exchange_id = 'binance' AND recorded_at >= 0",
+                "recorded_at >= 0",
+            ):
+                plan = connection.execute(
+                    f"EXPLAIN QUERY PLAN {SELECT} WHERE {where}"
+                ).fetchall()
+                assert "USING INDEX" in str(plan), where
+            assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
@@ -0,0 +1,89 @@
+import io
+import json
+import pytest
+from decimal import Decimal
+
+from src.trading.application.dto.order_dto import OrderDTO
+from src.trading.interface.batch_io import dto_to_json, order_symbols, read_orders
+
+
+class TestReadOrders:
+
+    def test_read_csv(self):
+        stream = io.StringIO("symbol,side,quantity\nBTCUSDT,buy,0.5\nethusdt,sell,2\n")
+
+        orders = list(read_orders(stream, "csv"))
+
+        assert [(o.symbol, o.side, o.quantity) for o in orders] == [
+            ("BTCUSDT", "buy", Decimal("0.5")),
+            ("ETHUSDT", "sell", Decimal("2")),
+        ]
+
+    def test_read_jsonl_skips_blank_lines(self):
+        stream = io.StringIO(
+            '{"symbol": "BTCUSDT", "side": "buy", "quantity": "1"}\n\n'
+            '{"symbol": "BTCUSDT", "side": "sell", "quantity": 0.1}\n'
+        )
+
+        orders = list(read_orders(stream))
+
+        assert [o.quantity for o in orders] == [Decimal("1"), Decimal("0.1")]
+
+    def test_read_limit_orders(self):
+        stream = io.StringIO(
+            '{"symbol": "BTCUSDT", "side": "buy", "quantity": 1, "order_type": "IOC", "max_slippage_bps": 5}\n'
+            '{"symbol": "BTCUSDT", "side": "sell", "quantity": 1}\n'
+        )
+
+        orders = list(read_orders(stream))
+
+        assert [(o.order_type, o.max_slippage_bps) for o in orders] == [
+            ("ioc", Decimal("5")),
+            ("market", None),
+        ]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            pytest.param('{"symbol": "BTCUSDT", "side": "buy"}\n'),
+            pytest.param('{"symbol": "BTCUSDT", "side": "hold", "quantity": 1}\n'),
+            pytest.param("not json\n"),
+            pytest.param(
+                '{"symbol": "BTCUSDT", "side": "buy", "quantity": 1, "order_type": "stop"}\n'
+            ),
+        ],
+    )
+    def test_invalid_line_reports_line_number(self, text):
+        stream = io.StringIO(
+            '{"symbol": "BTCUSDT", "side": "buy", "quantity": 1}\n' + text
+        )
+        with pytest.raises(ValueError, match="Line 2"):
+            list(read_orders(stream, "jsonl"))
+
+
+def test_order_symbols_are_distinct_and_skip_unknown_symbols():
+    order_dtos = [
+        OrderDTO(symbol=symbol, side="buy", quantity=Decimal("1"))
+        for symbol in ("ETHUSDT", "BTC-USDT", "ETH/USDT", "UNKNOWN")
+    ]
+
+    symbols = order_symbols(order_dtos)
+
+    assert [str(symbol) for symbol in symbols] == ["ETHUSDT", "BTCUSDT"]
+
+
+class TestDtoToJson:
+
+    def test_decimals_are_written_as_strings(self):
+        dto = OrderDTO(
+            symbol="BTCUSDT",
+            side="buy",
+            quantity=Decimal("0.10"),
+            filled_price=Decimal("50000.01"),
+        )
+
+        record = json.loads(dto_to_json(dto, index=3))
+
+        assert record["index"] == 3
+        assert record["quantity"] == "0.10"
+        assert record["filled_price"] == "50000.01"
@@ -0,0 +1,28 @@
+import pytest
+from click.testing import CliRunner
+
+from src.trading.interface.cli import cli
+
+
+@pytest.mark.parametrize(
+    "args, param",
+    [
+        (["scan", "--symbols", "BTCUSDT,FOO"], "--symbols"),
+        (["arbitrage", "--symbols", "FOO"], "--symbols"),
+        (
+            ["algo", "--side", "buy", "--quantity", "1", "--duration", "-1"],
+            "--duration",
+        ),
+        (
+            ["algo", "--symbol", "FOO", "--side", "buy", "--quantity", "1"]
+            + ["--duration", "60"],
+            "--symbol",
+        ),
+    ],
+)
+def test_invalid_options_are_usage_errors(args, param):
+    result = CliRunner().invoke(cli, args)
+
+    assert result.exit_code == 2
+    assert "Invalid value for" in result.output
+    assert param in result.output
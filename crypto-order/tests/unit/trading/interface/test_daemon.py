@@ -0,0 +1,101 @@
+import asyncio
+import os
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+import aiohttp
+
+from src.trading.application.dto.order_dto import OrderDTO
+from src.trading.interface.daemon import OrderDaemon
+from src.trading.interface.daemon_client import DaemonClient
+
+logger = Mock()
+
+
+def make_app_service() -> Mock:
+    async def place_market_order(order_dto):
+        return OrderDTO(
+            symbol=order_dto.symbol,
+            side=order_dto.side,
+            quantity=order_dto.quantity,
+            exchange_id="binance",
+            order_id="order-1",
+            status="filled",
+            filled_price=Decimal("50000.1"),
+        )
+
+    app_service = Mock()
+    app_service.place_market_order = AsyncMock(side_effect=place_market_order)
+    return app_service
+
+
+class TestOrderDaemon:
+
+    @pytest.mark.asyncio
+    async def test_order_over_unix_socket(self, tmp_path):
+        socket_path = str(tmp_path / "trading.sock")
+        app_service = make_app_service()
+        daemon = OrderDaemon(app_service, logger=logger)
+        await daemon.start(socket_path=socket_path)
+        mode = os.stat(socket_path).st_mode & 0o777
+        try:
+            # NOTE: The client blocks, so it runs in a thread while the daemon serves on the loop.
+            result = await asyncio.to_thread(
+                DaemonClient(socket_path=socket_path).place_market_order,
+                OrderDTO(symbol="BTCUSDT", side="buy", quantity=Decimal("0.5")),
+            )
+        finally:
+            await daemon.stop()
+
+        assert result.status == "filled"
+        assert result.filled_price == Decimal("50000.1")
+        assert result.quantity == Decimal("0.5")
+        assert daemon.orders == 1
+        assert mode == 0o600
+        assert not (tmp_path / "trading.sock").exists()
+
+    @pytest.mark.asyncio
+    async def test_order_over_http(self, unused_tcp_port):
+        daemon = OrderDaemon(make_app_service(), logger=logger)
+        await daemon.start(port=unused_tcp_port)
+        try:
+            result = await asyncio.to_thread(
+                DaemonClient(
+                    url=f"http://127.0.0.1:{unused_tcp_port}"
+                ).place_market_order,
+                OrderDTO(symbol="BTCUSDT", side="sell", quantity=Decimal("1")),
+            )
+        finally:
+            await daemon.stop()
+
+        assert result.side == "sell"
+        assert result.exchange_id == "binance"
+
+    @pytest.mark.asyncio
+    async def test_invalid_order_is_rejected(self, unused_tcp_port):
+        app_service = make_app_service()
+        daemon = OrderDaemon(app_service, logger=logger)
+        await daemon.start(port=unused_tcp_port)
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(
+                    f"http://127.0.0.1:{unused_tcp_port}/orders",
+                    json={"symbol": "BTCUSDT", "side": "hold", "quantity": "1"},
+                ) as response:
+                    status = response.status
+                    body = await response.json()
+        finally:
+            await daemon.stop()
+
+        assert status == 400
+        assert "Side must be" in body["error"]
+        app_service.place_market_order.assert_not_awaited()
+
+    def test_client_reports_unreachable_daemon(self, tmp_path):
+        client = DaemonClient(socket_path=str(tmp_path / "missing.sock"))
+
+        with pytest.raises(OSError):
+            client.place_market_order(
+                OrderDTO(symbol="BTCUSDT", side="buy", quantity=Decimal("1"))
+            )
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from src.trading.interface.startup_profile import format_report, parse_import_times
+
+SRC = str(Path(__file__).parents[4] / "src")
+
+
+def test_parse_import_times():
+    stderr = [
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |     aiohttp.helpers",
+        "import time:       500 |        620 |   aiohttp",
+        "import time:        80 |        700 | trading.interface.cli",
+        "INFO:trading:Order filled",
+    ]
+
+    timings, others = parse_import_times(stderr)
+
+    assert [(t.module, t.level) for t in timings] == [
+        ("aiohttp.helpers", 2),
+        ("aiohttp", 1),
+        ("trading.interface.cli", 0),
+    ]
+    assert timings[1].cumulative_us == 620
+    assert others == ["INFO:trading:Order filled"]
+    assert "0.7ms importing 3 modules" in format_report(timings, elapsed=0.01)
+
+
+def test_cli_import_does_not_load_aiohttp():
+    # NOTE: A fresh interpreter, since the test process has imported aiohttp already.
+    env = dict(os.environ, PYTHONPATH=SRC)
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, trading.interface.cli; print('aiohttp' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    ).stdout
+
+    assert output.strip() == "False"